@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/alerts/compiler.py — v0.3 (compiled, vectorized rules)
+# ------------------------------------------------------------
+# • Rules → polars expressions once at load
+# • Shared value columns deduplicated (10 × "RSI(14) …" = 1 RSI)
+# • One select per frame, or one group_by over a long universe frame
+# • Indicator rules compile only when the registry resolves them to the
+#   core function the expression mirrors, with params that function
+#   accepts; results then match eval_rule exactly
+# • Anything else (patterns, unknown indicators, bad params, frames
+#   missing an input column) falls back to alerts.evaluator.eval_rule
+# ============================================================
+from __future__ import annotations
+
+import inspect
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import polars as pl
+from queen.alerts.evaluator import eval_rule
+from queen.alerts.rules import Rule
+from queen.helpers.common import indicator_kwargs
+from queen.technicals.indicators import core
+from queen.technicals.registry import get_indicator
+
+Result = Tuple[bool, Dict[str, Any]]
+
+_CMP_OPS = ("lt", "gt", "eq")
+_CROSS_OPS = ("crosses_above", "crosses_below")
+
+
+# ------------------------------------------------------------
+# 📐 Indicator expressions (mirror technicals.indicators.core)
+# ------------------------------------------------------------
+# Each builder takes the bound kwargs of its core function and returns
+# (series name as the core function aliases it, expression).
+def _close() -> pl.Expr:
+    return pl.col("close").cast(pl.Float64, strict=False)
+
+
+def _src(a: Dict[str, Any]) -> pl.Expr:
+    return pl.col(a.get("column", "close")).cast(pl.Float64, strict=False)
+
+
+def _period(a: Dict[str, Any]) -> int:
+    """``length`` overrides ``period`` exactly as the core functions do."""
+    return int(a.get("length") or a["period"])
+
+
+def _ema_expr(a: Dict[str, Any]) -> Tuple[str, pl.Expr]:
+    n = _period(a)
+    return f"ema_{n}", _src(a).ewm_mean(span=n, adjust=False)
+
+
+def _sma_expr(a: Dict[str, Any]) -> Tuple[str, pl.Expr]:
+    n = _period(a)
+    return f"sma_{n}", _src(a).rolling_mean(window_size=n)
+
+
+def _ema_slope_expr(a: Dict[str, Any]) -> Tuple[str, pl.Expr]:
+    n, k = int(a["length"]), max(int(a["periods"] or 1), 1)
+    e = _src(a).ewm_mean(span=n, adjust=False)
+    return f"ema_{n}_slope{k}", e - e.shift(k)
+
+
+def _ema_cross_expr(a: Dict[str, Any]) -> Tuple[str, pl.Expr]:
+    f, s = int(a["fast"]), int(a["slow"])
+    src = _src(a)
+    spread = src.ewm_mean(span=f, adjust=False) - src.ewm_mean(span=s, adjust=False)
+    return f"ema_cross_{f}_{s}", spread
+
+
+def _price_minus_vwap_expr(a: Dict[str, Any]) -> Tuple[str, pl.Expr]:
+    h, lo, c = (pl.col(x).cast(pl.Float64, strict=False) for x in ("high", "low", "close"))
+    vol = pl.col("volume").cast(pl.Float64, strict=False)
+    vwap = ((h + lo + c) / 3.0 * vol).cum_sum() / (vol.cum_sum() + 1e-12)
+    return "price_minus_vwap", c - vwap
+
+
+def _rsi_expr(a: Dict[str, Any]) -> Tuple[str, pl.Expr]:
+    n = _period(a)
+    delta = _src(a).diff().fill_null(0.0)
+    gain = delta.clip(lower_bound=0.0).ewm_mean(span=n, adjust=False)
+    loss = (-delta).clip(lower_bound=0.0).ewm_mean(span=n, adjust=False)
+    return f"rsi_{n}", 100.0 - 100.0 / (1.0 + gain / (loss + 1e-12))
+
+
+def _atr_expr(a: Dict[str, Any]) -> Tuple[str, pl.Expr]:
+    n = _period(a)
+    h = pl.col("high").cast(pl.Float64, strict=False)
+    lo = pl.col("low").cast(pl.Float64, strict=False)
+    pc = pl.col("close").cast(pl.Float64, strict=False).shift(1)
+    tr = pl.max_horizontal((h - lo).abs(), (h - pc).abs(), (lo - pc).abs())
+    return f"atr_{n}", tr.ewm_mean(span=n, adjust=False)
+
+
+# name → (core function reproduced, expression builder)
+INDICATOR_EXPRS: Dict[str, Tuple[Callable, Callable[[Dict[str, Any]], Tuple[str, pl.Expr]]]] = {
+    "ema": (core.ema, _ema_expr),
+    "sma": (core.sma, _sma_expr),
+    "ema_slope": (core.ema_slope, _ema_slope_expr),
+    "ema_cross": (core.ema_cross, _ema_cross_expr),
+    "price_minus_vwap": (core.price_minus_vwap, _price_minus_vwap_expr),
+    "rsi": (core.rsi, _rsi_expr),
+    "atr": (core.atr, _atr_expr),
+}
+
+
+def _registered(name: str) -> Optional[Callable]:
+    try:
+        return get_indicator(name)
+    except KeyError:
+        return None
+
+
+def _bind(fn: Callable, params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Bind rule params to ``fn``'s signature exactly as eval_indicator calls it.
+
+    Returns None for params the function does not accept; such rules stay on
+    the interpreter, which reports the same error it always has.
+    """
+    try:
+        bound = inspect.signature(fn).bind(None, **indicator_kwargs(params))
+    except TypeError:
+        return None
+    bound.apply_defaults()
+    return dict(list(bound.arguments.items())[1:])
+
+
+# ------------------------------------------------------------
+# 🧱 Compiled rules
+# ------------------------------------------------------------
+@dataclass(frozen=True)
+class CompiledRule:
+    index: int
+    rule: Rule
+    column: Optional[str]  # None → interpreted fallback
+    series: str = ""
+
+
+def _compile_one(idx: int, rule: Rule) -> Tuple[CompiledRule, Optional[pl.Expr]]:
+    kind = (rule.kind or "").lower()
+    op = rule.op or ""
+    if op not in _CMP_OPS + _CROSS_OPS or rule.value is None:
+        return CompiledRule(idx, rule, None), None
+
+    if kind == "price":
+        return CompiledRule(idx, rule, "__v_close", "close"), _close()
+
+    if kind == "indicator":
+        # Only compile when the interpreter would run the very function we
+        # reproduce; unknown/overridden indicators keep eval_rule semantics.
+        name = (rule.indicator or "").lower()
+        fn, build = INDICATOR_EXPRS.get(name, (None, None))
+        if fn is None or _registered(name) is not fn:
+            return CompiledRule(idx, rule, None), None
+        args = _bind(fn, rule.params)
+        if args is None:
+            return CompiledRule(idx, rule, None), None
+        series, expr = build(args)
+        src = args.get("column", "close")
+        column = f"__v_{series}" if src == "close" else f"__v_{series}@{src}"
+        return CompiledRule(idx, rule, column, series), expr
+
+    return CompiledRule(idx, rule, None), None
+
+
+def _interpret(rule: Rule, df: pl.DataFrame) -> Result:
+    try:
+        return eval_rule(rule, df)
+    except Exception as e:
+        return False, {"reason": "eval_error", "error": str(e)}
+
+
+def _decide(cr: CompiledRule, last2: Optional[Sequence[Any]]) -> Result:
+    """Apply the rule's op to the last two non-null values of its column."""
+    rule = cr.rule
+    level = float(rule.value)
+    vals = [v for v in (last2 or []) if v is not None]
+    kind = (rule.kind or "").lower()
+    extra: Dict[str, Any] = {"kind": kind, "op": rule.op}
+    if kind == "indicator":
+        extra.update({"indicator": (rule.indicator or "").lower(), "series": cr.series})
+
+    if rule.op in _CMP_OPS:
+        if not vals:
+            if kind == "indicator":
+                return False, {"reason": "indicator_all_nulls", "indicator": extra["indicator"]}
+            return False, {"reason": "no_data"}
+        cur = float(vals[-1])
+        ok = cur < level if rule.op == "lt" else cur > level if rule.op == "gt" else cur == level
+        key = "close" if kind == "price" else "last"
+        return ok, {**extra, "value": rule.value, key: cur}
+
+    if len(vals) < 2:
+        prev, cur = (None, vals[-1] if vals else None)
+        return False, {"reason": "insufficient_data", "last2": [prev, cur], "level": level, **extra}
+    prev, cur = float(vals[-2]), float(vals[-1])
+    if rule.op == "crosses_above":
+        ok = prev < level and cur > level
+    else:
+        ok = prev > level and cur < level
+    return ok, {"last2": [prev, cur], "level": level, **extra}
+
+
+class CompiledRuleSet:
+    """Rules compiled once into deduplicated polars value columns."""
+
+    def __init__(self, rules: Sequence[Rule]):
+        self.rules: List[Rule] = list(rules)
+        self.compiled: List[CompiledRule] = []
+        self.columns: Dict[str, pl.Expr] = {}
+        for i, rule in enumerate(self.rules):
+            cr, expr = _compile_one(i, rule)
+            self.compiled.append(cr)
+            if cr.column and cr.column not in self.columns:
+                self.columns[cr.column] = expr
+
+    @property
+    def fallback(self) -> List[CompiledRule]:
+        return [cr for cr in self.compiled if cr.column is None]
+
+    def _last2_exprs(self, columns: Sequence[str]) -> List[pl.Expr]:
+        return [
+            self.columns[c].drop_nulls().tail(2).implode().alias(c) for c in columns
+        ]
+
+    def evaluate(
+        self, df: pl.DataFrame, indices: Optional[Sequence[int]] = None
+    ) -> Dict[int, Result]:
+        """Evaluate rules (by index) against one frame in a single select."""
+        targets = [self.compiled[i] for i in indices] if indices is not None else self.compiled
+        out: Dict[int, Result] = {}
+        cols = list(dict.fromkeys(cr.column for cr in targets if cr.column))
+        row: Optional[Dict[str, Any]] = {}
+        if cols and not df.is_empty():
+            try:
+                row = df.select(self._last2_exprs(cols)).row(0, named=True)
+            except pl.exceptions.PolarsError:
+                row = None  # e.g. no volume column → interpreter semantics
+        for cr in targets:
+            if cr.column is None or row is None:
+                out[cr.index] = _interpret(cr.rule, df)
+            else:
+                out[cr.index] = _decide(cr, row.get(cr.column))
+        return out
+
+    def evaluate_long(
+        self, df: pl.DataFrame, symbol_col: str = "symbol"
+    ) -> Dict[int, Result]:
+        """Evaluate every compiled rule over a long (symbol, bar) frame.
+
+        One ``group_by(symbol).agg`` computes each distinct value column per
+        symbol; rows must already be time-ordered within a symbol. Fallback
+        rules run on their symbol's slice.
+        """
+        out: Dict[int, Result] = {}
+        if df.is_empty():
+            return out
+        cols = list(self.columns)
+        by_sym: Optional[Dict[str, Dict[str, Any]]] = {}
+        if cols:
+            try:
+                agg = df.group_by(symbol_col, maintain_order=True).agg(self._last2_exprs(cols))
+                by_sym = {r[symbol_col]: r for r in agg.iter_rows(named=True)}
+            except pl.exceptions.PolarsError:
+                by_sym = None
+        for cr in self.compiled:
+            sym = cr.rule.symbol
+            if cr.column is None or by_sym is None:
+                out[cr.index] = _interpret(cr.rule, df.filter(pl.col(symbol_col) == sym))
+            else:
+                out[cr.index] = _decide(cr, (by_sym.get(sym) or {}).get(cr.column))
+        return out
+
+
+def compile_rules(rules: Sequence[Rule]) -> CompiledRuleSet:
+    return CompiledRuleSet(rules)
@@ -1,28 +1,48 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/alerts/state.py — v0.1 (persistent cooldown state)
+# queen/alerts/state.py — v0.2 (indexed cooldown store)
+# ------------------------------------------------------------
+# • SQLite key/value store (WAL) → atomic multi-process upserts
+# • In-memory dict mirror → O(1) lookups on the hot path
+# • Legacy append-only JSONL (state.json) is imported once,
+#   then truncated (snapshot + truncate)
 # ============================================================
 from __future__ import annotations
 
 import json
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
-from queen.settings.settings import alert_path_state
+from queen.settings.settings import alert_path_cooldowns, alert_path_state
 
-# (symbol, rule) -> last_fire_ts (float monotonic seconds)
+# (symbol, rule) -> last_fire_ts (float epoch seconds)
 CooldownMap = Dict[Tuple[str, str], float]
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cooldowns (
+    symbol TEXT NOT NULL,
+    rule TEXT NOT NULL,
+    last_fire_ts REAL NOT NULL,
+    PRIMARY KEY (symbol, rule)
+) WITHOUT ROWID
+"""
+
+# Latest timestamp wins, even when two processes race on the same key
+_UPSERT = """
+INSERT INTO cooldowns (symbol, rule, last_fire_ts) VALUES (?, ?, ?)
+ON CONFLICT(symbol, rule) DO UPDATE
+SET last_fire_ts = MAX(last_fire_ts, excluded.last_fire_ts)
+"""
+
 
 def _key(sym: str, rule: str) -> str:
     return f"{sym}::{rule}"
 
 
-def load_cooldowns() -> CooldownMap:
-    """Load cooldowns from state JSONL (latest wins)."""
-    path: Path = alert_path_state()
-    if not path.exists():
-        return {}
+def _read_legacy_jsonl(path: Path) -> CooldownMap:
+    """Parse the legacy append-only cooldown JSONL (latest wins)."""
     data: CooldownMap = {}
     with path.open("r", encoding="utf-8") as fh:
         for line in fh:
@@ -35,20 +55,104 @@ def load_cooldowns() -> CooldownMap:
                 rule = obj.get("rule")
                 t = float(obj.get("last_fire_ts", 0.0))
                 if sym and rule:
-                    data[(sym, rule)] = t
+                    data[(sym, rule)] = max(t, data.get((sym, rule), 0.0))
             except Exception:
                 # ignore bad lines
                 continue
     return data
 
 
+class CooldownStore:
+    """Compacting cooldown store: SQLite on disk, dict in memory.
+
+    One row per (symbol, rule) — no unbounded log growth. Lookups hit the
+    in-memory mirror; ``refresh()`` re-syncs it with writes from other
+    processes.
+    """
+
+    def __init__(self, path: Optional[Path] = None, legacy_path: Optional[Path] = None):
+        self.path = Path(path) if path else alert_path_cooldowns()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=10.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._migrate_legacy(Path(legacy_path) if legacy_path else alert_path_state())
+        self._cache: CooldownMap = {}
+        self.refresh()
+
+    # ---------------- lifecycle ----------------
+    def _migrate_legacy(self, legacy: Path) -> None:
+        """Import the append-only JSONL once, then truncate it."""
+        if not legacy.exists() or legacy.stat().st_size == 0:
+            return
+        rows = [(s, r, t) for (s, r), t in _read_legacy_jsonl(legacy).items()]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(_UPSERT, rows)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        legacy.write_text("", encoding="utf-8")
+
+    def refresh(self) -> CooldownMap:
+        """Reload the in-memory mirror from disk."""
+        with self._lock:
+            cur = self._conn.execute("SELECT symbol, rule, last_fire_ts FROM cooldowns")
+            self._cache = {(s, r): float(t) for s, r, t in cur}
+        return dict(self._cache)
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            finally:
+                self._conn.close()
+
+    # ---------------- access ----------------
+    def get(self, sym: str, rule: str, default: float = 0.0) -> float:
+        return self._cache.get((sym, rule), default)
+
+    def put(self, sym: str, rule: str, last_fire_ts: float) -> None:
+        ts = float(last_fire_ts)
+        with self._lock:
+            self._conn.execute(_UPSERT, (sym, rule, ts))
+            self._cache[(sym, rule)] = max(ts, self._cache.get((sym, rule), 0.0))
+
+    def prune(self, older_than_ts: float) -> int:
+        """Drop cooldowns last fired before ``older_than_ts``; returns rows removed."""
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM cooldowns WHERE last_fire_ts < ?", (float(older_than_ts),)
+            )
+            self._cache = {k: v for k, v in self._cache.items() if v >= older_than_ts}
+            return cur.rowcount
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_STORE: Optional[CooldownStore] = None
+
+
+def get_store() -> CooldownStore:
+    """Process-wide default store (lazy)."""
+    global _STORE
+    if _STORE is None:
+        _STORE = CooldownStore()
+    return _STORE
+
+
+def load_cooldowns() -> CooldownMap:
+    """Load all cooldowns (one indexed table scan, no log replay)."""
+    return get_store().refresh()
+
+
 def save_cooldown(sym: str, rule: str, last_fire_ts: float) -> None:
-    """Append a single cooldown record (append-only JSONL)."""
-    path: Path = alert_path_state()
-    rec = {
-        "symbol": sym,
-        "rule": rule,
-        "last_fire_ts": float(last_fire_ts),
-    }
-    with path.open("a", encoding="utf-8") as fh:
-        fh.write(json.dumps(rec) + "\n")
+    """Upsert a single cooldown record (atomic across processes)."""
+    get_store().put(sym, rule, last_fire_ts)
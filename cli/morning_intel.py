@@ -1,14 +1,15 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/cli/morning_intel.py — v1.1 (Run next-session forecast once)
+# queen/cli/morning_intel.py — v1.2 (Run next-session forecast / EOD precompute once)
 # ============================================================
 from __future__ import annotations
 
 import argparse
+import asyncio
 from datetime import date
 
 try:
-    from queen.daemons.morning_intel import run_cli
+    from queen.daemons.morning_intel import run_cli, run_eod
 except ImportError as e:
     print(f"[ImportError] Missing daemon dependency: {e}")
     raise SystemExit(1)
@@ -17,8 +18,14 @@ except ImportError as e:
 def main():
     parser = argparse.ArgumentParser(description="Queen Next-Session Forecast (actionable)")
     parser.add_argument("--date", help="YYYY-MM-DD (next session). Default: tomorrow", default=None)
+    parser.add_argument("--eod", action="store_true", help="Precompute EOD feature rows (run after close)")
     args = parser.parse_args()
 
+    if args.eod:
+        feats = asyncio.run(run_eod())
+        print(f"✅ EOD features stored ({feats.height} symbols).")
+        return
+
     next_d = date.fromisoformat(args.date) if args.date else None
     run_cli(next_d)
     print("✅ Morning Intelligence run completed.")
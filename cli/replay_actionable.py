@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/cli/replay_actionable.py — v3.3
+# queen/cli/replay_actionable.py — v3.4
 # ------------------------------------------------------------
 # Historical intraday actionable replay (dev analysis tool)
 #
@@ -27,6 +27,11 @@
 #   • EOD:
 #         In intraday auto-mode, last bar can force EXIT/EXIT_SHORT
 #         via eod_force=True passed into build_actionable_row.
+#   • by_day:
+#         Range is split into trading-day chunks, each seeded with the
+#         previous day's last `warmup` bars and flattened at its own EOD;
+#         chunks are independent, so `workers` > 1 runs them in a process
+#         pool and the rows are stitched back in day order.
 #
 # Notes:
 #   • There is NO legacy internal simulator here anymore.
@@ -39,15 +44,20 @@ from __future__ import annotations
 import argparse
 import asyncio
 import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from itertools import repeat
+from typing import Any, Dict, List, Optional, Tuple
 
 import polars as pl
 
 from queen.fetchers.upstox_fetcher import fetch_unified
 from queen.helpers.candles import ensure_sorted
 from queen.helpers.logger import log
-from queen.services.actionable_row import build_actionable_row
+from queen.helpers.market import MARKET_TZ, TIME_COLUMNS, with_time_columns
+from queen.services.actionable_row import build_actionable_row, reset_sim_memory
 
 
 # ------------------------------------------------------------
@@ -80,6 +90,10 @@ class ReplayConfig:
     # Position map — only used if pos_mode == "live"
     positions_map: Optional[Dict[str, Any]] = None
 
+    # Day-chunked replay (see header); workers > 1 → process pool
+    by_day: bool = False
+    workers: int = 1
+
 
 # ------------------------------------------------------------
 # JSON-safe row helper
@@ -140,29 +154,10 @@ async def _fetch_intraday_range(cfg: ReplayConfig) -> pl.DataFrame:
 
 
 # ------------------------------------------------------------
-# Main replay function — unified pipeline
+# Bar loop (shared by the whole-range and day-chunked paths)
 # ------------------------------------------------------------
-async def replay_actionable(cfg: ReplayConfig) -> Dict[str, Any]:
-    """Replay intraday candles through the exact same pipeline as live.
-
-    DF → build_actionable_row → (strategies, sim) → actionable rows
-    """
-    df = await _fetch_intraday_range(cfg)
-    if df.is_empty():
-        log.info(
-            f"[ReplayActionable] No data for {cfg.symbol} "
-            f"{cfg.date_from}→{cfg.date_to} @ {cfg.interval_min}m"
-        )
-        return {
-            "symbol": cfg.symbol,
-            "interval": f"{cfg.interval_min}m",
-            "from": cfg.date_from,
-            "to": cfg.date_to,
-            "book": cfg.book,
-            "count": 0,
-            "rows": [],
-        }
-
+def _replay_rows(cfg: ReplayConfig, df: pl.DataFrame, *, context: int = 0) -> List[Dict[str, Any]]:
+    """Rows for bars ``context:`` of ``df``; earlier bars only seed indicators."""
     rows: List[Dict[str, Any]] = []
     interval_str = f"{cfg.interval_min}m"
     n = df.height
@@ -180,9 +175,14 @@ async def replay_actionable(cfg: ReplayConfig) -> Dict[str, Any]:
     #   • FLAT/LONG/SHORT sim-side and PnL
     sim_state: Dict[str, Any] | None = None
 
+    # Time-of-day context for every bar in one pass (strategies read these)
+    time_cols: Dict[str, list] = {}
+    if "timestamp" in df.columns:
+        time_cols = with_time_columns(df).select(TIME_COLUMNS).to_dict(as_series=False)
+
     for i in range(n):
-        # Skip until warmup bars are available
-        if i + 1 < effective_warmup:
+        # Skip context bars and until warmup bars are available
+        if i < context or i + 1 < effective_warmup:
             continue
 
         df_slice = df.slice(0, i + 1)
@@ -218,9 +218,81 @@ async def replay_actionable(cfg: ReplayConfig) -> Dict[str, Any]:
             # If timestamp is missing, we still return data; callers like
             # scan_signals / sim_stats will fail loudly if they require it.
             pass
+        for col, values in time_cols.items():
+            row.setdefault(col, values[i])
 
         rows.append(_json_safe_row(row))
 
+    return rows
+
+
+def _day_chunks(df: pl.DataFrame, warmup: int) -> List[Tuple[pl.DataFrame, int]]:
+    """(previous day's last ``warmup`` bars + day bars, context length) per day."""
+    ts = pl.col("timestamp")
+    if getattr(df.schema["timestamp"], "time_zone", None):
+        ts = ts.dt.convert_time_zone(str(MARKET_TZ))
+    days = df.with_columns(ts.dt.date().alias("_day")).partition_by(
+        "_day", maintain_order=True, include_key=False
+    )
+    chunks: List[Tuple[pl.DataFrame, int]] = []
+    prev: Optional[pl.DataFrame] = None
+    for day in days:
+        tail = prev.tail(warmup) if prev is not None else day.clear()
+        chunks.append((pl.concat([tail, day]), tail.height))
+        prev = day
+    return chunks
+
+
+def _replay_chunk(cfg: ReplayConfig, df: pl.DataFrame, context: int) -> List[Dict[str, Any]]:
+    """One trading day from a flat book (process-pool entrypoint)."""
+    reset_sim_memory(cfg.symbol)
+    return _replay_rows(cfg, df, context=context)
+
+
+def _replay_by_day(cfg: ReplayConfig, df: pl.DataFrame) -> List[Dict[str, Any]]:
+    chunks = _day_chunks(df, cfg.warmup)
+    frames = [c[0] for c in chunks]
+    contexts = [c[1] for c in chunks]
+    workers = min(int(cfg.workers or 1), len(chunks))
+
+    if workers <= 1:
+        parts = [_replay_chunk(cfg, f, c) for f, c in zip(frames, contexts)]
+    else:
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            parts = list(pool.map(_replay_chunk, repeat(cfg), frames, contexts))
+
+    log.info(f"[ReplayActionable] {cfg.symbol}: {len(chunks)} day chunks, workers={workers}")
+    return [row for part in parts for row in part]
+
+
+# ------------------------------------------------------------
+# Main replay function — unified pipeline
+# ------------------------------------------------------------
+async def replay_actionable(cfg: ReplayConfig) -> Dict[str, Any]:
+    """Replay intraday candles through the exact same pipeline as live.
+
+    DF → build_actionable_row → (strategies, sim) → actionable rows
+    """
+    df = await _fetch_intraday_range(cfg)
+    if df.is_empty():
+        log.info(
+            f"[ReplayActionable] No data for {cfg.symbol} "
+            f"{cfg.date_from}→{cfg.date_to} @ {cfg.interval_min}m"
+        )
+        return {
+            "symbol": cfg.symbol,
+            "interval": f"{cfg.interval_min}m",
+            "from": cfg.date_from,
+            "to": cfg.date_to,
+            "book": cfg.book,
+            "count": 0,
+            "rows": [],
+        }
+
+    interval_str = f"{cfg.interval_min}m"
+    rows = _replay_by_day(cfg, df) if cfg.by_day else _replay_rows(cfg, df)
+
     if cfg.final_only and rows:
         rows = [rows[-1]]
 
@@ -266,6 +338,18 @@ def main() -> None:
         help='Auto-sim side bias: "long", "short", or "both".',
     )
 
+    parser.add_argument(
+        "--by-day",
+        action="store_true",
+        help="Replay each trading day as an independent chunk (warmup tail from the previous day).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Process-pool size for --by-day (default: CPU count; 1 = serial).",
+    )
+
     args = parser.parse_args()
 
     cfg = ReplayConfig(
@@ -278,6 +362,8 @@ def main() -> None:
         final_only=args.final_only,
         pos_mode=args.pos_mode,
         auto_side=args.auto_side,
+        by_day=args.by_day,
+        workers=args.workers or os.cpu_count() or 1,
     )
 
     async def _run() -> None:
@@ -37,6 +37,7 @@ import polars as pl
 
 from queen.cli.replay_actionable import ReplayConfig, replay_actionable
 from queen.helpers.logger import log
+from queen.helpers.market import with_time_columns
 
 # ----------------- helpers -----------------
 
@@ -215,6 +216,8 @@ async def _scan_symbols(
         return pl.DataFrame()
 
     df = pl.DataFrame(all_rows)
+    if "timestamp" in df.columns and "time_bucket" not in df.columns:
+        df = with_time_columns(df)
     if "timestamp" in df.columns:
         df = df.sort(["symbol", "timestamp"])
     else:
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/cli/startup_bench.py — v1.0 (cold-start import budget)
+# ============================================================
+"""Cold-start benchmark for Queen entrypoints.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter per
+target and reports:
+  • total    → cumulative import time of the target (includes polars etc.)
+  • queen    → self time spent in queen.* modules (what we control)
+  • heavy    → modules from the DEFERRED list that were imported anyway
+
+Budgets live in settings.DIAGNOSTICS["STARTUP"]; tests/smoke_startup.py
+enforces them.
+
+Usage:
+  python -m queen.cli.startup_bench
+  python -m queen.cli.startup_bench --module queen.services.live --top 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from queen.settings import settings as SETTINGS
+
+_PKG_PARENT = Path(os.path.abspath(__file__)).parents[2]  # no resolve(): keep symlinked checkouts importable
+
+
+@dataclass
+class ImportProfile:
+    module: str
+    total_ms: float = 0.0
+    queen_ms: float = 0.0
+    self_ms: Dict[str, float] = field(default_factory=dict)
+    heavy: List[str] = field(default_factory=list)
+
+    def top(self, n: int = 10, prefix: str = "queen") -> List[tuple[str, float]]:
+        rows = [(m, t) for m, t in self.self_ms.items() if m.split(".")[0] == prefix]
+        return sorted(rows, key=lambda r: r[1], reverse=True)[:n]
+
+
+def startup_config() -> dict:
+    return (SETTINGS.DIAGNOSTICS or {}).get("STARTUP", {})
+
+
+def parse_importtime(stderr: str) -> tuple[Dict[str, float], Dict[str, float]]:
+    """Parse ``-X importtime`` output → ({module: self_ms}, {module: cumulative_ms})."""
+    self_ms: Dict[str, float] = {}
+    cum_ms: Dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        try:
+            _, self_us, cum_us, name = (p.strip() for p in line.replace("import time:", "|").split("|"))
+        except ValueError:
+            continue
+        self_ms[name] = self_ms.get(name, 0.0) + int(self_us) / 1000.0
+        cum_ms[name] = max(cum_ms.get(name, 0.0), int(cum_us) / 1000.0)
+    return self_ms, cum_ms
+
+
+def profile_import(module: str, deferred: Optional[List[str]] = None) -> ImportProfile:
+    """Import ``module`` in a fresh interpreter and profile it."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(_PKG_PARENT), env.get("PYTHONPATH")]))
+    env.setdefault("QUEEN_LOG_CONSOLE", "0")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=str(_PKG_PARENT),
+    )
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ["?"]
+        raise RuntimeError(f"[StartupBench] import {module} failed: {tail[0]}")
+
+    self_ms, cum_ms = parse_importtime(proc.stderr)
+    deferred = deferred if deferred is not None else startup_config().get("DEFERRED", [])
+    return ImportProfile(
+        module=module,
+        total_ms=cum_ms.get(module, 0.0),
+        queen_ms=sum(t for m, t in self_ms.items() if m.split(".")[0] == "queen"),
+        self_ms=self_ms,
+        heavy=[m for m in deferred if m in self_ms],
+    )
+
+
+def check_budget(profile: ImportProfile, budget_ms: Optional[float] = None) -> List[str]:
+    """Return budget violations (empty list = within budget)."""
+    cfg = startup_config()
+    budget_ms = budget_ms if budget_ms is not None else cfg.get("BUDGET_MS", {}).get(profile.module)
+    problems: List[str] = []
+    if budget_ms is not None and profile.queen_ms > budget_ms:
+        top = ", ".join(f"{m}={t:.1f}" for m, t in profile.top(5))
+        problems.append(
+            f"{profile.module}: queen self time {profile.queen_ms:.1f} ms > {budget_ms} ms ({top})"
+        )
+    if profile.heavy:
+        problems.append(f"{profile.module}: eagerly imports deferred modules {profile.heavy}")
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Queen cold-start import benchmark")
+    ap.add_argument("--module", action="append", help="Module(s) to profile (default: budgeted set)")
+    ap.add_argument("--top", type=int, default=8, help="Show N slowest queen modules")
+    args = ap.parse_args(argv)
+
+    budgets = startup_config().get("BUDGET_MS", {})
+    modules = args.module or list(budgets)
+    failed = False
+    for mod in modules:
+        prof = profile_import(mod)
+        problems = check_budget(prof)
+        failed |= bool(problems)
+        mark = "❌" if problems else "✅"
+        print(
+            f"{mark} {mod:<36} total={prof.total_ms:7.1f} ms  "
+            f"queen={prof.queen_ms:6.1f} ms  budget={budgets.get(mod, '-')}"
+        )
+        for name, ms in prof.top(args.top):
+            print(f"      {ms:7.1f} ms  {name}")
+        for p in problems:
+            print(f"    ⚠️ {p}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
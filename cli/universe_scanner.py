@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/cli/universe_scanner.py — v2.1 (Shareholding Integration)
+# queen/cli/universe_scanner.py — v3.0 (Long-frame metrics + day cache)
 # ============================================================
 """Production-grade NSE/BSE universe scanner with fundamental analysis"""
 
@@ -8,15 +8,17 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import polars as pl
 
-from queen.fetchers.fetch_router import run_router
+from queen.fetchers.nse_fetcher import fetch_nse_bands
+from queen.helpers.lazy import lazy_attr
 from queen.helpers.logger import log
-from queen.helpers.nse_fetcher import fetch_nse_bands
+from queen.helpers.market import last_trading_day
+from queen.helpers.rate_limiter import limiter
 from queen.helpers.shareholding_fetcher import get_complete_fundamentals
 from queen.settings import settings as SETTINGS
 
@@ -87,77 +89,181 @@ def load_and_prefilter_symbols(symbols_path: Path, max_symbols: Optional[int] =
 
 
 # ============================================================
-# 🧮 PHASE 2: TECHNICAL CALCULATIONS
+# 🧮 PHASE 2: LONG-FRAME HISTORY + TECHNICAL METRICS
 # ============================================================
-def calculate_volatility(df: pl.DataFrame) -> Optional[float]:
-    """20-day ATR%"""
-    if df.is_empty() or len(df) < 20:
-        return None
-    df = df.with_columns(
-        tr=pl.max_horizontal(
-            pl.col("high") - pl.col("low"),
-            (pl.col("high") - pl.col("close").shift(1)).abs(),
-            (pl.col("low") - pl.col("close").shift(1)).abs(),
-        )
-    )
-    atr = df.select(pl.col("tr").rolling_mean(14).tail(1).first())["tr"].item()
-    close = df.select(pl.col("close").tail(1).first())["close"].item()
-    return (atr / close) * 100 if close else None
+fetch_unified = lazy_attr("queen.fetchers.upstox_fetcher", "fetch_unified")
 
-
-def calculate_liquidity_score(df: pl.DataFrame, avg_volume: float) -> Optional[float]:
-    """Recent volume vs 20-day average"""
-    if df.is_empty() or avg_volume == 0:
-        return None
-    recent_avg = df.select(pl.col("volume").tail(5).mean())["volume"].item()
-    return (recent_avg / avg_volume) * 100
+_OHLCV = ("open", "high", "low", "close", "volume")
 
 
-def calculate_momentum_score(df: pl.DataFrame) -> Optional[float]:
-    """Current price vs 50-EMA (100 = neutral)"""
-    if df.is_empty() or len(df) < 50:
-        return None
-    df = df.with_columns(ema_50=pl.col("close").ewm_mean(span=50))
-    current = df.select(pl.col("close").tail(1).first())["close"].item()
-    ema = df.select(pl.col("ema_50").tail(1).first())["ema_50"].item()
-    return (current / ema) * 100 if ema else None
+def _cfg() -> Dict[str, Any]:
+    return dict(getattr(SETTINGS, "FETCH", {}).get("UNIVERSE_SCAN", {}) or {})
 
 
-def calculate_beta(df: pl.DataFrame, nifty_df: pl.DataFrame) -> Optional[float]:
-    """Beta vs Nifty 50 (20-day)"""
-    if df.is_empty() or nifty_df.is_empty() or len(df) < 20:
-        return None
+async def fetch_long(
+    symbols: List[str],
+    *,
+    mode: str,
+    interval: str,
+    from_date: str,
+    to_date: str,
+    concurrency: Optional[int] = None,
+) -> pl.DataFrame:
+    """One long OHLCV frame (``symbol`` column) for many symbols.
+
+    At most ``concurrency`` requests in flight, each throttled by the
+    "universe_scan" rate limiter. Failed symbols are logged and skipped.
+    """
+    cfg = _cfg()
+    sem = asyncio.Semaphore(int(concurrency or cfg.get("MAX_CONCURRENCY", 8)))
+    rate_key = str(cfg.get("RATE_KEY", "universe_scan"))
+
+    async def _one(sym: str) -> pl.DataFrame:
+        async with sem:
+            async with limiter(rate_key):
+                df = await fetch_unified(
+                    sym, mode=mode, from_date=from_date, to_date=to_date, interval=interval
+                )
+        if df is None or df.is_empty():
+            return pl.DataFrame()
+        return df.select(
+            pl.lit(sym).alias("symbol"),
+            "timestamp",
+            *(pl.col(c).cast(pl.Float64) for c in _OHLCV),
+        )
 
-    merged = df.join(nifty_df, on="timestamp", how="inner", suffix="_nifty")
-    if merged.is_empty():
-        return None
+    results = await asyncio.gather(*(_one(s) for s in symbols), return_exceptions=True)
+    frames = []
+    for sym, r in zip(symbols, results):
+        if isinstance(r, BaseException):
+            log.warning(f"[Scanner] {sym} {mode} fetch failed → {r}")
+        elif not r.is_empty():
+            frames.append(r)
+    return pl.concat(frames, how="diagonal_relaxed") if frames else pl.DataFrame()
+
+
+def compute_metrics(
+    hist: pl.DataFrame,
+    benchmark: pl.DataFrame,
+    intra: Optional[pl.DataFrame] = None,
+    *,
+    beta_window: int = 20,
+) -> pl.DataFrame:
+    """Per-symbol technical metrics from long daily (and 5m) frames, one query.
+
+    volatility   14-day ATR% of last close (≥ 20 bars)
+    liquidity    5-day vs full-window average volume, % (100 = normal)
+    momentum     close vs EMA-50, % (≥ 50 bars)
+    beta         rolling ``beta_window`` cov(ret, bench ret) / var(bench ret)
+    spread_cost  mean intraday (high − low) / close, %
+    """
+    if hist.is_empty():
+        return pl.DataFrame()
+    day = pl.col("timestamp").dt.date().alias("d")
+    bench = (
+        benchmark.lazy()
+        .select(day, pl.col("close").cast(pl.Float64))
+        .sort("d")
+        .select("d", (pl.col("close") / pl.col("close").shift(1) - 1).alias("ret_bench"))
+        if not benchmark.is_empty()
+        else pl.LazyFrame(schema={"d": pl.Date, "ret_bench": pl.Float64})
+    )
 
-    merged = merged.with_columns(
-        returns=(pl.col("close") / pl.col("close").shift(1) - 1),
-        returns_nifty=(pl.col("close_nifty") / pl.col("close_nifty").shift(1) - 1),
-    ).drop_nulls()
+    prev = pl.col("close").shift(1).over("symbol")
+    h, l, c, v = pl.col("high"), pl.col("low"), pl.col("close"), pl.col("volume")
+    n = pl.len()
+    metrics = (
+        hist.lazy()
+        .with_columns(day)
+        .sort("symbol", "d")
+        .join(bench, on="d", how="left")
+        .with_columns(
+            pl.max_horizontal(h - l, (h - prev).abs(), (l - prev).abs()).alias("tr"),
+            (c / prev - 1).alias("ret"),
+        )
+        .with_columns(
+            pl.col("tr").rolling_mean(14).over("symbol").alias("atr"),
+            c.ewm_mean(span=50).over("symbol").alias("ema_50"),
+            (
+                pl.rolling_cov("ret", "ret_bench", window_size=beta_window).over("symbol")
+                / pl.col("ret_bench").rolling_var(beta_window).over("symbol")
+            ).alias("beta"),
+        )
+        .group_by("symbol")
+        .agg(
+            pl.when(n >= 20).then(pl.col("atr").last() / c.last() * 100).alias("volatility"),
+            pl.when(v.mean() > 0).then(v.tail(5).mean() / v.mean() * 100).alias("liquidity"),
+            pl.when(n >= 50).then(c.last() / pl.col("ema_50").last() * 100).alias("momentum"),
+            pl.when(n >= 20).then(pl.col("beta").last()).alias("beta"),
+            c.last().alias("current_price"),
+            v.mean().alias("avg_volume"),
+            (c * v).mean().alias("avg_daily_value"),
+        )
+    )
 
-    if merged.is_empty():
-        return None
+    if intra is not None and not intra.is_empty():
+        spread = intra.lazy().group_by("symbol").agg((((h - l) / c).mean() * 100).alias("spread_cost"))
+        metrics = metrics.join(spread, on="symbol", how="left")
+    else:
+        metrics = metrics.with_columns(pl.lit(None, dtype=pl.Float64).alias("spread_cost"))
 
-    cov = merged.select(pl.cov(pl.col("returns"), pl.col("returns_nifty")))["returns"][0]
-    var_nifty = merged.select(pl.col("returns_nifty").var())["returns_nifty"].item()
-    return cov / var_nifty if var_nifty else None
+    return (
+        metrics.with_columns(
+            pl.col("beta").fill_nan(None),
+            # Delivery % proxy — TODO: NSE sym-deliverables API
+            pl.lit(35.0).alias("delivery"),
+        )
+        .sort("symbol")
+        .collect()
+    )
 
 
-def calculate_spread_cost(df: pl.DataFrame) -> Optional[float]:
-    """Intraday spread cost proxy using OHLC"""
-    if df.is_empty():
-        return None
-    spread = df.select(((pl.col("high") - pl.col("low")) / pl.col("close")).mean())["high"].item()
-    return spread * 100
+def _metrics_path(day: date) -> Path:
+    return CACHE_DIR / f"metrics_{day:%Y%m%d}.parquet"
+
+
+async def scan_metrics(
+    symbols: List[str],
+    *,
+    day: Optional[date] = None,
+    refresh: bool = False,
+    concurrency: Optional[int] = None,
+) -> pl.DataFrame:
+    """Metrics for ``symbols`` as of trading ``day``, cached per day on disk.
+
+    Only symbols missing from the day's cache are fetched; the benchmark is
+    fetched once per such pass and shared by every beta.
+    """
+    cfg = _cfg()
+    day = day or last_trading_day()
+    path = _metrics_path(day)
+    cached = pl.read_parquet(path) if path.exists() and not refresh else pl.DataFrame()
+    have = set(cached["symbol"].to_list()) if not cached.is_empty() else set()
+    missing = [s for s in symbols if s not in have]
+
+    if missing:
+        to_date = day.isoformat()
+        hist_from = (day - timedelta(days=int(cfg.get("HISTORY_DAYS", 100)))).isoformat()
+        intra_from = (day - timedelta(days=int(cfg.get("INTRADAY_DAYS", 5)))).isoformat()
+        opts = dict(to_date=to_date, concurrency=concurrency)
+
+        log.info(f"[Scanner] Fetching {len(missing)} symbols (+ benchmark) for {to_date}")
+        bench = await fetch_long(
+            [str(cfg.get("BENCHMARK", "NIFTY50"))], mode="daily", interval="1d", from_date=hist_from, **opts
+        )
+        if bench.is_empty():
+            log.warning("[Scanner] Benchmark unavailable — beta will be null")
+        hist = await fetch_long(missing, mode="daily", interval="1d", from_date=hist_from, **opts)
+        intra = await fetch_long(missing, mode="intraday", interval="5m", from_date=intra_from, **opts)
 
+        fresh = compute_metrics(hist, bench, intra, beta_window=int(cfg.get("BETA_WINDOW", 20)))
+        if not fresh.is_empty():
+            cached = pl.concat([cached, fresh], how="diagonal_relaxed") if have else fresh
+            cached.write_parquet(path)
 
-def get_delivery_percentage(symbol: str, hist_df: pl.DataFrame) -> Optional[float]:
-    """Delivery percentage (proxy - replace with real NSE data)"""
-    # TODO: Integrate with NSE delivery data API:
-    # https://www.nseindia.com/api/sym-deliverables?symbol={symbol}&series=EQ
-    return 35.0
+    if cached.is_empty():
+        return cached
+    return cached.filter(pl.col("symbol").is_in(symbols))
 
 
 def score_parameter(value: Optional[float], ideal_range: tuple) -> float:
@@ -231,38 +337,10 @@ def score_fundamentals(fundamentals: Dict[str, Any]) -> float:
 # ============================================================
 # 🎯 PHASE 4: COMPLETE SYMBOL SCAN
 # ============================================================
-async def scan_symbol(
-    symbol: str,
-    nifty_df: pl.DataFrame,
-    from_date: str,
-    to_date: str,
-) -> Optional[Dict[str, Any]]:
-    """Complete scan: technical + fundamental analysis"""
+async def scan_symbol(symbol: str, metrics: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Fundamental filters + scoring on top of precomputed ``metrics`` (one row)."""
     log.info(f"[Scanner] Processing {symbol}")
 
-    # --- TECHNICAL DATA ---
-    hist_df = await run_router(
-        [symbol], mode="daily", from_date=from_date, to_date=to_date, interval="1d"
-    )
-    if hist_df is None or hist_df.is_empty():
-        log.warning(f"[Scanner] No historical data for {symbol}")
-        return None
-
-    # Re-verify liquidity
-    avg_daily_value = hist_df.select(
-        (pl.col("close") * pl.col("volume")).mean()
-    )["close"].item() or 0
-
-    if avg_daily_value < MIN_AVG_DAILY_VALUE:
-        log.info(f"[Scanner] {symbol} rejected: avg value ₹{avg_daily_value:,.0f} < threshold")
-        return None
-
-    # Intraday for spread
-    intra_start = (datetime.now() - timedelta(days=5)).strftime("%Y-%m-%d")
-    intra_df = await run_router(
-        [symbol], mode="intraday", from_date=intra_start, to_date=to_date, interval="5m"
-    )
-
     # --- FUNDAMENTALS ---
     fundamentals = await get_complete_fundamentals(symbol)
     if not fundamentals:
@@ -285,20 +363,8 @@ async def scan_symbol(
     # Score fundamentals
     fundamental_score = score_fundamentals(fundamentals)
 
-    # --- TECHNICAL METRICS ---
-    metrics = {
-        "volatility": calculate_volatility(hist_df),
-        "liquidity": calculate_liquidity_score(hist_df, hist_df["volume"].mean()),
-        "momentum": calculate_momentum_score(hist_df),
-        "beta": calculate_beta(hist_df, nifty_df),
-        "spread_cost": calculate_spread_cost(intra_df) if not intra_df.is_empty() else None,
-        "delivery": get_delivery_percentage(symbol, hist_df),
-        "current_price": hist_df.select(pl.col("close").tail(1).first())["close"].item(),
-        "avg_volume": hist_df.select(pl.col("volume").mean())["volume"].item(),
-    }
-
-    # Circuit limits
-    bands = fetch_nse_bands(symbol)
+    # Circuit limits (blocking HTTP → worker thread)
+    bands = await asyncio.to_thread(fetch_nse_bands, symbol)
 
     # --- SCORING ---
     tech_scores = {
@@ -353,7 +419,8 @@ async def main(
     symbols_path: Path,
     output_dir: Path,
     max_symbols: Optional[int] = None,
-    concurrency: int = 5,
+    concurrency: Optional[int] = None,
+    refresh: bool = False,
 ) -> None:
     """Complete end-to-end scan"""
     start_time = datetime.now()
@@ -364,24 +431,31 @@ async def main(
     # Phase 1: Pre-filter
     symbols = load_and_prefilter_symbols(symbols_path, max_symbols)
 
-    # Phase 2: Benchmark data
+    # Phase 2: Technical metrics (long frame, cached per trading day)
     today = datetime.now()
-    from_date = (today - timedelta(days=30)).strftime("%Y-%m-%d")
-    to_date = today.strftime("%Y-%m-%d")
-
-    log.info(f"[Phase 2] Fetching Nifty 50 baseline")
-    nifty_df = await run_router(
-        ["NIFTY50"], mode="daily", from_date=from_date, to_date=to_date, interval="1d"
-    )
-    if nifty_df is None or nifty_df.is_empty():
-        log.error("[Scanner] Failed to fetch Nifty 50")
+    log.info(f"[Phase 2] Metrics for {len(symbols)} symbols (concurrency={concurrency or 'settings'})")
+    metrics_df = await scan_metrics(symbols, refresh=refresh, concurrency=concurrency)
+    if metrics_df.is_empty():
+        log.error("[Scanner] No historical data fetched")
         return
 
-    # Phase 3: Scan with concurrency
-    log.info(f"[Phase 3] Scanning {len(symbols)} symbols with concurrency={concurrency}")
-    tasks = [scan_symbol(s, nifty_df, from_date, to_date) for s in symbols]
-    results = await asyncio.gather(*tasks)
+    # Re-verify liquidity
+    liquid = metrics_df.filter(pl.col("avg_daily_value") >= MIN_AVG_DAILY_VALUE)
+    log.info(f"[Phase 2] {liquid.height}/{metrics_df.height} pass avg daily value ≥ ₹{MIN_AVG_DAILY_VALUE:,}")
+
+    # Phase 3: Fundamentals + scoring (bounded)
+    sem = asyncio.Semaphore(int(concurrency or _cfg().get("MAX_CONCURRENCY", 8)))
+
+    async def _scan(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        symbol = row.pop("symbol")
+        async with sem:
+            return await scan_symbol(symbol, row)
+
+    results = await asyncio.gather(*(_scan(r) for r in liquid.iter_rows(named=True)))
     results = [r for r in results if r is not None]
+    if not results:
+        log.warning("[Scanner] No symbols passed the fundamental filters")
+        return
 
     # Phase 4: Save results
     results_df = pl.DataFrame(results)
@@ -423,8 +497,8 @@ async def main(
             log.info(f"[Output] {tier_name} → {csv_path} ({len(csv_df)} symbols)")
 
     # Summary
-    summary = results_df.groupby("tier").agg([
-        pl.count().alias("count"),
+    summary = results_df.group_by("tier").agg([
+        pl.len().alias("count"),
         pl.col("intraday_score").mean().alias("avg_intraday_score"),
         pl.col("btst_score").mean().alias("avg_btst_score"),
         pl.col("fundamental_score").mean().alias("avg_fundamental_score"),
@@ -466,8 +540,8 @@ def run_cli():
     parser.add_argument("--symbols", required=True, help="Path to NSE master CSV")
     parser.add_argument("--output", default=CACHE_DIR, help="Output directory")
     parser.add_argument("--max", type=int, metavar="N", help="Max symbols for testing")
-    parser.add_argument("--concurrency", type=int, default=5, help="Max concurrent scans")
-    parser.add_argument("--force-refresh", action="store_true", help="Clear fundamental cache")
+    parser.add_argument("--concurrency", type=int, help="Max concurrent requests (default: settings)")
+    parser.add_argument("--force-refresh", action="store_true", help="Clear fundamental + day metrics cache")
     args = parser.parse_args()
 
     if args.force_refresh:
@@ -476,7 +550,9 @@ def run_cli():
             cache_file.unlink()
             log.info("[CLI] Fundamental cache cleared")
 
-    asyncio.run(main(Path(args.symbols), Path(args.output), args.max, args.concurrency))
+    asyncio.run(
+        main(Path(args.symbols), Path(args.output), args.max, args.concurrency, refresh=args.force_refresh)
+    )
 
 
 if __name__ == "__main__":
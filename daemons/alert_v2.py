@@ -11,13 +11,15 @@ import asyncio
 import logging
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from time import monotonic
+from time import time
 from typing import Iterable, Optional, Tuple
 
 import httpx
 import polars as pl
+from queen.alerts.compiler import compile_rules
 from queen.alerts.evaluator import eval_rule
 from queen.alerts.rules import Rule, load_rules
+from queen.alerts.state import get_store
 from queen.fetchers.upstox_fetcher import fetch_unified
 from queen.helpers import io
 
@@ -31,7 +33,7 @@ from queen.helpers.common import (
 )
 from queen.helpers.instruments import get_listing_date, validate_historical_range
 from queen.helpers.logger import log
-from queen.helpers.market import MARKET_TZ, get_market_state, is_working_day
+from queen.helpers.market import MARKET_TZ, get_market_state, previous_trading_days
 from queen.settings.indicator_policy import min_bars_for_indicator
 from queen.settings.patterns import required_lookback  # canonical source
 from queen.settings.settings import DEFAULTS, alert_path_jsonl, alert_path_rules
@@ -51,24 +53,13 @@ _INDICATOR_MIN_MULT = int(_ALERTS.get("INDICATOR_MIN_MULT", 3))
 _INDICATOR_MIN_FLOOR = int(_ALERTS.get("INDICATOR_MIN_FLOOR", 30))
 _PATTERN_CUSHION = int(_ALERTS.get("PATTERN_CUSHION", 5))
 _PRICE_MIN_BARS = int(_ALERTS.get("PRICE_MIN_BARS", 5))
-
-# ------------------------------------------------------------
-# 🔧 Cooldown (proc-local)
-# ------------------------------------------------------------
-_LAST_FIRE: dict[tuple[str, str], float] = {}
-
+_FETCH_CONCURRENCY = int(_ALERTS.get("FETCH_CONCURRENCY", 8))
 
 # ------------------------------------------------------------
 # 📅 Helpers
 # ------------------------------------------------------------
 def _backfill_days(start: date, max_days: int) -> Iterable[date]:
-    d = start
-    yielded = 0
-    while yielded < max_days:
-        d = d - timedelta(days=1)
-        if is_working_day(d):
-            yielded += 1
-            yield d
+    return previous_trading_days(start, max_days)
 
 
 # ------------------------------------------------------------
@@ -273,6 +264,9 @@ async def run_daemon(
     log.info(f"[AlertV2] Loaded {len(rules)} rule(s) from {src.resolve()}")
     log.info(f"[AlertV2] Writing alerts → {out.resolve()}")
 
+    # persistent cooldowns (indexed store; survives restarts, shared by procs)
+    cooldowns = get_store()
+
     async def _intraday_probe(sym: str, interval: str) -> bool:
         """Lightweight check: if we can fetch intraday rows for *today*, consider it 'open'."""
         try:
@@ -288,115 +282,143 @@ async def run_daemon(
         except Exception:
             return False
 
-    async def evaluate_once():
-        state = get_market_state()
-        market_open = bool(state.get("is_open"))
+    def _dbg(msg: str, color: str = "cyan") -> None:
+        if debug:
+            log.info(colorize(msg, color, _CONSOLE_COLORS, color_ok))
+
+    gate_intraday = not force_closed and not no_market_gate
+
+    async def _market_open_for_cycle() -> bool:
+        """Calendar state, upgraded by a single intraday probe per cycle."""
+        market_open = bool(get_market_state().get("is_open"))
+        if market_open or not probe_intraday or not gate_intraday:
+            return market_open
+        probe = next(
+            (r for r in rules if (r.timeframe or "1m").lower().endswith(("m", "h"))),
+            None,
+        )
+        if probe is None:
+            return market_open
+        sym, tf = probe.symbol, (probe.timeframe or "1m").lower()
+        _dbg(f"[Debug] {sym} {tf}: calendar says closed — probing intraday…")
+        try:
+            if await _intraday_probe(sym, tf):
+                _dbg(f"[Debug] {sym} {tf}: probe found live intraday — proceeding as open")
+                return True
+        except Exception as e:
+            log.error(f"Error probing intraday for {sym}: {e}")
+        return market_open
+
+    async def _fetch_group(
+        sym: str, tf: str, need: int, market_open: bool
+    ) -> Optional[pl.DataFrame]:
+        """Fetch one (symbol, timeframe) frame covering the largest lookback.
+
+        Returns None when the group should be skipped (market closed).
+        """
+        intraday = tf.endswith(("m", "h"))
+        df: Optional[pl.DataFrame] = None
+
+        # --- Closed-market handling ---
+        if intraday and not market_open and gate_intraday:
+            if not closed_eval_daily:
+                _dbg(f"[Debug] {sym}: market closed; skipping {tf}", "yellow")
+                return None
+            _dbg(f"[Debug] {sym}: market closed — evaluating daily instead of {tf}")
+            df = await _fetch_daily_window(sym, "1d", max(need, daily_bars))
+
+        # --- Fetch ---
+        if df is None:
+            if intraday:
+                if no_intraday_backfill:
+                    today = datetime.now(MARKET_TZ).date()
+                    if not validate_historical_range(sym, today):
+                        df = pl.DataFrame()
+                    else:
+                        df = await _fetch_intraday(sym, tf)
+                else:
+                    df = await _fetch_df_intraday_with_backfill(
+                        sym, tf, need, backfill_days, debug
+                    )
+            elif tf in ("1d", "1w", "1mo"):
+                df = await _fetch_daily_window(sym, tf, need)
+            else:
+                df = await _fetch_daily_window(sym, "1d", need)
+
+        # --- Fallback ---
+        if df.is_empty() and daily_fallback and intraday:
+            _dbg(
+                f"[Debug] {sym} intraday empty after backfill — falling back to daily",
+                "yellow",
+            )
+            df = await _fetch_daily_window(sym, "1d", max(need, daily_bars))
+        return df
 
+    def _group_rules() -> dict[tuple[str, str], int]:
+        """(symbol, timeframe) → max bars needed by any rule in the group."""
+        groups: dict[tuple[str, str], int] = {}
         for rule in rules:
+            key = (rule.symbol, (rule.timeframe or "1m").lower())
+            groups[key] = max(groups.get(key, 0), _min_bars_for(rule))
+        return groups
+
+    groups = _group_rules()
+    compiled = compile_rules(rules)
+    compiled_idx = [cr.index for cr in compiled.compiled if cr.column]
+
+    # (symbol, timeframe, need) → compiled rule indices sharing one tail window
+    windows: dict[tuple[str, str, int], list[int]] = {}
+    for i in compiled_idx:
+        r = rules[i]
+        key = (r.symbol, (r.timeframe or "1m").lower(), _min_bars_for(r))
+        windows.setdefault(key, []).append(i)
+    fetch_sem = asyncio.Semaphore(max(1, _FETCH_CONCURRENCY))
+    log.info(
+        f"[AlertV2] {len(rules)} rule(s) → {len(groups)} fetch group(s) "
+        f"(concurrency={_FETCH_CONCURRENCY}), {len(compiled_idx)} compiled · "
+        f"{len(compiled.columns)} shared column(s)"
+    )
+
+    async def evaluate_once():
+        cooldowns.refresh()  # pick up fires from sibling processes
+        market_open = await _market_open_for_cycle()
+
+        async def _load(key: tuple[str, str], need: int):
+            async with fetch_sem:
+                try:
+                    return key, await _fetch_group(*key, need, market_open)
+                except Exception as e:
+                    log.error(f"[AlertV2] fetch failed for {key[0]} {key[1]} → {e}")
+                    return key, pl.DataFrame()
+
+        frames = dict(
+            await asyncio.gather(*(_load(k, n) for k, n in groups.items()))
+        )
+
+        # compiled rules: one select per (symbol, timeframe, window)
+        results: dict[int, tuple[bool, dict]] = {}
+        for (sym, tf, need), idxs in windows.items():
+            frame = frames.get((sym, tf))
+            if frame is None or frame.is_empty():
+                continue
+            try:
+                results.update(compiled.evaluate(frame.tail(need), idxs))
+            except Exception as e:
+                log.error(f"[AlertV2] compiled eval failed for {sym} {tf} → {e}")
+
+        for idx, rule in enumerate(rules):
             sym = rule.symbol
             tf = (rule.timeframe or "1m").lower()
             need = _min_bars_for(rule)
-            df: Optional[pl.DataFrame] = None
 
             try:
-                # --- Closed-market handling (with optional probe) ---
-                if tf.endswith(("m", "h")) and not force_closed and not no_market_gate:
-                    if not market_open and probe_intraday:
-                        try:
-                            if debug:
-                                log.info(
-                                    colorize(
-                                        f"[Debug] {sym} {rule.name}: calendar says closed — probing intraday…",
-                                        "cyan",
-                                        _CONSOLE_COLORS,
-                                        color_ok,
-                                    )
-                                )
-                            if await _intraday_probe(sym, tf):
-                                market_open = True
-                                if debug:
-                                    log.info(
-                                        colorize(
-                                            f"[Debug] {sym} {rule.name}: probe found live intraday — proceeding as open",
-                                            "cyan",
-                                            _CONSOLE_COLORS,
-                                            color_ok,
-                                        )
-                                    )
-                        except Exception as e:
-                            log.error(f"Error probing intraday for {sym}: {e}")
-
-                if (
-                    tf.endswith(("m", "h"))
-                    and not market_open
-                    and not force_closed
-                    and not no_market_gate
-                ):
-                    if closed_eval_daily:
-                        if debug:
-                            log.info(
-                                colorize(
-                                    f"[Debug] {sym} {rule.name}: market closed — evaluating daily instead of {tf}",
-                                    "cyan",
-                                    _CONSOLE_COLORS,
-                                    color_ok,
-                                )
-                            )
-                        df = await _fetch_daily_window(sym, "1d", max(need, daily_bars))
-                    else:
-                        if debug:
-                            log.info(
-                                colorize(
-                                    f"[Debug] {sym} {rule.name}: market closed; skipping {tf}",
-                                    "yellow",
-                                    _CONSOLE_COLORS,
-                                    color_ok,
-                                )
-                            )
-                        continue
-
-                # --- Fetch ---
+                df = frames.get((sym, tf))
                 if df is None:
-                    if tf.endswith(("m", "h")):
-                        if no_intraday_backfill:
-                            today = datetime.now(MARKET_TZ).date()
-                            if not validate_historical_range(sym, today):
-                                df = pl.DataFrame()
-                            else:
-                                df = await _fetch_intraday(sym, tf)
-                        else:
-                            df = await _fetch_df_intraday_with_backfill(
-                                sym, tf, need, backfill_days, debug
-                            )
-                    elif tf in ("1d", "1w", "1mo"):
-                        df = await _fetch_daily_window(sym, tf, need)
-                    else:
-                        df = await _fetch_daily_window(sym, "1d", need)
-
-                # --- Fallback ---
-                if df.is_empty() and daily_fallback and tf.endswith(("m", "h")):
-                    if debug:
-                        log.info(
-                            colorize(
-                                f"[Debug] {sym} intraday empty after backfill — falling back to daily",
-                                "yellow",
-                                _CONSOLE_COLORS,
-                                color_ok,
-                            )
-                        )
-                    df = await _fetch_daily_window(sym, "1d", max(need, daily_bars))
+                    continue
 
                 # --- Guards ---
                 if df.is_empty():
-                    if debug:
-                        log.info(
-                            colorize(
-                                f"[Debug] {sym} {rule.name}: empty df for {tf}",
-                                "yellow",
-                                _CONSOLE_COLORS,
-                                color_ok,
-                            )
-                        )
+                    _dbg(f"[Debug] {sym} {rule.name}: empty df for {tf}", "yellow")
                     continue
 
                 if df.height > need:
@@ -477,13 +499,14 @@ async def run_daemon(
                         )
 
                 # --- Evaluate ---
-                ok, meta = eval_rule(rule, df)
+                hit = results.get(idx)
+                ok, meta = hit if hit is not None else eval_rule(rule, df)
                 rname = rule.name or rule.pattern or rule.indicator or "unnamed"
 
                 if ok:
                     key = (sym, rname)
-                    now = monotonic()
-                    last = _LAST_FIRE.get(key, 0.0)
+                    now = time()
+                    last = cooldowns.get(*key)
                     if now - last < max(0, cooldown):
                         if debug:
                             log.info(
@@ -513,7 +536,7 @@ async def run_daemon(
                     }
                     if not post_only:
                         io.append_jsonl(out, evt)
-                    _LAST_FIRE[key] = now
+                    cooldowns.put(*key, now)
 
                     # HTTP sink
                     if client and http_post:
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/daemons/live_engine.py — v1.6 (Calendar-aware CPR + robust live loop)
+# queen/daemons/live_engine.py — v1.7 (Calendar-aware CPR + shared resampled bars)
 # ============================================================
 from __future__ import annotations
 
@@ -15,9 +15,9 @@ from rich.panel import Panel
 from rich.table import Table
 from zoneinfo import ZoneInfo
 
-from queen.fetchers.upstox_fetcher import fetch_intraday
 from queen.helpers.logger import log
 from queen.helpers.market import get_market_state, sleep_until_next_candle
+from queen.services import bars
 
 # ✅ DRY: shared core indicators
 from queen.technicals.indicators.core import (
@@ -42,8 +42,9 @@ class MonitorConfig:
 
 
 # --------------------- data fetch ---------------------
+# 15m and 60m share one cached base fetch per symbol (services.bars)
 async def _fetch_intraday(symbol: str, interval: str, limit: int) -> pl.DataFrame:
-    df = await fetch_intraday(symbol, interval)
+    df = (await bars.get_frames(symbol, [interval]))[interval]
     return df.tail(limit) if limit and not df.is_empty() else df
 
 
@@ -133,7 +134,7 @@ async def _ensure_prev_day_cpr(symbol: str, df15: pl.DataFrame, limit_bars: int)
 
     # union + sort, de-dup by timestamp
     # Using vertical concat + unique on timestamp is simple and robust
-    merged = pl.concat([df15, df60], how="vertical_relaxed").unique(subset=["timestamp"]).sort("timestamp")
+    merged = pl.concat([df15, df60], how="diagonal_relaxed").unique(subset=["timestamp"]).sort("timestamp")
     merged = merged.tail(max(limit_bars, 200))  # cap size
     # Retry both methods
     try:
@@ -1,36 +1,21 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/daemons/morning_intel.py — v1.0 (Next-session forecast + actionable leaderboard)
+# queen/daemons/morning_intel.py — v2.1 (Next-session forecast from EOD feature store)
 # ============================================================
 from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional
 
 import polars as pl
 
 from queen.helpers.logger import log
+from queen.helpers.market import last_trading_day
+from queen.services.eod_features import attempted, build_eod_features, load_features
 from queen.settings import settings as SETTINGS
 from queen.settings.settings import PATHS
-from queen.helpers.instruments import resolve_instrument
-from queen.fetchers.upstox_fetcher import (
-    fetch_intraday,
-    fetch_daily_range,
-)
-# shared indicator math (DRY)
-from queen.technicals.indicators.core import (
-    rsi_last, vwap_last, atr_last, cpr_from_prev_day, obv_trend,
-    ema,  # we'll use ema().tail(1).item() for bias checks
-)
-
-# optional supertrend import — soft dependency
-try:
-    # expected: returns DataFrame with columns ["supertrend","supertrend_dir"]
-    from queen.technicals.indicators.advanced import supertrend as st_compute  # type: ignore
-except Exception:  # pragma: no cover
-    st_compute = None
 
 
 @dataclass
@@ -46,194 +31,134 @@ class ForecastRow:
     supertrend_bias: str
 
 
-# --------------------- helpers ---------------------
-def _buy_sell_hold(score: int) -> str:
-    if score >= 8:
-        return "BUY"
-    if score <= 3:
-        return "SELL"
-    return "HOLD"
-
-
-def _fmt_last(s: pl.Series) -> Optional[float]:
-    if s is None or s.len() == 0:
-        return None
-    tail = s.drop_nulls().tail(1)
-    return float(tail.item()) if tail.len() else None
-
-
-async def _daily_df(symbol: str, days_window: int = 14, bars_fallback: int = 40) -> pl.DataFrame:
-    """Fetch ~2 weeks of daily candles; this is robust to weekends/holidays."""
-    to_d = date.today().isoformat()
-    from_d = (date.today() - timedelta(days=days_window)).isoformat()
-    df = await fetch_daily_range(symbol, from_d, to_d, "1d")
-    if df.is_empty() and days_window < 60:
-        # widen window once if broker gives no data in that span
-        return await _daily_df(symbol, days_window=60, bars_fallback=bars_fallback)
-    return df.tail(bars_fallback) if not df.is_empty() else df
-
-
-async def _intraday_df(symbol: str, interval: str = "15m", tail: int = 200) -> pl.DataFrame:
-    df = await fetch_intraday(symbol, interval)
-    return df.tail(tail) if not df.is_empty() else df
-
-
-def _ema_bias(daily_df: pl.DataFrame) -> str:
-    """EMA20/50/200 staircase bias from daily candles."""
-    if daily_df.is_empty() or daily_df.height < 200:
-        return "Neutral"
-    e20 = _fmt_last(ema(daily_df, 20))
-    e50 = _fmt_last(ema(daily_df, 50))
-    e200 = _fmt_last(ema(daily_df, 200))
-    if None in (e20, e50, e200):
-        return "Neutral"
-    if e20 > e50 > e200:
-        return "Bullish"
-    if e20 < e50 < e200:
-        return "Bearish"
-    return "Neutral"
-
+# --------------------- scoring (vectorized) ---------------------
+def score_forecast(features: pl.DataFrame) -> pl.DataFrame:
+    """EMA stack / Supertrend / RSI / VWAP / EMA50 score for every feature row.
 
-def _supertrend_bias(df: pl.DataFrame) -> Tuple[str, Optional[float]]:
-    if st_compute is None or df.is_empty():
-        return "Neutral", None
-    try:
-        st_df = st_compute(df)  # must return "supertrend" & "supertrend_dir"
-        bias = str(st_df["supertrend_dir"].tail(1).item())
-        val = float(st_df["supertrend"].tail(1).item())
-        return bias, val
-    except Exception:
-        return "Neutral", None
+    Same rules as the per-symbol loop this replaced: score clamped to 0..10,
+    BUY ≥ 8, SELL ≤ 3, HOLD otherwise; reasons in rule order.
+    """
+    cmp_, vwap, e50 = pl.col("cmp"), pl.col("vwap"), pl.col("ema50")
+    e20, e200 = pl.col("ema20"), pl.col("ema200")
+    rsi, st = pl.col("rsi"), pl.col("supertrend")
 
+    stack_ok = (pl.col("daily_bars") >= 200) & e20.is_not_null() & e50.is_not_null() & e200.is_not_null()
+    ema_bias = (
+        pl.when(stack_ok & (e20 > e50) & (e50 > e200)).then(pl.lit("Bullish"))
+        .when(stack_ok & (e20 < e50) & (e50 < e200)).then(pl.lit("Bearish"))
+        .otherwise(pl.lit("Neutral"))
+    )
+    st_bias = (
+        pl.when(cmp_ > st).then(pl.lit("Bullish"))
+        .when(cmp_ < st).then(pl.lit("Bearish"))
+        .otherwise(pl.lit("Neutral"))
+    )
+    has_vwap = cmp_.is_not_null() & vwap.is_not_null()
+    has_e50 = cmp_.is_not_null() & e50.is_not_null()
+
+    rules = [  # (points, reason)
+        (
+            pl.when(pl.col("ema_bias") == "Bullish").then(3).when(pl.col("ema_bias") == "Bearish").then(-2),
+            pl.when(pl.col("ema_bias") == "Bullish").then(pl.lit("EMA stack ↑"))
+            .when(pl.col("ema_bias") == "Bearish").then(pl.lit("EMA stack ↓")),
+        ),
+        (
+            pl.when(pl.col("supertrend_bias") == "Bullish").then(2)
+            .when(pl.col("supertrend_bias") == "Bearish").then(-2),
+            pl.when(pl.col("supertrend_bias") == "Bullish").then(pl.lit("Supertrend ↑"))
+            .when(pl.col("supertrend_bias") == "Bearish").then(pl.lit("Supertrend ↓")),
+        ),
+        (
+            pl.when(rsi >= 60).then(2).when(rsi <= 45).then(-2),
+            pl.when(rsi >= 60).then(pl.lit("RSI strong")).when(rsi <= 45).then(pl.lit("RSI weak")),
+        ),
+        (
+            pl.when(has_vwap & (cmp_ > vwap)).then(1),
+            pl.when(has_vwap).then(
+                pl.when(cmp_ > vwap).then(pl.lit("Price > VWAP")).otherwise(pl.lit("Price ≤ VWAP"))
+            ),
+        ),
+        (
+            pl.when(has_e50 & (cmp_ > e50)).then(2),
+            pl.when(has_e50).then(
+                pl.when(cmp_ > e50).then(pl.lit("Price > EMA50")).otherwise(pl.lit("Price ≤ EMA50"))
+            ),
+        ),
+    ]
+    score = pl.sum_horizontal(pts.fill_null(0) for pts, _ in rules).clip(0, 10).cast(pl.Int64)
+
+    return (
+        features.with_columns(ema_bias.alias("ema_bias"), st_bias.alias("supertrend_bias"))
+        .with_columns(
+            score.alias("score"),
+            pl.concat_list(reason for _, reason in rules).list.drop_nulls().alias("reasons"),
+            pl.when(has_vwap & (cmp_ > vwap)).then(pl.lit("Above VWAP"))
+            .when(has_vwap & (cmp_ < vwap)).then(pl.lit("Below VWAP"))
+            .otherwise(pl.lit("Neutral"))
+            .alias("vwap_zone"),
+        )
+        .with_columns(
+            pl.when(pl.col("score") >= 8).then(pl.lit("BUY"))
+            .when(pl.col("score") <= 3).then(pl.lit("SELL"))
+            .otherwise(pl.lit("HOLD"))
+            .alias("decision")
+        )
+    )
 
-def _vwap_zone(cmp_: Optional[float], vwap_: Optional[float]) -> str:
-    if cmp_ is None or vwap_ is None:
-        return "Neutral"
-    if cmp_ > vwap_:
-        return "Above VWAP"
-    if cmp_ < vwap_:
-        return "Below VWAP"
-    return "Neutral"
-
-
-def _score_and_reasons(
-    ema_bias: str,
-    supertrend_bias: str,
-    rsi_val: Optional[float],
-    cmp_: Optional[float],
-    vwap_: Optional[float],
-    e50_last: Optional[float],
-) -> Tuple[int, List[str]]:
-    score = 0
-    reasons: List[str] = []
-    if ema_bias == "Bullish":
-        score += 3
-        reasons.append("EMA stack ↑")
-    elif ema_bias == "Bearish":
-        score -= 2
-        reasons.append("EMA stack ↓")
-
-    if supertrend_bias == "Bullish":
-        score += 2
-        reasons.append("Supertrend ↑")
-    elif supertrend_bias == "Bearish":
-        score -= 2
-        reasons.append("Supertrend ↓")
-
-    if rsi_val is not None:
-        if rsi_val >= 60:
-            score += 2
-            reasons.append("RSI strong")
-        elif rsi_val <= 45:
-            score -= 2
-            reasons.append("RSI weak")
 
-    if cmp_ is not None and vwap_ is not None:
-        if cmp_ > vwap_:
-            score += 1
-            reasons.append("Price > VWAP")
-        else:
-            reasons.append("Price ≤ VWAP")
+def _symbols() -> List[str]:
+    return list(
+        SETTINGS.DEFAULTS.get("INTRADAY_SYMBOLS")  # prefer configured list
+        or SETTINGS.DEFAULTS.get("SYMBOLS")
+        or []
+    )
 
-    if cmp_ is not None and e50_last is not None:
-        if cmp_ > e50_last:
-            score += 2
-            reasons.append("Price > EMA50")
-        else:
-            reasons.append("Price ≤ EMA50")
 
-    # clamp to 0..10 for readability
-    score = max(0, min(10, score))
-    return score, reasons
+def _prev_session(next_session: date) -> date:
+    return last_trading_day(next_session - timedelta(days=1))
 
 
 # --------------------- core forecast ---------------------
 async def forecast_next_session(next_session: date) -> List[ForecastRow]:
-    """Compute BUY/SELL/HOLD + reasons for the next trading day."""
-    symbols: List[str] = (
-        SETTINGS.DEFAULTS.get("INTRADAY_SYMBOLS")  # prefer configured list
-        or SETTINGS.DEFAULTS.get("SYMBOLS")
-        or []
-    )
+    """Compute BUY/SELL/HOLD + reasons for the next trading day.
+
+    Reads the EOD feature store (services.eod_features); only symbols the
+    post-close job missed are computed here, then everything is scored in
+    one pass.
+    """
+    symbols = _symbols()
     if not symbols:
         log.warning("[Forecast] No symbols in settings; nothing to do.")
         return []
 
     log.info(f"[Forecast] Preparing plan for {next_session.isoformat()} on {len(symbols)} symbols")
 
-    out: List[ForecastRow] = []
-    for sym in symbols:
-        try:
-            _ = resolve_instrument(sym)  # validates we know this instrument
-        except Exception:
-            log.warning(f"[Forecast] Unknown instrument key for {sym}; skipping")
-            continue
-
-        # fetch sources
-        daily = await _daily_df(sym, days_window=30, bars_fallback=240)
-        intra = await _intraday_df(sym, "15m", 200)
-
-        if daily.is_empty() and intra.is_empty():
-            log.warning(f"[Forecast] No data for {sym}")
-            continue
-
-        # last close (pref: intraday last close, else daily last close)
-        cmp_: Optional[float] = None
-        if not intra.is_empty():
-            cmp_ = float(intra["close"].tail(1).item())
-        elif not daily.is_empty():
-            cmp_ = float(daily["close"].tail(1).item())
-
-        # indicators (DRY)
-        ema_bias = _ema_bias(daily)
-        rsi_val = rsi_last((intra if not intra.is_empty() else daily)["close"].cast(pl.Float64, strict=False), 14)
-        vwap_val = vwap_last(intra if not intra.is_empty() else daily)
-        _ = atr_last(daily, 14)  # not used in score now, but available for SL sizing
-        cpr = cpr_from_prev_day(intra if not intra.is_empty() else daily)  # available if needed
-        obv = obv_trend(intra if not intra.is_empty() else daily)          # available if needed
-        st_bias, _st_val = _supertrend_bias(intra if not intra.is_empty() else daily)
-
-        e50_last = None
-        if not daily.is_empty():
-            e50_last = _fmt_last(ema(daily, 50))
-
-        vwap_zone = _vwap_zone(cmp_, vwap_val)
-        score, reasons = _score_and_reasons(ema_bias, st_bias, rsi_val, cmp_, vwap_val, e50_last)
-        decision = _buy_sell_hold(score)
+    session = _prev_session(next_session)
+    feats = load_features(before=next_session, symbols=symbols).filter(pl.col("session") == session)
+    # Symbols the EOD job tried and found no data for count as covered
+    if not set(symbols) <= attempted(session):
+        log.info(f"[Forecast] Feature store incomplete for {session} — filling gaps")
+        feats = (await build_eod_features(symbols, session=session)).filter(
+            pl.col("symbol").is_in(symbols)
+        )
+    if feats.is_empty():
+        return []
 
-        out.append(
-            ForecastRow(
-                symbol=sym,
-                cmp=cmp_,
-                score=score,
-                decision=decision,
-                reasons=reasons,
-                ema_bias=ema_bias,
-                rsi=rsi_val,
-                vwap_zone=vwap_zone,
-                supertrend_bias=st_bias,
-            )
+    scored = score_forecast(feats)
+    out = [
+        ForecastRow(
+            symbol=r["symbol"],
+            cmp=r["cmp"],
+            score=r["score"],
+            decision=r["decision"],
+            reasons=r["reasons"],
+            ema_bias=r["ema_bias"],
+            rsi=r["rsi"],
+            vwap_zone=r["vwap_zone"],
+            supertrend_bias=r["supertrend_bias"],
         )
+        for r in scored.iter_rows(named=True)
+    ]
 
     # persist compact snapshot for server & cockpit
     if out:
@@ -267,6 +192,11 @@ async def forecast_next_session(next_session: date) -> List[ForecastRow]:
     return out
 
 
+async def run_eod(symbols: Optional[List[str]] = None, session: Optional[date] = None) -> pl.DataFrame:
+    """Post-close job: persist today's feature rows for the configured universe."""
+    return await build_eod_features(symbols or _symbols(), session=session)
+
+
 # --------------------- CLI entry ---------------------
 def run_cli(next_session: Optional[date] = None):
     next_d = next_session or (date.today() + timedelta(days=1))
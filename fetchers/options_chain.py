@@ -1,19 +1,28 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/fetchers/options_chain.py — v1.0
-# Upstox options chain fetcher (schema-driven, Polars-only)
+# queen/fetchers/options_chain.py — v1.2
+# Upstox options chain fetcher (schema-driven, Polars-only, async batch)
 # ============================================================
 from __future__ import annotations
 
+import asyncio
 import os
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 import httpx
 import polars as pl
 
+from queen.helpers.fno_universe import list_fno_symbols, select_expiry
+from queen.helpers.instruments import resolve_instrument
 from queen.helpers.logger import log
+from queen.helpers.market import MARKET_TZ
+from queen.helpers.options_catalog import get_atm_ladder
 from queen.helpers.options_schema import get_options_schema
+from queen.helpers.rate_limiter import limiter
+from queen.settings import settings as SETTINGS
 
 
 class OptionsAPIError(Exception):
@@ -58,22 +67,8 @@ def _handle_error(
     raise OptionsAPIError(msg)
 
 
-def fetch_option_chain(
-    req: OptionsChainRequest,
-    *,
-    timeout: float = 10.0,
-) -> pl.DataFrame:
-    """Fetch PUT/CALL option chain for a given underlying instrument_key.
-
-    Returns:
-        Polars DataFrame with one row per option contract.
-        Columns are directly from Upstox JSON (no renaming yet).
-
-    Note:
-        - This is a pure data fetch; scoring / signals sit on top.
-        - F&O gating (only call for F&O symbols) will be handled upstream.
-
-    """
+def _request_parts(req: OptionsChainRequest) -> Tuple[str, str, Dict[str, Any]]:
+    """(method, url, params) for ``req`` from the options schema."""
     schema = get_options_schema("upstox")
     ep = schema.option_chain_def()
 
@@ -110,22 +105,10 @@ def fetch_option_chain(
         )
         params[side_key] = req.side
 
-    token = _auth_token()
-    headers = _build_headers(token)
+    return method, url, params
 
-    log.info(
-        f"[OptionsChain] Fetching chain for {req.instrument_key} "
-        f"expiry={req.expiry_date or 'nearest'} side={req.side or 'both'}"
-    )
-
-    with httpx.Client(timeout=timeout) as client:
-        resp = client.request(
-            method=method,
-            url=url,
-            headers=headers,
-            params=params,
-        )
 
+def _parse_response(resp: httpx.Response, req: OptionsChainRequest) -> pl.DataFrame:
     if resp.status_code != 200:
         _handle_error(resp, info=f"Option chain {req.instrument_key}")
 
@@ -153,13 +136,215 @@ def fetch_option_chain(
             f"type={type(data)!r}"
         )
 
-    df = pl.DataFrame(data)
+    return pl.DataFrame(data)
+
+
+def fetch_option_chain(
+    req: OptionsChainRequest,
+    *,
+    timeout: float = 10.0,
+) -> pl.DataFrame:
+    """Fetch PUT/CALL option chain for a given underlying instrument_key.
+
+    Returns:
+        Polars DataFrame with one row per option contract.
+        Columns are directly from Upstox JSON (no renaming yet).
+
+    Note:
+        - This is a pure data fetch; scoring / signals sit on top.
+        - F&O gating (only call for F&O symbols) will be handled upstream.
+        - For many underlyings use ``fetch_chains`` (async, pooled, cached).
+
+    """
+    method, url, params = _request_parts(req)
+    headers = _build_headers(_auth_token())
+
+    log.info(
+        f"[OptionsChain] Fetching chain for {req.instrument_key} "
+        f"expiry={req.expiry_date or 'nearest'} side={req.side or 'both'}"
+    )
+
+    with httpx.Client(timeout=timeout) as client:
+        resp = client.request(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+    df = _parse_response(resp, req)
     log.info(
         f"[OptionsChain] Received {df.height} contracts for {req.instrument_key}"
     )
     return df
 
 
+# ------------------------------------------------------------
+# Async batch path (pooled client + rate limiter + TTL cache)
+# ------------------------------------------------------------
+def _cfg() -> Dict[str, Any]:
+    return dict(getattr(SETTINGS, "FETCH", {}).get("OPTIONS_CHAIN", {}) or {})
+
+
+# (instrument_key, expiry, side) → (monotonic fetched_at, raw chain)
+_CHAIN_CACHE: Dict[Tuple[str, Optional[str], Optional[str]], Tuple[float, pl.DataFrame]] = {}
+
+
+async def fetch_option_chain_async(
+    req: OptionsChainRequest,
+    *,
+    client: Optional[httpx.AsyncClient] = None,
+    ttl: Optional[float] = None,
+) -> pl.DataFrame:
+    """Async ``fetch_option_chain``; served from cache for ``ttl`` seconds."""
+    cfg = _cfg()
+    ttl = float(cfg.get("TTL_S", 20) if ttl is None else ttl)
+    key = (req.instrument_key, req.expiry_date, req.side)
+    hit = _CHAIN_CACHE.get(key)
+    if hit is not None and time.monotonic() - hit[0] < ttl:
+        return hit[1]
+
+    method, url, params = _request_parts(req)
+    headers = _build_headers(_auth_token())
+    own = client is None
+    if own:
+        client = httpx.AsyncClient(timeout=float(cfg.get("TIMEOUT_S", 10.0)))
+    try:
+        async with limiter(str(cfg.get("RATE_KEY", "options_chain"))):
+            resp = await client.request(method=method, url=url, headers=headers, params=params)
+    finally:
+        if own:
+            await client.aclose()
+
+    df = _parse_response(resp, req)
+    _CHAIN_CACHE[key] = (time.monotonic(), df)
+    return df
+
+
+def _field(col: str, dtype: pl.DataType, *path: str) -> pl.Expr:
+    """Nested struct field (null if any level is missing)."""
+    expr, cur = pl.col(col), dtype
+    for name in path:
+        fields = {f.name: f.dtype for f in getattr(cur, "fields", [])}
+        if name not in fields:
+            return pl.lit(None)
+        expr, cur = expr.struct.field(name), fields[name]
+    return expr
+
+
+def to_long_chain(df: pl.DataFrame, underlying: Optional[str] = None) -> pl.DataFrame:
+    """Upstox chain rows (call_options/put_options structs) → one row per contract.
+
+    Columns: underlying, expiry, strike_price, instrument_type (CE/PE),
+    instrument_key, open_interest, prev_open_interest, close, prev_close,
+    volume, iv, underlying_spot_price. Frames already in long form pass through.
+    """
+    if df.is_empty() or "instrument_type" in df.columns or "strike_price" not in df.columns:
+        return df
+    sides = []
+    for col, typ in (("call_options", "CE"), ("put_options", "PE")):
+        if col not in df.columns:
+            continue
+        dt = df.schema[col]
+        sides.append(
+            df.select(
+                pl.lit(underlying).cast(pl.Utf8).alias("underlying"),
+                (pl.col("expiry") if "expiry" in df.columns else pl.lit(None)).cast(pl.Utf8).alias("expiry"),
+                pl.col("strike_price").cast(pl.Float64),
+                pl.lit(typ).alias("instrument_type"),
+                _field(col, dt, "instrument_key").cast(pl.Utf8).alias("instrument_key"),
+                _field(col, dt, "market_data", "oi").cast(pl.Float64).alias("open_interest"),
+                _field(col, dt, "market_data", "prev_oi").cast(pl.Float64).alias("prev_open_interest"),
+                _field(col, dt, "market_data", "ltp").cast(pl.Float64).alias("close"),
+                _field(col, dt, "market_data", "close_price").cast(pl.Float64).alias("prev_close"),
+                _field(col, dt, "market_data", "volume").cast(pl.Float64).alias("volume"),
+                _field(col, dt, "option_greeks", "iv").cast(pl.Float64).alias("iv"),
+                (pl.col("underlying_spot_price") if "underlying_spot_price" in df.columns else pl.lit(None))
+                .cast(pl.Float64)
+                .alias("underlying_spot_price"),
+            )
+        )
+    return pl.concat(sides) if sides else pl.DataFrame()
+
+
+def trim_strike_window(
+    df: pl.DataFrame,
+    ltp: Optional[float | Dict[str, float]] = None,
+    width: Optional[int] = None,
+) -> pl.DataFrame:
+    """Keep ATM±``width`` strikes per underlying, for display/persistence only.
+
+    ``ltp`` is one spot or a {underlying: spot} map; missing spots fall back
+    to ``underlying_spot_price``. Width defaults to FETCH[OPTIONS_CHAIN]
+    STRIKE_WINDOW. Chain-wide stats (PCR, max pain) must use the full chain.
+    """
+    if df.is_empty() or "strike_price" not in df.columns:
+        return df
+    width = int(width if width is not None else _cfg().get("STRIKE_WINDOW", 10))
+    spots = {k.upper(): v for k, v in ltp.items()} if isinstance(ltp, dict) else {}
+    parts = df.partition_by("underlying", maintain_order=True) if "underlying" in df.columns else [df]
+
+    out = []
+    for part in parts:
+        spot = ltp if not isinstance(ltp, dict) else None
+        if spots and "underlying" in part.columns:
+            spot = spots.get(str(part["underlying"][0]).upper())
+        if spot is None and "underlying_spot_price" in part.columns:
+            spot = part["underlying_spot_price"].drop_nulls().first()
+        if spot is None:
+            out.append(part)
+            continue
+        strikes = part["strike_price"].drop_nulls().unique().sort().to_list()
+        window = get_atm_ladder(strikes, float(spot), width=width).get("window") or []
+        out.append(part.filter(pl.col("strike_price").is_in(window)))
+    return pl.concat(out, how="diagonal_relaxed")
+
+
+def _expiry_iso(symbol: str, mode: str) -> Optional[str]:
+    exp = select_expiry(symbol, mode)
+    if exp is None:
+        return None
+    return datetime.fromtimestamp(int(exp) / 1000, tz=MARKET_TZ).date().isoformat()
+
+
+async def fetch_chains(
+    symbols: Optional[Iterable[str]] = None,
+    *,
+    mode: str = "intraday",
+    concurrency: Optional[int] = None,
+) -> pl.DataFrame:
+    """Full long chain frame (see ``to_long_chain``) for many underlyings at once.
+
+    Defaults to the whole F&O list; all requests share one pooled client and
+    the "options_chain" rate limiter. Failed underlyings are logged and skipped.
+    Every strike is kept; use ``trim_strike_window`` for display.
+    """
+    cfg = _cfg()
+    syms = [s.upper() for s in (symbols if symbols is not None else list_fno_symbols())]
+    n = int(concurrency or cfg.get("MAX_CONCURRENCY", 16))
+    sem = asyncio.Semaphore(n)
+
+    limits = httpx.Limits(max_connections=n, max_keepalive_connections=n)
+    async with httpx.AsyncClient(timeout=float(cfg.get("TIMEOUT_S", 10.0)), limits=limits) as client:
+
+        async def _one(sym: str) -> pl.DataFrame:
+            req = OptionsChainRequest(instrument_key=resolve_instrument(sym), expiry_date=_expiry_iso(sym, mode))
+            async with sem:
+                raw = await fetch_option_chain_async(req, client=client)
+            return to_long_chain(raw, sym)
+
+        results = await asyncio.gather(*(_one(s) for s in syms), return_exceptions=True)
+
+    frames = []
+    for sym, r in zip(syms, results):
+        if isinstance(r, BaseException):
+            log.warning(f"[OptionsChain] {sym} skipped → {r}")
+        elif not r.is_empty():
+            frames.append(r)
+    log.info(f"[OptionsChain] {len(frames)}/{len(syms)} chains fetched")
+    return pl.concat(frames, how="diagonal_relaxed") if frames else pl.DataFrame()
+
+
 # ------------------------------------------------------------
 # CLI usage for quick manual tests:
 #   python -m queen.fetchers.options_chain "NSE_EQ|GROWW" 2024-12-26 call
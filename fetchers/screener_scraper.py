@@ -7,8 +7,12 @@ Screener.in Fundamentals Scraper - Full Data Extraction
 
 Features:
     - Multi-threaded parallel fetching (ThreadPoolExecutor)
+    - Async mode: pooled httpx client + shared token bucket + process-pool parse
+    - lxml XPath parsing (BeautifulSoup fallback)
     - Token bucket rate limiting
-    - Automatic checkpointing and resume
+    - Automatic checkpointing and resume (append-only JSONL)
+    - Conditional refresh: ETag/Last-Modified + content hash per symbol,
+      results-window aware skipping (--full-refresh to disable)
     - Complete data extraction: Growth, Peers, Pledge, etc.
     - Integrated with queen.settings
 
@@ -16,6 +20,7 @@ Usage:
     python -m queen.fetchers.fundamentals_scraper --symbol TCS
     python -m queen.fetchers.fundamentals_scraper RELIANCE TCS INFY
     python -m queen.fetchers.fundamentals_scraper --batch universe.csv --workers 4
+    python -m queen.fetchers.fundamentals_scraper --batch universe.csv --async --concurrency 8
     python -m queen.fetchers.fundamentals_scraper --analyze data/fundamentals/raw/TCS.html
 
 Requirements:
@@ -26,15 +31,17 @@ Requirements:
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
 import json
+import multiprocessing
 import os
 import random
 import re
 import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -129,6 +136,17 @@ class Config:
     RATE_LIMIT_RPM = 20
     RATE_LIMIT_BURST = 3
 
+    # Conditional refresh: skip symbols whose next results window has not
+    # opened (refetch anyway after REFRESH_MAX_AGE_DAYS)
+    CONDITIONAL_REFRESH = True
+    REFRESH_MAX_AGE_DAYS = 7
+    RESULT_LAG_DAYS = 45
+
+    # Async mode: concurrent fetches (pacing still comes from the rate limit)
+    # and processes for the HTML parse stage
+    ASYNC_CONCURRENCY = 8
+    PARSE_WORKERS = min(4, os.cpu_count() or 1)
+
     # Debug mode
     DEBUG = True
 
@@ -382,6 +400,22 @@ class ScrapeStats:
 # SESSION MANAGER (Thread-Safe)
 # ============================================================
 
+def _browser_headers() -> Dict[str, str]:
+    """Browser-like request headers with a random User-Agent."""
+    return {
+        "User-Agent": random.choice(Config.USER_AGENTS),
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Cache-Control": "max-age=0",
+    }
+
+
 class SessionManager:
     """Thread-safe HTTP session manager with rate limiting."""
 
@@ -397,18 +431,7 @@ class SessionManager:
         with self._lock:
             if thread_id not in self._sessions:
                 session = requests.Session()
-                session.headers.update({
-                    "User-Agent": random.choice(Config.USER_AGENTS),
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                    "Sec-Fetch-Dest": "document",
-                    "Sec-Fetch-Mode": "navigate",
-                    "Sec-Fetch-Site": "none",
-                    "Cache-Control": "max-age=0",
-                })
+                session.headers.update(_browser_headers())
                 self._sessions[thread_id] = session
             return self._sessions[thread_id]
 
@@ -429,7 +452,12 @@ class SessionManager:
             log.warning(f"Warm-up failed: {e}")
             return False
 
-    def get(self, url: str, retries: int = None) -> Optional[requests.Response]:
+    def get(
+        self,
+        url: str,
+        retries: int = None,
+        headers: Dict[str, str] = None,
+    ) -> Optional[requests.Response]:
         retries = retries or Config.MAX_RETRIES
         session = self._get_session()
 
@@ -443,9 +471,9 @@ class SessionManager:
                     session.headers["User-Agent"] = random.choice(Config.USER_AGENTS)
                     time.sleep(Config.RETRY_SLEEP_BASE * (2 ** attempt))
 
-                resp = session.get(url, timeout=Config.REQUEST_TIMEOUT)
+                resp = session.get(url, timeout=Config.REQUEST_TIMEOUT, headers=headers)
 
-                if resp.status_code == 200:
+                if resp.status_code in (200, 304):
                     return resp
                 elif resp.status_code == 404:
                     log.error(f"Page not found (404): {url}")
@@ -1210,48 +1238,171 @@ class DataExtractor:
         return None
 
 
+# ============================================================
+# FAST PARSER (lxml-backed soup for DataExtractor)
+# ============================================================
+
+try:
+    import lxml.html as _lxml_html
+    _HAS_LXML = True
+except ImportError:
+    _HAS_LXML = False
+
+
+class LxmlSoup:
+    """
+    Minimal BeautifulSoup-compatible view over an lxml element.
+
+    Implements only what DataExtractor calls (find/find_all by tag, id,
+    class and attrs; get_text; get), each as one compiled XPath. Skipping
+    the BeautifulSoup tree build makes a page parse several times faster
+    while DataExtractor's logic, and therefore its output, stays the same.
+    """
+
+    __slots__ = ("_el",)
+
+    def __init__(self, el):
+        self._el = el
+
+    @classmethod
+    def from_html(cls, html) -> "LxmlSoup":
+        return cls(_lxml_html.document_fromstring(html))
+
+    def __bool__(self) -> bool:
+        return True
+
+    @staticmethod
+    def _xpath(name, attrs=None, class_=None, id=None) -> str:
+        if name is None:
+            step = ".//*"
+        elif isinstance(name, (list, tuple)):
+            step = ".//*[" + " or ".join(f"self::{n}" for n in name) + "]"
+        else:
+            step = f".//{name}"
+
+        preds = []
+        for k, v in (attrs or {}).items():
+            preds.append(f"@{k}={_xpath_literal(v)}")
+        if id is not None:
+            preds.append(f"@id={_xpath_literal(id)}")
+        if class_ is not None:
+            preds.append(
+                "contains(concat(' ', normalize-space(@class), ' '), "
+                f"{_xpath_literal(' ' + class_ + ' ')})"
+            )
+        return step + "".join(f"[{p}]" for p in preds)
+
+    def find_all(self, name=None, attrs=None, class_=None, id=None) -> List["LxmlSoup"]:
+        return [LxmlSoup(e) for e in self._el.xpath(self._xpath(name, attrs, class_, id))]
+
+    def find(self, name=None, attrs=None, class_=None, id=None) -> Optional["LxmlSoup"]:
+        hits = self._el.xpath(f"({self._xpath(name, attrs, class_, id)})[1]")
+        return LxmlSoup(hits[0]) if hits else None
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        parts = self._el.xpath(".//text()[not(parent::script or parent::style)]")
+        if strip:
+            parts = [t.strip() for t in parts]
+            parts = [t for t in parts if t]
+        return separator.join(parts)
+
+    def get(self, key: str, default=None):
+        return self._el.get(key, default)
+
+
+def _xpath_literal(value: str) -> str:
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{p}'" for p in value.split("'")) + ")"
+
+
+def parse_company_html(html, symbol: str, fast: bool = True) -> Dict[str, Any]:
+    """Extract a Screener company page, via lxml when available."""
+    soup = LxmlSoup.from_html(html) if (fast and _HAS_LXML) else BS(html, "lxml")
+    return DataExtractor(soup, symbol).extract_all()
+
+
 # ============================================================
 # CHECKPOINT MANAGER
 # ============================================================
 
 class CheckpointManager:
-    """Thread-safe checkpoint management."""
+    """
+    Thread-safe, append-only checkpoint.
+
+    Each completed symbol is appended as one JSON line to
+    ``<checkpoint>.jsonl`` and flushed the moment it finishes, so progress
+    is never rewritten wholesale and a process crash loses at most the
+    line being written; ``save()`` additionally fsyncs. A legacy ``_checkpoint.json`` (full rewrite format) is still read.
+    """
 
     def __init__(self, checkpoint_file: Path):
         self.checkpoint_file = checkpoint_file
+        self.log_file = checkpoint_file.with_suffix(".jsonl")
         self._lock = threading.Lock()
         self._completed: Set[str] = set()
         self._results: Dict[str, Any] = {}
+        self._fh = None
         self._load()
 
     def _load(self):
-        if self.checkpoint_file.exists():
+        if self.checkpoint_file.exists() and self.checkpoint_file != self.log_file:
             try:
                 data = json.loads(self.checkpoint_file.read_text())
                 self._completed = set(data.get("completed", []))
                 self._results = data.get("results", {})
-                log.info(f"Loaded checkpoint: {len(self._completed)} symbols done")
             except Exception as e:
                 log.warning(f"Could not load checkpoint: {e}")
 
+        if self.log_file.exists():
+            with self.log_file.open("r", encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        rec = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # torn tail from an interrupted append
+                    sym = rec.get("symbol")
+                    if sym:
+                        self._completed.add(sym)
+                        self._results[sym] = rec.get("result", {})
+
+        if self._completed:
+            log.info(f"Loaded checkpoint: {len(self._completed)} symbols done")
+
     def is_completed(self, symbol: str) -> bool:
         with self._lock:
             return symbol in self._completed
 
     def mark_completed(self, symbol: str, result: Dict[str, Any]):
+        line = json.dumps(
+            {"symbol": symbol, "result": result, "ts": datetime.now().isoformat()},
+            ensure_ascii=False,
+            default=str,
+        )
         with self._lock:
             self._completed.add(symbol)
             self._results[symbol] = result
+            if self._fh is None:
+                self.log_file.parent.mkdir(parents=True, exist_ok=True)
+                self._fh = self.log_file.open("a", encoding="utf-8")
+            self._fh.write(line + "\n")
+            self._fh.flush()
 
     def save(self):
+        """Fsync appended lines to disk (no rewrite)."""
         with self._lock:
-            data = {
-                "completed": list(self._completed),
-                "results": self._results,
-                "timestamp": datetime.now().isoformat(),
-                "count": len(self._completed),
-            }
-            self.checkpoint_file.write_text(json.dumps(data, indent=2, default=str))
+            if self._fh is not None:
+                self._fh.flush()
+                os.fsync(self._fh.fileno())
+
+    def close(self):
+        self.save()
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
 
     def get_results(self) -> Dict[str, Any]:
         with self._lock:
@@ -1266,6 +1417,115 @@ class CheckpointManager:
 # THREADED SCRAPER
 # ============================================================
 
+try:
+    from queen.helpers.refresh_ledger import RefreshLedger
+except ImportError:
+    RefreshLedger = None
+
+
+def _make_ledger() -> Optional["RefreshLedger"]:
+    """Per-run refresh ledger next to the processed JSONs (None = full refresh)."""
+    if RefreshLedger is None or not Config.CONDITIONAL_REFRESH:
+        return None
+    return RefreshLedger(
+        Config.PROCESSED_DIR / "_refresh_ledger.json",
+        name="screener",
+        max_age=Config.REFRESH_MAX_AGE_DAYS * 86400,
+        result_lag_days=Config.RESULT_LAG_DAYS,
+    )
+
+
+def _load_processed(symbol: str) -> Optional[Dict[str, Any]]:
+    p = Config.PROCESSED_DIR / f"{symbol}.json"
+    if not p.exists():
+        return None
+    try:
+        return json.loads(p.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+
+def _latest_quarter(data: Dict[str, Any]) -> Optional[str]:
+    """Most recent quarter header (tables are ordered oldest -> newest)."""
+    for row in (data.get("quarters") or {}).values():
+        if isinstance(row, dict) and row:
+            return list(row)[-1]
+    return None
+
+
+def _refresh_headers(ledger: Optional["RefreshLedger"], symbol: str) -> Optional[Dict[str, str]]:
+    # Only ask for a 304 when there is a local copy to fall back on
+    if ledger is None or not (Config.PROCESSED_DIR / f"{symbol}.json").exists():
+        return None
+    return ledger.conditional_headers(symbol) or None
+
+
+def _reuse_if_unchanged(
+    ledger: Optional["RefreshLedger"],
+    symbol: str,
+    status: int,
+    headers: Any,
+    content: bytes,
+) -> Optional[Dict[str, Any]]:
+    """Record the response; return the stored JSON if the page did not change."""
+    if ledger is None:
+        return None
+    outcome = ledger.record_response(
+        symbol, status=status, headers=headers, content=content if status == 200 else None
+    )
+    if outcome == "changed":
+        return None
+    data = _load_processed(symbol)
+    if data is not None:
+        log.info(f"{symbol}: unchanged since last fetch ({outcome})")
+    return data
+
+
+def _plan_refresh(
+    ledger: Optional["RefreshLedger"],
+    symbols: List[str],
+    result_dates: Dict[str, Any] = None,
+) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+    """
+    Order symbols (known/due result dates first) and drop the ones whose
+    data cannot have changed; those are served from their processed JSON.
+    """
+    if ledger is None:
+        return symbols, {}
+    due, skipped = ledger.plan(symbols, result_dates=result_dates)
+    reused: Dict[str, Dict[str, Any]] = {}
+    for sym in skipped:
+        data = _load_processed(sym)
+        if data is None:
+            due.append(sym)
+        else:
+            reused[sym] = data
+            ledger.record_skip(sym)
+    if reused:
+        log.info(f"Conditional refresh: {len(reused)} symbols not due, {len(due)} to fetch")
+    return due, reused
+
+
+def _finish_batch(stats: ScrapeStats, all_results: Dict[str, Any]) -> Path:
+    """Write the combined results file and log the batch summary."""
+    combined_path = Config.PROCESSED_DIR / "_all_symbols.json"
+    combined_path.write_text(
+        json.dumps(all_results, indent=2, ensure_ascii=False, default=str),
+        encoding="utf-8"
+    )
+
+    log.success(f"\n{'='*60}")
+    log.success(f"Scraping complete!")
+    log.success(f"  Total: {stats.total}")
+    log.success(f"  Success: {stats.success}")
+    log.success(f"  Failed: {stats.failed}")
+    log.success(f"  Skipped: {stats.skipped}")
+    log.success(f"  Time: {time.time() - stats.start_time:.1f}s")
+    log.success(f"  Output: {combined_path}")
+    log.success(f"{'='*60}\n")
+    return combined_path
+
+
 class ThreadedFundamentalsScraper:
     """Multi-threaded scraper with rate limiting and checkpointing."""
 
@@ -1282,27 +1542,40 @@ class ThreadedFundamentalsScraper:
         Config.RAW_DIR.mkdir(parents=True, exist_ok=True)
         Config.PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
-    def scrape_symbol(self, symbol: str, save: bool = True) -> Dict[str, Any]:
+    def scrape_symbol(
+        self,
+        symbol: str,
+        save: bool = True,
+        ledger: Optional["RefreshLedger"] = None,
+    ) -> Dict[str, Any]:
         """Scrape fundamentals for a single symbol."""
         symbol = symbol.upper().strip()
         url = f"{Config.COMPANY_URL}{symbol}/"
 
         log.info(f"Scraping {symbol}...")
 
-        response = self.session_mgr.get(url)
+        response = self.session_mgr.get(url, headers=_refresh_headers(ledger, symbol))
         if not response:
             log.error(f"Failed to fetch {symbol}")
             return {"symbol": symbol, "_error": "Failed to fetch page"}
 
+        cached = _reuse_if_unchanged(
+            ledger, symbol, response.status_code, response.headers, response.content
+        )
+        if cached is not None:
+            return cached
+        if response.status_code == 304:
+            return {"symbol": symbol, "_error": "304 without a local copy"}
+
         # Save raw HTML
         if Config.DEBUG:
             raw_path = Config.RAW_DIR / f"{symbol}.html"
             raw_path.write_text(response.text, encoding="utf-8")
             log.debug(f"Saved raw HTML to {raw_path}")
 
-        soup = BS(response.content, "lxml")
-        extractor = DataExtractor(soup, symbol)
-        data = extractor.extract_all()
+        data = parse_company_html(response.content, symbol)
+        if ledger is not None:
+            ledger.set_period(symbol, _latest_quarter(data))
 
         if save:
             json_path = Config.PROCESSED_DIR / f"{symbol}.json"
@@ -1319,7 +1592,8 @@ class ThreadedFundamentalsScraper:
         symbol: str,
         checkpoint: CheckpointManager,
         stats: ScrapeStats,
-        save: bool = True
+        save: bool = True,
+        ledger: Optional["RefreshLedger"] = None,
     ) -> Tuple[str, Dict[str, Any]]:
         """Worker function for thread pool."""
 
@@ -1332,7 +1606,7 @@ class ThreadedFundamentalsScraper:
         time.sleep(random.uniform(Config.SYMBOL_SLEEP_MIN, Config.SYMBOL_SLEEP_MAX))
 
         try:
-            result = self.scrape_symbol(symbol, save=save)
+            result = self.scrape_symbol(symbol, save=save, ledger=ledger)
             success = bool(result.get("market_cap") or result.get("company_name"))
 
             if not result.get("_error"):
@@ -1350,9 +1624,17 @@ class ThreadedFundamentalsScraper:
         self,
         symbols: List[str],
         save: bool = True,
-        checkpoint_file: Path = None
+        checkpoint_file: Path = None,
+        result_dates: Dict[str, Any] = None,
     ) -> Dict[str, Dict[str, Any]]:
-        """Scrape multiple symbols in parallel."""
+        """
+        Scrape multiple symbols in parallel.
+
+        With Config.CONDITIONAL_REFRESH, symbols whose next results window
+        has not opened are served from their processed JSON; ``result_dates``
+        (symbol -> known announcement date) moves those symbols to the front
+        once the date has passed.
+        """
         symbols = [s.upper().strip() for s in symbols if s.strip()]
         checkpoint_file = checkpoint_file or Config.PROCESSED_DIR / "_checkpoint.json"
 
@@ -1367,21 +1649,28 @@ class ThreadedFundamentalsScraper:
             stats.success = already_done
             stats.skipped = already_done
 
+        ledger = _make_ledger()
+        remaining, reused = _plan_refresh(ledger, remaining, result_dates)
+        for _ in reused:
+            stats.increment(success=True, skipped=True)
+
         log.info(f"Parallel scrape: {len(remaining)} remaining of {len(symbols)} total")
         log.info(f"Workers: {self.max_workers}, Rate limit: {Config.RATE_LIMIT_RPM} req/min")
 
         if not remaining:
             log.success("All symbols already processed!")
-            return checkpoint.get_results()
+            if ledger is not None:
+                ledger.report()
+            return {**checkpoint.get_results(), **reused}
 
         self.session_mgr.warm_up()
 
-        results = {}
+        results = dict(reused)
 
         with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="Scraper") as executor:
             future_to_symbol = {
                 executor.submit(
-                    self._worker_scrape, symbol, checkpoint, stats, save
+                    self._worker_scrape, symbol, checkpoint, stats, save, ledger
                 ): symbol
                 for symbol in remaining
             }
@@ -1402,32 +1691,22 @@ class ThreadedFundamentalsScraper:
 
                 if completed_since_checkpoint >= Config.BATCH_CHECKPOINT_INTERVAL:
                     checkpoint.save()
+                    if ledger is not None:
+                        ledger.save()
                     log.info(f"Checkpoint saved. {stats.get_progress()}")
                     completed_since_checkpoint = 0
 
                 if stats.completed % 10 == 0:
                     log.info(stats.get_progress())
 
-        checkpoint.save()
+        checkpoint.close()
+        if ledger is not None:
+            ledger.save()
+            ledger.report()
 
         all_results = checkpoint.get_results()
         all_results.update(results)
-
-        combined_path = Config.PROCESSED_DIR / "_all_symbols.json"
-        combined_path.write_text(
-            json.dumps(all_results, indent=2, ensure_ascii=False, default=str),
-            encoding="utf-8"
-        )
-
-        log.success(f"\n{'='*60}")
-        log.success(f"Scraping complete!")
-        log.success(f"  Total: {stats.total}")
-        log.success(f"  Success: {stats.success}")
-        log.success(f"  Failed: {stats.failed}")
-        log.success(f"  Skipped: {stats.skipped}")
-        log.success(f"  Time: {time.time() - stats.start_time:.1f}s")
-        log.success(f"  Output: {combined_path}")
-        log.success(f"{'='*60}\n")
+        _finish_batch(stats, all_results)
 
         return all_results
 
@@ -1569,6 +1848,298 @@ class ThreadedFundamentalsScraper:
         print('='*70 + "\n")
 
 
+# ============================================================
+# ASYNC SCRAPER
+# ============================================================
+
+try:
+    import httpx
+    from queen.helpers.rate_limiter import AsyncTokenBucket
+    _HAS_ASYNC = True
+except ImportError:
+    _HAS_ASYNC = False
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2)
+    _HAS_H2 = True
+except ImportError:
+    _HAS_H2 = False
+
+
+def _parse_and_store(
+    html: bytes,
+    symbol: str,
+    save: bool,
+    raw_dir: str,
+    processed_dir: str,
+    debug: bool,
+) -> Dict[str, Any]:
+    """
+    Parse stage of the async scraper (runs in a worker process).
+
+    Directories are passed explicitly because spawned workers do not see
+    CLI overrides applied to Config in the parent.
+    """
+    Config.DEBUG = debug
+    if debug:
+        Path(raw_dir, f"{symbol}.html").write_bytes(html)
+
+    data = parse_company_html(html, symbol)
+
+    if save:
+        Path(processed_dir, f"{symbol}.json").write_text(
+            json.dumps(data, indent=2, ensure_ascii=False, default=str),
+            encoding="utf-8"
+        )
+    return data
+
+
+class AsyncFundamentalsScraper:
+    """
+    asyncio scraper: one pooled httpx client (HTTP/2 when ``h2`` is
+    installed), the shared AsyncTokenBucket for pacing, and page parsing
+    in a process pool so fetches keep flowing while pages are parsed.
+
+    Output files and checkpoint format match ThreadedFundamentalsScraper.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = None,
+        parse_workers: int = None,
+        transport: "httpx.AsyncBaseTransport" = None,
+    ):
+        if not _HAS_ASYNC:
+            raise RuntimeError("Async mode needs httpx and queen.helpers.rate_limiter")
+        self.concurrency = concurrency or Config.ASYNC_CONCURRENCY
+        self.parse_workers = Config.PARSE_WORKERS if parse_workers is None else parse_workers
+        self._transport = transport
+        self._pause_until = 0.0
+        Config.RAW_DIR.mkdir(parents=True, exist_ok=True)
+        Config.PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+
+    def _client(self) -> "httpx.AsyncClient":
+        return httpx.AsyncClient(
+            http2=_HAS_H2,
+            headers=_browser_headers(),
+            timeout=Config.REQUEST_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.concurrency,
+                max_keepalive_connections=self.concurrency,
+            ),
+            transport=self._transport,
+        )
+
+    async def _get(
+        self,
+        client: "httpx.AsyncClient",
+        bucket: "AsyncTokenBucket",
+        url: str,
+        headers: Dict[str, str] = None,
+    ) -> Optional["httpx.Response"]:
+        retries = Config.MAX_RETRIES
+
+        for attempt in range(retries):
+            if attempt > 0:
+                await asyncio.sleep(Config.RETRY_SLEEP_BASE * (2 ** attempt))
+
+            # A 429 pauses every in-flight task, not just the one that saw it
+            wait = self._pause_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            await bucket.acquire()
+
+            try:
+                req_headers = dict(headers or {})
+                if attempt:
+                    req_headers["User-Agent"] = random.choice(Config.USER_AGENTS)
+                resp = await client.get(url, headers=req_headers or None)
+            except httpx.TimeoutException:
+                log.warning(f"Timeout on attempt {attempt + 1}/{retries}")
+                continue
+            except httpx.HTTPError as e:
+                log.warning(f"Request error on attempt {attempt + 1}/{retries}: {e}")
+                continue
+
+            if resp.status_code in (200, 304):
+                return resp
+            elif resp.status_code == 404:
+                log.error(f"Page not found (404): {url}")
+                return None
+            elif resp.status_code == 429:
+                log.warning(f"Rate limited (429). Pausing {Config.BATCH_PAUSE_ON_429}s...")
+                self._pause_until = max(
+                    self._pause_until, time.monotonic() + Config.BATCH_PAUSE_ON_429
+                )
+            else:
+                log.warning(f"HTTP {resp.status_code} for {url}")
+
+        log.error(f"All {retries} attempts failed for {url}")
+        return None
+
+    async def _scrape_one(
+        self,
+        symbol: str,
+        client: "httpx.AsyncClient",
+        bucket: "AsyncTokenBucket",
+        sem: asyncio.Semaphore,
+        pool: Optional[ProcessPoolExecutor],
+        checkpoint: CheckpointManager,
+        stats: ScrapeStats,
+        save: bool,
+        ledger: Optional["RefreshLedger"] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        try:
+            async with sem:
+                resp = await self._get(
+                    client, bucket, f"{Config.COMPANY_URL}{symbol}/",
+                    headers=_refresh_headers(ledger, symbol),
+                )
+
+            if resp is None:
+                log.error(f"Failed to fetch {symbol}")
+                stats.increment(success=False)
+                return symbol, {"symbol": symbol, "_error": "Failed to fetch page"}
+
+            cached = _reuse_if_unchanged(ledger, symbol, resp.status_code, resp.headers, resp.content)
+            if cached is not None:
+                checkpoint.mark_completed(symbol, cached)
+                stats.increment(success=True, skipped=True)
+                return symbol, cached
+            if resp.status_code == 304:
+                stats.increment(success=False)
+                return symbol, {"symbol": symbol, "_error": "304 without a local copy"}
+
+            args = (
+                resp.content, symbol, save,
+                str(Config.RAW_DIR), str(Config.PROCESSED_DIR), Config.DEBUG,
+            )
+            if pool is not None:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(pool, _parse_and_store, *args)
+            else:
+                result = await asyncio.to_thread(_parse_and_store, *args)
+
+            checkpoint.mark_completed(symbol, result)
+            if ledger is not None:
+                ledger.set_period(symbol, _latest_quarter(result))
+            stats.increment(success=bool(result.get("market_cap") or result.get("company_name")))
+            if save:
+                log.success(f"Saved {symbol} to {symbol}.json")
+            return symbol, result
+
+        except Exception as e:
+            log.error(f"{symbol}: Error - {e}")
+            stats.increment(success=False)
+            return symbol, {"symbol": symbol, "_error": str(e)}
+
+    async def scrape(
+        self,
+        symbols: List[str],
+        save: bool = True,
+        checkpoint_file: Path = None,
+        result_dates: Dict[str, Any] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Scrape symbols concurrently; resumes from the same checkpoint and
+        applies the same conditional refresh as scrape_parallel().
+        """
+        symbols = [s.upper().strip() for s in symbols if s.strip()]
+        checkpoint_file = checkpoint_file or Config.PROCESSED_DIR / "_checkpoint.json"
+
+        checkpoint = CheckpointManager(checkpoint_file)
+        stats = ScrapeStats(total=len(symbols))
+
+        remaining = [s for s in symbols if not checkpoint.is_completed(s)]
+        already_done = len(symbols) - len(remaining)
+        if already_done > 0:
+            stats.completed = already_done
+            stats.success = already_done
+            stats.skipped = already_done
+
+        ledger = _make_ledger()
+        remaining, reused = _plan_refresh(ledger, remaining, result_dates)
+        for _ in reused:
+            stats.increment(success=True, skipped=True)
+
+        log.info(f"Async scrape: {len(remaining)} remaining of {len(symbols)} total")
+        log.info(
+            f"Concurrency: {self.concurrency}, parse workers: {self.parse_workers}, "
+            f"HTTP/2: {_HAS_H2}, Rate limit: {Config.RATE_LIMIT_RPM} req/min"
+        )
+
+        if not remaining:
+            log.success("All symbols already processed!")
+            if ledger is not None:
+                ledger.report()
+            return {**checkpoint.get_results(), **reused}
+
+        bucket = AsyncTokenBucket(
+            Config.RATE_LIMIT_RPM / 60.0,
+            name="screener",
+            diag=False,
+            burst=Config.RATE_LIMIT_BURST,
+        )
+        sem = asyncio.Semaphore(self.concurrency)
+        pool = None
+        if self.parse_workers > 1:
+            pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        results: Dict[str, Dict[str, Any]] = dict(reused)
+        try:
+            async with self._client() as client:
+                try:
+                    await bucket.acquire()
+                    await client.get(Config.BASE_URL)
+                except Exception as e:
+                    log.warning(f"Warm-up failed: {e}")
+
+                tasks = [
+                    asyncio.create_task(self._scrape_one(
+                        symbol, client, bucket, sem, pool, checkpoint, stats, save, ledger
+                    ))
+                    for symbol in remaining
+                ]
+                for done, fut in enumerate(asyncio.as_completed(tasks), 1):
+                    sym, data = await fut
+                    results[sym] = data
+                    if done % Config.BATCH_CHECKPOINT_INTERVAL == 0:
+                        checkpoint.save()
+                        if ledger is not None:
+                            ledger.save()
+                        log.info(f"Checkpoint saved. {stats.get_progress()}")
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            checkpoint.close()
+            if ledger is not None:
+                ledger.save()
+                ledger.report()
+
+        all_results = checkpoint.get_results()
+        all_results.update(results)
+        _finish_batch(stats, all_results)
+
+        return all_results
+
+    def run(
+        self,
+        symbols: List[str],
+        save: bool = True,
+        checkpoint_file: Path = None,
+        result_dates: Dict[str, Any] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Blocking wrapper around scrape()."""
+        return asyncio.run(self.scrape(
+            symbols, save=save, checkpoint_file=checkpoint_file, result_dates=result_dates
+        ))
+
+
 # ============================================================
 # CLI HELPERS
 # ============================================================
@@ -1748,6 +2319,9 @@ Examples:
     # Batch from CSV
     python fundamentals_scraper.py --batch universe.csv --workers 4
 
+    # Async batch (pooled client, process-pool parsing)
+    python fundamentals_scraper.py --batch universe.csv --async --concurrency 8
+
     # Analyze HTML structure
     python fundamentals_scraper.py --analyze data/fundamentals/raw/TCS.html
         """
@@ -1766,6 +2340,9 @@ Examples:
     parser.add_argument("--debug", action="store_true", help="Debug mode")
     parser.add_argument("--analyze", type=str, metavar="HTML", help="Analyze HTML")
     parser.add_argument("--rate-limit", type=int, default=Config.RATE_LIMIT_RPM, help="Req/min")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Async scraper mode")
+    parser.add_argument("--full-refresh", action="store_true", help="Refetch every symbol (ignore refresh ledger)")
+    parser.add_argument("--concurrency", type=int, default=Config.ASYNC_CONCURRENCY, help="Async fetches in flight")
 
     args = parser.parse_args()
 
@@ -1786,6 +2363,9 @@ Examples:
     if args.rate_limit:
         Config.RATE_LIMIT_RPM = args.rate_limit
 
+    if args.full_refresh:
+        Config.CONDITIONAL_REFRESH = False
+
     # Collect symbols
     symbols = []
 
@@ -1820,7 +2400,12 @@ Examples:
         len(symbols) > 5
     )
 
-    if use_parallel:
+    if use_parallel and args.use_async and _HAS_ASYNC:
+        log.info(f"ASYNC mode: {args.concurrency} in flight")
+        results = AsyncFundamentalsScraper(concurrency=args.concurrency).run(symbols, save=save)
+    elif use_parallel:
+        if args.use_async:
+            log.warning("Async mode unavailable (httpx/queen not importable); using threads")
         log.info(f"PARALLEL mode: {args.workers} workers")
         results = scraper.scrape_parallel(symbols, save=save)
     elif len(symbols) == 1:
@@ -9,6 +9,7 @@ import argparse
 import asyncio
 import time
 from datetime import date, timedelta
+from functools import lru_cache
 from math import ceil
 from typing import Any, Dict, Optional
 
@@ -23,9 +24,10 @@ from queen.helpers.instruments import (
 )
 from queen.helpers.intervals import to_fetcher_interval
 from queen.helpers.logger import log
+from queen.helpers.market import offset_working_day
 from queen.helpers.schema_adapter import (
-    SCHEMA,
     finalize_candle_df,
+    get_schema,
     handle_api_error,
     to_candle_df,
     validate_interval,
@@ -39,24 +41,40 @@ BROKER = SETTINGS.DEFAULTS["BROKER"]
 BROKER_CFG = SETTINGS.broker_config(BROKER)
 
 RETRY_CFG = BROKER_CFG.get("RETRY", {})
-API_BASE_URL = SCHEMA.get("base_url")
-if not API_BASE_URL:
-    raise RuntimeError(
-        "[UpstoxFetcher] 'base_url' missing in broker schema. "
-        'Add to api_upstox.json → { "base_url": "https://api.upstox.com/v3/" }'
-    )
 
 MAX_RETRIES = int(RETRY_CFG.get("MAX_RETRIES", 3))
 TIMEOUT = int(RETRY_CFG.get("TIMEOUT", 10))
 BACKOFF_BASE = float(RETRY_CFG.get("BACKOFF_BASE", 2))
 UPSTOX_ACCESS_TOKEN = getattr(SETTINGS, "UPSTOX_ACCESS_TOKEN", None)
 
-HISTORICAL_DEF = SCHEMA.get("historical_candle_api", {})
-INTRADAY_DEF = SCHEMA.get("intraday_candle_api", {})
 DEFAULT_INTERVALS = SETTINGS.DEFAULTS.get(
     "DEFAULT_INTERVALS", {"intraday": "5m", "daily": "1d"}
 )
 
+
+@lru_cache(maxsize=1)
+def _endpoints() -> Dict[str, Any]:
+    """Schema-derived endpoints, resolved on first fetch (not at import)."""
+    schema = get_schema()
+    base_url = schema.get("base_url")
+    if not base_url:
+        raise RuntimeError(
+            "[UpstoxFetcher] 'base_url' missing in broker schema. "
+            'Add to api_upstox.json → { "base_url": "https://api.upstox.com/v3/" }'
+        )
+    return {
+        "API_BASE_URL": base_url,
+        "HISTORICAL_DEF": schema.get("historical_candle_api", {}),
+        "INTRADAY_DEF": schema.get("intraday_candle_api", {}),
+    }
+
+
+def __getattr__(name: str):
+    if name in ("API_BASE_URL", "HISTORICAL_DEF", "INTRADAY_DEF"):
+        return _endpoints()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # ============================================================
 # 🧩 Per-timeframe FETCH override helper
 # ============================================================
@@ -152,7 +170,7 @@ async def _intraday_via_historical(
             from_d = start[:10]
         elif bars:
             est_days = _estimate_days_for_bars(unit, interval_num, int(bars))
-            from_d = (today - timedelta(days=est_days)).isoformat()
+            from_d = offset_working_day(today, -est_days).isoformat()
         else:
             from_d = (today - timedelta(days=int(days or 2))).isoformat()
         df = await fetch_daily_range(symbol, from_d, to_d, interval)
@@ -312,12 +330,13 @@ async def fetch_intraday(
 
     # Normal intraday "today" call (pure)
     instrument_key = resolve_instrument(symbol)
-    url_pattern = INTRADAY_DEF.get("url_pattern", "")
+    ep = _endpoints()
+    url_pattern = ep["INTRADAY_DEF"].get("url_pattern", "")
     if not url_pattern:
         log.error("[UpstoxFetcher] Intraday URL pattern missing in schema.")
         return pl.DataFrame()
 
-    url = f"{API_BASE_URL}{url_pattern}".format(
+    url = f"{ep['API_BASE_URL']}{url_pattern}".format(
         instrument_key=instrument_key,
         unit=unit,
         interval=interval_num,
@@ -356,12 +375,13 @@ async def fetch_daily_range(
         )
 
     instrument_key = resolve_instrument(symbol)
-    url_pattern = HISTORICAL_DEF.get("url_pattern", "")
+    ep = _endpoints()
+    url_pattern = ep["HISTORICAL_DEF"].get("url_pattern", "")
     if not url_pattern:
         log.error("[UpstoxFetcher] Historical URL pattern missing in schema.")
         return pl.DataFrame()
 
-    url = f"{API_BASE_URL}{url_pattern}".format(
+    url = f"{ep['API_BASE_URL']}{url_pattern}".format(
         instrument_key=instrument_key,
         unit=unit,
         interval=interval_num,
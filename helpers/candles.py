@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/helpers/candles.py — v1.1
-# Canonical candle helpers (CMP, ordering) on top of schema_adapter
+# queen/helpers/candles.py — v1.3
+# Canonical candle helpers (CMP, ordering, session resampling) on top of schema_adapter
 # ============================================================
 from __future__ import annotations
 
@@ -9,7 +9,9 @@ from typing import Optional
 
 import polars as pl
 
+from queen.helpers.intervals import parse_minutes
 from queen.helpers.logger import log
+from queen.helpers.market import MARKET_HOURS, MARKET_TZ_KEY
 
 
 def ensure_sorted(df: pl.DataFrame, ts_col: str = "timestamp") -> pl.DataFrame:
@@ -49,4 +51,74 @@ def last_close(df: pl.DataFrame) -> Optional[float]:
         return None
 
 
-__all__ = ["last_close", "ensure_sorted"]
+def _minutes_of(hhmm: str) -> int:
+    h, m = hhmm.split(":")[:2]
+    return int(h) * 60 + int(m)
+
+
+_OPEN_MIN = _minutes_of(MARKET_HOURS["OPEN"])
+_CLOSE_MIN = _minutes_of(MARKET_HOURS["CLOSE"])
+
+
+def _base_minutes(ts: pl.Series) -> int:
+    """Most common positive step between bars, in minutes."""
+    steps = ts.diff().dt.total_minutes().drop_nulls()
+    steps = steps.filter(steps > 0)
+    return int(steps.mode().min()) if steps.len() else 1
+
+
+def resample_session(
+    df: pl.DataFrame,
+    interval: str | int,
+    *,
+    ts_col: str = "timestamp",
+    base_minutes: Optional[int] = None,
+) -> pl.DataFrame:
+    """Session-aligned OHLCV resample via ``group_by_dynamic``.
+
+    Intraday windows start at the NSE open (09:15, 10:15 … for 1h) and the
+    last window of a day is cut at the close; "1d" gives one bar per session
+    labelled at local midnight. tz-aware input is converted to MARKET_TZ.
+
+    Adds ``is_partial``: the base bars do not yet cover the window up to its
+    end (or the session close) — i.e. the forming bar, or a gap.
+    """
+    if df.is_empty() or ts_col not in df.columns:
+        return df
+
+    token = str(interval).strip().lower()
+    if token in {"1d", "d", "day", "daily"}:
+        every, offset = "1d", None
+    else:
+        minutes = parse_minutes(interval)
+        if 1440 % minutes:
+            raise ValueError(f"[candles.resample_session] {interval!r} does not divide a day")
+        every, offset = f"{minutes}m", f"{_OPEN_MIN % minutes}m"
+
+    dtype = df.schema[ts_col]
+    if isinstance(dtype, pl.Datetime) and dtype.time_zone and dtype.time_zone != MARKET_TZ_KEY:
+        df = df.with_columns(pl.col(ts_col).dt.convert_time_zone(MARKET_TZ_KEY))
+    df = ensure_sorted(df, ts_col)
+    step = base_minutes or _base_minutes(df[ts_col])
+
+    aggs = [
+        pl.col(c).first() if c == "open"
+        else pl.col(c).max() if c == "high"
+        else pl.col(c).min() if c == "low"
+        else pl.col(c).sum() if c == "volume"
+        else pl.col(c).last()
+        for c in ("open", "high", "low", "close", "volume", "oi")
+        if c in df.columns
+    ]
+    out = df.group_by_dynamic(ts_col, every=every, offset=offset, label="left").agg(
+        *aggs, pl.col(ts_col).last().alias("_last")
+    )
+
+    ts = pl.col(ts_col)
+    close_ts = ts.dt.truncate("1d") + pl.duration(minutes=_CLOSE_MIN)
+    window_end = close_ts if every == "1d" else pl.min_horizontal(ts.dt.offset_by(every), close_ts)
+    covered = pl.col("_last") + pl.duration(minutes=step)
+    return out.with_columns((covered < window_end).alias("is_partial")).drop("_last")
+
+
+__all__ = ["last_close", "ensure_sorted", "resample_session"]
@@ -51,11 +51,19 @@ FNO = _df.select(_COLUMNS).unique()
 # Helpers
 # ============================================================
 
+_FNO_SYMBOLS = frozenset(FNO["asset_symbol"].drop_nulls().to_list())
+
+
 def is_fno(symbol: str) -> bool:
     """Check if symbol is part of F&O universe."""
     if not symbol:
         return False
-    return symbol.upper() in FNO["asset_symbol"].unique().to_list()
+    return symbol.upper() in _FNO_SYMBOLS
+
+
+def list_fno_symbols() -> List[str]:
+    """All F&O underlyings (sorted)."""
+    return sorted(_FNO_SYMBOLS)
 
 
 def get_expiries(symbol: str) -> List[int]:
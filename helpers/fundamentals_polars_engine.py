@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/helpers/fundamentals_polars_engine.py — v4.0 (SAFE AUTO-SCHEMA)
+# queen/helpers/fundamentals_polars_engine.py — v4.1 (SAFE AUTO-SCHEMA + SNAPSHOT)
 # ------------------------------------------------------------
 # Converts fundamentals JSON files to Polars DataFrame
 #
@@ -12,6 +12,11 @@
 #   - Deep tables (_quarters, _ratios, etc.) always Object
 #   - Numeric candidates cast with strict=False (bad strings -> null)
 #
+# Snapshot (v4.1):
+#   - _fundamentals_snapshot.parquet beside the JSONs, keyed by mtime/size
+#   - Unchanged universe => one parquet read; otherwise only changed
+#     files are reparsed (process pool for large batches)
+#
 # Public API:
 #   load_all(processed_dir)           - Load all JSONs to DataFrame
 #   load_one_processed(dir, symbol)   - Load single symbol
@@ -26,8 +31,12 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import polars as pl
 
@@ -69,6 +78,20 @@ except ImportError:
     HAS_SCHEMA = False
 
 
+# Consolidated parquet snapshot (lives next to the processed JSONs)
+SNAPSHOT_NAME = "_fundamentals_snapshot.parquet"
+_SNAPSHOT_VERSION = 1
+_SNAP_FILE = "__file"
+_SNAP_ROW = "__row"
+_META_VERSION = "queen.fundamentals.version"
+_META_MANIFEST = "queen.fundamentals.manifest"
+_META_OBJECTS = "queen.fundamentals.objects"
+
+# Parse in a process pool only when enough files changed to pay for it
+_LOAD_WORKERS = min(8, os.cpu_count() or 1)
+_POOL_MIN_FILES = 64
+
+
 # ============================================================
 # INTERNAL HELPERS
 # ============================================================
@@ -356,8 +379,12 @@ def build_df_from_rows(rows: Iterable[Dict[str, Any]]) -> pl.DataFrame:
     # Build safe auto-schema
     schema = _build_safe_schema(rows)
 
-    # Create DataFrame
-    df = pl.DataFrame(rows, schema=schema, strict=False)
+    # Create DataFrame column-wise (row-wise construction is ~8x slower
+    # with Object columns and yields the same frame)
+    df = pl.DataFrame([
+        pl.Series(c, [r.get(c) for r in rows], dtype=dt, strict=False)
+        for c, dt in schema.items()
+    ])
     df = _ensure_symbol_sector(df)
 
     # Safe numeric cast pass
@@ -366,12 +393,208 @@ def build_df_from_rows(rows: Iterable[Dict[str, Any]]) -> pl.DataFrame:
     return df
 
 
-def build_df_from_all_processed(processed_dir: Union[str, Path]) -> pl.DataFrame:
+def _parse_file(path: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Read, validate and adapt one processed JSON (process-pool worker).
+
+    Returns (row, None) on success or (None, reason) on failure; the
+    parent logs the reason so messages stay in the main log.
+    """
+    p = Path(path)
+    try:
+        raw = json.loads(p.read_text(encoding="utf-8"))
+    except Exception as e:
+        return None, f"JSON read failed: {p.name}: {e}"
+    if not raw:
+        return None, None
+
+    safe = _validate_or_fallback(raw, p.name)
+    try:
+        row = to_row(safe)
+    except Exception as e:
+        return None, f"Adapter failed for {p.name}: {e}"
+
+    if not (row.get("Symbol") or row.get("symbol")):
+        return None, f"Missing Symbol in {p.name}, skipped"
+    return row, None
+
+
+def _parse_files(
+    paths: List[Path],
+    workers: Optional[int],
+) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    """Parse files serially, or in a process pool for larger batches."""
+    n = workers if workers is not None else _LOAD_WORKERS
+    if n <= 1 or len(paths) < _POOL_MIN_FILES:
+        return [_parse_file(str(p)) for p in paths]
+
+    chunk = max(1, len(paths) // (n * 4))
+    try:
+        # spawn: forking a process that already runs polars threads can deadlock
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=n, mp_context=ctx) as pool:
+            return list(pool.map(_parse_file, [str(p) for p in paths], chunksize=chunk))
+    except Exception as e:
+        log.warning(f"[FUND-POLAR] Process pool unavailable ({e}); parsing serially")
+        return [_parse_file(str(p)) for p in paths]
+
+
+def _engine_fingerprint() -> str:
+    """
+    Cache key for the parsing code itself: snapshot version plus the
+    mtimes of the adapter/schema/map modules that shape a row.
+    """
+    parts = [str(_SNAPSHOT_VERSION)]
+    for mod in (to_row, FundamentalsModel if HAS_SCHEMA else None):
+        src = getattr(sys.modules.get(getattr(mod, "__module__", ""), None), "__file__", None)
+        if src:
+            try:
+                parts.append(f"{Path(src).name}:{os.stat(src).st_mtime_ns}")
+            except OSError:
+                pass
+    return "|".join(parts)
+
+
+def _file_stats(files: List[Path]) -> Dict[str, List[int]]:
+    """Manifest entries: file name -> [mtime_ns, size]."""
+    out: Dict[str, List[int]] = {}
+    for f in files:
+        st = f.stat()
+        out[f.name] = [st.st_mtime_ns, st.st_size]
+    return out
+
+
+def _read_snapshot(path: Path) -> Optional[Dict[str, Any]]:
+    """Return snapshot metadata if the parquet exists and was written by us."""
+    if not path.exists():
+        return None
+    try:
+        meta = pl.read_parquet_metadata(path)
+        return {
+            "version": meta.get(_META_VERSION),
+            "manifest": json.loads(meta.get(_META_MANIFEST, "{}")),
+            "objects": json.loads(meta.get(_META_OBJECTS, "[]")),
+        }
+    except Exception as e:
+        log.warning(f"[FUND-POLAR] Snapshot unreadable ({path.name}): {e}")
+        return None
+
+
+def _decode_objects(df: pl.DataFrame, objects: List[str]) -> pl.DataFrame:
+    """Restore JSON-encoded nested tables as Object columns."""
+    present = [c for c in objects if c in df.columns]
+    if not present:
+        return df
+    return df.with_columns(
+        pl.Series(
+            c,
+            [json.loads(v) if v is not None else None for v in df[c].to_list()],
+            dtype=pl.Object,
+        )
+        for c in present
+    )
+
+
+def _snapshot_rows(
+    path: Path,
+    objects: List[str],
+    keep: List[str],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Rebuild adapter rows for unchanged files from the snapshot.
+
+    ``__row`` holds each row's scalar fields verbatim (pre-cast); nested
+    tables are only stored once, in their Object columns.
+    """
+    snap = pl.read_parquet(path).filter(pl.col(_SNAP_FILE).is_in(keep))
+    present = [c for c in objects if c in snap.columns]
+    nested = {
+        c: [json.loads(v) if v is not None else None for v in snap[c].to_list()]
+        for c in present
+    }
+
+    out: Dict[str, Dict[str, Any]] = {}
+    for i, (f, raw) in enumerate(zip(snap[_SNAP_FILE].to_list(), snap[_SNAP_ROW].to_list())):
+        row = json.loads(raw)
+        for c in present:
+            if c in row:
+                row[c] = nested[c][i]
+        out[f] = row
+    return out
+
+
+def _write_snapshot(
+    path: Path,
+    df: pl.DataFrame,
+    row_files: List[str],
+    rows: List[Dict[str, Any]],
+    manifest: Dict[str, List[int]],
+    fingerprint: str,
+) -> None:
+    """
+    Persist the built DataFrame plus what is needed to rebuild its rows.
+
+    Object columns are stored as JSON text. ``__row`` keeps the scalar
+    adapter fields uncast so an incremental rebuild infers exactly the
+    same schema as a full reparse.
+    """
+    objects = [c for c, dt in df.schema.items() if dt == pl.Object]
+    obj_set = set(objects)
+    enc = df.with_columns(
+        pl.Series(
+            c,
+            [json.dumps(v) if v is not None else None for v in df[c].to_list()],
+            dtype=pl.Utf8,
+        )
+        for c in objects
+    ).with_columns(
+        pl.Series(_SNAP_FILE, row_files, dtype=pl.Utf8),
+        pl.Series(
+            _SNAP_ROW,
+            [
+                json.dumps({k: (None if k in obj_set else v) for k, v in r.items()})
+                for r in rows
+            ],
+            dtype=pl.Utf8,
+        ),
+    )
+
+    tmp = path.with_suffix(".tmp")
+    try:
+        enc.write_parquet(
+            tmp,
+            compression="zstd",
+            metadata={
+                _META_VERSION: fingerprint,
+                _META_MANIFEST: json.dumps(manifest),
+                _META_OBJECTS: json.dumps(objects),
+            },
+        )
+        os.replace(tmp, path)
+    except Exception as e:
+        log.warning(f"[FUND-POLAR] Snapshot write failed ({path.name}): {e}")
+        tmp.unlink(missing_ok=True)
+
+
+def build_df_from_all_processed(
+    processed_dir: Union[str, Path],
+    *,
+    use_cache: bool = True,
+    workers: Optional[int] = None,
+) -> pl.DataFrame:
     """
     Load all processed JSONs from directory into DataFrame.
 
+    A parquet snapshot (``_fundamentals_snapshot.parquet``) is kept next to
+    the JSONs, keyed by each file's mtime/size. When nothing changed the
+    snapshot is returned directly; otherwise only new or modified files are
+    reparsed (in a process pool for large batches) and merged with the
+    cached rows of the rest.
+
     Args:
         processed_dir: Path to processed JSON directory
+        use_cache: Read/write the parquet snapshot (False = always reparse)
+        workers: Parser processes (default: min(8, cpu count); 1 = serial)
 
     Returns:
         Polars DataFrame with all symbols
@@ -388,32 +611,71 @@ def build_df_from_all_processed(processed_dir: Union[str, Path]) -> pl.DataFrame
         log.warning(f"[FUND-POLAR] No processed JSONs in {processed_dir}")
         return pl.DataFrame()
 
-    rows: List[Dict[str, Any]] = []
-    log.info(f"[FUND-POLAR] Processing {len(files)} fundamental files...")
+    snap_path = processed_dir / SNAPSHOT_NAME
+    manifest = _file_stats(files)
+    fingerprint = _engine_fingerprint()
 
-    success_count = 0
-    error_count = 0
+    snap = _read_snapshot(snap_path) if use_cache else None
+    if snap and snap["version"] != fingerprint:
+        snap = None
 
-    for p in files:
-        raw = _read_json(p)
-        if not raw:
-            error_count += 1
-            continue
+    if snap and snap["manifest"] == manifest:
+        try:
+            schema = pl.read_parquet_schema(snap_path)
+            cols = [c for c in schema if c not in (_SNAP_FILE, _SNAP_ROW)]
+            df = _decode_objects(pl.read_parquet(snap_path, columns=cols), snap["objects"])
+            log.info(
+                f"[FUND-POLAR] Loaded snapshot: {df.height} symbols, "
+                f"{len(df.columns)} columns (0 reparsed)"
+            )
+            return df
+        except Exception as e:
+            log.warning(f"[FUND-POLAR] Snapshot decode failed, rebuilding: {e}")
+            snap = None
+
+    # Rows we can reuse: file unchanged since the snapshot was written
+    cached_rows: Dict[str, Dict[str, Any]] = {}
+    if snap:
+        old = snap["manifest"]
+        keep = [name for name, st in manifest.items() if old.get(name) == st]
+        if keep:
+            try:
+                cached_rows = _snapshot_rows(snap_path, snap["objects"], keep)
+            except Exception as e:
+                log.warning(f"[FUND-POLAR] Snapshot rows unreadable, full reparse: {e}")
+                cached_rows = {}
+        # Files that failed last time and are unchanged still fail: skip them
+        failed = {n for n in keep if n not in cached_rows} if cached_rows else set()
+    else:
+        failed = set()
 
-        safe = _validate_or_fallback(raw, p.name)
+    todo = [f for f in files if f.name not in cached_rows and f.name not in failed]
+    log.info(
+        f"[FUND-POLAR] Processing {len(todo)} fundamental files "
+        f"({len(cached_rows)} cached)..."
+    )
+    parsed = dict(zip((f.name for f in todo), _parse_files(todo, workers)))
 
-        try:
-            row = to_row(safe)
-            symbol = row.get("Symbol") or row.get("symbol")
-            if symbol:
-                rows.append(row)
-                success_count += 1
-            else:
-                log.warning(f"[FUND-POLAR] Missing Symbol in {p.name}, skipped")
+    rows: List[Dict[str, Any]] = []
+    row_files: List[str] = []
+    success_count = len(cached_rows)
+    error_count = len(failed)
+
+    for f in files:
+        if f.name in cached_rows:
+            row = cached_rows[f.name]
+        elif f.name in parsed:
+            row, err = parsed[f.name]
+            if row is None:
                 error_count += 1
-        except Exception as e:
-            log.error(f"[FUND-POLAR] Adapter failed for {p.name}: {e}")
-            error_count += 1
+                if err:
+                    log.warning(f"[FUND-POLAR] {err}")
+                continue
+            success_count += 1
+        else:
+            continue
+        rows.append(row)
+        row_files.append(f.name)
 
     if not rows:
         log.warning("[FUND-POLAR] No rows after adapter conversion")
@@ -421,9 +683,12 @@ def build_df_from_all_processed(processed_dir: Union[str, Path]) -> pl.DataFrame
 
     df = build_df_from_rows(rows)
 
+    if use_cache:
+        _write_snapshot(snap_path, df, row_files, rows, manifest, fingerprint)
+
     log.info(
         f"[FUND-POLAR] Built DataFrame: {df.height} symbols, {len(df.columns)} columns "
-        f"(success={success_count}, errors={error_count})"
+        f"(success={success_count}, errors={error_count}, reparsed={len(todo)})"
     )
 
     return df
@@ -433,12 +698,17 @@ def build_df_from_all_processed(processed_dir: Union[str, Path]) -> pl.DataFrame
 # BACK-COMPAT ALIAS (devcheck/smoke tests expect load_all)
 # ============================================================
 
-def load_all(processed_dir: Union[str, Path]) -> pl.DataFrame:
+def load_all(
+    processed_dir: Union[str, Path],
+    *,
+    use_cache: bool = True,
+    workers: Optional[int] = None,
+) -> pl.DataFrame:
     """
     Alias for build_df_from_all_processed().
     Maintained for backward compatibility.
     """
-    return build_df_from_all_processed(processed_dir)
+    return build_df_from_all_processed(processed_dir, use_cache=use_cache, workers=workers)
 
 
 # ============================================================
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/helpers/fundamentals_timeseries_engine.py — v2.0 (COMPATIBLE WITH SCRAPER v7.0)
+# queen/helpers/fundamentals_timeseries_engine.py — v3.0 (native list expressions)
 # ------------------------------------------------------------
 # Adds trend features over time-series fundamentals:
 #   • slopes (ROCE/ROE/Sales/Profit/EPS/NPA)
@@ -10,6 +10,9 @@
 #   • composite scores
 #
 # Zero pandas. Zero numpy. 100% Polars-safe.
+# Nested tables are flattened once per (table, metric) into
+# List[Float64] columns; every feature is a native polars
+# expression (no map_elements / row-wise UDFs).
 #
 # Input DF = output of fundamentals_polars_engine.load_all()
 # Deep tables live under: _quarters / _profit_loss / _balance_sheet / _ratios
@@ -65,95 +68,6 @@ def _series_values(series_dict: Dict[str, Any]) -> List[float]:
     return out
 
 
-def _first_last_slope(vals: List[float]) -> Optional[float]:
-    """Calculate simple slope: (last - first) / (n - 1)
-    Returns change per period.
-    """
-    if not vals or len(vals) < 2:
-        return None
-    n = len(vals)
-    return (vals[-1] - vals[0]) / max(1, n - 1)
-
-
-def _linear_regression_slope(vals: List[float]) -> Optional[float]:
-    """Calculate slope using simple linear regression.
-    More robust than first-last for noisy data.
-    """
-    if not vals or len(vals) < 3:
-        return _first_last_slope(vals)
-
-    n = len(vals)
-    x_mean = (n - 1) / 2.0
-    y_mean = sum(vals) / n
-
-    numerator = 0.0
-    denominator = 0.0
-
-    for i, y in enumerate(vals):
-        x_diff = i - x_mean
-        numerator += x_diff * (y - y_mean)
-        denominator += x_diff * x_diff
-
-    if denominator == 0:
-        return None
-
-    return numerator / denominator
-
-
-def _qoq_accel(vals: List[float]) -> Optional[float]:
-    """Calculate QoQ acceleration (second derivative).
-    Positive = accelerating growth, Negative = decelerating.
-    """
-    if not vals or len(vals) < 3:
-        return None
-    # (latest change) - (previous change)
-    return (vals[-1] - vals[-2]) - (vals[-2] - vals[-3])
-
-
-def _cv(vals: List[float]) -> Optional[float]:
-    """Calculate Coefficient of Variation (std / mean).
-    Lower CV = more stable earnings.
-    """
-    if not vals or len(vals) < 2:
-        return None
-
-    n = len(vals)
-    mean = sum(vals) / n
-
-    if mean == 0:
-        return None
-
-    variance = sum((x - mean) ** 2 for x in vals) / (n - 1)
-    std = variance ** 0.5
-
-    return std / abs(mean)
-
-
-def _growth_rate(vals: List[float]) -> Optional[float]:
-    """Calculate CAGR-like growth rate.
-    """
-    if not vals or len(vals) < 2:
-        return None
-
-    first = vals[0]
-    last = vals[-1]
-
-    if first == 0 or first is None:
-        return None
-
-    n = len(vals) - 1
-    if n <= 0:
-        return None
-
-    # Simple CAGR: (last/first)^(1/n) - 1
-    try:
-        if last / first < 0:
-            return None  # Can't take root of negative
-        return ((last / first) ** (1.0 / n) - 1) * 100
-    except (ValueError, ZeroDivisionError):
-        return None
-
-
 def _pick_series_from_table(
     table: Any,
     candidates: Sequence[str]
@@ -178,165 +92,154 @@ def _pick_series_from_table(
             if vals:
                 return vals
 
-    # Also try with common suffixes/variations
+    # Also try the "+" suffix Screener adds to expandable rows
     for k in candidates:
-        for suffix in ["", "+", " "]:
-            for prefix in ["", " "]:
-                key = f"{prefix}{k}{suffix}".strip()
-                sdict = table.get(key)
-                if _is_series_dict(sdict):
-                    vals = _series_values(sdict)
-                    if vals:
-                        return vals
+        sdict = table.get(f"{k}+")
+        if _is_series_dict(sdict):
+            vals = _series_values(sdict)
+            if vals:
+                return vals
 
     return None
 
 
-def _trend_label(slope: Optional[float], accel: Optional[float]) -> Optional[str]:
-    """Generate human-readable trend label from slope and acceleration.
+def _series_list(tables: Sequence[Any], candidates: Sequence[str]) -> pl.Series:
+    """Flatten one metric out of nested tables into a List[Float64] Series.
+
+    Built from a flat value buffer + row ids (no per-row list construction).
     """
-    if slope is None:
-        return None
+    flat: List[float] = []
+    rows: List[int] = []
+    for i, t in enumerate(tables):
+        vals = _pick_series_from_table(t, candidates)
+        if vals:
+            flat.extend(vals)
+            rows.extend([i] * len(vals))
+    nested = (
+        pl.DataFrame(
+            {"row": pl.Series(rows, dtype=pl.Int64), "v": pl.Series(flat, dtype=pl.Float64)}
+        )
+        .group_by("row", maintain_order=True)
+        .agg(pl.col("v"))
+    )
+    return (
+        pl.DataFrame({"row": pl.int_range(len(tables), eager=True, dtype=pl.Int64)})
+        .join(nested, on="row", how="left", maintain_order="left")
+        .get_column("v")
+    )
 
-    if slope > 0.5:
-        if accel is None or accel >= 0:
-            return "RISING"
-        return "RISING_BUT_SLOWING"
 
-    if slope < -0.5:
-        if accel is None or accel <= 0:
-            return "FALLING"
-        return "FALLING_BUT_RECOVERING"
+# ============================================================
+# POLARS EXPRESSION BUILDERS (native, over List[Float64])
+# ============================================================
 
-    return "FLAT"
+def _len(col: str) -> pl.Expr:
+    return pl.col(col).list.len().cast(pl.Float64)
 
 
-def _momentum_score(slope: Optional[float], cv: Optional[float]) -> Optional[float]:
-    """Calculate momentum score combining slope and stability.
-    Higher slope + lower CV = better momentum.
-    """
-    if slope is None:
-        return None
+def _first_last_slope_expr(col: str) -> pl.Expr:
+    """(last - first) / (n - 1); change per period."""
+    n = _len(col)
+    return pl.when(n >= 2).then(
+        (pl.col(col).list.last() - pl.col(col).list.first()) / (n - 1)
+    )
 
-    # Normalize slope to 0-1 range (assuming typical slopes are -10 to +10)
-    slope_norm = max(0, min(1, (slope + 10) / 20))
 
-    # Stability factor (lower CV is better)
-    if cv is not None and cv > 0:
-        stability = 1 / (1 + cv)
-    else:
-        stability = 0.5
+def _regression_slope_expr(col: str) -> pl.Expr:
+    """Closed-form least-squares slope over x = 0..n-1 (first/last for n < 3)."""
+    x = pl.int_range(pl.len()).cast(pl.Float64)
+    xd = x - x.mean()
+    y = pl.element()
+    slope = (
+        pl.col(col)
+        .list.eval((xd * (y - y.mean())).sum() / (xd * xd).sum())
+        .list.first()
+    )
+    return pl.when(_len(col) >= 3).then(slope).otherwise(_first_last_slope_expr(col))
 
-    return (slope_norm * 0.7 + stability * 0.3) * 100
 
+def _slope_expr(col: str, *, out_name: str, use_regression: bool = False) -> pl.Expr:
+    fn = _regression_slope_expr if use_regression else _first_last_slope_expr
+    return fn(col).alias(out_name)
 
-# ============================================================
-# POLARS EXPRESSION BUILDERS
-# ============================================================
 
-def _slope_expr(
-    table_col: str,
-    candidates: Sequence[str],
-    *,
-    out_name: str,
-    use_regression: bool = False
-) -> pl.Expr:
-    """Create Polars expression to calculate slope from nested table."""
-    slope_fn = _linear_regression_slope if use_regression else _first_last_slope
+def _accel_expr(col: str, *, out_name: str) -> pl.Expr:
+    """QoQ acceleration: (latest change) - (previous change)."""
+    lst = pl.col(col).list
+    v1, v2, v3 = (lst.get(i, null_on_oob=True) for i in (-1, -2, -3))
+    return pl.when(_len(col) >= 3).then((v1 - v2) - (v2 - v3)).alias(out_name)
+
 
+def _cv_expr(col: str, *, out_name: str) -> pl.Expr:
+    """Coefficient of variation (sample std / |mean|); lower = more stable."""
+    mean = pl.col(col).list.mean()
     return (
-        pl.col(table_col)
-        .map_elements(
-            lambda t: slope_fn(_pick_series_from_table(t, candidates) or []),
-            return_dtype=pl.Float64,
-        )
+        pl.when((_len(col) >= 2) & (mean != 0))
+        .then(pl.col(col).list.std(ddof=1) / mean.abs())
         .alias(out_name)
     )
 
 
-def _accel_expr(
-    table_col: str,
-    candidates: Sequence[str],
-    *,
-    out_name: str
-) -> pl.Expr:
-    """Create Polars expression to calculate acceleration from nested table."""
+def _growth_expr(col: str, *, out_name: str) -> pl.Expr:
+    """CAGR-like growth: ((last/first)^(1/(n-1)) - 1) * 100."""
+    n = _len(col)
+    first = pl.col(col).list.first()
+    ratio = pl.col(col).list.last() / first
     return (
-        pl.col(table_col)
-        .map_elements(
-            lambda t: _qoq_accel(_pick_series_from_table(t, candidates) or []),
-            return_dtype=pl.Float64,
-        )
+        pl.when((n >= 2) & (first != 0) & (ratio >= 0))
+        .then((ratio.pow(1.0 / (n - 1)) - 1) * 100)
         .alias(out_name)
     )
 
 
-def _cv_expr(
-    table_col: str,
-    candidates: Sequence[str],
-    *,
-    out_name: str
-) -> pl.Expr:
-    """Create Polars expression to calculate CV from nested table."""
+def _label_expr(slope_col: str, accel_col: str, *, out_name: str) -> pl.Expr:
+    """Human-readable trend label from slope and acceleration."""
+    slope, accel = pl.col(slope_col), pl.col(accel_col)
     return (
-        pl.col(table_col)
-        .map_elements(
-            lambda t: _cv(_pick_series_from_table(t, candidates) or []),
-            return_dtype=pl.Float64,
+        pl.when(slope.is_null())
+        .then(pl.lit(None, dtype=pl.Utf8))
+        .when(slope > 0.5)
+        .then(
+            pl.when(accel.is_null() | (accel >= 0))
+            .then(pl.lit("RISING"))
+            .otherwise(pl.lit("RISING_BUT_SLOWING"))
+        )
+        .when(slope < -0.5)
+        .then(
+            pl.when(accel.is_null() | (accel <= 0))
+            .then(pl.lit("FALLING"))
+            .otherwise(pl.lit("FALLING_BUT_RECOVERING"))
         )
+        .otherwise(pl.lit("FLAT"))
         .alias(out_name)
     )
 
 
-def _growth_expr(
-    table_col: str,
-    candidates: Sequence[str],
-    *,
-    out_name: str
-) -> pl.Expr:
-    """Create Polars expression to calculate growth rate from nested table."""
+def _momentum_expr(slope_col: str, cv_col: str, *, out_name: str) -> pl.Expr:
+    """Momentum score: normalized slope (70%) + stability 1/(1+CV) (30%)."""
+    slope, cv = pl.col(slope_col), pl.col(cv_col)
+    slope_norm = ((slope + 10) / 20).clip(0.0, 1.0)
+    stability = pl.when(cv.is_not_null() & (cv > 0)).then(1 / (1 + cv)).otherwise(0.5)
     return (
-        pl.col(table_col)
-        .map_elements(
-            lambda t: _growth_rate(_pick_series_from_table(t, candidates) or []),
-            return_dtype=pl.Float64,
-        )
+        pl.when(slope.is_not_null())
+        .then((slope_norm * 0.7 + stability * 0.3) * 100)
         .alias(out_name)
     )
 
 
-def _label_expr(
-    slope_col: str,
-    accel_col: str,
-    *,
-    out_name: str
-) -> pl.Expr:
-    """Create Polars expression to generate trend label."""
-    return (
-        pl.struct([slope_col, accel_col])
-        .map_elements(
-            lambda s: _trend_label(s.get(slope_col), s.get(accel_col)),
-            return_dtype=pl.Utf8,
-        )
-        .alias(out_name)
+def _weighted_mean_expr(parts: Sequence[tuple[pl.Expr, float]]) -> pl.Expr:
+    """Null-aware weighted mean: weights of missing inputs drop out."""
+    if not parts:
+        return pl.lit(None, dtype=pl.Float64)
+    num = pl.sum_horizontal([e * w for e, w in parts])
+    den = pl.sum_horizontal(
+        [pl.when(e.is_not_null()).then(pl.lit(w)).otherwise(pl.lit(0.0)) for e, w in parts]
     )
+    return pl.when(den > 0).then(num / den)
 
 
-def _momentum_expr(
-    slope_col: str,
-    cv_col: str,
-    *,
-    out_name: str
-) -> pl.Expr:
-    """Create Polars expression to calculate momentum score."""
-    return (
-        pl.struct([slope_col, cv_col])
-        .map_elements(
-            lambda s: _momentum_score(s.get(slope_col), s.get(cv_col)),
-            return_dtype=pl.Float64,
-        )
-        .alias(out_name)
-    )
+def _slope_score(col: str, mult: float) -> pl.Expr:
+    return (50 + pl.col(col) * mult).clip(0.0, 100.0)
 
 
 # ============================================================
@@ -398,73 +301,93 @@ def add_timeseries_features(df: pl.DataFrame) -> pl.DataFrame:
     if df is None or df.is_empty():
         return df
 
-    exprs: List[pl.Expr] = []
+    # (out_name, table, candidates, feature, kwargs)
+    specs: List[tuple] = []
 
     # ─────────────────────────────────────────────────────────
     # QUARTERLY TRENDS
     # ─────────────────────────────────────────────────────────
     if "_quarters" in df.columns:
-        exprs.extend([
+        specs.extend([
             # Sales trends
-            _slope_expr("_quarters", Q_SALES_CANDIDATES, out_name="Sales_Q_Slope"),
-            _accel_expr("_quarters", Q_SALES_CANDIDATES, out_name="Sales_Q_Accel"),
-            _cv_expr("_quarters", Q_SALES_CANDIDATES, out_name="Sales_Q_CV"),
-            _growth_expr("_quarters", Q_SALES_CANDIDATES, out_name="Sales_Q_Growth"),
+            ("Sales_Q_Slope", "_quarters", Q_SALES_CANDIDATES, _slope_expr, {}),
+            ("Sales_Q_Accel", "_quarters", Q_SALES_CANDIDATES, _accel_expr, {}),
+            ("Sales_Q_CV", "_quarters", Q_SALES_CANDIDATES, _cv_expr, {}),
+            ("Sales_Q_Growth", "_quarters", Q_SALES_CANDIDATES, _growth_expr, {}),
 
             # Profit trends
-            _slope_expr("_quarters", Q_PROFIT_CANDIDATES, out_name="Profit_Q_Slope"),
-            _accel_expr("_quarters", Q_PROFIT_CANDIDATES, out_name="Profit_Q_Accel"),
-            _cv_expr("_quarters", Q_PROFIT_CANDIDATES, out_name="Profit_Q_CV"),
+            ("Profit_Q_Slope", "_quarters", Q_PROFIT_CANDIDATES, _slope_expr, {}),
+            ("Profit_Q_Accel", "_quarters", Q_PROFIT_CANDIDATES, _accel_expr, {}),
+            ("Profit_Q_CV", "_quarters", Q_PROFIT_CANDIDATES, _cv_expr, {}),
 
             # EPS trends
-            _slope_expr("_quarters", Q_EPS_CANDIDATES, out_name="EPS_Q_Slope"),
-            _accel_expr("_quarters", Q_EPS_CANDIDATES, out_name="EPS_Q_Accel"),
-            _cv_expr("_quarters", Q_EPS_CANDIDATES, out_name="EPS_Q_CV"),
+            ("EPS_Q_Slope", "_quarters", Q_EPS_CANDIDATES, _slope_expr, {}),
+            ("EPS_Q_Accel", "_quarters", Q_EPS_CANDIDATES, _accel_expr, {}),
+            ("EPS_Q_CV", "_quarters", Q_EPS_CANDIDATES, _cv_expr, {}),
 
             # OPM trends
-            _slope_expr("_quarters", Q_OPM_CANDIDATES, out_name="OPM_Q_Slope"),
+            ("OPM_Q_Slope", "_quarters", Q_OPM_CANDIDATES, _slope_expr, {}),
         ])
 
     # ─────────────────────────────────────────────────────────
     # ANNUAL TRENDS (from P&L)
     # ─────────────────────────────────────────────────────────
     if "_profit_loss" in df.columns:
-        exprs.extend([
-            _slope_expr("_profit_loss", PL_SALES_CANDIDATES, out_name="Sales_Y_Slope", use_regression=True),
-            _slope_expr("_profit_loss", PL_PROFIT_CANDIDATES, out_name="Profit_Y_Slope", use_regression=True),
-            _slope_expr("_profit_loss", PL_EPS_CANDIDATES, out_name="EPS_Y_Slope", use_regression=True),
-            _growth_expr("_profit_loss", PL_SALES_CANDIDATES, out_name="Sales_Y_CAGR"),
-            _growth_expr("_profit_loss", PL_PROFIT_CANDIDATES, out_name="Profit_Y_CAGR"),
+        reg = {"use_regression": True}
+        specs.extend([
+            ("Sales_Y_Slope", "_profit_loss", PL_SALES_CANDIDATES, _slope_expr, reg),
+            ("Profit_Y_Slope", "_profit_loss", PL_PROFIT_CANDIDATES, _slope_expr, reg),
+            ("EPS_Y_Slope", "_profit_loss", PL_EPS_CANDIDATES, _slope_expr, reg),
+            ("Sales_Y_CAGR", "_profit_loss", PL_SALES_CANDIDATES, _growth_expr, {}),
+            ("Profit_Y_CAGR", "_profit_loss", PL_PROFIT_CANDIDATES, _growth_expr, {}),
         ])
 
     # ─────────────────────────────────────────────────────────
     # RATIO TRENDS
     # ─────────────────────────────────────────────────────────
     if "_ratios" in df.columns:
-        exprs.extend([
-            _slope_expr("_ratios", ROCE_CANDIDATES, out_name="ROCE_Slope"),
-            _slope_expr("_ratios", ROE_CANDIDATES, out_name="ROE_Slope"),
-            _slope_expr("_ratios", GROSS_NPA_CANDIDATES, out_name="GrossNPA_Slope"),
-            _slope_expr("_ratios", NET_NPA_CANDIDATES, out_name="NetNPA_Slope"),
-            _slope_expr("_ratios", DEBTOR_DAYS_CANDIDATES, out_name="DebtorDays_Slope"),
-            _slope_expr("_ratios", WORKING_CAPITAL_CANDIDATES, out_name="WorkingCapital_Slope"),
+        specs.extend([
+            ("ROCE_Slope", "_ratios", ROCE_CANDIDATES, _slope_expr, {}),
+            ("ROE_Slope", "_ratios", ROE_CANDIDATES, _slope_expr, {}),
+            ("GrossNPA_Slope", "_ratios", GROSS_NPA_CANDIDATES, _slope_expr, {}),
+            ("NetNPA_Slope", "_ratios", NET_NPA_CANDIDATES, _slope_expr, {}),
+            ("DebtorDays_Slope", "_ratios", DEBTOR_DAYS_CANDIDATES, _slope_expr, {}),
+            ("WorkingCapital_Slope", "_ratios", WORKING_CAPITAL_CANDIDATES, _slope_expr, {}),
         ])
 
     # ─────────────────────────────────────────────────────────
     # BALANCE SHEET TRENDS
     # ─────────────────────────────────────────────────────────
     if "_balance_sheet" in df.columns:
-        exprs.extend([
-            _slope_expr("_balance_sheet", BS_BORROWINGS_CANDIDATES, out_name="Borrowings_Slope"),
-            _slope_expr("_balance_sheet", BS_RESERVES_CANDIDATES, out_name="Reserves_Slope"),
-            _slope_expr("_balance_sheet", BS_DEPOSITS_CANDIDATES, out_name="Deposits_Slope"),
-            _slope_expr("_balance_sheet", BS_ASSETS_CANDIDATES, out_name="Assets_Slope"),
-            _growth_expr("_balance_sheet", BS_RESERVES_CANDIDATES, out_name="Reserves_Growth"),
+        specs.extend([
+            ("Borrowings_Slope", "_balance_sheet", BS_BORROWINGS_CANDIDATES, _slope_expr, {}),
+            ("Reserves_Slope", "_balance_sheet", BS_RESERVES_CANDIDATES, _slope_expr, {}),
+            ("Deposits_Slope", "_balance_sheet", BS_DEPOSITS_CANDIDATES, _slope_expr, {}),
+            ("Assets_Slope", "_balance_sheet", BS_ASSETS_CANDIDATES, _slope_expr, {}),
+            ("Reserves_Growth", "_balance_sheet", BS_RESERVES_CANDIDATES, _growth_expr, {}),
         ])
 
+    # Flatten each (table, metric) once; all features read the same list column
+    tables: Dict[str, List[Any]] = {}
+    series_cols: Dict[tuple, str] = {}
+    flat: List[pl.Series] = []
+    exprs: List[pl.Expr] = []
+    for out_name, table, candidates, feature, kwargs in specs:
+        key = (table, tuple(candidates))
+        if key not in series_cols:
+            if table not in tables:
+                tables[table] = df[table].to_list()
+            series_cols[key] = f"__ts{len(series_cols)}"
+            flat.append(_series_list(tables[table], candidates).alias(series_cols[key]))
+        exprs.append(feature(series_cols[key], out_name=out_name, **kwargs))
+
     # Apply all expressions
     if exprs:
-        df = df.with_columns(exprs)
+        df = (
+            df.with_columns(flat)
+            .with_columns(exprs)
+            .drop(list(series_cols.values()))
+        )
 
     # ─────────────────────────────────────────────────────────
     # MOMENTUM LABELS
@@ -501,27 +424,21 @@ def add_timeseries_features(df: pl.DataFrame) -> pl.DataFrame:
             .alias("Bank_Asset_Quality_Trend")
         )
 
-    # Apply label expressions
-    if label_exprs:
-        df = df.with_columns(label_exprs)
-
     # ─────────────────────────────────────────────────────────
     # MOMENTUM SCORES
     # ─────────────────────────────────────────────────────────
-    score_exprs = []
-
     if "Profit_Q_Slope" in df.columns and "Profit_Q_CV" in df.columns:
-        score_exprs.append(
+        label_exprs.append(
             _momentum_expr("Profit_Q_Slope", "Profit_Q_CV", out_name="Earnings_Momentum_Score")
         )
 
     if "Sales_Q_Slope" in df.columns and "Sales_Q_CV" in df.columns:
-        score_exprs.append(
+        label_exprs.append(
             _momentum_expr("Sales_Q_Slope", "Sales_Q_CV", out_name="Sales_Momentum_Score")
         )
 
-    if score_exprs:
-        df = df.with_columns(score_exprs)
+    if label_exprs:
+        df = df.with_columns(label_exprs)
 
     log.info(f"[FUND-TS] Added time-series features to {df.height} rows")
     return df
@@ -538,81 +455,39 @@ def add_composite_scores(df: pl.DataFrame) -> pl.DataFrame:
     if df is None or df.is_empty():
         return df
 
-    def _composite_score(row: Dict[str, Any]) -> Optional[float]:
-        scores = []
-        weights = []
-
-        # Earnings momentum (weight: 0.3)
-        if row.get("Earnings_Momentum_Score") is not None:
-            scores.append(row["Earnings_Momentum_Score"])
-            weights.append(0.3)
-
-        # Sales momentum (weight: 0.2)
-        if row.get("Sales_Momentum_Score") is not None:
-            scores.append(row["Sales_Momentum_Score"])
-            weights.append(0.2)
-
-        # ROCE trend (weight: 0.25)
-        roce_slope = row.get("ROCE_Slope")
-        if roce_slope is not None:
-            # Normalize slope to 0-100
-            roce_score = max(0, min(100, 50 + roce_slope * 5))
-            scores.append(roce_score)
-            weights.append(0.25)
-
-        # ROE trend (weight: 0.15)
-        roe_slope = row.get("ROE_Slope")
-        if roe_slope is not None:
-            roe_score = max(0, min(100, 50 + roe_slope * 5))
-            scores.append(roe_score)
-            weights.append(0.15)
-
-        # Profit stability (weight: 0.1)
-        profit_cv = row.get("Profit_Q_CV")
-        if profit_cv is not None:
-            stability_score = max(0, min(100, 100 - profit_cv * 100))
-            scores.append(stability_score)
-            weights.append(0.1)
-
-        if not scores:
-            return None
-
-        total_weight = sum(weights)
-        return sum(s * w for s, w in zip(scores, weights)) / total_weight
-
-    def _quality_trend(row: Dict[str, Any]) -> Optional[float]:
-        scores = []
-
-        for col in ["ROCE_Slope", "ROE_Slope", "OPM_Q_Slope"]:
-            val = row.get(col)
-            if val is not None:
-                scores.append(max(0, min(100, 50 + val * 5)))
-
-        return sum(scores) / len(scores) if scores else None
-
-    def _growth_trend(row: Dict[str, Any]) -> Optional[float]:
-        scores = []
-
-        for col in ["Sales_Q_Slope", "Profit_Q_Slope", "EPS_Q_Slope"]:
-            val = row.get(col)
-            if val is not None:
-                scores.append(max(0, min(100, 50 + val * 2)))
-
-        return sum(scores) / len(scores) if scores else None
+    cols = set(df.columns)
+
+    def _has(c: str) -> bool:
+        return c in cols
+
+    # Trend composite: earnings 0.3, sales 0.2, ROCE 0.25, ROE 0.15, stability 0.1
+    composite: List[tuple[pl.Expr, float]] = []
+    if _has("Earnings_Momentum_Score"):
+        composite.append((pl.col("Earnings_Momentum_Score"), 0.3))
+    if _has("Sales_Momentum_Score"):
+        composite.append((pl.col("Sales_Momentum_Score"), 0.2))
+    if _has("ROCE_Slope"):
+        composite.append((_slope_score("ROCE_Slope", 5), 0.25))
+    if _has("ROE_Slope"):
+        composite.append((_slope_score("ROE_Slope", 5), 0.15))
+    if _has("Profit_Q_CV"):
+        composite.append(((100 - pl.col("Profit_Q_CV") * 100).clip(0.0, 100.0), 0.1))
+
+    quality = [
+        _slope_score(c, 5) for c in ("ROCE_Slope", "ROE_Slope", "OPM_Q_Slope") if _has(c)
+    ]
+    growth = [
+        _slope_score(c, 2)
+        for c in ("Sales_Q_Slope", "Profit_Q_Slope", "EPS_Q_Slope")
+        if _has(c)
+    ]
+    none = pl.lit(None, dtype=pl.Float64)
 
     # Apply composite calculations
     df = df.with_columns([
-        pl.struct(df.columns)
-        .map_elements(_composite_score, return_dtype=pl.Float64)
-        .alias("Trend_Composite_Score"),
-
-        pl.struct(df.columns)
-        .map_elements(_quality_trend, return_dtype=pl.Float64)
-        .alias("Quality_Trend_Score"),
-
-        pl.struct(df.columns)
-        .map_elements(_growth_trend, return_dtype=pl.Float64)
-        .alias("Growth_Trend_Score"),
+        _weighted_mean_expr(composite).alias("Trend_Composite_Score"),
+        (pl.mean_horizontal(quality) if quality else none).alias("Quality_Trend_Score"),
+        (pl.mean_horizontal(growth) if growth else none).alias("Growth_Trend_Score"),
     ])
 
     return df
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/helpers/instrument_index.py — v1.0 (precompiled instrument index)
+# ============================================================
+"""Precompiled, hot-reloadable instrument index.
+
+The static JSON masters are parsed once into a compact columnar snapshot
+(Arrow IPC, written by polars) under PATHS["CACHE"]/instruments:
+
+    mode | symbol | isin | listing_date | has_listing
+
+On startup the snapshot is memory-mapped and folded into plain dicts:
+
+    by_mode[mode]   symbol → isin
+    rev_by_mode     isin   → symbol
+    merged          symbol → isin across all modes (first source wins)
+    listing_by_mode symbol → listing_date
+
+The snapshot is keyed by (path, mtime_ns, size) of every master file, so an
+edited master is re-compiled on the next check. ``IndexHandle.get()`` re-stats
+the masters at most every ``check_every`` seconds; between checks a lookup
+is a monotonic-clock compare plus a dict hit (sub-microsecond).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+import timeit
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Mapping, Optional
+
+import polars as pl
+
+from queen.helpers.logger import log
+
+INDEX_VERSION = 1
+RELOAD_CHECK_S = 2.0
+
+_SCHEMA = {
+    "mode": pl.Utf8,
+    "symbol": pl.Utf8,
+    "isin": pl.Utf8,
+    "listing_date": pl.Date,
+    "has_listing": pl.Boolean,
+}
+
+
+def index_dir() -> Path:
+    from queen.settings.settings import PATHS
+
+    return PATHS["CACHE"] / "instruments"
+
+
+def fingerprint(sources: Mapping[str, Optional[Path]]) -> str:
+    """Short hash over (mode, path, mtime_ns, size) of every master file."""
+    h = hashlib.blake2b(f"v{INDEX_VERSION}".encode(), digest_size=8)
+    for mode in sorted(sources):
+        p = sources[mode]
+        try:
+            st = os.stat(p) if p else None
+            sig = f"{mode}|{p}|{st.st_mtime_ns}|{st.st_size}" if st else f"{mode}|{p}|-"
+        except OSError:
+            sig = f"{mode}|{p}|-"
+        h.update(sig.encode())
+    return h.hexdigest()
+
+
+# ------------------------------------------------------------
+# Index
+# ------------------------------------------------------------
+class InstrumentIndex:
+    """Dict views over the columnar snapshot. Immutable once built."""
+
+    __slots__ = ("fingerprint", "frame", "modes", "by_mode", "rev_by_mode", "merged", "merged_rev", "listing_by_mode", "has_listing")
+
+    def __init__(self, frame: pl.DataFrame, fp: str, modes: Iterable[str]):
+        self.fingerprint = fp
+        self.frame = frame
+        self.modes = tuple(modes)
+        self.by_mode: Dict[str, Dict[str, str]] = {m: {} for m in self.modes}
+        self.rev_by_mode: Dict[str, Dict[str, str]] = {m: {} for m in self.modes}
+        self.has_listing: Dict[str, bool] = {m: False for m in self.modes}
+        self.listing_by_mode: Dict[str, Dict[str, Optional[date]]] = {m: {} for m in self.modes}
+
+        cols = [frame[c].to_list() for c in ("mode", "symbol", "isin", "listing_date", "has_listing")]
+        for mode, sym, isin, ld, has in zip(*cols):
+            fwd = self.by_mode.setdefault(mode, {})
+            if sym in fwd:
+                continue
+            fwd[sym] = isin
+            self.rev_by_mode.setdefault(mode, {}).setdefault(isin, sym)
+            self.has_listing[mode] = bool(has)
+            self.listing_by_mode.setdefault(mode, {})[sym] = ld
+
+        # Fallback view: distinct sources in mode order, first symbol wins
+        self.merged: Dict[str, str] = {}
+        self.merged_rev: Dict[str, str] = {}
+        for m in self.modes:
+            for sym, isin in self.by_mode[m].items():
+                if sym not in self.merged:
+                    self.merged[sym] = isin
+                    self.merged_rev.setdefault(isin, sym)
+
+    @property
+    def listing(self) -> Dict[str, Optional[date]]:
+        return self.listing_by_mode.get("MONTHLY", {})
+
+    def __len__(self) -> int:
+        return len(self.merged)
+
+    def mode_frame(self, mode: str) -> pl.DataFrame:
+        """Per-mode frame shaped like the JSON master (symbol, isin[, listing_date])."""
+        df = self.frame.filter(pl.col("mode") == mode).drop("mode", "has_listing")
+        return df if self.has_listing.get(mode) else df.drop("listing_date")
+
+
+# ------------------------------------------------------------
+# Compile / load
+# ------------------------------------------------------------
+def _as_date(v) -> Optional[date]:
+    if isinstance(v, datetime):
+        return v.date()
+    if isinstance(v, date):
+        return v
+    if isinstance(v, str):
+        try:
+            return date.fromisoformat(v[:10])
+        except ValueError:
+            return None
+    return None
+
+
+def compile_frame(modes: Iterable[str], load_mode: Callable[[str], pl.DataFrame]) -> pl.DataFrame:
+    """Stack normalized per-mode frames into the snapshot schema."""
+    parts = []
+    for mode in modes:
+        df = load_mode(mode)
+        if df.is_empty():
+            continue
+        has = "listing_date" in df.columns
+        ld = (
+            pl.Series("listing_date", [_as_date(v) for v in df["listing_date"].to_list()], dtype=pl.Date)
+            if has
+            else pl.Series("listing_date", [None] * df.height, dtype=pl.Date)
+        )
+        parts.append(
+            pl.DataFrame(
+                {
+                    "mode": [mode] * df.height,
+                    "symbol": df["symbol"].cast(pl.Utf8),
+                    "isin": df["isin"].cast(pl.Utf8),
+                    "listing_date": ld,
+                    "has_listing": [has] * df.height,
+                },
+                schema=_SCHEMA,
+            )
+        )
+    if not parts:
+        return pl.DataFrame(schema=_SCHEMA)
+    return pl.concat(parts, how="vertical")
+
+
+def _snapshot_path(fp: str) -> Path:
+    return index_dir() / f"index_{fp}.arrow"
+
+
+def load_or_compile(
+    sources: Mapping[str, Optional[Path]],
+    load_mode: Callable[[str], pl.DataFrame],
+) -> InstrumentIndex:
+    """Memory-map the snapshot for the current masters, compiling it if absent."""
+    fp = fingerprint(sources)
+    path = _snapshot_path(fp)
+    if path.exists():
+        try:
+            frame = pl.read_ipc(path)  # uncompressed IPC → polars memory-maps it
+            return InstrumentIndex(frame, fp, sources)
+        except Exception as e:
+            log.debug(f"[InstrumentIndex] {path.name} unreadable, recompiling: {e}")
+
+    frame = compile_frame(sources, load_mode)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        frame.write_ipc(tmp, compression="uncompressed")
+        tmp.replace(path)
+        for old in path.parent.glob("index_*.arrow"):
+            if old != path:
+                old.unlink(missing_ok=True)
+        log.info(f"[InstrumentIndex] Compiled {path.name} ({frame.height} rows)")
+    except Exception as e:
+        log.debug(f"[InstrumentIndex] snapshot save failed: {e}")
+    return InstrumentIndex(frame, fp, sources)
+
+
+# ------------------------------------------------------------
+# Hot-reloading handle
+# ------------------------------------------------------------
+class IndexHandle:
+    """Holds the live index; re-stats the masters at most every ``check_every`` s."""
+
+    def __init__(
+        self,
+        sources: Callable[[], Mapping[str, Optional[Path]]],
+        load_mode: Callable[[str], pl.DataFrame],
+        check_every: float = RELOAD_CHECK_S,
+    ):
+        self._sources = sources
+        self._load_mode = load_mode
+        self.check_every = check_every
+        self._index: Optional[InstrumentIndex] = None
+        self._next_check = 0.0
+        self.reloads = 0
+
+    def get(self) -> InstrumentIndex:
+        if self._index is not None and time.monotonic() < self._next_check:
+            return self._index
+        return self._refresh()
+
+    def _refresh(self) -> InstrumentIndex:
+        srcs = self._sources()
+        if self._index is None or fingerprint(srcs) != self._index.fingerprint:
+            if self._index is not None:
+                log.info("[InstrumentIndex] Master changed → reloading")
+            self._index = load_or_compile(srcs, self._load_mode)
+            self.reloads += 1
+        self._next_check = time.monotonic() + self.check_every
+        return self._index
+
+    def invalidate(self) -> None:
+        self._index = None
+        self._next_check = 0.0
+
+    def info(self) -> Dict[str, object]:
+        idx = self._index
+        return {
+            "loaded": idx is not None,
+            "fingerprint": idx.fingerprint if idx else None,
+            "symbols": len(idx) if idx else 0,
+            "reloads": self.reloads,
+        }
+
+
+def bench(handle: IndexHandle, symbols: Iterable[str], number: int = 200_000) -> float:
+    """Mean ns per ``handle.get().merged.get(sym)`` lookup (cycling ``symbols``)."""
+    syms = list(symbols) or ["_"]
+    handle.get()
+    n = len(syms)
+    state = {"i": 0}
+
+    def one():
+        i = state["i"] = (state["i"] + 1) % n
+        handle.get().merged.get(syms[i])
+
+    return timeit.timeit(one, number=number) / number * 1e9
+
+
+__all__ = [
+    "IndexHandle",
+    "InstrumentIndex",
+    "bench",
+    "compile_frame",
+    "fingerprint",
+    "index_dir",
+    "load_or_compile",
+]
@@ -1,14 +1,14 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/helpers/instruments.py — v10.1
-# Static JSON Instruments (NSE/BSE) + Caches + Universe Filter
+# queen/helpers/instruments.py — v10.3
+# Static JSON Instruments (NSE/BSE) + Precompiled Index + Universe Filter
 # ============================================================
 
 from __future__ import annotations
 
 from collections.abc import Iterable
-from datetime import date, datetime
-from functools import cache, lru_cache
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +16,7 @@ import polars as pl
 
 from queen.helpers import io
 from queen.helpers.common import normalize_symbol
+from queen.helpers.instrument_index import IndexHandle, InstrumentIndex
 from queen.helpers.logger import log
 from queen.settings import settings as SETTINGS
 
@@ -33,9 +34,13 @@ INSTRUMENT_COLUMNS = ["symbol", "isin", "listing_date"]  # listing_date optional
 # ============================================================
 # 📁 Path Resolution (uses EXCHANGE dict directly)
 # ============================================================
+def _mode(mode: str | None) -> str:
+    return (mode or "MONTHLY").strip().upper()
+
+
 def _instrument_path_for(mode: str) -> Path | None:
     """Resolve the JSON file path for a given mode."""
-    mode = (mode or "MONTHLY").strip().upper()
+    mode = _mode(mode)
     ex_cfg = getattr(SETTINGS, "EXCHANGE", None)
     if not isinstance(ex_cfg, dict):
         log.error("[Instruments] SETTINGS.EXCHANGE must be a dict.")
@@ -54,18 +59,6 @@ def _instrument_path_for(mode: str) -> Path | None:
     return Path(path).expanduser().resolve()
 
 
-def _all_instrument_paths() -> Iterable[Path]:
-    """Return all distinct instrument JSON paths across VALID_MODES."""
-    seen: dict[str, Path] = {}
-    for m in VALID_MODES:
-        p = _instrument_path_for(m)
-        if p:
-            rp = str(p)
-            if rp not in seen:
-                seen[rp] = p
-    return seen.values()
-
-
 # ============================================================
 # 📚 Readers (via queen.helpers.io)
 # ============================================================
@@ -136,78 +129,49 @@ def _normalize_columns(df: pl.DataFrame) -> pl.DataFrame:
 
 
 # ============================================================
-# 🧠 Cached loaders
+# 🧠 Precompiled index (hot-reloaded when a master JSON changes)
 # ============================================================
-@cache
+def _load_mode_json(mode: str) -> pl.DataFrame:
+    """Parse + normalize one master JSON (used only to compile the index)."""
+    return _normalize_columns(_read_instruments(_instrument_path_for(mode)))
+
+
+def _index_sources() -> dict[str, Path | None]:
+    return {m: _instrument_path_for(m) for m in VALID_MODES}
+
+
+_INDEX = IndexHandle(_index_sources, _load_mode_json)
+
+
+def instrument_index() -> InstrumentIndex:
+    """Live instrument index (dict lookups; re-checks masters every few seconds)."""
+    return _INDEX.get()
+
+
 def load_instruments_df(mode: str = "MONTHLY") -> pl.DataFrame:
-    """Load instruments for a specific mode from STATIC JSON."""
-    p = _instrument_path_for(mode)
-    df_raw = _read_instruments(p)
-    df = _normalize_columns(df_raw)
+    """Instruments for a specific mode (symbol, isin[, listing_date])."""
+    mode = _mode(mode)
+    df = instrument_index().mode_frame(mode)
     if df.is_empty():
         log.error(f"[Instruments] No valid instrument data for mode={mode}")
-        return pl.DataFrame()
-    log.info(f"[Instruments] Loaded {len(df)} rows for mode={mode} from {p.name}")
     return df
 
 
-@cache
-def _merged_df_all_modes() -> pl.DataFrame:
-    """Merged view across all instrument sources (for fallback lookups)."""
-    parts = []
-    for p in _all_instrument_paths():
-        df = _normalize_columns(_read_instruments(p))
-        if not df.is_empty():
-            parts.append(df)
-    if not parts:
-        return pl.DataFrame()
-    merged = (
-        pl.concat(parts, how="vertical")
-        .unique(subset=["symbol"], keep="first")
-    )
-    log.info(
-        f"[Instruments] Merged instruments: {len(merged)} symbols across all modes"
-    )
-    return merged
-
-
 # ============================================================
 # 🔍 Lookups
 # ============================================================
-@lru_cache(maxsize=4096)
 def get_listing_date(symbol: str) -> date | None:
     """Return listing date for symbol, if present in MONTHLY file."""
-    symbol = normalize_symbol(symbol)
-    df = load_instruments_df("MONTHLY")
-    if df.is_empty() or "symbol" not in df.columns:
-        return None
-    try:
-        row = df.filter(pl.col("symbol") == symbol).select("listing_date").head(1)
-        if row.is_empty():
-            return None
-        val = row.item(0, 0)
-        if isinstance(val, date):
-            return val
-        if isinstance(val, datetime):
-            return val.date()
-        if isinstance(val, str):
-            try:
-                return date.fromisoformat(val)
-            except Exception:
-                return None
-    except Exception:
-        return None
-    return None
+    return instrument_index().listing.get(normalize_symbol(symbol))
 
 
-@cache
 def get_instrument_map(mode: str = "MONTHLY") -> dict[str, str]:
-    """Symbol → isin map for a given mode."""
-    df = load_instruments_df(mode)
-    if df.is_empty():
+    """Symbol → isin map for a given mode (a copy; the index stays shared)."""
+    m = instrument_index().by_mode.get(_mode(mode))
+    if not m:
         log.warning(f"[Instruments] Empty dataset for mode '{mode}'.")
         return {}
-    return dict(zip(df["symbol"].to_list(), df["isin"].to_list()))
+    return dict(m)
 
 
 def resolve_instrument(symbol_or_key: str, mode: str = "MONTHLY") -> str:
@@ -217,18 +181,12 @@ def resolve_instrument(symbol_or_key: str, mode: str = "MONTHLY") -> str:
     if "|" in symbol_or_key:
         return symbol_or_key
 
-    # Mode-local map first
-    m = get_instrument_map(mode).get(symbol_or_key)
+    # Mode-local map first, then the merged view
+    idx = instrument_index()
+    m = idx.by_mode.get(_mode(mode), {}).get(symbol_or_key) or idx.merged.get(symbol_or_key)
     if m:
         return m
 
-    # Fallback: merged view
-    merged = _merged_df_all_modes()
-    if not merged.is_empty():
-        row = merged.filter(pl.col("symbol") == symbol_or_key)
-        if not row.is_empty():
-            return row["isin"].item()
-
     msg = f"[Instruments] Unknown symbol: {symbol_or_key}"
     log.warning(msg)
     raise ValueError(msg)
@@ -236,37 +194,29 @@ def resolve_instrument(symbol_or_key: str, mode: str = "MONTHLY") -> str:
 
 def get_symbol_from_isin(isin: str, mode: str = "MONTHLY") -> str | None:
     """Reverse lookup: ISIN/instrument-key → symbol."""
-    df = load_instruments_df(mode)
-    if df.is_empty():
-        df = _merged_df_all_modes()
-        if df.is_empty():
-            return None
-    row = df.filter(pl.col("isin") == isin)
-    return row["symbol"].item() if not row.is_empty() else None
+    idx = instrument_index()
+    rev = idx.rev_by_mode.get(_mode(mode)) or idx.merged_rev
+    return rev.get(isin)
 
 
 def get_instrument_meta(symbol: str, mode: str = "MONTHLY") -> dict[str, Any]:
     """Return dict with symbol, isin, and optional listing_date."""
     symbol = normalize_symbol(symbol)
-    df = load_instruments_df(mode)
-    if df.is_empty():
-        df = _merged_df_all_modes()
-    if df.is_empty():
+    mode = _mode(mode)
+    idx = instrument_index()
+    fwd = idx.by_mode.get(mode)
+    if not fwd:
+        fwd = idx.merged
+    if not fwd:
         raise ValueError("Instrument dataset not loaded.")
 
-    row = df.filter(pl.col("symbol") == symbol)
-    if row.is_empty():
+    isin = fwd.get(symbol)
+    if isin is None:
         raise ValueError(f"Unknown symbol: {symbol}")
 
-    meta: dict[str, Any] = {
-        "symbol": symbol,
-        "isin": row["isin"].item(),
-    }
-    if "listing_date" in row.columns:
-        try:
-            meta["listing_date"] = row["listing_date"].item()
-        except Exception:
-            meta["listing_date"] = None
+    meta: dict[str, Any] = {"symbol": symbol, "isin": isin}
+    if idx.has_listing.get(mode):
+        meta["listing_date"] = idx.listing_by_mode[mode].get(symbol)
     return meta
 
 
@@ -294,7 +244,7 @@ def validate_historical_range(
 def list_symbols(mode: str = "MONTHLY") -> list[str]:
     """Return all symbols for the given mode (from static JSON)."""
     df = load_instruments_df(mode)
-    return df["symbol"].drop_nulls().unique().to_list() if not df.is_empty() else []
+    return df["symbol"].drop_nulls().unique(maintain_order=True).to_list() if not df.is_empty() else []
 
 
 # ============================================================
@@ -368,20 +318,14 @@ def filter_to_active_universe(symbols: Iterable[str]) -> list[str]:
 # 🧹 Cache Admin
 # ============================================================
 def clear_instrument_cache() -> None:
-    load_instruments_df.cache_clear()
-    get_instrument_map.cache_clear()
-    _merged_df_all_modes.cache_clear()
-    get_listing_date.cache_clear()
+    _INDEX.invalidate()
     load_active_universe.cache_clear()
     log.info("[Instruments] Cache cleared.")
 
 
 def cache_info() -> dict[str, str]:
     infos = {
-        "load_instruments_df": str(load_instruments_df.cache_info()),
-        "get_instrument_map": str(get_instrument_map.cache_info()),
-        "_merged_df_all_modes": str(_merged_df_all_modes.cache_info()),
-        "get_listing_date": str(get_listing_date.cache_info()),
+        "instrument_index": str(_INDEX.info()),
         "load_active_universe": str(load_active_universe.cache_info()),
     }
     log.info(f"[Instruments] Cache info: {infos}")
@@ -407,7 +351,7 @@ def list_symbols_from_active_universe(mode: str = "INTRADAY") -> list[str]:
 # 🧪 Self-Test
 # ============================================================
 if __name__ == "__main__":
-    print("📘 Instruments Resolver — v10.1 (STATIC JSON + Universe)")
+    print("📘 Instruments Resolver — v10.2 (STATIC JSON → index + Universe)")
     for m in ("INTRADAY", "MONTHLY", "WEEKLY"):
         df = load_instruments_df(m)
         print(m, "→", len(df), "rows")
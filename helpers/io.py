@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/helpers/io.py — v3.2 (Universal I/O: JSON/NDJSON/CSV/Parquet + JSONL + safe dirs)
+# queen/helpers/io.py — v3.4 (Universal I/O: JSON/NDJSON/CSV/Parquet + JSONL + safe dirs)
 # ============================================================
 from __future__ import annotations
 
@@ -12,6 +12,7 @@ from typing import Any
 
 import polars as pl
 
+from queen.helpers import jsonl_log, log_writer
 from queen.helpers.logger import log
 
 
@@ -166,12 +167,16 @@ def write_parquet(df: pl.DataFrame, path: str | Path, *, atomic: bool = True) ->
 
 
 # ---------- JSONL (append/tail) ----------
-def append_jsonl(path: str | Path, record: dict) -> None:
-    p = _p(path)
-    ensure_dir(p)
-    line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
-    with open(p, "ab") as f:
-        f.write(line)
+def append_jsonl(path: str | Path, record: dict, *, buffered: bool = False) -> None:
+    """Append one record via the shared per-file writer (helpers.log_writer).
+
+    ``buffered=True`` lets the writer group-commit; otherwise the record is
+    on disk when this returns (same visibility as a plain append).
+    """
+    w = log_writer.get_writer(_p(path), fmt="jsonl")
+    w.write(record)
+    if not buffered:
+        w.flush()
 
 
 def read_jsonl(path: str | Path, limit: int | None = None) -> list[dict]:
@@ -191,8 +196,8 @@ def read_jsonl(path: str | Path, limit: int | None = None) -> list[dict]:
 
 
 def tail_jsonl(path: str | Path, n: int = 200) -> list[dict]:
-    items = read_jsonl(path)
-    return items[-n:]
+    """Last ``n`` records; seeks backward from EOF instead of reading the file."""
+    return jsonl_log.tail_records(_p(path), n)
 
 
 # ---------- convenience ----------
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/helpers/jsonl_log.py — v1.2 (reverse tail, segments, offset index)
+# ============================================================
+"""Append-only JSONL logs that stay cheap to read as they grow.
+
+Layout (per logical log ``alerts.jsonl``):
+
+    alerts.jsonl                 active segment (appended to)
+    alerts.000001.jsonl          closed segments, oldest → newest
+    alerts.000002.jsonl
+    alerts.000002.jsonl.idx      sidecar offset index (written on rotation)
+
+Reads:
+  • tail_records(path, n)        last n records, reading backward from EOF in
+                                 blocks (cost ∝ n, not file size)
+  • tail_segmented(path, n)      same, walking back across closed segments
+  • read_range(path, a, b)       records whose ``ts_key`` falls in [a, b], using
+                                 the sidecar index to seek into each segment
+                                 (records are assumed roughly time-ordered)
+
+Writes stay plain appends; ``rotate(path, max_bytes)`` closes the active
+segment by renaming it to the next sequence number and indexes it. Reads
+never write sidecars; each segment's index is also kept in process (keyed
+by path + inode) and extended from its last offset, so repeated range
+reads on a never-rotated active file only scan newly appended bytes.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import re
+from collections import deque
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
+from zoneinfo import ZoneInfo
+
+from queen.helpers.logger import log
+from queen.settings import settings as SETTINGS
+
+# Naive query/record timestamps are market-local (helpers.market imports
+# this module via helpers.io, so resolve the zone the same way it does).
+try:
+    MARKET_TZ = ZoneInfo(SETTINGS.market_timezone())
+except Exception:
+    MARKET_TZ = ZoneInfo("Asia/Kolkata")
+
+BLOCK_SIZE = 64 * 1024
+INDEX_EVERY = 256  # one index entry per N records
+INDEX_VERSION = 1
+MEM_INDEX_MAX = 64  # segments whose index is kept in process
+
+_MEM_INDEX: "dict[tuple[str, str, int], dict]" = {}
+
+
+# ------------------------------------------------------------
+# Reverse tail
+# ------------------------------------------------------------
+def _iter_lines_reverse(path: Path, block_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    """Yield complete non-empty lines from EOF backward."""
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with f:
+        pos = f.seek(0, os.SEEK_END)
+        rest = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + rest
+            lines = buf.split(b"\n")
+            rest = lines[0]  # may be a partial line; completed by the next block
+            for line in reversed(lines[1:]):
+                if line.strip():
+                    yield line
+        if rest.strip():
+            yield rest
+
+
+def _loads(line: bytes) -> Optional[dict]:
+    try:
+        rec = json.loads(line)
+    except Exception:
+        return None
+    return rec if isinstance(rec, dict) else None
+
+
+def tail_records(path: str | Path, n: int = 200, *, block_size: int = BLOCK_SIZE) -> list[dict]:
+    """Last ``n`` parseable records of one JSONL file, oldest first."""
+    if n <= 0:
+        return []
+    out: list[dict] = []
+    for line in _iter_lines_reverse(Path(path), block_size):
+        rec = _loads(line)
+        if rec is not None:
+            out.append(rec)
+            if len(out) >= n:
+                break
+    out.reverse()
+    return out
+
+
+# ------------------------------------------------------------
+# Segments
+# ------------------------------------------------------------
+def _segment_re(active: Path) -> re.Pattern:
+    return re.compile(rf"^{re.escape(active.stem)}\.(\d+){re.escape(active.suffix)}$")
+
+
+def segments(path: str | Path) -> list[Path]:
+    """Closed segments (oldest → newest) followed by the active file if present."""
+    active = Path(path)
+    rx = _segment_re(active)
+    closed: list[tuple[int, Path]] = []
+    if active.parent.is_dir():
+        for p in active.parent.iterdir():
+            m = rx.match(p.name)
+            if m:
+                closed.append((int(m.group(1)), p))
+    out = [p for _, p in sorted(closed)]
+    if active.exists():
+        out.append(active)
+    return out
+
+
+def rotate(path: str | Path, max_bytes: int, *, index_key: Optional[str] = "timestamp") -> Optional[Path]:
+    """Close the active segment if it is ≥ ``max_bytes``; return the closed path.
+
+    The closed segment never changes again, so its sidecar index (keyed on
+    ``index_key``; None skips it) is written here once.
+    """
+    active = Path(path)
+    try:
+        if active.stat().st_size < max_bytes:
+            return None
+    except FileNotFoundError:
+        return None
+    rx = _segment_re(active)
+    seqs = [int(m.group(1)) for p in active.parent.iterdir() if (m := rx.match(p.name))]
+    closed = active.with_name(f"{active.stem}.{max(seqs, default=0) + 1:06d}{active.suffix}")
+    os.replace(active, closed)
+    if _index_path(active).exists():
+        os.replace(_index_path(active), _index_path(closed))  # same bytes, index still valid
+    if index_key:
+        build_index(closed, index_key)
+    return closed
+
+
+def tail_segmented(path: str | Path, n: int = 200) -> list[dict]:
+    """Last ``n`` records across the active file and closed segments."""
+    out: list[dict] = []
+    for seg in reversed(segments(path)):
+        need = n - len(out)
+        if need <= 0:
+            break
+        out = tail_records(seg, need) + out
+    return out
+
+
+# ------------------------------------------------------------
+# Sidecar offset index
+# ------------------------------------------------------------
+def ts_value(v: Any) -> Optional[float]:
+    """Comparable epoch seconds from a record/query timestamp (None if unusable).
+
+    Naive datetimes, dates and offset-less ISO strings are read as MARKET_TZ,
+    never as the host's local zone.
+    """
+    if v is None or isinstance(v, bool):
+        return None
+    if isinstance(v, (int, float)):
+        return float(v)
+    if isinstance(v, datetime):
+        dt = v
+    elif isinstance(v, date):
+        dt = datetime(v.year, v.month, v.day)
+    else:
+        try:
+            dt = datetime.fromisoformat(str(v).strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=MARKET_TZ)
+    return dt.timestamp()
+
+
+def _index_path(seg: Path) -> Path:
+    return seg.with_name(seg.name + ".idx")
+
+
+def build_index(
+    seg: str | Path,
+    ts_key: str = "timestamp",
+    every: int = INDEX_EVERY,
+    *,
+    persist: bool = True,
+) -> dict:
+    """Create or extend the sidecar index for ``seg``.
+
+    Index = {"size", "ts_key", "entries": [[ts, offset], ...], "min", "max"}.
+    Only bytes appended since the last build (in this process or in the
+    sidecar, whichever got further) are scanned. ``persist=False`` extends
+    the index without writing the sidecar (readers).
+    """
+    seg = Path(seg)
+    ipath = _index_path(seg)
+    st = seg.stat()
+    size = st.st_size
+    key = (str(seg.absolute()), ts_key, every)
+    idx: dict = {"version": INDEX_VERSION, "ts_key": ts_key, "every": every,
+                 "size": 0, "count": 0, "entries": [], "min": None, "max": None}
+    mem = _MEM_INDEX.get(key)
+    if mem is not None and mem.get("inode") == st.st_ino and mem["size"] <= size:
+        idx = mem
+    if idx["size"] < size:
+        try:
+            cached = json.loads(ipath.read_text(encoding="utf-8"))
+            if (cached.get("version"), cached.get("ts_key"), cached.get("every")) == (INDEX_VERSION, ts_key, every) \
+                    and idx["size"] < cached.get("size", 0) <= size:
+                idx = cached
+        except (FileNotFoundError, ValueError):
+            pass
+    if idx["size"] == size:
+        _remember(key, idx, st.st_ino)
+        return idx
+    idx = {**idx, "entries": list(idx["entries"])}  # never mutate a shared index
+
+    with open(seg, "rb") as f:
+        f.seek(idx["size"])
+        offset = idx["size"]
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # partial trailing write; index it next time
+            rec = _loads(line)
+            ts = ts_value(rec.get(ts_key)) if rec else None
+            if ts is not None:
+                if idx["count"] % every == 0:
+                    idx["entries"].append([ts, offset])
+                idx["count"] += 1
+                idx["min"] = ts if idx["min"] is None else min(idx["min"], ts)
+                idx["max"] = ts if idx["max"] is None else max(idx["max"], ts)
+            offset += len(line)
+        idx["size"] = offset
+
+    _remember(key, idx, st.st_ino)
+    if persist:
+        try:
+            tmp = ipath.with_suffix(".tmp")
+            tmp.write_text(json.dumps({k: v for k, v in idx.items() if k != "inode"}), encoding="utf-8")
+            tmp.replace(ipath)
+        except OSError as e:
+            log.debug(f"[JSONL] index save failed for {seg.name}: {e}")
+    return idx
+
+
+def _remember(key: tuple[str, str, int], idx: dict, inode: int) -> None:
+    idx["inode"] = inode
+    _MEM_INDEX.pop(key, None)
+    _MEM_INDEX[key] = idx
+    while len(_MEM_INDEX) > MEM_INDEX_MAX:
+        _MEM_INDEX.pop(next(iter(_MEM_INDEX)))
+
+
+def _scan(seg: Path, offset: int, lo: Optional[float], hi: Optional[float], ts_key: str) -> Iterator[dict]:
+    with open(seg, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            rec = _loads(line)
+            ts = ts_value(rec.get(ts_key)) if rec else None
+            if ts is None or (lo is not None and ts < lo):
+                continue
+            if hi is not None and ts > hi:
+                break
+            yield rec
+
+
+def read_range(
+    path: str | Path,
+    start: Any = None,
+    end: Any = None,
+    *,
+    ts_key: str = "timestamp",
+    limit: Optional[int] = None,
+    newest: bool = False,
+) -> List[dict]:
+    """Records with ``start ≤ rec[ts_key] ≤ end`` across all segments (oldest first).
+
+    ``limit`` caps the result at the first ``limit`` matches, or the last
+    ``limit`` with ``newest=True``; the latter walks segments newest first
+    and seeks near ``end`` so the work tracks ``limit``, not the range.
+    Reads never write index sidecars (those are built on rotation); the
+    in-process index only scans bytes appended since the previous call.
+    """
+    lo, hi = ts_value(start), ts_value(end)
+    segs = segments(path)
+    out: list[dict] = []
+    for seg in reversed(segs) if newest and limit else segs:
+        idx = build_index(seg, ts_key, persist=False)
+        if idx["min"] is None:
+            continue
+        if (lo is not None and idx["max"] < lo) or (hi is not None and idx["min"] > hi):
+            continue
+        entries = idx["entries"]
+        stamps = [e[0] for e in entries]
+        lo_k = max(bisect.bisect_left(stamps, lo) - 1, 0) if lo is not None else 0
+        lo_off = entries[lo_k][1] if entries else 0
+
+        if not (newest and limit):
+            for rec in _scan(seg, lo_off, lo, hi, ts_key):
+                out.append(rec)
+                if limit and len(out) >= limit:
+                    return out
+            continue
+
+        need = limit - len(out)
+        hi_k = bisect.bisect_right(stamps, hi) if hi is not None else len(entries)
+        start_k = max(lo_k, hi_k - need // idx["every"] - 2)
+        chunk = deque(_scan(seg, entries[start_k][1] if entries else 0, lo, hi, ts_key), maxlen=need)
+        if len(chunk) < need and start_k > lo_k:
+            chunk = deque(_scan(seg, lo_off, lo, hi, ts_key), maxlen=need)
+        out = list(chunk) + out
+        if len(out) >= limit:
+            break
+    return out
+
+
+__all__ = [
+    "build_index",
+    "read_range",
+    "rotate",
+    "segments",
+    "tail_records",
+    "tail_segmented",
+    "ts_value",
+]
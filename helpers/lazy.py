@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/helpers/lazy.py — v1.0 (deferred imports for heavy modules)
+# ============================================================
+"""Lazy-import facade.
+
+Heavy or optional modules (broker fetchers, requests/httpx stacks, rich
+tables) are bound at module level as proxies and only imported on first
+attribute access / call, so short-lived CLIs don't pay for code paths they
+never touch.
+
+Usage:
+    from queen.helpers.lazy import lazy_import, lazy_attr
+
+    upstox = lazy_import("queen.fetchers.upstox_fetcher")
+    fetch_intraday = lazy_attr("queen.fetchers.upstox_fetcher", "fetch_intraday")
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from types import ModuleType
+from typing import Any
+
+__all__ = ["LazyModule", "LazyAttr", "lazy_import", "lazy_attr", "is_loaded"]
+
+
+class LazyModule(ModuleType):
+    """Module proxy; imports the real module on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_mod"] = None
+
+    def _load(self) -> ModuleType:
+        mod = self.__dict__["_lazy_mod"]
+        if mod is None:
+            mod = importlib.import_module(self.__name__)
+            self.__dict__["_lazy_mod"] = mod
+        return mod
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_mod"] is not None else "deferred"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+class LazyAttr:
+    """Callable proxy for ``module:attr``; resolves on first call/access."""
+
+    __slots__ = ("_module", "_attr", "_obj")
+
+    def __init__(self, module: str, attr: str):
+        self._module = module
+        self._attr = attr
+        self._obj = None
+
+    def resolve(self) -> Any:
+        if self._obj is None:
+            self._obj = getattr(importlib.import_module(self._module), self._attr)
+        return self._obj
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        return f"<lazy {self._module}:{self._attr}>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return the module if already imported, else a LazyModule proxy."""
+    mod = sys.modules.get(name)
+    return mod if mod is not None else LazyModule(name)
+
+
+def lazy_attr(module: str, attr: str) -> LazyAttr:
+    return LazyAttr(module, attr)
+
+
+def is_loaded(name: str) -> bool:
+    return name in sys.modules
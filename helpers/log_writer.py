@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/helpers/log_writer.py — v1.1 (buffered, rotating event-log writer)
+# ============================================================
+"""Shared buffered writer for append-only event logs (JSONL or CSV).
+
+  • One open handle per log file (process-wide, see ``get_writer``)
+  • Group commit: records are encoded into a buffer and written with a single
+    ``write()`` once FLUSH_RECORDS / FLUSH_BYTES / FLUSH_INTERVAL_S is hit
+  • Size-based rotation into the helpers.jsonl_log segment layout
+    (``log.jsonl`` → ``log.000001.jsonl`` …) instead of read-trim-rewrite
+  • Optional parquet roll-up of each closed segment (``log.000001.parquet``)
+    and pruning of raw segments beyond KEEP_SEGMENTS
+
+Defaults come from settings.LOGGING["EVENT_LOGS"]; every knob can be
+overridden per writer.
+
+Usage:
+    from queen.helpers.log_writer import get_writer
+
+    w = get_writer(path, max_bytes=8 << 20, rollup=True)
+    w.write_many(rows)
+    w.flush()
+"""
+
+from __future__ import annotations
+
+import atexit
+import csv
+import io as _stdio
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Iterable, List, Optional
+
+import polars as pl
+
+from queen.helpers import jsonl_log
+from queen.helpers.logger import log
+
+
+def _cfg() -> dict:
+    try:
+        from queen.settings.settings import LOGGING
+
+        return LOGGING.get("EVENT_LOGS", {}) or {}
+    except Exception:
+        return {}
+
+
+def _csv_cell(v: Any) -> Any:
+    if v is None:
+        return ""
+    if isinstance(v, bool):
+        return "true" if v else "false"
+    return v
+
+
+class BufferedLogWriter:
+    """Append-only writer with group commit and segment rotation (not for concurrent processes)."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        fmt: Optional[str] = None,
+        flush_records: Optional[int] = None,
+        flush_bytes: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        keep_segments: Optional[int] = None,
+        rollup: Optional[bool] = None,
+    ):
+        cfg = _cfg()
+        self.path = Path(os.path.abspath(Path(path).expanduser()))
+        self.fmt = (fmt or ("csv" if self.path.suffix.lower() == ".csv" else "jsonl")).lower()
+        self.flush_records = int(flush_records or cfg.get("FLUSH_RECORDS", 256))
+        self.flush_bytes = int(flush_bytes or cfg.get("FLUSH_BYTES", 1 << 20))
+        self.flush_interval = float(flush_interval if flush_interval is not None else cfg.get("FLUSH_INTERVAL_S", 2.0))
+        self.max_bytes = max_bytes  # None → never rotate
+        self.keep_segments = keep_segments if keep_segments is not None else cfg.get("KEEP_SEGMENTS")
+        self.rollup = bool(cfg.get("ROLLUP_PARQUET", True) if rollup is None else rollup)
+
+        self._lock = threading.Lock()
+        self._buf: List[bytes] = []
+        self._buf_bytes = 0
+        self._last_flush = time.monotonic()
+        self._fh = None
+        self._ino: Optional[int] = None
+        self._fields: Optional[List[str]] = None
+        self.stats = {"records": 0, "flushes": 0, "rotations": 0}
+
+    # ---------------- encoding ----------------
+    def _encode(self, record: dict) -> bytes:
+        if self.fmt == "jsonl":
+            return (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+        if self._fields is None:
+            self._fields = self._existing_header() or list(record)
+        out = _stdio.StringIO()
+        csv.writer(out, lineterminator="\n").writerow([_csv_cell(record.get(k)) for k in self._fields])
+        return out.getvalue().encode("utf-8")
+
+    def _existing_header(self) -> Optional[List[str]]:
+        try:
+            with open(self.path, "r", encoding="utf-8", newline="") as f:
+                row = next(csv.reader(f), None)
+            return list(row) if row else None
+        except FileNotFoundError:
+            return None
+
+    # ---------------- handle ----------------
+    def _open(self):
+        """(Re)open the active file if missing, replaced, or not yet open."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            st = None
+        if self._fh is not None and st is not None and st.st_ino == self._ino:
+            return self._fh
+        if self._fh is not None:
+            self._fh.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.path, "ab")
+        self._ino = os.fstat(self._fh.fileno()).st_ino
+        if self.fmt == "csv" and self._fh.tell() == 0 and self._fields:
+            out = _stdio.StringIO()
+            csv.writer(out, lineterminator="\n").writerow(self._fields)
+            self._fh.write(out.getvalue().encode("utf-8"))
+        return self._fh
+
+    # ---------------- public API ----------------
+    def write(self, record: dict) -> None:
+        data = self._encode(record)
+        with self._lock:
+            self._buf.append(data)
+            self._buf_bytes += len(data)
+            self.stats["records"] += 1
+            due = (
+                len(self._buf) >= self.flush_records
+                or self._buf_bytes >= self.flush_bytes
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        if due:
+            self.flush()
+
+    def write_many(self, records: Iterable[dict]) -> None:
+        for r in records:
+            self.write(r)
+
+    def flush(self) -> None:
+        """Group commit: one write() of everything buffered, then maybe rotate."""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._buf:
+                return
+            payload = b"".join(self._buf)
+            self._buf.clear()
+            self._buf_bytes = 0
+            fh = self._open()
+            fh.write(payload)
+            fh.flush()
+            self.stats["flushes"] += 1
+            size = fh.tell()
+        if self.max_bytes and size >= self.max_bytes:
+            self.rotate()
+
+    def rotate(self) -> Optional[Path]:
+        """Close the active segment now; roll it up / prune old segments."""
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+            closed = jsonl_log.rotate(
+                self.path, 1, index_key=None if self.fmt == "csv" else "timestamp"
+            )
+            if closed is None:
+                return None
+            self.stats["rotations"] += 1
+        if self.rollup:
+            rollup_segment(closed, fmt=self.fmt)
+        if self.keep_segments:
+            prune_segments(self.path, int(self.keep_segments))
+        return closed
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    def __enter__(self) -> "BufferedLogWriter":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+# ------------------------------------------------------------
+# Roll-up / pruning
+# ------------------------------------------------------------
+def rollup_segment(seg: Path, fmt: str = "jsonl") -> Optional[Path]:
+    """Write ``seg`` as parquet next to it (analytics copy of a closed segment)."""
+    out = seg.with_suffix(".parquet")
+    try:
+        df = pl.read_csv(seg) if fmt == "csv" else pl.read_ndjson(seg, infer_schema_length=None)
+        if df.is_empty():
+            return None
+        tmp = out.with_suffix(".parquet.tmp")
+        df.write_parquet(tmp, compression="zstd")
+        tmp.replace(out)
+        return out
+    except Exception as e:
+        log.debug(f"[LogWriter] roll-up skipped for {seg.name}: {e}")
+        return None
+
+
+def prune_segments(path: Path, keep: int) -> List[Path]:
+    """Delete raw closed segments beyond the newest ``keep`` (parquet roll-ups stay)."""
+    closed = [p for p in jsonl_log.segments(path) if p != Path(path)]
+    removed = closed[: max(0, len(closed) - keep)]
+    for p in removed:
+        p.unlink(missing_ok=True)
+        p.with_name(p.name + ".idx").unlink(missing_ok=True)
+    return removed
+
+
+def scan_rollups(path: str | Path) -> Optional[pl.LazyFrame]:
+    """Lazy frame over every parquet roll-up of ``path`` (None if there are none)."""
+    p = Path(path)
+    files = sorted(p.parent.glob(f"{p.stem}.*.parquet"))
+    return pl.scan_parquet(files) if files else None
+
+
+# ------------------------------------------------------------
+# Process-wide registry (one handle per file)
+# ------------------------------------------------------------
+_WRITERS: "OrderedDict[str, BufferedLogWriter]" = OrderedDict()
+_REG_LOCK = threading.Lock()
+
+
+def get_writer(path: str | Path, **opts) -> BufferedLogWriter:
+    """Shared writer for ``path``; options apply when it is first created."""
+    key = os.path.abspath(Path(path).expanduser())
+    with _REG_LOCK:
+        w = _WRITERS.get(key)
+        if w is not None:
+            _WRITERS.move_to_end(key)
+            return w
+        w = _WRITERS[key] = BufferedLogWriter(key, **opts)
+        limit = int(_cfg().get("MAX_OPEN_WRITERS", 64))
+        while len(_WRITERS) > limit:
+            _, old = _WRITERS.popitem(last=False)
+            old.close()
+    return w
+
+
+def flush_all() -> None:
+    for w in list(_WRITERS.values()):
+        try:
+            w.flush()
+        except Exception as e:
+            log.debug(f"[LogWriter] flush failed for {w.path.name}: {e}")
+
+
+def close_all() -> None:
+    with _REG_LOCK:
+        writers = list(_WRITERS.values())
+        _WRITERS.clear()
+    for w in writers:
+        try:
+            w.close()
+        except Exception as e:
+            log.debug(f"[LogWriter] close failed for {w.path.name}: {e}")
+
+
+atexit.register(close_all)
+
+__all__ = [
+    "BufferedLogWriter",
+    "close_all",
+    "flush_all",
+    "get_writer",
+    "prune_segments",
+    "rollup_segment",
+    "scan_rollups",
+]
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/helpers/market.py — v9.6 (single source of truth for time/calendar)
+# queen/helpers/market.py — v9.7 (single source of truth for time/calendar)
 # ============================================================
 """Market Time & Calendar Utilities
 --------------------------------
 ✅ Delegates ALL exchange data to queen.settings.settings (no hardcoded TF tokens)
 ✅ Provides working-day / holiday logic, market-open gates, and async sleep helpers
+✅ Trading-day arithmetic runs on a precomputed NumPy busday calendar (O(1) lookups)
 ❌ Does NOT parse timeframe tokens (delegated to helpers.intervals / settings.timeframes)
 """
 
@@ -14,10 +15,12 @@ from __future__ import annotations
 import asyncio
 import datetime as dt
 import random
+from collections.abc import Iterable
 from datetime import date, timedelta
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import polars as pl
 
 from queen.helpers import io
@@ -179,8 +182,123 @@ def _holidays() -> dict[int, set[str]]:
 
 def reload_holidays() -> None:
     """Force a reload of the holidays cache (e.g., when file updated)."""
-    global _HOLIDAYS_CACHE
+    global _HOLIDAYS_CACHE, _CALENDAR
     _HOLIDAYS_CACHE = None
+    _CALENDAR = None
+
+
+# -----------------------------
+# Trading calendar (NumPy busday, precomputed)
+# -----------------------------
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_CAL_PAD_YEARS = (20, 2)  # years before / after the known holiday span
+_CALENDAR: TradingCalendar | None = None
+
+
+def _as_date(d: date | dt.datetime) -> date:
+    return d.date() if isinstance(d, dt.datetime) else d
+
+
+class TradingCalendar:
+    """Trading days over [first_year, last_year] as NumPy arrays.
+
+    mask[i]  → is (start + i) a trading day
+    cum[i]   → number of trading days in [start, start + i)
+    days     → the trading days themselves (datetime64[D], sorted)
+
+    Point queries and range counts are index arithmetic; dates outside the
+    precomputed span fall back to ``np.busday_*`` with the same busdaycal.
+    """
+
+    def __init__(
+        self,
+        holidays: Iterable[str | date],
+        trading_days: Iterable[str] = TRADING_DAYS,
+        first_year: int = 2000,
+        last_year: int = 2035,
+    ):
+        names = set(trading_days)
+        hol = np.array(sorted({str(h)[:10] for h in holidays}), dtype="datetime64[D]")
+        self.busdaycal = np.busdaycalendar(
+            weekmask=[1 if n in names else 0 for n in _WEEKDAYS], holidays=hol
+        )
+        self.start = date(first_year, 1, 1)
+        span = np.arange(
+            np.datetime64(self.start, "D"), np.datetime64(f"{last_year + 1}-01-01"), dtype="datetime64[D]"
+        )
+        self.mask = np.is_busday(span, busdaycal=self.busdaycal)
+        self.cum = np.concatenate(([0], np.cumsum(self.mask, dtype=np.int64)))
+        self.days = span[self.mask]
+        self._n = len(span)
+
+    def _pos(self, d: date) -> int | None:
+        i = (d - self.start).days
+        return i if 0 <= i < self._n else None
+
+    def is_trading_day(self, d: date | dt.datetime) -> bool:
+        d = _as_date(d)
+        i = self._pos(d)
+        if i is None:
+            return bool(np.is_busday(np.datetime64(d, "D"), busdaycal=self.busdaycal))
+        return bool(self.mask[i])
+
+    def offset(self, d: date | dt.datetime, n: int) -> date:
+        """``n`` trading days after (n > 0) / before (n < 0) ``d``; ``d`` itself never counts."""
+        d = _as_date(d)
+        if n == 0:
+            return d
+        i = self._pos(d)
+        if i is not None:
+            k = int(self.cum[i])  # trading days strictly before d
+            j = (k + bool(self.mask[i]) + n - 1) if n > 0 else (k + n)
+            if 0 <= j < len(self.days):
+                return self.days[j].item()
+        roll = "backward" if n > 0 else "forward"
+        return np.busday_offset(np.datetime64(d, "D"), n, roll=roll, busdaycal=self.busdaycal).item()
+
+    def count(self, start: date | dt.datetime, end: date | dt.datetime) -> int:
+        """Trading days in [start, end] (inclusive; 0 if end < start)."""
+        a, b = _as_date(start), _as_date(end)
+        if b < a:
+            return 0
+        i, j = self._pos(a), self._pos(b)
+        if i is not None and j is not None:
+            return int(self.cum[j + 1] - self.cum[i])
+        return int(
+            np.busday_count(np.datetime64(a, "D"), np.datetime64(b + timedelta(days=1), "D"), busdaycal=self.busdaycal)
+        )
+
+    def between(self, start: date | dt.datetime, end: date | dt.datetime) -> list[date]:
+        """Trading days in [start, end] (inclusive, ascending)."""
+        a, b = _as_date(start), _as_date(end)
+        if b < a:
+            return []
+        i, j = self._pos(a), self._pos(b)
+        if i is not None and j is not None:
+            return self.days[self.cum[i] : self.cum[j + 1]].tolist()
+        span = np.arange(np.datetime64(a, "D"), np.datetime64(b + timedelta(days=1), "D"))
+        return span[np.is_busday(span, busdaycal=self.busdaycal)].tolist()
+
+    def mask_for(self, dates) -> np.ndarray:
+        """Vectorized is-trading-day over any array-like of dates/datetime64."""
+        arr = np.asarray(dates, dtype="datetime64[D]")
+        return np.is_busday(arr, busdaycal=self.busdaycal)
+
+
+def trading_calendar() -> TradingCalendar:
+    """Process-wide calendar built from the holiday file (rebuilt after reload_holidays)."""
+    global _CALENDAR
+    if _CALENDAR is None:
+        hol = _holidays()
+        years = sorted(hol) or [dt.datetime.now(MARKET_TZ).year]
+        this_year = dt.datetime.now(MARKET_TZ).year
+        _CALENDAR = TradingCalendar(
+            (d for ds in hol.values() for d in ds),
+            TRADING_DAYS,
+            first_year=min(years[0], this_year) - _CAL_PAD_YEARS[0],
+            last_year=max(years[-1], this_year) + _CAL_PAD_YEARS[1],
+        )
+    return _CALENDAR
 
 
 # -----------------------------
@@ -200,33 +318,40 @@ def is_holiday(d: date | None = None) -> bool:
 
 
 def is_working_day(d: date) -> bool:
-    return d.strftime("%A") in TRADING_DAYS and not is_holiday(d)
+    return trading_calendar().is_trading_day(d)
 
 
 def last_working_day(ref: date | None = None) -> date:
     ref = ref or dt.datetime.now(MARKET_TZ).date()
-    d = ref
-    while not is_working_day(d):
-        d -= timedelta(days=1)
-    return d
+    cal = trading_calendar()
+    return _as_date(ref) if cal.is_trading_day(ref) else cal.offset(ref, -1)
 
 
 def next_working_day(d: date) -> date:
-    d = d + timedelta(days=1)
-    while not is_working_day(d):
-        d += timedelta(days=1)
-    return d
+    return trading_calendar().offset(d, 1)
 
 
 def offset_working_day(start: date, offset: int) -> date:
-    cur = start
-    step = 1 if offset > 0 else -1
-    remain = abs(offset)
-    while remain > 0:
-        cur += timedelta(days=step)
-        if is_working_day(cur):
-            remain -= 1
-    return cur
+    return trading_calendar().offset(start, offset)
+
+
+def trading_days_between(start: date, end: date) -> int:
+    """Number of trading days in [start, end] (inclusive)."""
+    return trading_calendar().count(start, end)
+
+
+def trading_days_in_range(start: date, end: date) -> list[date]:
+    """Trading days in [start, end] (inclusive, ascending)."""
+    return trading_calendar().between(start, end)
+
+
+def previous_trading_days(ref: date, n: int) -> list[date]:
+    """The ``n`` trading days strictly before ``ref``, most recent first."""
+    if n <= 0:
+        return []
+    cal = trading_calendar()
+    first = cal.offset(ref, -n)
+    return cal.between(first, ref - timedelta(days=1))[::-1][:n]
 
 
 # -----------------------------
@@ -244,18 +369,143 @@ _SESSIONS = {
 
 
 def current_session(now: dt.datetime | None = None) -> str:
-    now = ensure_tz_aware(now or dt.datetime.now(MARKET_TZ))
+    t = ensure_tz_aware(now or dt.datetime.now(MARKET_TZ)).time()
     for name, (start, end) in _SESSIONS.items():
-        s = dt.datetime.combine(now.date(), start, MARKET_TZ)
-        e = dt.datetime.combine(now.date(), end, MARKET_TZ)
-        if s <= now <= e:
+        if start <= t <= end:
             return name
     return "CLOSED"
 
 
+def session_expr(ts: str | pl.Expr = "timestamp") -> pl.Expr:
+    """Vectorized ``current_session`` over a market-local Datetime column.
+
+    Convert tz-aware columns first (see ``with_session_columns``); the first
+    matching window wins, boundaries inclusive, like ``current_session``.
+    """
+    t = (pl.col(ts) if isinstance(ts, str) else ts).dt.time()
+    expr = None
+    for name, (start, end) in _SESSIONS.items():
+        cond = t.is_between(pl.lit(start), pl.lit(end), closed="both")
+        expr = pl.when(cond).then(pl.lit(name)) if expr is None else expr.when(cond).then(pl.lit(name))
+    return expr.otherwise(pl.lit("CLOSED"))
+
+
+# Strategy-facing intraday buckets: [start, end), last one closed at CLOSE
+_MID_START, _LATE_START = dt.time(10, 30), dt.time(13, 30)
+TIME_BUCKETS = (
+    ("OPENING_DRIVE", _SESSIONS["REGULAR"][0], _MID_START),
+    ("MID_SESSION", _MID_START, _LATE_START),
+    ("LATE_SESSION", _LATE_START, _SESSIONS["REGULAR"][1]),
+)
+TIME_BUCKET_NAMES = frozenset(name for name, _, _ in TIME_BUCKETS)
+TIME_COLUMNS = ("time_bucket", "session_phase", "minutes_from_open")
+
+
+def parse_market_ts(ts) -> dt.datetime | None:
+    """Best-effort scalar parse (datetime / ISO string); wall clock as given."""
+    if isinstance(ts, dt.datetime):
+        return ts
+    if ts is None:
+        return None
+    s = str(ts).strip()
+    if not s:
+        return None
+    try:
+        return dt.datetime.fromisoformat(s)
+    except ValueError:
+        pass
+    for sep in ("+", "Z"):
+        if sep in s:
+            try:
+                return dt.datetime.fromisoformat(s.split(sep)[0])
+            except ValueError:
+                continue
+    return None
+
+
+def time_bucket(ts) -> str:
+    """Scalar time bucket for one timestamp (UNKNOWN outside the session)."""
+    parsed = parse_market_ts(ts)
+    if parsed is None:
+        return "UNKNOWN"
+    t = parsed.time()
+    for i, (name, start, end) in enumerate(TIME_BUCKETS):
+        if start <= t < end or (i == len(TIME_BUCKETS) - 1 and t == end):
+            return name
+    return "UNKNOWN"
+
+
+def time_bucket_expr(ts: str | pl.Expr = "timestamp") -> pl.Expr:
+    """Vectorized ``time_bucket`` over a market-local Datetime column."""
+    t = (pl.col(ts) if isinstance(ts, str) else ts).dt.time()
+    expr = None
+    for i, (name, start, end) in enumerate(TIME_BUCKETS):
+        closed = "both" if i == len(TIME_BUCKETS) - 1 else "left"
+        cond = t.is_between(pl.lit(start), pl.lit(end), closed=closed)
+        expr = pl.when(cond).then(pl.lit(name)) if expr is None else expr.when(cond).then(pl.lit(name))
+    return expr.otherwise(pl.lit("UNKNOWN"))
+
+
+def _local_ts(df: pl.DataFrame, ts_col: str) -> pl.Expr:
+    """Market-local naive Datetime expression for ``ts_col``.
+
+    tz-aware Datetime → converted to MARKET_TZ; naive → taken as market-local;
+    strings → parsed at the wall clock written (offset suffix ignored).
+    """
+    dtype = df.schema[ts_col]
+    col = pl.col(ts_col)
+    if dtype == pl.Utf8:
+        return (
+            col.str.replace(r"(Z|[+-]\d{2}:?\d{2})$", "")
+            .str.replace("T", " ", literal=True)
+            .str.to_datetime(strict=False)
+        )
+    if isinstance(dtype, pl.Datetime) and dtype.time_zone:
+        return col.dt.convert_time_zone(MARKET_TZ_KEY).dt.replace_time_zone(None)
+    return col
+
+
+def with_session_columns(
+    df: pl.DataFrame, ts_col: str = "timestamp", *, prefix: str = ""
+) -> pl.DataFrame:
+    """Add ``session`` (PRE_MARKET/REGULAR/POST_MARKET/CLOSED) and ``is_trading_day``.
+
+    One pass, no per-row Python (see ``_local_ts`` for timezone handling).
+    """
+    if df.is_empty() or ts_col not in df.columns:
+        return df
+    local = _local_ts(df, ts_col)
+    days = pl.Series(trading_calendar().days, dtype=pl.Date)
+    return df.with_columns(
+        session_expr(local).alias(f"{prefix}session"),
+        local.dt.date().is_in(days.implode()).alias(f"{prefix}is_trading_day"),
+    )
+
+
+def with_time_columns(df: pl.DataFrame, ts_col: str = "timestamp") -> pl.DataFrame:
+    """Add ``time_bucket``, ``session_phase`` and ``minutes_from_open`` in one pass.
+
+    Works on candle frames and on row frames (replay / scan output, where the
+    timestamp may be a string). Strategies read these columns instead of
+    re-parsing each row's timestamp.
+    """
+    if df.is_empty() or ts_col not in df.columns:
+        return df
+    local = _local_ts(df, ts_col)
+    open_t = _SESSIONS["REGULAR"][0]
+    open_min = open_t.hour * 60 + open_t.minute
+    return df.with_columns(
+        time_bucket_expr(local).alias("time_bucket"),
+        session_expr(local).alias("session_phase"),
+        (local.dt.hour().cast(pl.Int32) * 60 + local.dt.minute().cast(pl.Int32) - open_min).alias(
+            "minutes_from_open"
+        ),
+    )
+
+
 def is_market_open(now: dt.datetime | None = None) -> bool:
     now = ensure_tz_aware(now or dt.datetime.now(MARKET_TZ))
-    if now.strftime("%A") not in TRADING_DAYS or is_holiday(now.date()):
+    if not is_working_day(now.date()):
         return False
     s, e = _SESSIONS["REGULAR"]
     sdt = dt.datetime.combine(now.date(), s, MARKET_TZ)
@@ -264,6 +514,16 @@ def is_market_open(now: dt.datetime | None = None) -> bool:
     return sdt <= now <= edt
 
 
+def last_session_close(now: dt.datetime | None = None) -> dt.datetime:
+    """Most recent regular-session close at or before ``now`` (tz-aware)."""
+    now = ensure_tz_aware(now or dt.datetime.now(MARKET_TZ))
+    close_t = _SESSIONS["REGULAR"][1]
+    d = now.date()
+    if not is_working_day(d) or now < dt.datetime.combine(d, close_t, MARKET_TZ):
+        d = last_working_day(d - timedelta(days=1))
+    return dt.datetime.combine(d, close_t, MARKET_TZ)
+
+
 def _intraday_available(now: dt.datetime) -> bool:
     if now.strftime("%A") not in TRADING_DAYS or is_holiday(now.date()):
         return False
@@ -59,8 +59,8 @@ def validate_strike(symbol: str, expiry: int, strike: float) -> bool:
 
 def get_atm_ladder(strikes: List[float], ltp: float, width: int = 2) -> dict:
     """
-    Return ATM+1/+2/-1/-2 strikes.
-    width = 2 → returns 5 strikes (ATM, ±1, ±2)
+    Return ATM+1/+2/-1/-2 strikes, plus ``window`` = ATM±width strikes.
+    width = 2 → window has 5 strikes (ATM, ±1, ±2)
     """
     if not strikes:
         return {}
@@ -75,4 +75,5 @@ def get_atm_ladder(strikes: List[float], ltp: float, width: int = 2) -> dict:
         "plus_two": strikes[idx + 2] if idx + 2 < len(strikes) else None,
         "minus_one": strikes[idx - 1] if idx - 1 >= 0 else None,
         "minus_two": strikes[idx - 2] if idx - 2 >= 0 else None,
+        "window": strikes[max(0, idx - width): idx + width + 1],
     }
@@ -49,14 +49,18 @@ class AsyncTokenBucket:
         *,
         jitter_min: float = 0.002,
         jitter_max: float = 0.01,
+        burst: float | None = None,
     ):
         rate = float(rate_per_second or DEFAULT_QPS)
         if rate <= 0:
             raise ValueError("rate_per_second must be > 0")
 
         self.rate = rate
-        self.capacity = rate  # burst capacity per second
-        self.tokens = float(rate)
+        # burst capacity: one second of tokens, but never below one request
+        # (sub-1/s rates such as 20 req/min would otherwise never fill)
+        self._burst = float(burst) if burst else None
+        self.capacity = self._burst or max(1.0, rate)
+        self.tokens = float(self.capacity)
         self.last_refill = time.monotonic()
         self.lock = asyncio.Lock()
         self.name = name
@@ -118,7 +122,7 @@ class AsyncTokenBucket:
             now = time.monotonic()
             self._refill_unlocked(now)
             self.rate = float(rate_per_second)
-            self.capacity = float(rate_per_second)
+            self.capacity = self._burst or max(1.0, float(rate_per_second))
             self.tokens = min(self.tokens, self.capacity)
             self.last_refill = now
 
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/helpers/refresh_ledger.py — v1.1 (conditional refresh for scraped sources)
+# ============================================================
+"""Per-key refresh ledger for scrapers.
+
+Remembers, per symbol, what the last fetch returned: HTTP validators
+(ETag / Last-Modified), a content hash, body size, fetch time and the
+latest reported period. Scrapers use it to:
+
+  • send conditional requests (If-None-Match / If-Modified-Since)
+  • skip symbols whose data cannot have changed since the last fetch
+    (next results window not open yet, no known result date passed)
+  • order the batch so symbols with due/known result dates go first
+  • report requests and bytes saved per run
+"""
+
+from __future__ import annotations
+
+import calendar
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from queen.helpers.logger import log
+
+DateLike = Union[date, datetime, float, int, str]
+
+_PERIOD_FORMATS = ("%b %Y", "%d-%b-%Y", "%d %b %Y", "%Y-%m-%d", "%d-%m-%Y", "%B %Y")
+
+
+# ------------------------------------------------------------
+# Period / results-window helpers
+# ------------------------------------------------------------
+def _parse_date(text: str) -> Optional[date]:
+    text = text.strip()
+    for fmt in _PERIOD_FORMATS:
+        try:
+            return datetime.strptime(text.title() if "%b" in fmt else text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def parse_period(label: Any) -> Optional[date]:
+    """Parse a reporting-period label ('Sep 2025', '30-Sep-2025', ISO) to its month end."""
+    if isinstance(label, datetime):
+        d = label.date()
+    elif isinstance(label, date):
+        d = label
+    elif isinstance(label, str) and label.strip():
+        d = _parse_date(label)
+    else:
+        d = None
+    if d is None:
+        return None
+    return d.replace(day=calendar.monthrange(d.year, d.month)[1])
+
+
+def _add_months(d: date, months: int) -> date:
+    m = d.month - 1 + months
+    y, m = d.year + m // 12, m % 12 + 1
+    return date(y, m, calendar.monthrange(y, m)[1])
+
+
+def results_window(
+    period: Any,
+    lag_days: int,
+    annual_extra_days: int = 15,
+) -> Optional[Tuple[date, date]]:
+    """
+    Window in which the *next* period's numbers can appear.
+
+    Opens at the next quarter end and closes ``lag_days`` later
+    (+ ``annual_extra_days`` for March quarter ends, when annual results
+    get the longer filing deadline).
+    """
+    last = parse_period(period)
+    if last is None:
+        return None
+    start = _add_months(last, 3)
+    extra = annual_extra_days if start.month == 3 else 0
+    return start, start + timedelta(days=lag_days + extra)
+
+
+def _epoch(v: DateLike) -> Optional[float]:
+    if isinstance(v, (int, float)):
+        return float(v)
+    if isinstance(v, datetime):
+        return v.timestamp()
+    if isinstance(v, date):
+        return datetime(v.year, v.month, v.day).timestamp()
+    if isinstance(v, str):
+        try:
+            return datetime.fromisoformat(v).timestamp()
+        except ValueError:
+            d = _parse_date(v)
+            return _epoch(d) if d else None
+    return None
+
+
+def content_hash(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+# ------------------------------------------------------------
+# Stats
+# ------------------------------------------------------------
+@dataclass
+class RefreshStats:
+    requests: int = 0           # requests actually sent
+    changed: int = 0            # 200 with new content
+    unchanged: int = 0          # 200 with identical content hash (parse skipped)
+    not_modified: int = 0       # 304 (body not transferred)
+    skipped: int = 0            # not requested at all
+    bytes_downloaded: int = 0
+    bytes_saved: int = 0        # last known body size of skipped / 304 keys
+
+    @property
+    def requests_saved(self) -> int:
+        return self.skipped
+
+    def summary(self) -> str:
+        return (
+            f"requests={self.requests} saved={self.requests_saved} "
+            f"(changed={self.changed} unchanged={self.unchanged} "
+            f"304={self.not_modified} skipped={self.skipped}) "
+            f"bytes={self.bytes_downloaded / 1e6:.2f}MB saved≈{self.bytes_saved / 1e6:.2f}MB"
+        )
+
+
+# ------------------------------------------------------------
+# Ledger
+# ------------------------------------------------------------
+class RefreshLedger:
+    """JSON-backed, thread-safe refresh ledger for one source.
+
+    Args:
+        path: ledger file (written atomically on save()).
+        name: source label for logs.
+        max_age: seconds after which a key is always refetched.
+        recheck: while a results window is open and the new period has not
+            shown up yet, refetch at most this often (seconds).
+        result_lag_days: filing deadline after quarter end for this source.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        name: str = "refresh",
+        max_age: float = 7 * 86400,
+        recheck: float = 86400,
+        result_lag_days: int = 45,
+    ):
+        self.path = Path(path)
+        self.name = name
+        self.max_age = float(max_age)
+        self.recheck = float(recheck)
+        self.result_lag_days = int(result_lag_days)
+        self.stats = RefreshStats()
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    # ---------------- persistence ----------------
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception as e:
+            log.warning(f"[Refresh:{self.name}] ledger unreadable, starting fresh: {e}")
+            self._entries = {}
+
+    def save(self) -> None:
+        with self._lock:
+            payload = json.dumps(self._entries, ensure_ascii=False, default=str)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            tmp.replace(self.path)
+        except Exception as e:
+            log.error(f"[Refresh:{self.name}] ledger save failed: {e}")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            e = self._entries.get(key)
+            return dict(e) if e else None
+
+    # ---------------- requests ----------------
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since for the key's last response."""
+        e = self.get(key) or {}
+        h: Dict[str, str] = {}
+        if e.get("etag"):
+            h["If-None-Match"] = e["etag"]
+        if e.get("last_modified"):
+            h["If-Modified-Since"] = e["last_modified"]
+        return h
+
+    def _due_rank(
+        self,
+        key: str,
+        now: float,
+        known: Optional[float],
+    ) -> Optional[Tuple[int, float]]:
+        """(priority, tiebreak) if the key should be fetched, else None."""
+        e = self._entries.get(key)
+        if not e or not e.get("fetched_at"):
+            return (2, 0.0)
+        fetched = float(e["fetched_at"])
+
+        # Known publication date passed since our last fetch
+        if known is not None and fetched < known <= now:
+            return (0, -known)
+
+        # Results window open and the new period not seen yet
+        win = e.get("window")
+        if win:
+            start, end = _epoch(win[0]), _epoch(win[1])
+            # end is the deadline date itself → open through that whole day
+            open_ = start is not None and start <= now and (end is None or now < end + 86400)
+            if open_ and now - fetched >= self.recheck:
+                return (1, end or now)
+
+        if now - fetched >= self.max_age:
+            return (3, fetched)
+        return None
+
+    def is_due(
+        self,
+        key: str,
+        *,
+        now: Optional[float] = None,
+        result_date: Optional[DateLike] = None,
+    ) -> bool:
+        now = time.time() if now is None else now
+        known = _epoch(result_date) if result_date is not None else None
+        with self._lock:
+            return self._due_rank(key, now, known) is not None
+
+    def plan(
+        self,
+        keys: Iterable[str],
+        *,
+        now: Optional[float] = None,
+        result_dates: Optional[Mapping[str, DateLike]] = None,
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Split keys into (due, skipped); due is ordered by priority:
+        known result date just passed > results window open > never fetched
+        > stale by max_age (oldest first).
+        """
+        now = time.time() if now is None else now
+        result_dates = result_dates or {}
+        ranked: List[Tuple[Tuple[int, float], int, str]] = []
+        skipped: List[str] = []
+        with self._lock:
+            for i, k in enumerate(keys):
+                rd = result_dates.get(k)
+                rank = self._due_rank(k, now, _epoch(rd) if rd is not None else None)
+                if rank is None:
+                    skipped.append(k)
+                else:
+                    ranked.append((rank, i, k))
+        ranked.sort()
+        return [k for _, _, k in ranked], skipped
+
+    # ---------------- recording ----------------
+    def record_skip(self, key: str) -> None:
+        with self._lock:
+            e = self._entries.get(key) or {}
+            self.stats.skipped += 1
+            self.stats.bytes_saved += int(e.get("bytes") or 0)
+
+    def record_response(
+        self,
+        key: str,
+        *,
+        status: int,
+        headers: Optional[Mapping[str, str]] = None,
+        content: Optional[bytes] = None,
+        size: Optional[int] = None,
+        data: Any = None,
+    ) -> str:
+        """
+        Record one response; returns "not_modified", "unchanged" or "changed".
+
+        ``size`` overrides len(content) for byte accounting (e.g. when the
+        hash is taken over extracted fields rather than the raw page).
+        ``data`` is stored as-is for sources that want the last payload back
+        when a key is skipped.
+        """
+        headers = headers or {}
+        now = time.time()
+        with self._lock:
+            e = self._entries.setdefault(key, {})
+            self.stats.requests += 1
+            e["fetched_at"] = now
+            etag = headers.get("etag") or headers.get("ETag")
+            lm = headers.get("last-modified") or headers.get("Last-Modified")
+            if etag:
+                e["etag"] = etag
+            if lm:
+                e["last_modified"] = lm
+
+            if status == 304:
+                self.stats.not_modified += 1
+                self.stats.bytes_saved += int(e.get("bytes") or 0)
+                return "not_modified"
+
+            nbytes = int(size if size is not None else len(content or b""))
+            self.stats.bytes_downloaded += nbytes
+            digest = content_hash(content) if content is not None else None
+            same = digest is not None and digest == e.get("hash")
+            e["hash"] = digest
+            e["bytes"] = nbytes
+            if data is not None:
+                e["data"] = data
+            if same:
+                self.stats.unchanged += 1
+                return "unchanged"
+            self.stats.changed += 1
+            return "changed"
+
+    def set_period(self, key: str, period: Any) -> None:
+        """Store the latest reported period and the window for the next one."""
+        win = results_window(period, self.result_lag_days)
+        with self._lock:
+            e = self._entries.setdefault(key, {})
+            e["period"] = str(period) if period is not None else None
+            e["window"] = [win[0].isoformat(), win[1].isoformat()] if win else None
+
+    def report(self) -> RefreshStats:
+        log.info(f"[Refresh:{self.name}] {self.stats.summary()}")
+        return self.stats
+
+
+__all__ = [
+    "RefreshLedger",
+    "RefreshStats",
+    "content_hash",
+    "parse_period",
+    "results_window",
+]
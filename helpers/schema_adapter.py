@@ -5,7 +5,7 @@
 """Queen Schema Adapter — Unified Broker Schema Bridge
 ------------------------------------------------------
 ✅ Reads broker schema via settings (single source of truth)
-✅ Exposes SCHEMA at module level for consumers (DRY)
+✅ Exposes SCHEMA at module level for consumers (DRY; loaded on first access)
 ✅ Adds get_supported_intervals()/validate helpers for UX/DX
 ✅ Uses settings-driven log + drift paths
 ✅ Polars-native builders for candle frames
@@ -17,6 +17,7 @@ import argparse
 import json
 from collections.abc import Iterable
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -59,8 +60,25 @@ def _load_schema() -> dict:
         return {}
 
 
-SCHEMA: dict[str, Any] = _load_schema()
-ERROR_CODES: dict[str, str] = SCHEMA.get("error_codes", {})
+@lru_cache(maxsize=1)
+def get_schema() -> dict[str, Any]:
+    """Broker schema, read once on first use (not at import)."""
+    return _load_schema()
+
+
+def _error_codes() -> dict[str, str]:
+    return get_schema().get("error_codes", {})
+
+
+def __getattr__(name: str):
+    # SCHEMA / ERROR_CODES stay importable by name but load lazily
+    if name == "SCHEMA":
+        return get_schema()
+    if name == "ERROR_CODES":
+        return _error_codes()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 DEFAULT_SCHEMA = ["timestamp", "open", "high", "low", "close", "volume", "oi"]
 
 
@@ -77,7 +95,7 @@ def _parse_range_token(tok: str) -> tuple[int, int]:
 
 
 def _collect_intraday_supported() -> dict[str, Iterable[tuple[int, int]]]:
-    intr = SCHEMA.get("intraday_candle_api", {}).get("supported_timelines", {})
+    intr = get_schema().get("intraday_candle_api", {}).get("supported_timelines", {})
     out: dict[str, Iterable[tuple[int, int]]] = {}
     for unit, spec in intr.items():
         rng = spec.get("intervals")
@@ -86,7 +104,7 @@ def _collect_intraday_supported() -> dict[str, Iterable[tuple[int, int]]]:
 
 
 def _collect_historical_supported() -> dict[str, Iterable[tuple[int, int]]]:
-    hist = SCHEMA.get("historical_candle_api", {}).get("supported_timelines", {})
+    hist = get_schema().get("historical_candle_api", {}).get("supported_timelines", {})
     out: dict[str, Iterable[tuple[int, int]]] = {}
     for unit, entries in hist.items():
         ranges: list[tuple[int, int]] = []
@@ -314,12 +332,12 @@ def _log_drift(cols: list[str]):
 class UpstoxAPIError(Exception):
     def __init__(self, code: str, message: str | None = None):
         self.code = code
-        self.message = message or ERROR_CODES.get(code, "Unknown error")
+        self.message = message or _error_codes().get(code, "Unknown error")
         super().__init__(f"[{code}] {self.message}")
 
 
 def handle_api_error(code: str):
-    if code in ERROR_CODES:
+    if code in _error_codes():
         raise UpstoxAPIError(code)
     log.error(f"[SchemaAdapter] Unmapped error code: {code}")
     raise UpstoxAPIError(code, "Unmapped error code.")
@@ -380,7 +398,7 @@ def run_cli():
         table = Table(show_header=True, title="Broker Field Mapping")
         table.add_column("Section", style="bold magenta")
         table.add_column("Fields", style="white")
-        for section, fields in SCHEMA.get("field_mapping", {}).items():
+        for section, fields in get_schema().get("field_mapping", {}).items():
             table.add_row(section, ", ".join(fields))
         console.print(Panel(table, title="[bold green]📘 Broker Schema[/bold green]"))
     elif args.validate:
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/helpers/shareholding_fetcher.py — v1.0 (Production)
+# queen/helpers/shareholding_fetcher.py — v1.1 (Production)
 # ============================================================
 """NSE Shareholding Pattern Fetcher
 Fetches promoter, FII, DII, public holdings from NSE's corporate disclosures API
-Cache-enabled with 24h TTL
+Cache-enabled with 24h TTL; past the TTL, a refresh ledger decides whether the
+symbol is worth refetching (next filing window open / stale) and sends
+conditional requests so unchanged patterns are not re-parsed.
 """
 
 from __future__ import annotations
@@ -20,6 +22,7 @@ from typing import Dict, Optional, Any
 import httpx
 
 from queen.helpers.logger import log
+from queen.helpers.refresh_ledger import RefreshLedger
 from queen.settings.settings import PATHS
 
 # Cache configuration
@@ -27,6 +30,8 @@ CACHE_DIR = PATHS["CACHE"] / "shareholding"
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 CACHE_FILE = CACHE_DIR / "shareholding_cache.json"
 CACHE_TTL = 24 * 3600  # 24 hours
+LEDGER_FILE = CACHE_DIR / "refresh_ledger.json"
+FILING_LAG_DAYS = 21  # SEBI LODR Reg 31: within 21 days of quarter end
 
 # NSE API endpoints
 SHAREHOLDING_URL = "https://www.nseindia.com/api/corp-share-holding"
@@ -45,8 +50,21 @@ _HEADERS = {
 }
 
 
-def load_cache() -> Dict[str, Dict[str, Any]]:
-    """Load shareholding cache with TTL check"""
+_LEDGER: Optional[RefreshLedger] = None
+
+
+def get_ledger() -> RefreshLedger:
+    """Process-wide refresh ledger for shareholding (lazy)."""
+    global _LEDGER
+    if _LEDGER is None:
+        _LEDGER = RefreshLedger(
+            LEDGER_FILE, name="shareholding", result_lag_days=FILING_LAG_DAYS
+        )
+    return _LEDGER
+
+
+def load_cache(include_expired: bool = False) -> Dict[str, Dict[str, Any]]:
+    """Load shareholding cache with TTL check (skipped if include_expired)"""
     if not CACHE_FILE.exists():
         return {}
 
@@ -56,7 +74,7 @@ def load_cache() -> Dict[str, Dict[str, Any]]:
 
         # Filter expired entries
         now = time.time()
-        valid_cache = {
+        valid_cache = cache if include_expired else {
             k: v for k, v in cache.items()
             if (now - v.get("timestamp", 0)) < CACHE_TTL
         }
@@ -118,12 +136,20 @@ async def fetch_shareholding_pattern(
     }
     """
     symbol = symbol.strip().upper()
-    cache = load_cache()
+    cache = load_cache(include_expired=True)
+    cached = cache.get(symbol)
+    ledger = get_ledger()
 
     # Check cache first
-    if symbol in cache:
+    if cached and (time.time() - cached.get("timestamp", 0)) < CACHE_TTL:
         log.debug(f"[Shareholding] Cache hit for {symbol}")
-        return cache[symbol]["data"]
+        return cached["data"]
+
+    # Expired, but the next filing window is not open yet → nothing new to fetch
+    if cached and not ledger.is_due(symbol):
+        ledger.record_skip(symbol)
+        log.debug(f"[Shareholding] Not due for {symbol}, serving cached pattern")
+        return cached["data"]
 
     log.info(f"[Shareholding] Fetching for {symbol}")
 
@@ -135,13 +161,29 @@ async def fetch_shareholding_pattern(
         async with httpx.AsyncClient(cookies=cookies, timeout=10) as client:
             # Fetch shareholding data
             params = {"symbol": symbol}
+            headers = {**_HEADERS, **ledger.conditional_headers(symbol)} if cached else _HEADERS
             response = await client.get(
                 SHAREHOLDING_URL,
                 params=params,
-                headers=_HEADERS,
+                headers=headers,
                 timeout=15
             )
-            response.raise_for_status()
+            if response.status_code != 304:
+                response.raise_for_status()
+
+            outcome = ledger.record_response(
+                symbol,
+                status=response.status_code,
+                headers=response.headers,
+                content=response.content if response.status_code != 304 else None,
+            )
+            if cached and outcome in ("not_modified", "unchanged"):
+                log.debug(f"[Shareholding] {symbol} {outcome}, cache refreshed")
+                cached["timestamp"] = time.time()
+                save_cache(cache)
+                ledger.save()
+                return cached["data"]
+
             data = response.json()
 
             if not data or data.get("data") is None:
@@ -199,6 +241,8 @@ async def fetch_shareholding_pattern(
                 "data": holdings
             }
             save_cache(cache)
+            ledger.set_period(symbol, holdings["timestamp"])
+            ledger.save()
 
             log.info(
                 f"[Shareholding] {symbol}: P:{holdings['promoter']:.1f}% "
@@ -1,53 +1,45 @@
 import polars as pl
 import asyncio
 from typing import List
-from bse_scraper import BSEHeadlessScraper, PolarsDataProcessor
+from bse_scraper import PAGE_DELAY, BSEHeadlessScraper, PolarsDataProcessor
 import json
 import logging
 
 class BatchStockProcessor:
     """Process large batches of stocks with progress tracking"""
 
-    def __init__(self, batch_size: int = 5, max_concurrent: int = 3):
-        self.batch_size = batch_size
+    def __init__(self, batch_size: int = 5, max_concurrent: int = 3, pages_per_context: int = 2,
+                 page_delay: float = PAGE_DELAY):
+        self.batch_size = batch_size  # progress-save interval
         self.max_concurrent = max_concurrent
-        self.scraper = BSEHeadlessScraper(max_workers=max_concurrent)
+        self.scraper = BSEHeadlessScraper(max_workers=max_concurrent,
+                                          pages_per_context=pages_per_context,
+                                          page_delay=page_delay)
         self.processor = PolarsDataProcessor()
 
     async def process_large_batch(self, scripcds: List[str], output_file: str):
-        """Process large batches of stock codes"""
+        """Process large batches of stock codes through the browser pool"""
         all_results = []
 
+        def save_progress(result):
+            all_results.append(result)
+            # Save progress every batch_size completed stocks
+            if len(all_results) % self.batch_size == 0:
+                logging.info(f"Progress {len(all_results)}/{len(scripcds)} "
+                             f"({self.scraper.metrics.pages_per_sec:.2f} pages/s)")
+                data_dicts = [self.scraper.stock_data_to_dict(r) for r in all_results]
+                df = self.processor.create_dataframe(data_dicts)
+                self.processor.save_to_parquet(df, f"{output_file}_progress.parquet")
+
         await self.scraper.setup_browser()
 
         try:
-            total_batches = (len(scripcds) - 1) // self.batch_size + 1
-
-            for batch_num in range(total_batches):
-                start_idx = batch_num * self.batch_size
-                end_idx = min((batch_num + 1) * self.batch_size, len(scripcds))
-                batch = scripcds[start_idx:end_idx]
-
-                logging.info(f"Processing batch {batch_num + 1}/{total_batches} "
-                           f"({len(batch)} stocks)")
-
-                batch_results = await self.scraper.scrape_stocks_async(batch)
-                all_results.extend(batch_results)
-
-                # Save progress after each batch
-                if all_results:
-                    data_dicts = [self.scraper.stock_data_to_dict(result)
-                                for result in all_results]
-                    df = self.processor.create_dataframe(data_dicts)
-                    self.processor.save_to_parquet(df, f"{output_file}_progress.parquet")
-
-                # Rate limiting
-                if batch_num < total_batches - 1:
-                    await asyncio.sleep(3)
+            results = await self.scraper.scrape_stocks_async(scripcds, on_result=save_progress)
+            logging.info(f"Pool: {self.scraper.metrics.summary()}")
 
             # Final save
             data_dicts = [self.scraper.stock_data_to_dict(result)
-                         for result in all_results]
+                         for result in results]
             df = self.processor.create_dataframe(data_dicts)
             self.processor.save_to_parquet(df, f"{output_file}_final.parquet")
             self.processor.save_to_csv(df, f"{output_file}_final.csv")
@@ -1,19 +1,40 @@
 import polars as pl
 import asyncio
 import json
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from collections import deque
+from typing import Callable, Deque, List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, asdict
+from urllib.parse import urlparse
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from queue import Queue, Empty
 import logging
-from playwright.async_api import async_playwright
 import re
 
+try:  # optional: conditional refresh when run inside the queen package
+    from queen.helpers.refresh_ledger import RefreshLedger
+    from queen.helpers.market import is_market_open, last_session_close
+    from queen.settings.settings import PATHS
+except ImportError:  # standalone script
+    RefreshLedger = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+BSE_QUOTE_URL = "https://m.bseindia.com/StockReach.aspx?scripcd={scripcd}"
+# Politeness pause each page worker takes after a navigation (seconds)
+PAGE_DELAY = 2.0
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+VIEWPORT = {'width': 1920, 'height': 1080}
+
+# Never needed for the quote fields; aborted at the network layer
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+BLOCKED_HOSTS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "googlesyndication.com", "facebook.net", "scorecardresearch.com", "hotjar.com",
+)
+
 @dataclass
 class StockData:
     scripcd: str
@@ -30,23 +51,224 @@ class StockData:
     week_low: Optional[float] = None
     error: Optional[str] = None
 
+@dataclass
+class PoolMetrics:
+    pages: int = 0
+    errors: int = 0
+    recycled: int = 0
+    steals: int = 0
+    blocked_requests: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def pages_per_sec(self) -> float:
+        return self.pages / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        return (f"{self.pages} pages in {self.elapsed:.1f}s ({self.pages_per_sec:.2f} pages/s), "
+                f"errors={self.errors} recycled={self.recycled} steals={self.steals} "
+                f"blocked={self.blocked_requests}")
+
+
+class BrowserContextPool:
+    """Persistent browser contexts with reusable pages and a work-stealing queue.
+
+    Each context owns ``pages_per_context`` pages; every page is one worker.
+    Work is dealt round-robin into one deque per context; a worker whose
+    context runs dry steals from the tail of the longest other deque.
+    Pages are recycled after ``recycle_after`` navigations or any error.
+    """
+
+    def __init__(self, browser, contexts: int = 3, pages_per_context: int = 2,
+                 recycle_after: int = 50, block_resources: bool = True,
+                 wait_until: str = "domcontentloaded", page_delay: float = PAGE_DELAY):
+        self.browser = browser
+        self.n_contexts = max(1, contexts)
+        self.pages_per_context = max(1, pages_per_context)
+        self.recycle_after = recycle_after
+        self.block_resources = block_resources
+        self.wait_until = wait_until
+        self.page_delay = page_delay
+        self.metrics = PoolMetrics()
+        self._contexts = []
+        self._pages: List[List[Any]] = []
+        self._uses: List[List[int]] = []
+        self._queues: List[Deque[Tuple[int, str]]] = []
+
+    async def _route(self, route):
+        req = route.request
+        host = urlparse(req.url).hostname or ""
+        if req.resource_type in BLOCKED_RESOURCE_TYPES or host.endswith(BLOCKED_HOSTS):
+            self.metrics.blocked_requests += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def start(self):
+        for _ in range(self.n_contexts):
+            ctx = await self.browser.new_context(user_agent=USER_AGENT, viewport=VIEWPORT)
+            if self.block_resources:
+                await ctx.route("**/*", self._route)
+            self._contexts.append(ctx)
+            self._pages.append([await ctx.new_page() for _ in range(self.pages_per_context)])
+            self._uses.append([0] * self.pages_per_context)
+
+    async def _recycle(self, ci: int, slot: int):
+        try:
+            await self._pages[ci][slot].close()
+        except Exception:
+            pass
+        self._pages[ci][slot] = await self._contexts[ci].new_page()
+        self._uses[ci][slot] = 0
+        self.metrics.recycled += 1
+
+    def _next(self, ci: int) -> Optional[Tuple[int, str]]:
+        own = self._queues[ci]
+        if own:
+            return own.popleft()
+        victim = max(self._queues, key=len)
+        if not victim:
+            return None
+        self.metrics.steals += 1
+        return victim.pop()
+
+    async def run(self, scraper: "BSEHeadlessScraper", scripcds: List[str],
+                  on_result: Optional[Callable[[StockData], None]] = None) -> List[StockData]:
+        """Scrape all scrips across the pool; results keep input order."""
+        if not self._contexts:
+            await self.start()
+        self._queues = [deque() for _ in range(self.n_contexts)]
+        for i, code in enumerate(scripcds):
+            self._queues[i % self.n_contexts].append((i, code))
+        results: List[Optional[StockData]] = [None] * len(scripcds)
+        t0 = time.perf_counter()
+        base_elapsed = self.metrics.elapsed
+
+        async def worker(ci: int, slot: int):
+            while True:
+                item = self._next(ci)
+                if item is None:
+                    return
+                idx, code = item
+                if self._uses[ci][slot] >= self.recycle_after:
+                    try:
+                        await self._recycle(ci, slot)
+                    except Exception as e:
+                        # Hand the scrip back to the pool and retire this slot
+                        self._queues[ci].appendleft(item)
+                        logger.error(f"Pool slot {ci}.{slot} dropped (recycle failed): {e}")
+                        return
+                self._uses[ci][slot] += 1
+                data = await scraper.scrape_single_stock(
+                    code, page=self._pages[ci][slot], wait_until=self.wait_until
+                )
+                self.metrics.pages += 1
+                results[idx] = data
+                self.metrics.elapsed = base_elapsed + time.perf_counter() - t0
+                if on_result is not None:
+                    on_result(data)
+                if data.error:
+                    self.metrics.errors += 1
+                    try:
+                        await self._recycle(ci, slot)
+                    except Exception as e:
+                        logger.error(f"Pool slot {ci}.{slot} dropped (recycle failed): {e}")
+                        return
+                if self.page_delay:
+                    await asyncio.sleep(self.page_delay)
+
+        outcomes = await asyncio.gather(*(
+            worker(ci, slot)
+            for ci in range(self.n_contexts)
+            for slot in range(self.pages_per_context)
+        ), return_exceptions=True)
+        for exc in outcomes:
+            if isinstance(exc, Exception):
+                logger.error(f"Pool worker failed: {exc}")
+        self.metrics.elapsed = base_elapsed + time.perf_counter() - t0
+
+        # Every slot gone: report what is left instead of dropping it
+        for idx, code in (item for q in self._queues for item in q):
+            results[idx] = StockData(scripcd=code, error="No browser page available")
+        return [r for r in results if r is not None]
+
+    async def close(self):
+        for ctx in self._contexts:
+            try:
+                await ctx.close()
+            except Exception:
+                pass
+        self._contexts, self._pages, self._uses = [], [], []
+
+
 class BSEHeadlessScraper:
-    def __init__(self, max_workers: int = 5, headless: bool = True):
+    def __init__(self, max_workers: int = 5, headless: bool = True, ledger=None,
+                 pages_per_context: int = 2, recycle_after: int = 50,
+                 block_resources: bool = True, url_template: str = BSE_QUOTE_URL,
+                 page_delay: float = PAGE_DELAY):
         self.max_workers = max_workers
         self.headless = headless
         self.results_queue = Queue()
         self.failed_scrips = Queue()
+        # Optional RefreshLedger: skip scrips whose quote cannot have moved
+        self.ledger = ledger
+        self.url_template = url_template
+        self.pages_per_context = pages_per_context
+        self.recycle_after = recycle_after
+        self.block_resources = block_resources
+        self.page_delay = page_delay
+        self.pool: Optional[BrowserContextPool] = None
+
+    def plan_refresh(self, scripcds: List[str]) -> Tuple[List[str], List[StockData]]:
+        """
+        Split scrips into (to_fetch, cached). With the market closed, a scrip
+        fetched after the last session close is served from the ledger.
+        """
+        if self.ledger is None:
+            return list(scripcds), []
+        now = time.time()
+        changed_after = now if is_market_open() else last_session_close().timestamp()
+        due, skipped = self.ledger.plan(
+            scripcds, now=now, result_dates={c: changed_after for c in scripcds}
+        )
+        cached = []
+        for code in skipped:
+            entry = self.ledger.get(code) or {}
+            if entry.get("data"):
+                self.ledger.record_skip(code)
+                cached.append(StockData(**entry["data"]))
+            else:
+                due.append(code)
+        return due, cached
 
     async def setup_browser(self):
-        """Setup playwright browser"""
+        """Setup playwright browser and the persistent context pool"""
+        from playwright.async_api import async_playwright
+
         self.playwright = await async_playwright().start()
         self.browser = await self.playwright.chromium.launch(
             headless=self.headless,
             args=['--no-sandbox', '--disable-dev-shm-usage']
         )
+        self.pool = BrowserContextPool(
+            self.browser,
+            contexts=-(-self.max_workers // self.pages_per_context),
+            pages_per_context=self.pages_per_context,
+            recycle_after=self.recycle_after,
+            block_resources=self.block_resources,
+            page_delay=self.page_delay,
+        )
+        await self.pool.start()
+
+    @property
+    def metrics(self) -> Optional[PoolMetrics]:
+        return self.pool.metrics if self.pool is not None else None
 
     async def close_browser(self):
         """Close browser resources"""
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
         if hasattr(self, 'browser'):
             await self.browser.close()
         if hasattr(self, 'playwright'):
@@ -87,19 +309,19 @@ class BSEHeadlessScraper:
         except (ValueError, TypeError):
             return None
 
-    async def scrape_single_stock(self, scripcd: str) -> StockData:
-        """Scrape data for a single stock"""
+    async def scrape_single_stock(self, scripcd: str, page=None,
+                                  wait_until: str = 'networkidle') -> StockData:
+        """Scrape data for a single stock (on a pooled page if given)"""
         stock_data = StockData(scripcd=scripcd)
+        context = None
 
         try:
-            context = await self.browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                viewport={'width': 1920, 'height': 1080}
-            )
-            page = await context.new_page()
+            if page is None:
+                context = await self.browser.new_context(user_agent=USER_AGENT, viewport=VIEWPORT)
+                page = await context.new_page()
 
-            url = f"https://m.bseindia.com/StockReach.aspx?scripcd={scripcd}"
-            await page.goto(url, wait_until='networkidle', timeout=30000)
+            url = self.url_template.format(scripcd=scripcd)
+            response = await page.goto(url, wait_until=wait_until, timeout=30000)
 
             # Wait for key elements to load
             await page.wait_for_selector('table', timeout=10000)
@@ -169,17 +391,37 @@ class BSEHeadlessScraper:
                 if market_cap_text:
                     stock_data.market_cap = market_cap_text.strip()
 
-            await context.close()
+            if self.ledger is not None:
+                # Quote pages embed per-request tokens: hash the extracted fields
+                fields = asdict(stock_data)
+                body = await response.body() if response is not None else b""
+                self.ledger.record_response(
+                    scripcd,
+                    status=response.status if response is not None else 200,
+                    headers=response.headers if response is not None else None,
+                    content=json.dumps(fields, sort_keys=True).encode(),
+                    size=len(body),
+                    data=fields,
+                )
 
         except Exception as e:
             stock_data.error = f"Scraping failed: {str(e)}"
             logger.error(f"Error scraping {scripcd}: {str(e)}")
             self.failed_scrips.put(scripcd)
 
+        finally:
+            if context is not None:
+                await context.close()
+
         return stock_data
 
-    async def scrape_stocks_async(self, scripcds: List[str]) -> List[StockData]:
-        """Scrape multiple stocks asynchronously"""
+    async def scrape_stocks_async(self, scripcds: List[str],
+                                  on_result: Optional[Callable[[StockData], None]] = None) -> List[StockData]:
+        """Scrape multiple stocks asynchronously (through the pool when set up)"""
+        scripcds, cached = self.plan_refresh(scripcds)
+        if self.pool is not None:
+            return list(cached) + await self.pool.run(self, scripcds, on_result=on_result)
+
         tasks = []
         for scripcd in scripcds:
             task = self.scrape_single_stock(scripcd)
@@ -188,7 +430,7 @@ class BSEHeadlessScraper:
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Filter out exceptions and return valid results
-        valid_results = []
+        valid_results = list(cached)
         for result in results:
             if isinstance(result, Exception):
                 logger.error(f"Async task failed: {result}")
@@ -283,7 +525,11 @@ async def main():
         return
 
     # Initialize scraper and processor
-    scraper = BSEHeadlessScraper(max_workers=5, headless=True)
+    ledger = (
+        RefreshLedger(PATHS['RUNTIME'] / 'bse_refresh_ledger.json', name='bse', max_age=86400)
+        if RefreshLedger else None
+    )
+    scraper = BSEHeadlessScraper(max_workers=5, headless=True, ledger=ledger)
     processor = PolarsDataProcessor()
 
     try:
@@ -295,20 +541,9 @@ async def main():
         logger.info("Starting data scraping...")
         start_time = time.time()
 
-        # Scrape in batches to avoid overwhelming the server
-        batch_size = 3
-        all_results = []
-
-        for i in range(0, len(scripcds), batch_size):
-            batch = scripcds[i:i + batch_size]
-            logger.info(f"Processing batch {i//batch_size + 1}/{(len(scripcds)-1)//batch_size + 1}")
-
-            batch_results = await scraper.scrape_stocks_async(batch)
-            all_results.extend(batch_results)
-
-            # Add delay between batches to be respectful to the server
-            if i + batch_size < len(scripcds):
-                await asyncio.sleep(2)
+        # One pass through the context pool (bounded by its page count)
+        all_results = await scraper.scrape_stocks_async(scripcds)
+        logger.info(f"Pool: {scraper.metrics.summary()}")
 
         # Convert to dictionaries
         data_dicts = [scraper.stock_data_to_dict(result) for result in all_results]
@@ -348,6 +583,9 @@ async def main():
 
         elapsed_time = time.time() - start_time
         print(f"\nTotal execution time: {elapsed_time:.2f} seconds")
+        if ledger is not None:
+            ledger.save()
+            print(f"Refresh: {ledger.stats.summary()}")
 
     except Exception as e:
         logger.error(f"Main execution failed: {str(e)}")
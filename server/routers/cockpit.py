@@ -72,8 +72,12 @@ async def cockpit_summary(request: Request):
 
 
 @router_api.get("/history")
-async def history_api(limit: int = Query(500, ge=1, le=2000)) -> Dict[str, Any]:
-    rows = load_history(limit)
+async def history_api(
+    limit: int = Query(500, ge=1, le=2000),
+    since: Optional[str] = Query(None),
+    until: Optional[str] = Query(None),
+) -> Dict[str, Any]:
+    rows = load_history(limit, since=since, until=until)
     return {"count": len(rows), "rows": rows}
 
 
@@ -145,8 +145,12 @@ async def summary(
 # History (unchanged)
 # -------------------------------------------------------------------
 @router.get("/history")
-async def history(limit: int = Query(500, ge=1, le=2000)):
-    rows = load_history(limit)
+async def history(
+    limit: int = Query(500, ge=1, le=2000),
+    since: Optional[str] = Query(None),
+    until: Optional[str] = Query(None),
+):
+    rows = load_history(limit, since=since, until=until)
     return {"count": len(rows), "rows": rows}
 
 
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/services/actionable_row.py — v1.5
+# queen/services/actionable_row.py — v1.6
 # ------------------------------------------------------------
 # Single entrypoint for building an actionable row + synthetic
 # simulator state used by:
@@ -86,6 +86,14 @@ _TRADE_STATE_REGISTRY: Dict[Tuple[str, str, str, int], TradeState] = {}
 _LADDER_META: Dict[Tuple[str, str], Dict[str, Any]] = {}
 
 
+def reset_sim_memory(symbol: str) -> None:
+    """Drop R-space / ladder memory for ``symbol`` (fresh synthetic session)."""
+    symbol_u = str(symbol).upper()
+    for store in (_TRADE_STATE, _LADDER_META, _TRADE_STATE_REGISTRY):
+        for key in [k for k in store if k[0] == symbol_u]:
+            store.pop(key, None)
+
+
 # ----------------- decision helpers -----------------
 
 
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/services/bars.py — v1.0 (shared base-bar cache + derived timeframes)
+# ============================================================
+"""One broker fetch per symbol, every timeframe derived from it.
+
+    frames = await get_frames("TCS", ["15m", "1h", "1d"], lookback_days=60)
+
+  • Base bars (RESAMPLE_BASE_INTERVAL, default 5m) are cached per symbol:
+    history is fetched once, later refreshes only pull today's intraday
+    bars (and any gap since the last cached day).
+  • Higher intervals come from helpers.candles.resample_session and are
+    memoized until the base bars change.
+  • Entries older than RESAMPLE_CACHE_TTL_S are refreshed on the next call.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+import polars as pl
+
+from queen.helpers.candles import resample_session
+from queen.helpers.intervals import parse_minutes
+from queen.helpers.lazy import lazy_attr
+from queen.helpers.logger import log
+from queen.settings.timeframes import (
+    DAILY_ATR_BACKFILL_DAYS_INTRADAY,
+    RESAMPLE_BASE_INTERVAL,
+    RESAMPLE_CACHE_TTL_S,
+)
+
+fetch_unified = lazy_attr("queen.fetchers.upstox_fetcher", "fetch_unified")
+fetch_intraday = lazy_attr("queen.fetchers.upstox_fetcher", "fetch_intraday")
+
+
+@dataclass
+class _Entry:
+    df: pl.DataFrame
+    since: date  # first day covered by the history fetch
+    fetched_at: float
+    version: int = 0
+    derived: Dict[str, Tuple[int, pl.DataFrame]] = field(default_factory=dict)
+
+
+_CACHE: Dict[Tuple[str, str], _Entry] = {}
+
+
+def _merge(*dfs: pl.DataFrame) -> pl.DataFrame:
+    parts = [d for d in dfs if d is not None and not d.is_empty()]
+    if not parts:
+        return pl.DataFrame()
+    if len(parts) == 1:
+        return parts[0]
+    return (
+        pl.concat(parts, how="diagonal_relaxed")
+        .unique(subset=["timestamp"], keep="last")
+        .sort("timestamp")
+    )
+
+
+async def _safe(coro, symbol: str, what: str) -> pl.DataFrame:
+    try:
+        return await coro
+    except Exception as e:
+        log.debug(f"[Bars] {symbol} {what} fetch failed → {e}")
+        return pl.DataFrame()
+
+
+async def base_bars(
+    symbol: str,
+    *,
+    base: Optional[str] = None,
+    lookback_days: int = DAILY_ATR_BACKFILL_DAYS_INTRADAY,
+    max_age_s: float = RESAMPLE_CACHE_TTL_S,
+) -> pl.DataFrame:
+    """Cached base-interval bars for ``symbol`` covering ``lookback_days``."""
+    base = base or RESAMPLE_BASE_INTERVAL
+    key = (symbol.upper(), base)
+    today = date.today()
+    want_since = today - timedelta(days=lookback_days)
+    entry = _CACHE.get(key)
+
+    if entry is not None and entry.since <= want_since and time.time() - entry.fetched_at < max_age_s:
+        return entry.df
+
+    if entry is None or entry.since > want_since or entry.df.is_empty():
+        hist_from, old, since = want_since, None, want_since
+    else:
+        hist_from, old, since = entry.df["timestamp"].max().date(), entry.df, entry.since
+
+    hist = pl.DataFrame()
+    if hist_from < today:
+        hist = await _safe(
+            fetch_unified(
+                symbol,
+                mode="intraday",
+                interval=base,
+                from_date=hist_from.isoformat(),
+                to_date=today.isoformat(),
+            ),
+            symbol,
+            "history",
+        )
+    live = await _safe(fetch_intraday(symbol, base), symbol, "intraday")
+
+    df = _merge(old, hist, live)
+    if not df.is_empty():
+        df = df.filter(pl.col("timestamp").dt.date() >= since)
+    version = (entry.version + 1) if entry is not None else 0
+    _CACHE[key] = _Entry(df=df, since=since, fetched_at=time.time(), version=version)
+    return df
+
+
+def derive(symbol: str, interval: str | int, *, base: Optional[str] = None) -> pl.DataFrame:
+    """``interval`` bars from the cached base (memoized per base version)."""
+    base = base or RESAMPLE_BASE_INTERVAL
+    entry = _CACHE.get((symbol.upper(), base))
+    if entry is None or entry.df.is_empty():
+        return pl.DataFrame()
+    token = str(interval).strip().lower()
+    try:
+        if parse_minutes(token) == parse_minutes(base):
+            return entry.df
+    except ValueError:
+        pass  # daily token
+    hit = entry.derived.get(token)
+    if hit is not None and hit[0] == entry.version:
+        return hit[1]
+    out = resample_session(entry.df, token, base_minutes=parse_minutes(base))
+    entry.derived[token] = (entry.version, out)
+    return out
+
+
+async def get_frames(
+    symbol: str,
+    intervals: Iterable[str | int],
+    *,
+    base: Optional[str] = None,
+    lookback_days: int = DAILY_ATR_BACKFILL_DAYS_INTRADAY,
+    max_age_s: float = RESAMPLE_CACHE_TTL_S,
+) -> Dict[str, pl.DataFrame]:
+    """{interval: frame} for every requested interval from one base fetch."""
+    await base_bars(symbol, base=base, lookback_days=lookback_days, max_age_s=max_age_s)
+    return {str(iv): derive(symbol, iv, base=base) for iv in intervals}
+
+
+def invalidate(symbol: Optional[str] = None) -> None:
+    """Drop cached bars for ``symbol`` (or everything)."""
+    if symbol is None:
+        _CACHE.clear()
+        return
+    for key in [k for k in _CACHE if k[0] == symbol.upper()]:
+        _CACHE.pop(key, None)
+
+
+__all__ = ["base_bars", "derive", "get_frames", "invalidate"]
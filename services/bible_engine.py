@@ -23,7 +23,10 @@ from typing import Any, Dict, List, Optional, Tuple
 import polars as pl
 
 from queen.helpers.candles import ensure_sorted, last_close
-from queen.fetchers.nse_fetcher import fetch_nse_bands
+from queen.helpers.lazy import lazy_attr
+
+# requests-backed; resolved on the first bands lookup
+fetch_nse_bands = lazy_attr("queen.fetchers.nse_fetcher", "fetch_nse_bands")
 
 __all__ = [
     "compute_structure_block",
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/services/eod_features.py — v1.1 (end-of-day feature store)
+# ============================================================
+"""Per-symbol end-of-day feature rows, computed once after close.
+
+    await build_eod_features(symbols)          # EOD job, right after close
+    feats = load_features(before=next_session)  # morning: pure read
+
+  • One parquet file per session under CACHE/eod_features
+    (features_YYYYMMDD.parquet); reruns only fetch symbols not yet stored.
+    Symbols that returned no data are listed in a sidecar
+    (features_YYYYMMDD.nodata.json) so they are not refetched either.
+  • Rows hold raw indicator values (cmp, EMAs, RSI, VWAP, ATR, CPR, OBV,
+    supertrend) plus the structure/targets block, so the morning forecast
+    and /intel/nextday only score a frame.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import polars as pl
+
+from queen.helpers.lazy import lazy_attr
+from queen.helpers.logger import log
+from queen.helpers.market import last_trading_day
+from queen.helpers.rate_limiter import limiter
+from queen.services.live import structure_and_targets
+from queen.settings import settings as SETTINGS
+from queen.settings.settings import PATHS
+from queen.technicals.indicators.advanced import supertrend
+from queen.technicals.indicators.core import (
+    atr_last,
+    cpr_from_prev_day,
+    ema,
+    obv_trend,
+    rsi_last,
+    vwap_last,
+)
+
+fetch_daily_range = lazy_attr("queen.fetchers.upstox_fetcher", "fetch_daily_range")
+fetch_intraday = lazy_attr("queen.fetchers.upstox_fetcher", "fetch_intraday")
+fetch_unified = lazy_attr("queen.fetchers.upstox_fetcher", "fetch_unified")
+
+SCHEMA: Dict[str, pl.DataType] = {
+    "symbol": pl.Utf8,
+    "session": pl.Date,
+    "cmp": pl.Float64,
+    "ema20": pl.Float64,
+    "ema50": pl.Float64,
+    "ema200": pl.Float64,
+    "daily_bars": pl.Int64,
+    "rsi": pl.Float64,
+    "vwap": pl.Float64,
+    "atr": pl.Float64,
+    "cpr": pl.Float64,
+    "obv": pl.Utf8,
+    "supertrend": pl.Float64,
+    "summary": pl.Utf8,
+    "targets": pl.List(pl.Utf8),
+    "sl": pl.Float64,
+    "computed_at": pl.Utf8,
+}
+
+
+def _cfg() -> Dict[str, Any]:
+    return dict(getattr(SETTINGS, "SCHEDULER", {}).get("EOD_FEATURES", {}) or {})
+
+
+def intraday_interval() -> str:
+    """Bar size the intraday features (RSI / VWAP / CPR / OBV) are built on."""
+    return str(_cfg().get("INTRADAY_INTERVAL", "15m"))
+
+
+def store_dir() -> Path:
+    return PATHS["CACHE"] / "eod_features"
+
+
+def _path(session: date) -> Path:
+    return store_dir() / f"features_{session:%Y%m%d}.parquet"
+
+
+def _nodata_path(session: date) -> Path:
+    return store_dir() / f"features_{session:%Y%m%d}.nodata.json"
+
+
+def _read_nodata(session: date) -> set[str]:
+    path = _nodata_path(session)
+    try:
+        return set(json.loads(path.read_text())) if path.exists() else set()
+    except (OSError, ValueError):
+        return set()
+
+
+def attempted(session: date) -> set[str]:
+    """Symbols already handled for ``session``: stored rows plus no-data ones."""
+    path = _path(session)
+    stored = set(pl.read_parquet(path, columns=["symbol"])["symbol"].to_list()) if path.exists() else set()
+    return stored | _read_nodata(session)
+
+
+def _last(s: pl.Series) -> Optional[float]:
+    tail = s.drop_nulls().tail(1)
+    return float(tail.item()) if tail.len() else None
+
+
+# ------------------------------------------------------------
+# Feature row (one symbol)
+# ------------------------------------------------------------
+def compute_features(symbol: str, daily: pl.DataFrame, intra: pl.DataFrame, session: date) -> Optional[Dict[str, Any]]:
+    """Raw EOD features for one symbol (None when there is no data at all)."""
+    if daily.is_empty() and intra.is_empty():
+        return None
+    ctx = intra if not intra.is_empty() else daily
+    cmp_ = _last(ctx["close"].cast(pl.Float64, strict=False))
+    if cmp_ is None:
+        return None
+
+    e20 = e50 = e200 = None
+    if not daily.is_empty():
+        e20, e50, e200 = (_last(ema(daily, n)) for n in (20, 50, 200))
+
+    rsi = rsi_last(ctx["close"].cast(pl.Float64, strict=False), 14)
+    vwap = vwap_last(ctx)
+    atr = atr_last(daily, 14) if not daily.is_empty() else None
+    cpr = cpr_from_prev_day(ctx)
+    obv = obv_trend(ctx)
+    try:
+        st = _last(supertrend(ctx))
+    except Exception:
+        st = None
+    summary, targets, sl = structure_and_targets(
+        last_close_val=cmp_, cpr=cpr, vwap=vwap, rsi=rsi, atr=atr, obv=obv
+    )
+    return {
+        "symbol": symbol,
+        "session": session,
+        "cmp": cmp_,
+        "ema20": e20,
+        "ema50": e50,
+        "ema200": e200,
+        "daily_bars": daily.height,
+        "rsi": rsi,
+        "vwap": vwap,
+        "atr": atr,
+        "cpr": cpr,
+        "obv": obv,
+        "supertrend": st,
+        "summary": summary,
+        "targets": targets,
+        "sl": sl,
+        "computed_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+# ------------------------------------------------------------
+# EOD job
+# ------------------------------------------------------------
+async def build_eod_features(
+    symbols: List[str],
+    *,
+    session: Optional[date] = None,
+    refresh: bool = False,
+    concurrency: Optional[int] = None,
+) -> pl.DataFrame:
+    """Compute and persist feature rows for ``session`` (default: last trading day).
+
+    Symbols already stored for the session are skipped unless ``refresh``.
+    Fetches run with at most ``concurrency`` requests in flight, each
+    throttled by the "eod_features" rate limiter.
+    """
+    cfg = _cfg()
+    session = session or last_trading_day()
+    path = _path(session)
+    stored = pl.read_parquet(path) if path.exists() and not refresh else pl.DataFrame(schema=SCHEMA)
+    nodata = set() if refresh else _read_nodata(session)
+    have = set(stored["symbol"].to_list()) | nodata
+    todo = [s for s in dict.fromkeys(symbols) if s not in have]
+    if not todo:
+        return stored
+
+    lookback = int(cfg.get("LOOKBACK_DAYS", 400))
+    interval = intraday_interval()
+    sem = asyncio.Semaphore(int(concurrency or cfg.get("MAX_CONCURRENCY", 8)))
+    rate_key = str(cfg.get("RATE_KEY", "eod_features"))
+    from_d = (session - timedelta(days=lookback)).isoformat()
+    live_session = session >= date.today()
+
+    async def _one(sym: str) -> Optional[Dict[str, Any]]:
+        async with sem:
+            async with limiter(rate_key):
+                daily = await fetch_daily_range(sym, from_d, session.isoformat(), "1d")
+            async with limiter(rate_key):
+                if live_session:
+                    intra = await fetch_intraday(sym, interval)
+                else:
+                    intra = await fetch_unified(
+                        sym, mode="intraday", from_date=session.isoformat(),
+                        to_date=session.isoformat(), interval=interval,
+                    )
+        return await asyncio.to_thread(compute_features, sym, daily, intra, session)
+
+    results = await asyncio.gather(*(_one(s) for s in todo), return_exceptions=True)
+    rows, empty = [], set()
+    for sym, r in zip(todo, results):
+        if isinstance(r, BaseException):
+            log.warning(f"[EODFeatures] {sym} skipped → {r}")  # retried on the next run
+        elif r is None:
+            log.warning(f"[EODFeatures] No data for {sym}")
+            empty.add(sym)
+        else:
+            rows.append(r)
+
+    if empty or (refresh and _nodata_path(session).exists()):
+        nodata = (nodata | empty) - {r["symbol"] for r in rows}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _nodata_path(session).write_text(json.dumps(sorted(nodata)))
+
+    if rows:
+        fresh = pl.DataFrame(rows, schema=SCHEMA)
+        stored = pl.concat([stored.filter(~pl.col("symbol").is_in(fresh["symbol"].to_list())), fresh])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".parquet.tmp")
+        stored.write_parquet(tmp)
+        tmp.replace(path)
+        log.info(f"[EODFeatures] {len(rows)} rows → {path.name} ({stored.height} total)")
+        _prune(int(cfg.get("KEEP_SESSIONS", 30)))
+    return stored
+
+
+def _prune(keep: int) -> None:
+    files = sorted(store_dir().glob("features_*.parquet"))
+    for old in files[: max(0, len(files) - keep)]:
+        old.unlink(missing_ok=True)
+        old.with_suffix(".nodata.json").unlink(missing_ok=True)
+
+
+# ------------------------------------------------------------
+# Reads
+# ------------------------------------------------------------
+def load_features(
+    before: Optional[date] = None,
+    symbols: Optional[List[str]] = None,
+) -> pl.DataFrame:
+    """Latest stored session strictly before ``before`` (or the latest overall)."""
+    cutoff = f"features_{before:%Y%m%d}.parquet" if before else None
+    files = sorted(
+        p for p in store_dir().glob("features_*.parquet") if cutoff is None or p.name < cutoff
+    )
+    if not files:
+        return pl.DataFrame(schema=SCHEMA)
+    df = pl.read_parquet(files[-1])
+    return df.filter(pl.col("symbol").is_in(symbols)) if symbols is not None else df
+
+
+__all__ = [
+    "SCHEMA",
+    "compute_features",
+    "build_eod_features",
+    "load_features",
+    "attempted",
+    "intraday_interval",
+    "store_dir",
+]
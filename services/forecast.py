@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/services/forecast.py — v0.9 (next-session tactical plan)
+# queen/services/forecast.py — v1.1 (next-session tactical plan)
 # ============================================================
 from __future__ import annotations
 
@@ -10,11 +10,14 @@ from datetime import datetime, timedelta, date
 from pathlib import Path
 from typing import Dict, List
 
+import polars as pl
+
 from queen.helpers.logger import log
 from queen.settings.settings import PATHS
-from queen.helpers.market import MARKET_TZ, next_working_day
+from queen.helpers.market import MARKET_TZ, last_trading_day, next_working_day
 from queen.daemons.live_engine import MonitorConfig, _one_pass  # reuse indicator math
 from queen.helpers.portfolio import position_for, compute_pnl
+from queen.services.eod_features import intraday_interval, load_features
 
 RUNTIME_DIR: Path = PATHS["RUNTIME"]
 ARCHIVE_DIR: Path = PATHS["ARCHIVES"]
@@ -124,16 +127,28 @@ def _row_to_plan(row: Dict) -> Dict:
     }
 
 async def build_next_session_plan(symbols: List[str], opt: ForecastOptions | None = None) -> Dict:
-    """Run one indicator pass and synthesize a next-session plan JSON."""
-    opt = opt or ForecastOptions()
-    cfg = MonitorConfig(symbols=symbols, interval_min=opt.interval_min, view=opt.view)
-
-    rows = await _one_pass(cfg)  # DRY: uses your technicals/core
-    plan_rows = [_row_to_plan(r) for r in rows]
+    """Synthesize a next-session plan JSON.
 
+    Rows come from the EOD feature store (services.eod_features) when it
+    holds the session just before ``next_sess`` at the same bar size;
+    symbols missing from it (or a stale / other-interval store) go through
+    a live indicator pass.
+    """
+    opt = opt or ForecastOptions()
     now_ist = datetime.now(MARKET_TZ)
     next_sess = _infer_next_session_date(now_ist)
 
+    rows: List[Dict] = []
+    if f"{opt.interval_min}m" == intraday_interval():
+        prev_sess = last_trading_day(next_sess - timedelta(days=1))
+        feats = load_features(before=next_sess, symbols=symbols)
+        rows = feats.filter(pl.col("session") == prev_sess).to_dicts()
+    missing = [s for s in symbols if s not in {r["symbol"] for r in rows}]
+    if missing:
+        cfg = MonitorConfig(symbols=missing, interval_min=opt.interval_min, view=opt.view)
+        rows += await _one_pass(cfg)  # DRY: uses your technicals/core
+    plan_rows = [_row_to_plan(r) for r in rows]
+
     payload = {
         "generated_at": now_ist.isoformat(),
         "next_session": next_sess.isoformat(),
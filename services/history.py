@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/services/history.py — v1.1 (runtime ARCHIVES-aware)
+# queen/services/history.py — v1.4 (runtime ARCHIVES-aware, tail/range reads)
 # ============================================================
 from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List
 
+from queen.helpers import jsonl_log
 from queen.settings.settings import PATHS
 
 ARCHIVES_DIR: Path = PATHS["ARCHIVES"]
@@ -19,18 +20,33 @@ DEFAULT_PATHS = [
 ]
 
 
-def load_history(max_items: int = 500) -> List[Dict]:
+def load_history(
+    max_items: int = 500,
+    *,
+    since: Any = None,
+    until: Any = None,
+    ts_key: str = "timestamp",
+) -> List[Dict]:
+    """Most recent ``max_items`` alerts (optionally within [since, until]).
+
+    JSONL archives are read backward from EOF (and across rotated segments),
+    so the cost tracks ``max_items`` rather than the archive size. Range
+    queries return the newest ``max_items`` matches, seeking via the offset
+    indexes (sidecars for rotated segments, an in-process index for the
+    active file); reads never write to the archive dir.
+    """
     for p in DEFAULT_PATHS:
+        if p.suffix == ".jsonl" and jsonl_log.segments(p):
+            try:
+                if since is not None or until is not None:
+                    return jsonl_log.read_range(
+                        p, since, until, ts_key=ts_key, limit=max_items, newest=True
+                    )
+                return jsonl_log.tail_segmented(p, max_items)
+            except Exception:
+                continue
         if p.exists():
             try:
-                if p.suffix == ".jsonl":
-                    rows = []
-                    for line in p.read_text().splitlines():
-                        try:
-                            rows.append(json.loads(line))
-                        except Exception:
-                            pass
-                    return rows[-max_items:]
                 j = json.loads(p.read_text())
                 if isinstance(j, list):
                     return j[-max_items:]
@@ -19,8 +19,8 @@ from typing import (
 
 import polars as pl
 
-from queen.fetchers.upstox_fetcher import fetch_intraday
 from queen.helpers.candles import ensure_sorted, last_close
+from queen.helpers.lazy import lazy_attr
 from queen.helpers.logger import log
 from queen.helpers.portfolio import load_positions
 from queen.services.actionable_row import build_actionable_row
@@ -40,6 +40,9 @@ try:
 except Exception:
     _SETTINGS_MIN_BARS = None
 
+# Broker fetcher (httpx + schema + instruments) loads on the first fetch
+fetch_intraday = lazy_attr("queen.fetchers.upstox_fetcher", "fetch_intraday")
+
 
 # -------------------------------------------------------------------
 # Today-only intraday helper (CMP anchor)
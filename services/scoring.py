@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/services/scoring.py — v2.5
+# queen/services/scoring.py — v2.8
 # ------------------------------------------------------------
 # Actionable scoring + early-signal fusion (cockpit / TUI ready)
 #
@@ -25,7 +25,7 @@
 #   • Trend+Volume override:
 #       - maybe_apply_trend_volume_override() (Balanced Trend-First Model — PATCH B-2)
 #   • Sector veto:
-#       - compute_sector_strength() + log_sector_veto()
+#       - services.sector_context (once per sector per bar) + log_sector_veto()
 # ============================================================
 
 from __future__ import annotations
@@ -34,8 +34,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import polars as pl
 
-from queen.fetchers.nse_fetcher import fetch_nse_bands
-from queen.helpers.market import MARKET_TZ_KEY
+from queen.helpers.lazy import lazy_attr
+from queen.helpers.candles import resample_session
 from queen.helpers.portfolio import compute_pnl, position_for
 from queen.services.bible_engine import (
     compute_indicators_plus_bible as bible_compute_plus,
@@ -44,9 +44,13 @@ from queen.technicals.indicators import core as ind
 from queen.technicals.fusion_trend_volume import (
     maybe_apply_trend_volume_override,
 )
+from queen.services import sector_context
 from queen.technicals.sector_strength import compute_sector_strength
 from queen.helpers.diagnostic_override_logger import log_sector_veto
 
+# NSE bands pull in requests; only needed when a row is actually scored
+fetch_nse_bands = lazy_attr("queen.fetchers.nse_fetcher", "fetch_nse_bands")
+
 
 # --------------- small utils -----------------
 def _last(series: pl.Series) -> Optional[float]:
@@ -71,7 +75,7 @@ def _ema_last(
 
 # --------------- daily risk snapshot -----------------
 def _daily_ohlc_from_intraday(df: pl.DataFrame) -> pl.DataFrame:
-    """Compress intraday bars into 1 bar per session (MARKET_TZ_KEY date).
+    """Compress intraday bars into 1 bar per session (helpers.candles.resample_session).
 
     Expects columns: timestamp, open, high, low, close.
     """
@@ -87,27 +91,10 @@ def _daily_ohlc_from_intraday(df: pl.DataFrame) -> pl.DataFrame:
             }
         )
 
-    dated = df.with_columns(
-        pl.col("timestamp")
-        .dt.convert_time_zone(MARKET_TZ_KEY)
-        .dt.date()
-        .alias("d")
-    )
-
-    daily = (
-        dated.sort("timestamp")
-        .group_by("d")
-        .agg(
-            pl.col("open").first().alias("open"),
-            pl.col("high").max().alias("high"),
-            pl.col("low").min().alias("low"),
-            pl.col("close").last().alias("close"),
-        )
-        .sort("d")
+    return resample_session(df, "1d").select(
+        pl.col("timestamp").dt.date().alias("d"), "open", "high", "low", "close"
     )
 
-    return daily
-
 
 def _daily_risk_snapshot(
     df: pl.DataFrame,
@@ -446,7 +433,12 @@ def _apply_sector_veto_if_needed(
     Thresholds are dynamically adjusted based on:
       - risk_rating ("Low" / "Medium" / "High")
       - regime_name (e.g. "TREND", "RANGE", "VOLATILE", "BEAR")
+
+    A context flagged ``sector_stale`` (older than the symbol's bar) never
+    vetoes.
     """
+    if sector_ctx.get("sector_stale"):
+        return decision, bias, sector_ctx
     score = sector_ctx.get("sector_score")
     if score is None:
         return decision, bias, sector_ctx
@@ -626,7 +618,8 @@ def action_for(
           - Trend_Bias / Trend_Score / Trend_Label
           - Bible Trade fields: Trade_Status / Trade_Status_Label /
             Trade_Reason / Trade_Score / Trade_Flags
-          - sector_df / sector_ctx (for sector veto)
+          - sector_ctx, or sector_name (+ sector_df) → services.sector_context
+            (for sector veto)
     """
     cmp_ = float(indd["CMP"])
     atr_intraday = indd.get("ATR")
@@ -723,10 +716,22 @@ def action_for(
         if isinstance(raw_sector_ctx, dict) and "sector_score" in raw_sector_ctx:
             sector_ctx.update(raw_sector_ctx)
         else:
+            # Shared per-bar context: computed once per sector, read per symbol
+            sector_name = indd.get("sector_name") or indd.get("sector")
             sector_df = indd.get("sector_df")
-            if isinstance(sector_df, pl.DataFrame) and not sector_df.is_empty():
-                computed = compute_sector_strength(sector_df) or {}
-                sector_ctx.update(computed)
+            has_df = isinstance(sector_df, pl.DataFrame) and not sector_df.is_empty()
+            if sector_name and has_df:
+                sector_context.update(sector_name, sector_df)
+            as_of = (
+                df_ctx["timestamp"].max()
+                if df_ctx is not None and "timestamp" in df_ctx.columns
+                else None
+            )
+            cached = sector_context.get(sector_name, as_of=as_of)
+            if cached is not None:
+                sector_ctx.update(cached)
+            elif has_df:
+                sector_ctx.update(compute_sector_strength(sector_df) or {})
 
         if sector_ctx.get("sector_score") is not None:
             decision, bias, sector_ctx = _apply_sector_veto_if_needed(
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/services/sector_context.py — v1.1 (per-bar sector strength cache)
+# ============================================================
+"""Sector strength computed once per sector per bar close.
+
+    await refresh_sectors({"NIFTY BANK": "NIFTY BANK"})   # once per tick
+    ctx = get("NIFTY BANK", as_of=last_bar_ts)            # per symbol
+
+  • Index candles come from services.bars (shared base-bar cache), so a
+    refresh costs one cached read per sector.
+  • compute_sector_strength runs only when the index's last bar timestamp
+    moves; every symbol in the sector reads the same context dict.
+  • Staleness is by bar timestamp: a context whose last bar ends at or
+    before the caller's bar is returned with ``sector_stale=True``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+import polars as pl
+
+from queen.helpers.logger import log
+from queen.services import bars
+from queen.settings.timeframes import (
+    SECTOR_CONTEXT_INTERVAL,
+    SECTOR_CONTEXT_LOOKBACK_DAYS,
+)
+from queen.technicals.sector_strength import compute_sector_strength
+
+
+@dataclass
+class _Entry:
+    bar_ts: Optional[datetime]  # start of the index's last bar
+    span: Optional[timedelta]  # bar length (gap between the last two bars)
+    ctx: Dict[str, Any]
+
+
+_CACHE: Dict[str, _Entry] = {}
+
+
+def _key(sector: str) -> str:
+    return str(sector).strip().upper()
+
+
+def _tail_ts(df: pl.DataFrame) -> tuple[Optional[datetime], Optional[timedelta]]:
+    if df.is_empty() or "timestamp" not in df.columns:
+        return None, None
+    ts = df["timestamp"].sort().tail(2).to_list()
+    return ts[-1], (ts[-1] - ts[0]) if len(ts) == 2 else None
+
+
+def update(sector: str, df: pl.DataFrame) -> Dict[str, Any]:
+    """Context for ``sector`` from its index candles; recomputed per new bar.
+
+    An empty frame (failed or not-yet-available fetch) leaves a cached
+    context untouched; it ages into ``sector_stale`` instead.
+    """
+    key = _key(sector)
+    bar_ts, span = _tail_ts(df)
+    entry = _CACHE.get(key)
+    if entry is not None and (bar_ts is None or entry.bar_ts == bar_ts):
+        return entry.ctx
+
+    ctx = dict(compute_sector_strength(df) or {})
+    ctx.update(sector_name=key, bar_ts=bar_ts)
+    _CACHE[key] = _Entry(bar_ts=bar_ts, span=span, ctx=ctx)
+    return ctx
+
+
+def get(sector: Optional[str], *, as_of: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+    """Cached context for ``sector`` (None if never computed).
+
+    With ``as_of`` (the caller's bar timestamp) the returned copy carries
+    ``sector_stale`` — True when ``as_of`` falls after the sector's last
+    bar (so a 5m symbol bar inside the current 15m sector bar is fresh).
+    """
+    if not sector:
+        return None
+    entry = _CACHE.get(_key(sector))
+    if entry is None:
+        return None
+    if as_of is None:
+        return entry.ctx
+    try:
+        if entry.bar_ts is None:
+            stale = True
+        elif entry.span is None:
+            stale = entry.bar_ts < as_of
+        else:
+            stale = entry.bar_ts + entry.span <= as_of
+    except TypeError:  # naive vs aware
+        stale = True
+    return {**entry.ctx, "sector_stale": stale}
+
+
+async def refresh_sector(
+    sector: str,
+    index_symbol: Optional[str] = None,
+    *,
+    interval: str = SECTOR_CONTEXT_INTERVAL,
+    lookback_days: int = SECTOR_CONTEXT_LOOKBACK_DAYS,
+) -> Dict[str, Any]:
+    """Pull ``index_symbol`` candles from the bar cache and update the context."""
+    symbol = index_symbol or sector
+    try:
+        frames = await bars.get_frames(symbol, [interval], lookback_days=lookback_days)
+    except Exception as e:
+        log.debug(f"[SectorCtx] {sector} index fetch failed → {e}")
+        return get(sector) or {}
+    return update(sector, frames.get(interval, pl.DataFrame()))
+
+
+async def refresh_sectors(
+    sectors: Mapping[str, str] | Iterable[str],
+    **kwargs: Any,
+) -> Dict[str, Dict[str, Any]]:
+    """Refresh many sectors concurrently; ``{sector: index_symbol}`` or names."""
+    pairs = list(sectors.items()) if isinstance(sectors, Mapping) else [(s, s) for s in sectors]
+    out = await asyncio.gather(*(refresh_sector(s, i, **kwargs) for s, i in pairs))
+    return {_key(s): ctx for (s, _), ctx in zip(pairs, out)}
+
+
+def invalidate(sector: Optional[str] = None) -> None:
+    """Drop cached context for ``sector`` (or everything)."""
+    if sector is None:
+        _CACHE.clear()
+    else:
+        _CACHE.pop(_key(sector), None)
+
+
+__all__ = ["update", "get", "refresh_sector", "refresh_sectors", "invalidate"]
@@ -40,21 +40,47 @@ def _mk(p: Path) -> Path:
     p.mkdir(parents=True, exist_ok=True)
     return p
 
+class _LazyPaths(dict):
+    """PATHS mapping that creates runtime dirs on first lookup, not at import."""
+
+    def __init__(self, paths: Dict[str, Path], make: set[str]):
+        super().__init__(paths)
+        self._pending = set(make)
+
+    def __getitem__(self, key: str) -> Path:
+        p = dict.__getitem__(self, key)
+        if key in self._pending:
+            self._pending.discard(key)
+            _mk(p)
+        return p
+
+    def get(self, key: str, default=None):
+        return self[key] if key in self else default
+
 def _build_paths(env: str) -> Dict[str, Path]:
     base_runtime = _env_base(env)
-    fundamentals_root = _mk(base_runtime / "fundamentals")
-    return {
+    fundamentals_root = base_runtime / "fundamentals"
+    runtime = {
+        "RUNTIME": base_runtime,
+        "LOGS": base_runtime / "logs",
+        "SNAPSHOTS": base_runtime / "snapshots",
+        "EXPORTS": base_runtime / "exports",
+        "ALERTS": base_runtime / "exports" / "alerts",
+        "FETCH_OUTPUTS": base_runtime / "exports" / "fetch_outputs",
+        "CACHE": base_runtime / "cache",
+        "MODELS": base_runtime / "cache" / "models",
+        "MODEL_SNAPSHOTS": base_runtime / "cache" / "models" / "snapshots",
+        "TEST_HELPERS": base_runtime / "test_helpers",
+        "TEMPLATES": _REPO_ROOT / "queen" / "server" / "templates",
+        "ARCHIVES": base_runtime / "archives",
+
+        # ✅ Fundamentals shortcuts (NEW)
+        "FUNDAMENTALS_OUTPUT": fundamentals_root,
+        "FUNDAMENTALS_RAW": fundamentals_root / "raw",
+        "FUNDAMENTALS_PROCESSED": fundamentals_root / "processed",
+    }
+    static = {
         "ROOT": _REPO_ROOT,
-        "RUNTIME": _mk(base_runtime),
-        "LOGS": _mk(base_runtime / "logs"),
-        "SNAPSHOTS": _mk(base_runtime / "snapshots"),
-        "EXPORTS": _mk(base_runtime / "exports"),
-        "ALERTS": _mk(base_runtime / "exports" / "alerts"),
-        "FETCH_OUTPUTS": _mk(base_runtime / "exports" / "fetch_outputs"),
-        "CACHE": _mk(base_runtime / "cache"),
-        "MODELS": _mk(base_runtime / "cache" / "models"),
-        "MODEL_SNAPSHOTS": _mk(base_runtime / "cache" / "models" / "snapshots"),
-        "TEST_HELPERS": _mk(base_runtime / "test_helpers"),
 
         # static + project resources
         "STATIC": _REPO_ROOT / "queen" / "data" / "static",
@@ -63,15 +89,8 @@ def _build_paths(env: str) -> Dict[str, Path]:
         "UNIVERSE": _REPO_ROOT / "queen" / "data" / "static",
         "PROFILES": _REPO_ROOT / "queen" / "data" / "static" / "profiles",
         "CONFIGS": _REPO_ROOT / "configs",
-
-        "TEMPLATES": _mk(_REPO_ROOT / "queen" / "server" / "templates"),
-        "ARCHIVES": _mk(base_runtime / "archives"),
-
-        # ✅ Fundamentals shortcuts (NEW)
-        "FUNDAMENTALS_OUTPUT": fundamentals_root,
-        "FUNDAMENTALS_RAW": _mk(fundamentals_root / "raw"),
-        "FUNDAMENTALS_PROCESSED": _mk(fundamentals_root / "processed"),
     }
+    return _LazyPaths({**static, **runtime}, make=set(runtime))
 
 PATHS: Dict[str, Path] = _build_paths(get_env())
 
@@ -162,6 +181,28 @@ FETCH = {
     "max_retries": 3,
     "max_empty_streak": 5,
 
+    # Option chains (fetchers/options_chain.py → fetch_chains): pooled async
+    # client, full chains, short-lived per-chain cache. STRIKE_WINDOW is the
+    # ATM± width trim_strike_window keeps for display.
+    "OPTIONS_CHAIN": {
+        "TTL_S": 20,
+        "STRIKE_WINDOW": 10,
+        "MAX_CONCURRENCY": 16,
+        "TIMEOUT_S": 10.0,
+        "RATE_KEY": "options_chain",
+    },
+
+    # Universe scanner (cli/universe_scanner.py): bounded history pool into
+    # one long frame, metrics cached per trading day under CACHE/universe_scan.
+    "UNIVERSE_SCAN": {
+        "MAX_CONCURRENCY": 8,
+        "RATE_KEY": "universe_scan",
+        "HISTORY_DAYS": 100,      # ≥ 50 sessions for the EMA-50 momentum
+        "INTRADAY_DAYS": 5,
+        "BETA_WINDOW": 20,
+        "BENCHMARK": "NIFTY50",
+    },
+
     # Optional min-row thresholds (commented examples):
     # "MIN_ROWS_AUTO_BACKFILL": 80,
     # "MIN_ROWS_AUTO_BACKFILL_1M": 180,
@@ -232,6 +273,16 @@ SCHEDULER = {
     "MAX_SYMBOLS": 250,
     "UNIVERSE_REFRESH_MINUTES": 60,
     "LOG_UNIVERSE_STATS": True,
+
+    # EOD feature store (services/eod_features.py): run right after close,
+    # read by the morning forecast and /intel/nextday.
+    "EOD_FEATURES": {
+        "LOOKBACK_DAYS": 400,     # ≥ 200 sessions for the EMA-200 stack
+        "INTRADAY_INTERVAL": "15m",
+        "MAX_CONCURRENCY": 8,
+        "RATE_KEY": "eod_features",
+        "KEEP_SESSIONS": 30,
+    },
 }
 
 # ============================================================
@@ -263,6 +314,17 @@ LOGGING = {
         "SCHEMA": "schema_drift.log",
         "RATELIMITER": "rate_limiter.log",
     },
+    # Buffered JSONL/CSV event logs (helpers/log_writer.py): group commit +
+    # size-based segment rotation with optional parquet roll-up of closed segments.
+    "EVENT_LOGS": {
+        "FLUSH_RECORDS": 256,
+        "FLUSH_BYTES": 1 << 20,
+        "FLUSH_INTERVAL_S": 2.0,
+        "SEGMENT_MB": 8,
+        "KEEP_SEGMENTS": 20,
+        "ROLLUP_PARQUET": True,
+        "MAX_OPEN_WRITERS": 64,
+    },
 }
 
 DIAGNOSTICS = {
@@ -274,6 +336,24 @@ DIAGNOSTICS = {
         "trace_market_state": True,
     },
     "CACHE": {"auto_rotate": True, "max_snapshots": 3},
+    # Cold-start budget (cli/startup_bench.py, enforced by tests/smoke_startup.py):
+    # self time of queen.* modules per entrypoint, and modules that must stay lazy.
+    "STARTUP": {
+        "BUDGET_MS": {
+            "queen.settings.settings": 25,
+            "queen.services.scoring": 120,
+            "queen.services.live": 150,
+            "queen.cli.show_snapshot": 80,
+            "queen.cli.list_signals": 150,
+        },
+        "DEFERRED": [
+            "requests",
+            "httpx",
+            "queen.fetchers.upstox_fetcher",
+            "queen.fetchers.nse_fetcher",
+            "queen.helpers.schema_adapter",
+        ],
+    },
 }
 
 # ============================================================
@@ -357,6 +437,9 @@ def alert_path_rules() -> Path:
 def alert_path_state() -> Path:
     return PATHS["ALERTS"] / "state.json"
 
+def alert_path_cooldowns() -> Path:
+    return PATHS["ALERTS"] / "cooldowns.sqlite"
+
 def get_env_paths() -> Dict[str, Path]:
     """Convenience: return useful runtime paths."""
     return {
@@ -57,6 +57,16 @@ MIN_ROWS_AUTO_BACKFILL = {
 # If caller doesn’t specify a window, use this for the intraday historical bridge
 DEFAULT_BACKFILL_DAYS_INTRADAY = 2
 DAILY_ATR_BACKFILL_DAYS_INTRADAY = 25
+
+# Shared bar cache (services/bars.py): one base fetch per symbol, every
+# other interval resampled from it (helpers.candles.resample_session).
+RESAMPLE_BASE_INTERVAL = "5m"
+RESAMPLE_CACHE_TTL_S = 30
+
+# Sector context (services/sector_context.py): index candles per sector,
+# strength recomputed once per bar close. Daily EMA200 needs ~250 sessions.
+SECTOR_CONTEXT_INTERVAL = "15m"
+SECTOR_CONTEXT_LOOKBACK_DAYS = 400
 # ------------------------------------------------------------
 # 🧩 Token parsing + conversions
 # ------------------------------------------------------------
@@ -40,9 +40,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, time
 from typing import Any, Dict, Optional, Tuple
 
+from queen.helpers.market import time_bucket as _market_time_bucket
+
 
 # ------------------------------------------------------------
 # Helpers to read PhaseState / RiskState in a tolerant way
@@ -64,35 +65,6 @@ class RiskView:
     reason: str = ""             # optional explanation
 
 
-def _parse_timestamp(ts: Any) -> Optional[datetime]:
-    """Best-effort conversion of timestamp into datetime."""
-    if isinstance(ts, datetime):
-        return ts
-
-    if ts is None:
-        return None
-
-    s = str(ts).strip()
-    if not s:
-        return None
-
-    # Try ISO format with offset.
-    try:
-        return datetime.fromisoformat(s)
-    except Exception:
-        pass
-
-    # Fallback: trim common timezone suffixes.
-    for sep in ["+", "Z"]:
-        if sep in s:
-            try:
-                return datetime.fromisoformat(s.split(sep)[0])
-            except Exception:
-                continue
-
-    return None
-
-
 def _time_bucket_from_ts(ts: Any) -> str:
     """Rough time-of-day segmentation.
 
@@ -102,18 +74,7 @@ def _time_bucket_from_ts(ts: Any) -> str:
       • LATE_SESSION  : 13:30–15:30
       • UNKNOWN       : anything else / parse error
     """
-    dt = _parse_timestamp(ts)
-    if dt is None:
-        return "UNKNOWN"
-
-    t = dt.time()
-    if time(9, 15) <= t < time(10, 30):
-        return "OPENING_DRIVE"
-    if time(10, 30) <= t < time(13, 30):
-        return "MID_SESSION"
-    if time(13, 30) <= t <= time(15, 30):
-        return "LATE_SESSION"
-    return "UNKNOWN"
+    return _market_time_bucket(ts)
 
 
 def _view_phase(phase: Any) -> PhaseView:
@@ -76,6 +76,16 @@ def _f_to_float(val):
         return None
 
 
+def _last_float(df: pl.DataFrame, col: str, default: float) -> float:
+    if col not in df.columns or df.is_empty():
+        return default
+    try:
+        v = _f_to_float(df.get_column(col).tail(1).item())
+        return default if v is None else v
+    except Exception:
+        return default
+
+
 def _last_str(df: pl.DataFrame, col: str, default: str = "") -> str:
     if col not in df.columns or df.is_empty():
         return default
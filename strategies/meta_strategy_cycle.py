@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/strategies/meta_strategy_cycle.py — v1.2
+# queen/strategies/meta_strategy_cycle.py — v1.6
 # Produce tactical snapshots (per symbol × timeframe) using fusion strategy
 # ============================================================
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Tuple
@@ -15,6 +16,8 @@ import polars as pl
 from queen.helpers.logger import log
 from queen.settings import settings as SETTINGS
 from queen.helpers import io
+from queen.helpers.log_writer import get_writer
+from queen.services import bars
 from queen.strategies.fusion import run_strategy
 
 
@@ -56,25 +59,16 @@ _SNAPSHOT_DEFAULTS: dict[str, Any] = {
 
 
 # ------------------------------------------------------------
-# 🔸 JSONL helpers
+# 🔸 JSONL snapshot log (buffered writer, size-rotated segments)
 # ------------------------------------------------------------
-def _append_jsonl(path: Path, record: dict) -> None:
-    path = Path(path).expanduser().resolve()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(record, ensure_ascii=False) + "\n")
-
-
-def _cap_jsonl(path: Path, max_lines: int = 5000):
-    """Trim JSONL to last N lines (keeps file tidy)."""
-    try:
-        if not path.exists():
-            return
-        lines = path.read_text(encoding="utf-8").splitlines()
-        if len(lines) > max_lines:
-            path.write_text("\n".join(lines[-max_lines:]) + "\n", encoding="utf-8")
-    except Exception:
-        pass
+def _snapshot_writer(path: Path):
+    cfg = SETTINGS.LOGGING.get("EVENT_LOGS", {})
+    return get_writer(
+        path,
+        max_bytes=int(cfg.get("SEGMENT_MB", 8)) << 20,
+        keep_segments=cfg.get("KEEP_SEGMENTS", 20),
+        rollup=cfg.get("ROLLUP_PARQUET", True),
+    )
 
 
 # ------------------------------------------------------------
@@ -169,9 +163,23 @@ def _ensure_snapshot_schema(df: pl.DataFrame) -> pl.DataFrame:
 # ------------------------------------------------------------
 # 🧠 Core meta cycle functions
 # ------------------------------------------------------------
-def _frames_for(symbol: str, tfs: Iterable[str]) -> Dict[str, pl.DataFrame]:
-    """Placeholder for fetch integration — returns dummy frames for now."""
-    return {tf: _dummy_ohlcv(240 if "hourly" in tf else 180) for tf in tfs}
+# timeframe → interval token; all derived from one cached base fetch (services.bars)
+TF_RULES: Dict[str, str] = {
+    "intraday_15m": "15m",
+    "hourly_1h": "1h",
+    "daily": "1d",
+}
+LOOKBACK_DAYS = 120
+
+
+async def _frames_for(symbol: str, tfs: Iterable[str]) -> Dict[str, pl.DataFrame]:
+    """Frames per timeframe from one base fetch; dummy bars when nothing is fetched (dev/offline)."""
+    tfs = list(tfs)
+    tokens = {tf: TF_RULES.get(tf, "15m") for tf in tfs}
+    got = await bars.get_frames(symbol, set(tokens.values()), lookback_days=LOOKBACK_DAYS)
+    if all(df.is_empty() for df in got.values()):
+        return {tf: _dummy_ohlcv(240 if "hourly" in tf else 180) for tf in tfs}
+    return {tf: got[tok] for tf, tok in tokens.items()}
 
 
 def _last_str(df: pl.DataFrame, col: str, default: str = "") -> str:
@@ -314,13 +322,41 @@ def _append_fused_rows(df: pl.DataFrame) -> pl.DataFrame:
     return combined.select(wanted)
 
 
-def run_meta_cycle(
+async def _collect_rows(
+    symbols: List[str], tfs: List[str], *, max_workers: int | None = None
+) -> List[Dict[str, Any]]:
+    """Fetch symbols concurrently and score them in a thread pool (polars releases the GIL)."""
+    n = int(max_workers or SETTINGS.FETCH.get("max_workers", 8))
+    sem = asyncio.Semaphore(n)
+    loop = asyncio.get_running_loop()
+
+    with ThreadPoolExecutor(max_workers=n, thread_name_prefix="meta") as pool:
+
+        async def _one(symbol: str) -> List[Dict[str, Any]]:
+            async with sem:
+                frames = await _frames_for(symbol, tfs)
+            res = await loop.run_in_executor(pool, run_strategy, symbol, frames)
+            return _emit_records(symbol, res.get("per_tf", {}), frames)
+
+        results = await asyncio.gather(*(_one(s) for s in symbols), return_exceptions=True)
+
+    rows: List[Dict[str, Any]] = []
+    for symbol, r in zip(symbols, results):
+        if isinstance(r, BaseException):
+            log.warning(f"[MetaCycle] {symbol} skipped → {r}")
+            continue
+        rows.extend(r)
+    return rows
+
+
+async def run_meta_cycle_async(
     symbols: Iterable[str],
     tfs: Iterable[str] = ("intraday_15m", "hourly_1h", "daily"),
     *,
     snapshot_parquet: Path | None = None,
     snapshot_jsonl: Path | None = None,
 ) -> Tuple[Path, Path, pl.DataFrame]:
+    """Build and write the tactical snapshot (await this from async code)."""
     snap_dir = SETTINGS.PATHS["SNAPSHOTS"]
     snapshot_parquet = (
         Path(snapshot_parquet or snap_dir / "tactical_snapshot.parquet")
@@ -335,33 +371,56 @@ def run_meta_cycle(
     snapshot_parquet.parent.mkdir(parents=True, exist_ok=True)
     snapshot_jsonl.parent.mkdir(parents=True, exist_ok=True)
 
-    all_rows: List[Dict[str, Any]] = []
-
-    for symbol in symbols:
-        frames = _frames_for(symbol, tfs)
-        res = run_strategy(symbol, frames)
-        per_tf = res.get("per_tf", {})
-        all_rows.extend(_emit_records(symbol, per_tf, frames))
+    all_rows = await _collect_rows(list(symbols), list(tfs))
 
     if not all_rows:
         log.warning("[MetaCycle] No rows produced; skipping writes.")
         return snapshot_parquet, snapshot_jsonl, pl.DataFrame()
 
+    df = await asyncio.to_thread(_write_snapshot, all_rows, snapshot_parquet, snapshot_jsonl)
+    return snapshot_parquet, snapshot_jsonl, df
+
+
+def _write_snapshot(all_rows: List[Dict[str, Any]], snapshot_parquet: Path, snapshot_jsonl: Path) -> pl.DataFrame:
     df = pl.DataFrame(all_rows)
     df = _append_fused_rows(df)
     df = df.select([c for c in SNAPSHOT_COLS if c in df.columns])
 
     io.write_parquet(df, snapshot_parquet)
-    for r in all_rows:
-        _append_jsonl(snapshot_jsonl, r)
-    _cap_jsonl(snapshot_jsonl, 5000)
+    writer = _snapshot_writer(snapshot_jsonl)
+    writer.write_many(all_rows)
+    writer.flush()
     _write_latest_pointer(snapshot_parquet, snapshot_jsonl)
 
     log.info(
         f"[MetaCycle] Wrote snapshot: {len(df)} rows → "
         f"{snapshot_parquet.name} + {snapshot_jsonl.name}"
     )
-    return snapshot_parquet, snapshot_jsonl, df
+    return df
+
+
+def run_meta_cycle(
+    symbols: Iterable[str],
+    tfs: Iterable[str] = ("intraday_15m", "hourly_1h", "daily"),
+    *,
+    snapshot_parquet: Path | None = None,
+    snapshot_jsonl: Path | None = None,
+) -> Tuple[Path, Path, pl.DataFrame]:
+    """Sync wrapper for CLI/scripts; async callers await ``run_meta_cycle_async``."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            "run_meta_cycle() called from a running event loop; "
+            "await run_meta_cycle_async(...) instead"
+        )
+    return asyncio.run(
+        run_meta_cycle_async(
+            symbols, tfs, snapshot_parquet=snapshot_parquet, snapshot_jsonl=snapshot_jsonl
+        )
+    )
 
 
 def _discover_symbols(limit: int) -> List[str]:
@@ -28,9 +28,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime, time
 from typing import Any, Dict, List, Optional
 
+from queen.helpers.market import TIME_BUCKET_NAMES, time_bucket
+
 
 # ------------------------------------------------------------
 # Dataclasses (internal usage)
@@ -49,41 +50,6 @@ class PlaybookContext:
 # ------------------------------------------------------------
 # Time + interval helpers
 # ------------------------------------------------------------
-def _parse_timestamp(ts: Any) -> Optional[datetime]:
-    """Best-effort conversion of timestamp into datetime.
-
-    Accepts:
-      • datetime objects (returned unchanged)
-      • ISO-like strings (with or without timezone offset)
-    Fails silently and returns None if parsing is impossible.
-    """
-    if isinstance(ts, datetime):
-        return ts
-
-    if ts is None:
-        return None
-
-    s = str(ts).strip()
-    if not s:
-        return None
-
-    # Try basic fromisoformat; handle "+05:30" style offsets.
-    try:
-        return datetime.fromisoformat(s)
-    except Exception:
-        pass
-
-    # Fallback: try trimming timezone portion if present.
-    for sep in ["+", "Z"]:
-        if sep in s:
-            try:
-                return datetime.fromisoformat(s.split(sep)[0])
-            except Exception:
-                continue
-
-    return None
-
-
 def _time_bucket_from_ts(ts: Any) -> str:
     """Rough time-of-day segmentation for intraday logic.
 
@@ -93,18 +59,7 @@ def _time_bucket_from_ts(ts: Any) -> str:
       • LATE_SESSION  : 13:30–15:30
       • UNKNOWN       : anything else / parse error
     """
-    dt = _parse_timestamp(ts)
-    if dt is None:
-        return "UNKNOWN"
-
-    t = dt.time()
-    if time(9, 15) <= t < time(10, 30):
-        return "OPENING_DRIVE"
-    if time(10, 30) <= t < time(13, 30):
-        return "MID_SESSION"
-    if time(13, 30) <= t <= time(15, 30):
-        return "LATE_SESSION"
-    return "UNKNOWN"
+    return time_bucket(ts)
 
 
 def _normalize_interval(interval: Optional[str]) -> str:
@@ -192,7 +147,9 @@ def _classify_intraday_playbook(
     drivers = _get_drivers(row)
     ts = row.get("timestamp")
 
-    ctx.time_bucket = _time_bucket_from_ts(ts)
+    # Prefer the bucket precomputed by helpers.market.with_time_columns
+    pre = row.get("time_bucket")
+    ctx.time_bucket = pre if pre in TIME_BUCKET_NAMES else _time_bucket_from_ts(ts)
 
     is_buy = decision in {"BUY", "ADD", "BUY / ADD", "STRONG_BUY"}
     is_hold = decision == "HOLD"
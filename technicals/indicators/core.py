@@ -1,5 +1,5 @@
 # ============================================================
-# queen/technicals/indicators/core.py — v1.4 (No-Duplicate + VWAP_LAST)
+# queen/technicals/indicators/core.py — v1.5 (No-Duplicate + VWAP_LAST + rule exports)
 # ------------------------------------------------------------
 # Core Polars-based indicator helpers used across the engine:
 #   • SMA / EMA (+ EMA slope)
@@ -9,7 +9,10 @@
 #   • ATR (+ atr_last)
 #   • CPR from previous day
 #   • OBV trend classification
+#   • EMA cross / price-minus-VWAP spreads (alert rule series)
 #
+# SMA / EMA / RSI / ATR accept ``length`` as an alias of ``period`` (the
+# key alert rule configs use). EXPORTS registers the rule-facing series.
 # All functions are forward-only, Polars-native, and kept DRY.
 # ============================================================
 
@@ -24,8 +27,11 @@ from queen.helpers.market import MARKET_TZ
 
 
 # ---------------- SMA / EMA ----------------
-def sma(df: pl.DataFrame, period: int = 20, column: str = "close") -> pl.Series:
+def sma(
+    df: pl.DataFrame, period: int = 20, column: str = "close", length: Optional[int] = None
+) -> pl.Series:
     """Simple Moving Average over `period` bars."""
+    period = int(length or period)
     return (
         df[column]
         .cast(pl.Float64, strict=False)
@@ -34,8 +40,11 @@ def sma(df: pl.DataFrame, period: int = 20, column: str = "close") -> pl.Series:
     )
 
 
-def ema(df: pl.DataFrame, period: int = 20, column: str = "close") -> pl.Series:
+def ema(
+    df: pl.DataFrame, period: int = 20, column: str = "close", length: Optional[int] = None
+) -> pl.Series:
     """Exponential Moving Average over `period` bars."""
+    period = int(length or period)
     return (
         df[column]
         .cast(pl.Float64, strict=False)
@@ -62,8 +71,11 @@ def ema_slope(
 
 
 # ---------------- RSI ----------------
-def rsi(df: pl.DataFrame, period: int = 14, column: str = "close") -> pl.Series:
+def rsi(
+    df: pl.DataFrame, period: int = 14, column: str = "close", length: Optional[int] = None
+) -> pl.Series:
     """Classic RSI (Wilder-style via EMA approximation)."""
+    period = int(length or period)
     close = df[column].cast(pl.Float64, strict=False)
     delta = close.diff().fill_null(0.0)
 
@@ -78,6 +90,24 @@ def rsi(df: pl.DataFrame, period: int = 14, column: str = "close") -> pl.Series:
     return out.alias(f"rsi_{period}")
 
 
+# ---------------- Rule spreads ----------------
+def ema_cross(
+    df: pl.DataFrame, fast: int = 20, slow: int = 50, column: str = "close"
+) -> pl.Series:
+    """EMA(fast) − EMA(slow); crossing 0 is the EMA crossover."""
+    fast, slow = int(fast), int(slow)
+    spread = ema(df, period=fast, column=column) - ema(df, period=slow, column=column)
+    return spread.alias(f"ema_cross_{fast}_{slow}")
+
+
+def price_minus_vwap(df: pl.DataFrame) -> pl.Series:
+    """Close − running VWAP; crossing 0 is a VWAP reclaim / loss."""
+    if df.is_empty():
+        return pl.Series("price_minus_vwap", [], dtype=pl.Float64)
+    close = df["close"].cast(pl.Float64, strict=False)
+    return (close - vwap(df)).alias("price_minus_vwap")
+
+
 # ---------------- MACD (simple helper; advanced MACD lives in momentum_macd.py) ----------------
 def macd(
     df: pl.DataFrame,
@@ -146,8 +176,9 @@ def vwap_last(df: pl.DataFrame) -> Optional[float]:
 
 
 # ---------------- ATR ----------------
-def atr(df: pl.DataFrame, period: int = 14) -> pl.Series:
+def atr(df: pl.DataFrame, period: int = 14, length: Optional[int] = None) -> pl.Series:
     """ATR using a simple rolling-mean of True Range."""
+    period = int(length or period)
     if df.is_empty():
         return pl.Series(f"atr_{period}", [])
 
@@ -279,6 +310,8 @@ __all__ = [
     "sma",
     "ema",
     "ema_slope",
+    "ema_cross",
+    "price_minus_vwap",
     "rsi",
     "rsi_last",
     "macd",
@@ -288,4 +321,17 @@ __all__ = [
     "atr_last",
     "cpr_from_prev_day",
     "obv_trend",
+    "EXPORTS",
 ]
+
+
+# Registry export (alert rules resolve these by name)
+EXPORTS = {
+    "sma": sma,
+    "ema": ema,
+    "ema_slope": ema_slope,
+    "ema_cross": ema_cross,
+    "price_minus_vwap": price_minus_vwap,
+    "rsi": rsi,
+    "atr": atr,
+}
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/technicals/manifest.py — v1.0 (cached registry manifest)
+# ============================================================
+"""Pre-built manifest for the indicator / signal / pattern registries.
+
+Discovery (walk_packages + import every submodule) runs once and its result
+is written to the runtime cache as JSON:
+
+    {group: {name: {"module": "pkg.mod", "attr": "func",        # or
+                    "module": "pkg.mod", "export": "EXPORTS key",
+                    "required_columns": [...] | None,
+                    "lookback": int | None}}}
+
+The manifest is keyed by the mtimes of every .py file under the scanned
+packages (plus the registry sources), so adding/editing a plugin rebuilds
+it on the next lookup. Lookups then import only the owning module.
+
+Plugins may declare requirements next to the callable (function attribute)
+or at module level:
+    REQUIRED_COLUMNS = ["high", "low", "close"]
+    LOOKBACK = 14
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
+
+from queen.helpers.logger import log
+
+MANIFEST_VERSION = 1
+Groups = Dict[str, Dict[str, Dict[str, Any]]]
+
+_QUEEN_ROOT = Path(os.path.abspath(__file__)).parents[1]
+_MEMO: Dict[str, Groups] = {}
+
+
+def enabled() -> bool:
+    return os.getenv("QUEEN_REGISTRY_MANIFEST", "1") != "0"
+
+
+def manifest_dir() -> Path:
+    from queen.settings.settings import PATHS
+
+    return PATHS["CACHE"] / "registry"
+
+
+# ------------------------------------------------------------
+# Fingerprint (filesystem only — nothing is imported)
+# ------------------------------------------------------------
+def _package_dir(pkg: str) -> Optional[Path]:
+    parts = pkg.split(".")
+    if parts[0] == "queen":
+        p = _QUEEN_ROOT.joinpath(*parts[1:])
+        return p if p.is_dir() else None
+    try:
+        spec = importlib.util.find_spec(pkg)
+    except Exception:
+        return None
+    locs = list(getattr(spec, "submodule_search_locations", None) or [])
+    return Path(locs[0]) if locs else None
+
+
+def source_fingerprint(packages: Iterable[str], sources: Iterable[str] = ()) -> Dict[str, int]:
+    """{pkg:relpath: mtime_ns} for every .py under ``packages`` plus ``sources``.
+
+    Keys are checkout-relative so the same tree reached via another path
+    (symlink, container mount) reuses the manifest.
+    """
+    fp: Dict[str, int] = {}
+    for pkg in packages:
+        d = _package_dir(pkg)
+        if d is None:
+            fp[f"<missing:{pkg}>"] = 0
+            continue
+        for root, dirs, files in os.walk(d):
+            dirs[:] = [x for x in dirs if x != "__pycache__"]
+            for f in files:
+                if f.endswith(".py"):
+                    p = os.path.join(root, f)
+                    fp[f"{pkg}:{os.path.relpath(p, d)}"] = os.stat(p).st_mtime_ns
+    for src in sources:
+        try:
+            fp[os.path.basename(src)] = os.stat(src).st_mtime_ns
+        except OSError:
+            fp[os.path.basename(src)] = 0
+    return fp
+
+
+# ------------------------------------------------------------
+# Entries
+# ------------------------------------------------------------
+def _lookup(module: str, qualname: str) -> Any:
+    obj: Any = sys.modules.get(module) or importlib.import_module(module)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def declared_requirements(obj: Any, mod: Any = None) -> tuple[Optional[list], Optional[int]]:
+    cols = getattr(obj, "REQUIRED_COLUMNS", None) or getattr(mod, "REQUIRED_COLUMNS", None)
+    look = getattr(obj, "LOOKBACK", None) or getattr(mod, "LOOKBACK", None)
+    cols = list(cols) if isinstance(cols, (list, tuple, set)) else None
+    look = int(look) if isinstance(look, (int, float)) and not isinstance(look, bool) else None
+    return cols, look
+
+
+def entry_for(obj: Any, module_name: str, export_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Describe where ``obj`` can be re-imported from (None if it can't)."""
+    mod = getattr(obj, "__module__", None)
+    qual = getattr(obj, "__qualname__", None)
+    entry: Optional[Dict[str, Any]] = None
+    if mod and qual and "<" not in qual:
+        try:
+            if _lookup(mod, qual) is obj:
+                entry = {"module": mod, "attr": qual}
+        except Exception:
+            entry = None
+    if entry is None and export_key is not None:
+        entry = {"module": module_name, "export": export_key}
+    if entry is None:
+        return None
+    entry["source"] = module_name
+    entry["required_columns"], entry["lookback"] = declared_requirements(
+        obj, sys.modules.get(module_name)
+    )
+    return entry
+
+
+def resolve(entry: Dict[str, Any]) -> Any:
+    """Import the owning module and return the registered object."""
+    if entry.get("attr"):
+        return _lookup(entry["module"], entry["attr"])
+    mod = importlib.import_module(entry["module"])
+    return getattr(mod, "EXPORTS")[entry["export"]]
+
+
+# ------------------------------------------------------------
+# Load / build
+# ------------------------------------------------------------
+def _path_for(name: str, packages: Sequence[str]) -> Path:
+    tag = hashlib.blake2b(",".join(packages).encode(), digest_size=4).hexdigest()
+    return manifest_dir() / f"{name}_{tag}.json"
+
+
+def load_or_build(
+    name: str,
+    packages: Sequence[str],
+    build: Callable[[], Groups],
+    sources: Iterable[str] = (),
+) -> Groups:
+    """Return the cached manifest for ``name`` or rebuild it via ``build()``."""
+    key = f"{name}|{','.join(packages)}"
+    if key in _MEMO:
+        return _MEMO[key]
+    if not enabled():
+        return build()
+
+    fp = source_fingerprint(packages, sources)
+    path = _path_for(name, packages)
+    try:
+        cached = json.loads(path.read_text(encoding="utf-8"))
+        if cached.get("version") == MANIFEST_VERSION and cached.get("fingerprint") == fp:
+            _MEMO[key] = cached["groups"]
+            return _MEMO[key]
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log.debug(f"[Manifest] {path.name} unreadable, rebuilding: {e}")
+
+    groups = build()
+    payload = {"version": MANIFEST_VERSION, "packages": list(packages), "fingerprint": fp, "groups": groups}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload, indent=1, sort_keys=True), encoding="utf-8")
+        tmp.replace(path)
+        log.info(f"[Manifest] Rebuilt {path.name} ({sum(len(g) for g in groups.values())} entries)")
+    except Exception as e:
+        log.debug(f"[Manifest] save failed for {path.name}: {e}")
+    _MEMO[key] = groups
+    return groups
+
+
+def forget(name: Optional[str] = None) -> None:
+    """Drop the in-process memo (the JSON stays; its fingerprint guards it)."""
+    for k in list(_MEMO):
+        if name is None or k.split("|", 1)[0] == name:
+            del _MEMO[k]
+
+
+__all__ = [
+    "declared_requirements",
+    "entry_for",
+    "forget",
+    "load_or_build",
+    "resolve",
+    "source_fingerprint",
+]
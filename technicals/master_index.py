@@ -11,7 +11,9 @@ import pkgutil
 from typing import Iterable, Tuple
 
 import polars as pl
-from queen.technicals import registry
+from queen.technicals import manifest, registry
+
+_PATTERNS_PKG = "queen.technicals.patterns"
 
 
 def _scan_package(pkg: str) -> Iterable[Tuple[str, str]]:
@@ -56,26 +58,36 @@ def _scan_package(pkg: str) -> Iterable[Tuple[str, str]]:
     return found
 
 
+def _build_patterns_manifest() -> dict:
+    rows = {}
+    for i, (name, mod) in enumerate(_scan_package(_PATTERNS_PKG)):
+        rows[f"{i:04d}"] = {"name": name, "module": mod}
+    return {"patterns": rows}
+
+
 def master_index() -> pl.DataFrame:
     """Return a master DataFrame with kind/name/module for:
     - indicators (registry)
     - signals (registry)
     - patterns  (explicit scan of queen.technicals.patterns.*)
     """
-    # registry-backed indicators/signals
-    registry.build_registry()
+    # registry-backed indicators/signals (manifest: no plugin imports)
     indicators = [
-        ("indicator", n, registry._REG_INDICATORS[n].fn.__module__)  # type: ignore[attr-defined]
+        ("indicator", n, registry.module_of("indicator", n) or "")
         for n in registry.list_indicators()
     ]
     signals = [
-        ("signal", n, registry._REG_SIGNALS[n].fn.__module__)  # type: ignore[attr-defined]
+        ("signal", n, registry.module_of("signal", n) or "")
         for n in registry.list_signals()
     ]
 
     # explicit pattern scan (keeps future-proof if patterns move)
-    patterns_raw = list(_scan_package("queen.technicals.patterns"))
-    patterns = [("pattern", name, mod) for (name, mod) in patterns_raw]
+    patterns = [
+        ("pattern", e["name"], e["module"])
+        for e in manifest.load_or_build(
+            "patterns", [_PATTERNS_PKG], _build_patterns_manifest, sources=[__file__]
+        )["patterns"].values()
+    ]
 
     # combine + normalize names (canonical, lower_snake)
     items = []
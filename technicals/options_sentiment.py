@@ -4,75 +4,172 @@
 # ============================================================
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 import polars as pl
 
 from queen.helpers.fno_universe import is_fno
-from queen.helpers.options_catalog import get_atm_ladder
+
+# Long chain frame (fetchers.options_chain.to_long_chain):
+#   underlying, expiry, strike_price, instrument_type (CE/PE), open_interest,
+#   prev_open_interest | change_in_oi, close, prev_close, underlying_spot_price
+GROUP_KEYS = ("underlying", "expiry")
 
 # ============================================================
-# Internal utilities
+# Internal utilities (expressions over the long chain)
 # ============================================================
 
-def _compute_pcr(df: pl.DataFrame) -> Optional[float]:
-    puts = df.filter(pl.col("instrument_type") == "PE")["open_interest"].sum()
-    calls = df.filter(pl.col("instrument_type") == "CE")["open_interest"].sum()
-    return float(puts / calls) if calls > 0 else None
+def _oi_class(dp: pl.Expr, doi: pl.Expr, n: pl.Expr) -> pl.Expr:
+    """Price × OI change → lbu / luu / scu / sbu / neutral (unknown if no data)."""
+    return (
+        pl.when((n == 0) | dp.is_null()).then(pl.lit("unknown"))
+        .when((dp > 0) & (doi > 0)).then(pl.lit("lbu"))  # Long Build-Up
+        .when((dp < 0) & (doi < 0)).then(pl.lit("luu"))  # Long Unwinding
+        .when((dp > 0) & (doi < 0)).then(pl.lit("scu"))  # Short Covering
+        .when((dp < 0) & (doi > 0)).then(pl.lit("sbu"))  # Short Build-Up
+        .otherwise(pl.lit("neutral"))
+    )
 
 
-def _classify_oi_change(df: pl.DataFrame) -> Dict[str, str]:
-    """Expect df to contain:
-    strike_price, instrument_type, open_interest, prev_open_interest
-    """
-    out = {}
-
-    for t in ("CE", "PE"):
-        d = df.filter(pl.col("instrument_type") == t)
-        if d.is_empty():
-            out[t] = "unknown"
-            continue
-
-        oi = d["open_interest"].sum()
-        prev = d["prev_open_interest"].sum()
-        price_now = d["close"].max() if "close" in d.columns else None
-        price_prev = d["prev_close"].max() if "prev_close" in d.columns else None
-
-        if price_now is None or price_prev is None:
-            out[t] = "unknown"
-            continue
-
-        dp = price_now - price_prev
-        doi = oi - prev
-
-        if dp > 0 and doi > 0:
-            out[t] = "lbu"  # Long Build-Up
-        elif dp < 0 and doi < 0:
-            out[t] = "luu"  # Long Unwinding
-        elif dp > 0 and doi < 0:
-            out[t] = "scu"  # Short Covering
-        elif dp < 0 and doi > 0:
-            out[t] = "sbu"  # Short Build-Up
-        else:
-            out[t] = "neutral"
-
-    return out
-
-
-def _max_pain(df: pl.DataFrame) -> Optional[float]:
-    """Max Pain = strike with highest combined (CE+PE) OI.
-    Derived only from LIVE chain, no catalog.
+def _prepare(chain: pl.DataFrame | pl.LazyFrame, spot: Optional[Dict[str, float]]) -> pl.LazyFrame:
+    lf = chain.lazy()
+    cols = set(lf.collect_schema().names())
+    oi = pl.col("open_interest").cast(pl.Float64).fill_null(0.0)
+    if "prev_open_interest" in cols:
+        prev = pl.col("prev_open_interest").cast(pl.Float64)
+    elif "change_in_oi" in cols:
+        prev = oi - pl.col("change_in_oi").cast(pl.Float64)
+    else:
+        prev = pl.lit(0.0)
+    adds = [
+        oi.alias("open_interest"),
+        prev.fill_null(0.0).alias("prev_open_interest"),
+        pl.col("strike_price").cast(pl.Float64),
+    ]
+    for c in ("underlying", "expiry", "close", "prev_close", "underlying_spot_price"):
+        if c not in cols:
+            adds.append(pl.lit(None).alias(c))
+    lf = lf.with_columns(adds)
+    if spot:
+        lf = lf.with_columns(
+            pl.col("underlying")
+            .replace_strict(spot, default=None, return_dtype=pl.Float64)
+            .fill_null(pl.col("underlying_spot_price").cast(pl.Float64))
+            .alias("underlying_spot_price")
+        )
+    return lf
+
+
+def options_sentiment_frame(
+    chain: pl.DataFrame | pl.LazyFrame,
+    *,
+    spot: Optional[Dict[str, float]] = None,
+    by: Sequence[str] = GROUP_KEYS,
+) -> pl.DataFrame:
+    """PCR, OI build-up, true max pain, ATM pressure and bias per ``by`` group.
+
+    One lazy query over the long chain for every underlying at once. Max pain
+    is the settlement strike with the minimum total writer payout
+    (Σ CE oi·max(S−K, 0) + Σ PE oi·max(K−S, 0)) over the chain's strikes.
+    Spot comes from ``spot[underlying]`` or ``underlying_spot_price``.
     """
-    if df.is_empty():
-        return None
+    keys = list(by)
+    lf = _prepare(chain, spot)
+    is_ce = pl.col("instrument_type") == "CE"
+    is_pe = pl.col("instrument_type") == "PE"
+    oi, prev = pl.col("open_interest"), pl.col("prev_open_interest")
+
+    stats = lf.group_by(keys).agg(
+        oi.filter(is_ce).sum().alias("ce_oi"),
+        oi.filter(is_pe).sum().alias("pe_oi"),
+        (oi - prev).filter(is_ce).sum().alias("ce_doi"),
+        (oi - prev).filter(is_pe).sum().alias("pe_doi"),
+        (pl.col("close").filter(is_ce).max() - pl.col("prev_close").filter(is_ce).max()).alias("ce_dp"),
+        (pl.col("close").filter(is_pe).max() - pl.col("prev_close").filter(is_pe).max()).alias("pe_dp"),
+        is_ce.sum().alias("ce_n"),
+        is_pe.sum().alias("pe_n"),
+        pl.col("underlying_spot_price").drop_nulls().first().cast(pl.Float64).alias("spot"),
+        *([pl.col("expiry").first()] if "expiry" not in keys else []),
+    )
 
-    out = (
-        df.group_by("strike_price")
-        .agg(pl.col("open_interest").sum().alias("total_oi"))
-        .sort("total_oi", descending=True)
+    # Strike × strike payout matrix per group → argmin settlement
+    settle = lf.select(*keys, pl.col("strike_price").alias("settle")).unique()
+    payout = (
+        lf.select(*keys, "strike_price", "instrument_type", "open_interest")
+        .join(settle, on=keys, nulls_equal=True)
+        .with_columns(
+            pl.when(is_ce)
+            .then(pl.col("open_interest") * (pl.col("settle") - pl.col("strike_price")).clip(lower_bound=0))
+            .otherwise(pl.col("open_interest") * (pl.col("strike_price") - pl.col("settle")).clip(lower_bound=0))
+            .alias("payout")
+        )
+        .group_by(*keys, "settle")
+        .agg(pl.col("payout").sum())
+    )
+    max_pain = payout.group_by(keys).agg(
+        pl.col("settle").sort_by(["payout", "settle"]).first().alias("max_pain")
     )
 
-    return float(out["strike_price"][0]) if out.height > 0 else None
+    # ATM = strike nearest spot (lower strike on ties), then PE−CE OI there
+    atm = (
+        settle.join(stats.select(*keys, "spot"), on=keys, nulls_equal=True)
+        .group_by(keys)
+        .agg(
+            pl.col("settle")
+            .sort_by([(pl.col("settle") - pl.col("spot")).abs(), pl.col("settle")])
+            .first()
+            .alias("atm")
+        )
+    )
+    atm_oi = (
+        lf.join(atm, on=keys, nulls_equal=True)
+        .filter(pl.col("strike_price") == pl.col("atm"))
+        .group_by(keys)
+        .agg((oi.filter(is_pe).sum() - oi.filter(is_ce).sum()).alias("atm_pressure"))
+    )
+
+    pcr = pl.when(pl.col("ce_oi") > 0).then(pl.col("pe_oi") / pl.col("ce_oi")).alias("pcr")
+    out = (
+        stats.join(max_pain, on=keys, how="left", nulls_equal=True)
+        .join(atm, on=keys, how="left", nulls_equal=True)
+        .join(atm_oi, on=keys, how="left", nulls_equal=True)
+        .with_columns(
+            pcr,
+            (pl.col("spot") - pl.col("max_pain")).alias("max_pain_distance"),
+            _oi_class(pl.col("ce_dp"), pl.col("ce_doi"), pl.col("ce_n")).alias("oi_change_call"),
+            _oi_class(pl.col("pe_dp"), pl.col("pe_doi"), pl.col("pe_n")).alias("oi_change_put"),
+            pl.when(pl.col("spot").is_null() | pl.col("atm").is_null())
+            .then(None)
+            .otherwise(pl.col("atm_pressure").fill_null(0.0))
+            .alias("atm_pressure"),
+        )
+        .with_columns(
+            pl.when(pl.col("pcr").is_null() | pl.col("atm_pressure").is_null()).then(pl.lit("neutral"))
+            .when((pl.col("pcr") > 1.1) & (pl.col("atm_pressure") > 0)).then(pl.lit("bullish"))
+            .when((pl.col("pcr") < 0.9) & (pl.col("atm_pressure") < 0)).then(pl.lit("bearish"))
+            .otherwise(pl.lit("neutral"))
+            .alias("bias")
+        )
+        .with_columns(
+            pl.col("bias").replace_strict({"bullish": 70, "bearish": 30, "neutral": 50}).alias("sentiment_score")
+        )
+        .select(
+            *keys,
+            *(["expiry"] if "expiry" not in keys else []),
+            "bias",
+            "sentiment_score",
+            "pcr",
+            "max_pain",
+            "max_pain_distance",
+            "atm_pressure",
+            "oi_change_call",
+            "oi_change_put",
+            "atm",
+            "spot",
+        )
+        .sort(keys, nulls_last=True)
+    )
+    return out.collect()
 
 
 # ============================================================
@@ -123,7 +220,9 @@ def compute_options_sentiment(
 
     # Inject previous chain if present
     if prev_chain_df is not None:
-        chain_df = chain_df.join(
+        chain_df = chain_df.drop(
+            [c for c in ("prev_open_interest", "prev_close") if c in chain_df.columns]
+        ).join(
             prev_chain_df.select([
                 "strike_price",
                 "instrument_type",
@@ -136,78 +235,60 @@ def compute_options_sentiment(
             on=["strike_price", "instrument_type"],
             how="left",
         )
-    else:
+    elif not {"prev_open_interest", "prev_close"} <= set(chain_df.columns):
         chain_df = chain_df.with_columns([
             pl.lit(0).alias("prev_open_interest"),
             pl.lit(ltp).alias("prev_close"),  # fallback
         ])
 
-
-    # ------------------------------------------------------------
-    # PCR
-    # ------------------------------------------------------------
-    pcr = _compute_pcr(chain_df)
-
-    # ------------------------------------------------------------
-    # OI Change Classification (CE & PE)
     # ------------------------------------------------------------
-    oi_class = _classify_oi_change(chain_df)
-
+    # Same lazy query as the batch path, one group
     # ------------------------------------------------------------
-    # Max Pain (from LIVE, not catalog)
-    # ------------------------------------------------------------
-    mp = _max_pain(chain_df)
-    mp_dist = (ltp - mp) if mp else None
-
-    # ------------------------------------------------------------
-    # ATM Ladder
-    # ------------------------------------------------------------
-    expiries = chain_df["expiry"].unique().to_list()
-    expiry = expiries[0] if expiries else None
-
-    strikes = chain_df["strike_price"].unique().sort().to_list()
-    ladder = get_atm_ladder(strikes, ltp)
-
-    atm = ladder.get("atm")
-    if atm:
-        ce_atm_oi = chain_df.filter(
-            (pl.col("strike_price") == atm) & (pl.col("instrument_type") == "CE")
-        )["open_interest"].sum()
+    chain_df = chain_df.with_columns(
+        pl.lit(symbol.upper()).alias("underlying"),
+        pl.lit(float(ltp)).alias("underlying_spot_price"),
+    )
+    row = options_sentiment_frame(chain_df, by=("underlying",)).row(0, named=True)
+    return {
+        "bias": row["bias"],
+        "sentiment_score": row["sentiment_score"],
+        "pcr": row["pcr"],
+        "max_pain": row["max_pain"],
+        "max_pain_distance": row["max_pain_distance"],
+        "atm_pressure": row["atm_pressure"],
+        "oi_change_call": row["oi_change_call"],
+        "oi_change_put": row["oi_change_put"],
+        "expiry": row["expiry"],
+        "atm": row["atm"],
+    }
 
-        pe_atm_oi = chain_df.filter(
-            (pl.col("strike_price") == atm) & (pl.col("instrument_type") == "PE")
-        )["open_interest"].sum()
 
-        atm_pressure = pe_atm_oi - ce_atm_oi
-    else:
-        atm_pressure = None
+# ============================================================
+# Batch refresh (whole F&O list, one pooled fetch)
+# ============================================================
 
-    # ------------------------------------------------------------
-    # Derive Bias
-    # ------------------------------------------------------------
-    if atm_pressure is None or pcr is None:
-        bias = "neutral"
-        score = 50
-    else:
-        if pcr > 1.1 and atm_pressure > 0:
-            bias = "bullish"
-            score = 70
-        elif pcr < 0.9 and atm_pressure < 0:
-            bias = "bearish"
-            score = 30
-        else:
-            bias = "neutral"
-            score = 50
+async def refresh_options_sentiment(
+    symbols: Optional[List[str]] = None,
+    *,
+    mode: str = "intraday",
+    ltp: Optional[Dict[str, float]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Sentiment for every underlying from one ``fetch_chains`` batch.
+
+    Chains are TTL-cached by the fetcher and scored in one lazy query, so
+    this is cheap enough for a 1-minute cadence over the full F&O list.
+    PCR and max pain use every strike; trim (fetchers.options_chain
+    ``trim_strike_window``) only what is displayed.
+    """
+    from queen.fetchers.options_chain import fetch_chains
 
+    chains = await fetch_chains(symbols, mode=mode)
+    if chains.is_empty():
+        return {}
+    spot = {k.upper(): float(v) for k, v in (ltp or {}).items()}
+    frame = options_sentiment_frame(chains, spot=spot, by=("underlying",))
     return {
-        "bias": bias,
-        "sentiment_score": score,
-        "pcr": pcr,
-        "max_pain": mp,
-        "max_pain_distance": mp_dist,
-        "atm_pressure": atm_pressure,
-        "oi_change_call": oi_class.get("CE"),
-        "oi_change_put": oi_class.get("PE"),
-        "expiry": expiry,
-        "atm": atm,
+        r["underlying"]: {k: v for k, v in r.items() if k not in ("underlying", "spot")}
+        for r in frame.iter_rows(named=True)
+        if r["spot"] is not None
     }
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/technicals/registry.py — v1.2 (Auto-discovery, DRY, safe)
+# queen/technicals/registry.py — v1.3 (Auto-discovery, DRY, safe)
+# ------------------------------------------------------------
+# Lookups go through the cached manifest (technicals/manifest.py):
+# get_indicator(name) imports only the owning module; list_* import nothing.
+# build_registry() still performs the full discovery.
 # ============================================================
 from __future__ import annotations
 
@@ -8,19 +12,30 @@ import importlib
 import inspect
 import pkgutil
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 import polars as pl
 
+from queen.technicals import manifest
+
 
 @dataclass(frozen=True)
 class Entry:
     name: str
     fn: Callable[..., pl.DataFrame | pl.Series | dict | None]
+    module: str = ""                 # module the entry was discovered in
+    export: Optional[str] = None     # EXPORTS key, if registered that way
 
 
 _REG_INDICATORS: Dict[str, Entry] = {}
 _REG_SIGNALS: Dict[str, Entry] = {}
+# Resolved through the manifest (one import per lookup)
+_RESOLVED: Dict[str, Dict[str, Callable]] = {"indicators": {}, "signals": {}}
+
+_PACKAGES = {
+    "indicators": "queen.technicals.indicators",
+    "signals": "queen.technicals.signals",
+}
 
 
 # ---------- helpers ----------
@@ -51,7 +66,7 @@ def _register_many(target: Dict[str, Entry], mod, exports: Dict) -> int:
         key = _norm(k)
         fn = v if callable(v) else _resolve_dotted(mod, str(v))
         if callable(fn):
-            target[key] = Entry(name=key, fn=fn)
+            target[key] = Entry(name=key, fn=fn, module=mod.__name__, export=k)
             count += 1
     return count
 
@@ -69,14 +84,14 @@ def _try_module_exports(mod, target: Dict[str, Entry]) -> int:
     comp = getattr(mod, "compute", None)
     if isinstance(name, str) and callable(comp):
         key = _norm(name)
-        target[key] = Entry(name=key, fn=comp)
+        target[key] = Entry(name=key, fn=comp, module=mod.__name__)
         count += 1
 
     # 3) any compute_* functions (auto-expose)
     for n, v in inspect.getmembers(mod, inspect.isfunction):
         if n.startswith("compute_"):
             key = _norm(n.replace("compute_", "", 1))
-            target[key] = Entry(name=key, fn=v)
+            target[key] = Entry(name=key, fn=v, module=mod.__name__)
             count += 1
     return count
 
@@ -117,34 +132,76 @@ def build_registry(force: bool = False) -> None:
     _autoscan("queen.technicals.signals", _REG_SIGNALS)
 
 
+# ---------- manifest ----------
+def _build_manifest() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    groups: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for group, pkg in _PACKAGES.items():
+        found: Dict[str, Entry] = {}
+        _autoscan(pkg, found)
+        groups[group] = {
+            k: e
+            for k, e in (
+                (k, manifest.entry_for(v.fn, v.module, export_key=v.export))
+                for k, v in found.items()
+            )
+            if e is not None
+        }
+    return groups
+
+
+def _manifest(group: str) -> Dict[str, Dict[str, Any]]:
+    return manifest.load_or_build(
+        "technicals", list(_PACKAGES.values()), _build_manifest, sources=[__file__]
+    ).get(group, {})
+
+
+def _lookup(group: str, reg: Dict[str, Entry], name: str, label: str) -> Callable:
+    key = _norm(name)
+    if key in reg:
+        return reg[key].fn
+    cache = _RESOLVED[group]
+    if key in cache:
+        return cache[key]
+    entry = _manifest(group).get(key)
+    if entry is None:
+        raise KeyError(f"{label} not found: {name}")
+    fn = manifest.resolve(entry)
+    cache[key] = fn
+    return fn
+
+
 def list_indicators() -> list[str]:
-    if not _REG_INDICATORS:
-        build_registry()
-    return sorted(_REG_INDICATORS.keys())
+    return sorted(set(_manifest("indicators")) | set(_REG_INDICATORS))
 
 
 def list_signals() -> list[str]:
-    if not _REG_SIGNALS:
-        build_registry()
-    return sorted(_REG_SIGNALS.keys())
+    return sorted(set(_manifest("signals")) | set(_REG_SIGNALS))
 
 
 def get_indicator(name: str) -> Callable[..., pl.DataFrame | pl.Series | dict | None]:
-    if not _REG_INDICATORS:
-        build_registry()
-    key = _norm(name)
-    if key not in _REG_INDICATORS:
-        raise KeyError(f"Indicator not found: {name}")
-    return _REG_INDICATORS[key].fn
+    return _lookup("indicators", _REG_INDICATORS, name, "Indicator")
 
 
 def get_signal(name: str) -> Callable[..., pl.DataFrame | pl.Series | dict | None]:
-    if not _REG_SIGNALS:
-        build_registry()
+    return _lookup("signals", _REG_SIGNALS, name, "Signal")
+
+
+def module_of(kind: str, name: str) -> Optional[str]:
+    """Defining module for an indicator/signal without importing it."""
+    group = "indicators" if kind == "indicator" else "signals"
+    reg = _REG_INDICATORS if group == "indicators" else _REG_SIGNALS
     key = _norm(name)
-    if key not in _REG_SIGNALS:
-        raise KeyError(f"Signal not found: {name}")
-    return _REG_SIGNALS[key].fn
+    if key in reg:
+        return reg[key].fn.__module__
+    entry = _manifest(group).get(key)
+    return entry["module"] if entry else None
+
+
+def requirements(name: str, kind: str = "indicator") -> Dict[str, Any]:
+    """Declared {'required_columns', 'lookback'} from the manifest (no import)."""
+    group = "indicators" if kind == "indicator" else "signals"
+    entry = _manifest(group).get(_norm(name)) or {}
+    return {"required_columns": entry.get("required_columns"), "lookback": entry.get("lookback")}
 
 
 def register_indicator(name: str, fn: Callable) -> None:
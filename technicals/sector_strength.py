@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # ============================================================
-# queen/technicals/sector_strength.py — v1.1
+# queen/technicals/sector_strength.py — v1.2
 # ------------------------------------------------------------
 # Sector-level Trend Strength (Daily by compression)
 # ============================================================
@@ -11,7 +11,7 @@ from typing import Optional, Dict, Any
 
 import polars as pl
 
-from queen.helpers.market import MARKET_TZ_KEY
+from queen.helpers.candles import resample_session
 from queen.technicals.indicators import core as ind
 
 
@@ -20,22 +20,8 @@ def _compress_to_daily(df: pl.DataFrame) -> pl.DataFrame:
     if df.is_empty() or "timestamp" not in df.columns:
         return pl.DataFrame()
 
-    return (
-        df.with_columns(
-            pl.col("timestamp")
-            .dt.convert_time_zone(MARKET_TZ_KEY)
-            .dt.date()
-            .alias("d")
-        )
-        .sort("timestamp")
-        .group_by("d")
-        .agg(
-            pl.col("open").first().alias("open"),
-            pl.col("high").max().alias("high"),
-            pl.col("low").min().alias("low"),
-            pl.col("close").last().alias("close"),
-        )
-        .sort("d")
+    return resample_session(df, "1d").select(
+        pl.col("timestamp").dt.date().alias("d"), "open", "high", "low", "close"
     )
 
 
@@ -9,6 +9,10 @@
 #   3) Functions named compute_*/evaluate/compute with df as first param
 # Env:
 #   QUEEN_REGISTRY_PACKAGES="pkgA,pkgB,..." to override/extend search roots
+#   QUEEN_REGISTRY_MANIFEST=0 to always discover live (no cached manifest)
+#
+# Lookups (get/names/names_with_modules) go through a cached manifest
+# (technicals/manifest.py): get(name) imports only the owning module.
 # ============================================================
 from __future__ import annotations
 
@@ -19,6 +23,7 @@ import pkgutil
 from typing import Any, Callable, Dict, List, Tuple
 
 from queen.helpers.logger import log  # <- use shared logger instance
+from queen.technicals import manifest
 
 # Default packages to search (can be extended via env)
 _DEFAULT_PACKAGES = [
@@ -30,6 +35,10 @@ _DEFAULT_PACKAGES = [
 
 # Key -> (callable, module_name)
 _REGISTRY: Dict[str, Tuple[Callable[..., Any], str]] = {}
+# Key -> registered (un-canonical) name, for EXPORTS fallbacks in the manifest
+_NAMES: Dict[str, str] = {}
+# Key -> callable resolved through the manifest (single-module imports)
+_RESOLVED: Dict[str, Callable[..., Any]] = {}
 
 
 def _search_packages() -> List[str]:
@@ -54,6 +63,7 @@ def _register(name: str, obj: Any, module_name: str):
         log.debug(f"[Registry] Duplicate '{name}' ignored (already registered).")
         return
     _REGISTRY[key] = (obj, module_name)
+    _NAMES[key] = name
 
 
 def _scan_module(mod):
@@ -119,20 +129,61 @@ def build_registry() -> Dict[str, Callable[..., Any]]:
     return {k: v[0] for k, v in _REGISTRY.items()}
 
 
+def _build_manifest() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    build_registry()
+    entries: Dict[str, Dict[str, Any]] = {}
+    for key, (obj, mod_name) in _REGISTRY.items():
+        entry = manifest.entry_for(obj, mod_name, export_key=_NAMES.get(key))
+        if entry is not None:
+            entries[key] = entry
+    return {"signals": entries}
+
+
+def _manifest() -> Dict[str, Dict[str, Any]]:
+    return manifest.load_or_build(
+        "signals", _search_packages(), _build_manifest, sources=[__file__]
+    ).get("signals", {})
+
+
 def get(name: str) -> Callable[..., Any] | None:
-    return build_registry().get(_canonical(name))
+    key = _canonical(name)
+    if key in _REGISTRY:
+        return _REGISTRY[key][0]
+    if key in _RESOLVED:
+        return _RESOLVED[key]
+    entry = _manifest().get(key)
+    if entry is None:
+        return None
+    try:
+        obj = manifest.resolve(entry)
+    except Exception as e:
+        log.debug(f"[Registry] Resolve failed {key} → {entry.get('module')}: {e}")
+        return None
+    _RESOLVED[key] = obj
+    return obj
+
+
+def requirements(name: str) -> Dict[str, Any]:
+    """Declared {'required_columns', 'lookback'} for a signal (no import)."""
+    entry = _manifest().get(_canonical(name)) or {}
+    return {"required_columns": entry.get("required_columns"), "lookback": entry.get("lookback")}
 
 
 def names() -> list[str]:
-    return sorted(build_registry().keys())
+    return sorted(_manifest().keys())
 
 
 def names_with_modules() -> List[Tuple[str, str]]:
     """Return [(canonical_name, module_name)] for CLI/debug."""
-    build_registry()  # ensure populated
-    return sorted(((k, v[1]) for k, v in _REGISTRY.items()), key=lambda x: x[0])
+    return sorted(
+        ((k, e.get("source") or e["module"]) for k, e in _manifest().items()),
+        key=lambda x: x[0],
+    )
 
 
 def reset_registry() -> None:
     """Testing helper: clear cache so discovery runs fresh."""
     _REGISTRY.clear()
+    _NAMES.clear()
+    _RESOLVED.clear()
+    manifest.forget("signals")
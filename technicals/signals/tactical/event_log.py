@@ -3,7 +3,7 @@
 # ------------------------------------------------------------
 # 🧭 Unified Tactical Event Logger (Phase 4.9 • settings-driven)
 # Collects tactical outputs and appends structured analytics
-# records into SETTINGS.PATHS["LOGS"]/tactical_event_log.csv
+# records (buffered append, no rewrite) into SETTINGS.PATHS["LOGS"]/tactical_event_log.csv
 # ============================================================
 from __future__ import annotations
 
@@ -13,6 +13,8 @@ from typing import Dict
 
 import polars as pl
 
+from queen.helpers.log_writer import get_writer
+
 try:
     from queen.settings import settings as SETTINGS  # canonical paths
 except Exception:
@@ -32,7 +34,7 @@ def _last(df: pl.DataFrame, col: str):
 
 
 # ------------------------------------------------------------
-# ⚙️ Main function — Event Log Writer (Polars I/O, de-duped)
+# ⚙️ Main function — Event Log Writer (buffered append-only CSV)
 # ------------------------------------------------------------
 def log_tactical_events(global_health_dfs: Dict[str, pl.DataFrame]) -> pl.DataFrame:
     """
@@ -85,15 +87,12 @@ def log_tactical_events(global_health_dfs: Dict[str, pl.DataFrame]) -> pl.DataFr
 
     df_new = pl.DataFrame(records)
 
-    # Append safely with de-dup by (timestamp, timeframe)
-    if log_file.exists():
-        df_existing = pl.read_csv(log_file)
-        df_all = pl.concat([df_existing, df_new], how="vertical_relaxed")
-        df_all = df_all.unique(subset=["timestamp", "timeframe"], keep="last")
-    else:
-        df_all = df_new
-
-    df_all.write_csv(log_file)
+    # Append-only: one (timestamp, timeframe) row per TF per call, so no
+    # read-dedup-rewrite of the whole history; the shared writer keeps the
+    # file open and commits the batch in one write.
+    writer = get_writer(log_file, fmt="csv")
+    writer.write_many(records)
+    writer.flush()
     return df_new
 
 
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_alert_compiler.py — v1.2
+# Compiled rule engine: parity with eval_rule + universe latency
+# ============================================================
+from __future__ import annotations
+
+import math
+import os
+import time
+
+import numpy as np
+import polars as pl
+import pytest
+
+from queen.alerts import compiler
+from queen.alerts.compiler import compile_rules
+from queen.alerts.evaluator import eval_rule
+from queen.alerts.rules import Rule
+from queen.technicals import registry
+from queen.technicals.indicators import core
+
+
+def _frame(n: int = 200, seed: int = 0) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.8, n))
+    volume = rng.integers(100, 1000, n).astype(float)
+    return pl.DataFrame(
+        {"open": close, "high": close + 0.6, "low": close - 0.6, "close": close, "volume": volume}
+    )
+
+
+def _interpreted(rule: Rule, df: pl.DataFrame):
+    try:
+        return eval_rule(rule, df)
+    except Exception as e:
+        return False, {"reason": "eval_error", "error": str(e)}
+
+
+def _same(a, b) -> bool:
+    if isinstance(a, float) or isinstance(b, float):
+        return a is not None and b is not None and math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_same(a[k], b[k]) for k in a)
+    return a == b
+
+
+def _rule(name: str, op: str, value: float, **kw) -> Rule:
+    kind = "indicator" if "indicator" in kw else "price"
+    return Rule(name=name, symbol="X", kind=kind, timeframe="5m", op=op, value=value, **kw)
+
+
+def _rules_for(df: pl.DataFrame) -> list[Rule]:
+    last, prev = float(df["close"][-1]), float(df["close"][-2])
+    mid = (last + prev) / 2
+    rules = [
+        _rule(f"price_{op}_{v}", op, v)
+        for op in ("gt", "lt", "eq", "crosses_above", "crosses_below")
+        for v in (last - 1, mid, last)
+    ]
+    cases = [
+        ("rsi", {}), ("rsi", {"period": 5}), ("rsi", {"period": 14, "need": 60}),
+        ("ema", {"period": 20}), ("sma", {"period": 10}), ("atr", {"period": 14}),
+        ("ema_slope", {"length": 21, "periods": 3}),
+        ("rsi", {"length": 14}), ("ema", {"length": 21}),  # config spelling
+        ("ema_cross", {"fast": 20, "slow": 50}), ("price_minus_vwap", {}),
+        ("rsi", {"window": 14}),       # not a core.rsi kwarg
+        ("macd", {}),                   # not compiled at all
+    ]
+    for ind, params in cases:
+        ref = _interpreted(_rule("ref", "gt", 0.0, indicator=ind, params=params), df)[1]
+        lvl = ref.get("last", 0.0)
+        for op in ("gt", "lt", "crosses_above", "crosses_below"):
+            rules.append(_rule(f"{ind}_{op}", op, lvl, indicator=ind, params=params))
+    return rules
+
+
+def test_registry_resolves_compiled_indicators():
+    # No patching: eval_rule dispatches these names to the functions we mirror
+    for name, (fn, _) in compiler.INDICATOR_EXPRS.items():
+        assert registry.get_indicator(name) is fn, name
+
+
+def test_parity_with_interpreter():
+    for seed in range(4):
+        df = _frame(seed=seed)
+        rules = _rules_for(df)
+        cs = compile_rules(rules)
+        out = cs.evaluate(df)
+        for i, r in enumerate(rules):
+            assert _same(out[i], _interpreted(r, df)), (r.name, r.params, out[i])
+
+    # bad params stay on the interpreter and fail exactly like it does
+    by_name = {(r.indicator, tuple(r.params or {})): cr for r, cr in zip(rules, cs.compiled)}
+    assert by_name[("rsi", ("window",))].column is None
+    assert by_name[("rsi", ("period", "need"))].column == "__v_rsi_14"
+    assert by_name[("rsi", ("length",))].column == "__v_rsi_14"
+    assert by_name[("ema_cross", ("fast", "slow"))].column == "__v_ema_cross_20_50"
+    assert by_name[("price_minus_vwap", ())].column == "__v_price_minus_vwap"
+
+
+def test_missing_input_column_falls_back():
+    df = _frame().drop("volume")
+    rules = [_rule("v", "gt", 0.0, indicator="price_minus_vwap", params={}), _rule("p", "gt", 0.0)]
+    out = compile_rules(rules).evaluate(df)
+    for i, r in enumerate(rules):
+        assert _same(out[i], _interpreted(r, df))
+
+
+def test_unregistered_indicator_keeps_interpreter_error():
+    df = _frame()
+    rule = _rule("r", "gt", 50.0, indicator="no_such_indicator", params={"period": 14})
+    cs = compile_rules([rule])
+    assert cs.compiled[0].column is None
+    ok, meta = cs.evaluate(df)[0]
+    assert not ok and meta["reason"] == "eval_error" and "Unknown indicator" in meta["error"]
+
+
+def test_indicator_columns_shared():
+    df = _frame()
+    rules = [
+        _rule(f"rsi{i}", "gt", float(i * 10), indicator="rsi", params={"period": 14})
+        for i in range(10)
+    ]
+    cs = compile_rules(rules)
+    assert len(cs.columns) == 1
+    out = cs.evaluate(df)
+    ref = float(core.rsi(df, 14)[-1])
+    assert math.isclose(out[0][1]["last"], ref, rel_tol=1e-9)
+    assert [out[i][0] for i in range(10)] == [ref > i * 10 for i in range(10)]
+
+
+def test_long_frame_latency():
+    n_sym, n_bars = 500, 120
+    frames = [_frame(n_bars, s).with_columns(pl.lit(f"S{s}").alias("symbol")) for s in range(n_sym)]
+    long = pl.concat(frames)
+    rules = []
+    for s in range(n_sym):
+        rules += [
+            Rule(name="p", symbol=f"S{s}", kind="price", timeframe="5m", op="gt", value=100),
+            Rule(name="r", symbol=f"S{s}", kind="indicator", timeframe="5m",
+                 indicator="rsi", op="crosses_above", value=50, params={"period": 14}),
+            Rule(name="e", symbol=f"S{s}", kind="indicator", timeframe="5m",
+                 indicator="ema_slope", op="gt", value=0, params={"length": 21}),
+        ]
+    cs = compile_rules(rules)
+    assert all(cr.column for cr in cs.compiled)
+    cs.evaluate_long(long)
+
+    t0 = time.perf_counter()
+    out = cs.evaluate_long(long)
+    dt_ms = (time.perf_counter() - t0) * 1000.0
+    assert len(out) == len(rules)
+
+    # spot-check against the interpreter on the per-symbol frame
+    for k in (3 * 7, 3 * 7 + 1, 3 * 7 + 2):
+        assert _same(out[k], _interpreted(rules[k], frames[7].drop("symbol")))
+
+    cap_ms = float(os.getenv("ALERT_COMPILER_CAP_MS", "2000.0"))
+    print(f"⏱️ {len(rules)} compiled rules over {n_sym} symbols: {dt_ms:.1f} ms")
+    assert dt_ms < cap_ms
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
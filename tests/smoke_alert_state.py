@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_alert_state.py — v1.0
+# Indexed cooldown store: migration, upsert, cross-handle reads
+# ============================================================
+from __future__ import annotations
+
+import json
+
+from queen.alerts.state import CooldownStore
+from queen.settings.settings import PATHS
+
+
+def test_cooldown_store():
+    base = PATHS["TEST_HELPERS"] / "alert_state_smoke"
+    base.mkdir(parents=True, exist_ok=True)
+    db = base / "cooldowns.sqlite"
+    legacy = base / "state.json"
+    for p in base.glob("cooldowns.sqlite*"):
+        p.unlink()
+
+    # legacy append-only log: latest wins, bad lines ignored
+    with legacy.open("w", encoding="utf-8") as fh:
+        fh.write(json.dumps({"symbol": "TCS", "rule": "r1", "last_fire_ts": 10}) + "\n")
+        fh.write("not json\n")
+        fh.write(json.dumps({"symbol": "TCS", "rule": "r1", "last_fire_ts": 20}) + "\n")
+
+    a = CooldownStore(db, legacy_path=legacy)
+    assert a.get("TCS", "r1") == 20.0
+    assert legacy.stat().st_size == 0  # snapshot + truncate
+
+    # second handle (≈ another process) sees writes after refresh
+    b = CooldownStore(db, legacy_path=legacy)
+    a.put("INFY", "r2", 100.0)
+    assert b.get("INFY", "r2") == 0.0
+    b.refresh()
+    assert b.get("INFY", "r2") == 100.0
+
+    # stale writer cannot move a cooldown backwards
+    b.put("INFY", "r2", 50.0)
+    assert a.refresh()[("INFY", "r2")] == 100.0
+
+    assert a.prune(older_than_ts=30.0) == 1
+    assert len(a) == 1
+    a.close()
+    b.close()
+
+
+if __name__ == "__main__":
+    test_cooldown_store()
+    print("✅ smoke_alert_state: passed")
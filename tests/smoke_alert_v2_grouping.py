@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_alert_v2_grouping.py — v1.0
+# evaluate_once: one fetch per (symbol, timeframe) group
+# ============================================================
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import polars as pl
+
+from queen.daemons import alert_v2
+from queen.settings.settings import PATHS
+
+
+def _frame(n: int = 300) -> pl.DataFrame:
+    ts0 = datetime(2025, 1, 6, 9, 15)
+    close = 100 + np.cumsum(np.random.default_rng(3).normal(0, 0.5, n))
+    return pl.DataFrame(
+        {
+            "timestamp": [ts0 + timedelta(minutes=5 * i) for i in range(n)],
+            "open": close,
+            "high": close + 0.5,
+            "low": close - 0.5,
+            "close": close,
+            "volume": np.full(n, 1000.0),
+        }
+    )
+
+
+def test_grouped_fetch(monkeypatch):
+    base = PATHS["TEST_HELPERS"] / "alert_v2_grouping"
+    base.mkdir(parents=True, exist_ok=True)
+    rules_yml = base / "rules.yml"
+    rules_yml.write_text(
+        "rules:\n"
+        + "".join(
+            f"  - {{name: 'p{i}', symbol: 'AAA', kind: price, timeframe: 5m, op: gt, value: {-i}}}\n"
+            for i in range(10)
+        )
+        + "  - {name: 'q', symbol: 'BBB', kind: price, timeframe: 5m, op: gt, value: 0}\n"
+    )
+
+    calls: list[str] = []
+
+    async def fake_intraday(symbol, interval, from_date=None, to_date=None):
+        calls.append(symbol)
+        return _frame()
+
+    class _Store:
+        def __init__(self):
+            self.d = {}
+
+        def refresh(self):
+            return dict(self.d)
+
+        def get(self, s, r, default=0.0):
+            return self.d.get((s, r), default)
+
+        def put(self, s, r, ts):
+            self.d[(s, r)] = ts
+
+    monkeypatch.setattr(alert_v2, "_fetch_intraday", fake_intraday)
+    monkeypatch.setattr(alert_v2, "get_store", _Store)
+    monkeypatch.setattr(alert_v2, "get_market_state", lambda: {"is_open": True})
+    monkeypatch.setattr(alert_v2, "validate_historical_range", lambda *a, **k: True)
+
+    asyncio.run(
+        alert_v2.run_daemon(
+            rules_path=str(rules_yml),
+            out_path=str(base / "alerts.jsonl"),
+            once=True,
+            post_only=True,
+        )
+    )
+    # 11 rules, 2 (symbol, timeframe) groups → 2 fetches
+    assert sorted(calls) == ["AAA", "BBB"]
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_bse_pool.py — v1.1
+# BSE browser-context pool: work stealing, recycling, blocking,
+# and a real headless pass over locally served HTML (if playwright)
+# ============================================================
+from __future__ import annotations
+
+import asyncio
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+SCRAPERS = Path(__file__).resolve().parents[1] / "scrapers"
+if str(SCRAPERS) not in sys.path:
+    sys.path.insert(0, str(SCRAPERS))
+
+import bse_scraper as bse  # noqa: E402
+
+
+def _quote_html(code: str) -> str:
+    p = 100 + int(code) % 50
+    return f"""<html><head>
+<link rel="stylesheet" href="/site.css">
+<script src="https://www.googletagmanager.com/gtag/js"></script>
+</head><body>
+<img src="/logo.png">
+<span id="ctl00_ContentPlaceHolder1_CompanyName">CO {code}</span>
+<span id="ctl00_ContentPlaceHolder1_lblCurr">{p:,.2f}</span>
+<span id="ctl00_ContentPlaceHolder1_lblPrev">{p - 1:,.2f}</span>
+<span id="ctl00_ContentPlaceHolder1_lblChange">1.00 (0.99%)</span>
+<span id="ctl00_ContentPlaceHolder1_lblVol">1,234</span>
+<table><tr><td>Market Cap</td><td>12,345 Cr</td></tr></table>
+</body></html>"""
+
+
+# ---------------- fake browser (no playwright needed) ----------------
+class _El:
+    def __init__(self, text):
+        self._t = text
+
+    async def text_content(self):
+        return self._t
+
+
+class _Resp:
+    status = 200
+    headers: dict = {}
+
+    async def body(self):
+        return b"x" * 1000
+
+
+class _Page:
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self.code = None
+        self.closed = False
+        self.navs = 0
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        self.code = url.rsplit("=", 1)[1]
+        self.navs += 1
+        self.ctx.navigations += 1
+        await asyncio.sleep(0.002 * self.ctx.slowness)
+        if self.code == "999":
+            raise RuntimeError("boom")
+        return _Resp()
+
+    async def wait_for_selector(self, sel, timeout=None):
+        return None
+
+    async def query_selector(self, sel):
+        m = re.search(r"id=\"%s\">([^<]*)<" % sel.split("#")[-1], _quote_html(self.code)) if "#" in sel else None
+        return _El(m.group(1)) if m else None
+
+    async def close(self):
+        self.closed = True
+
+
+class _Ctx:
+    def __init__(self, slowness):
+        self.slowness = slowness
+        self.navigations = 0
+        self.pages = []
+        self.routed = False
+        self.broken = False
+
+    async def route(self, pattern, handler):
+        self.routed = True
+
+    async def new_page(self):
+        if self.broken:
+            raise RuntimeError("context crashed")
+        p = _Page(self)
+        self.pages.append(p)
+        return p
+
+    async def close(self):
+        pass
+
+
+class _Browser:
+    def __init__(self):
+        self.contexts = []
+
+    async def new_context(self, **kw):
+        # First context is 10x slower: the others must steal its work
+        c = _Ctx(slowness=10 if not self.contexts else 1)
+        self.contexts.append(c)
+        return c
+
+
+def test_pool_work_stealing_and_recycling():
+    async def go():
+        scraper = bse.BSEHeadlessScraper(max_workers=4, pages_per_context=2)
+        browser = _Browser()
+        pool = bse.BrowserContextPool(
+            browser, contexts=2, pages_per_context=2, recycle_after=5, page_delay=0.0
+        )
+        codes = [str(500000 + i) for i in range(40)] + ["999"]
+        out = await pool.run(scraper, codes)
+        await pool.close()
+        return browser, pool, codes, out
+
+    browser, pool, codes, out = asyncio.run(go())
+    assert [d.scripcd for d in out] == codes
+    ok = [d for d in out if d.error is None]
+    assert len(ok) == 40
+    assert ok[0].current_price == 100.0 and ok[0].market_cap is None
+    assert out[-1].error and pool.metrics.errors == 1
+    assert pool.metrics.pages == 41
+    assert pool.metrics.steals > 0
+    slow, fast = browser.contexts
+    assert fast.navigations > slow.navigations
+    pages = [p for c in browser.contexts for p in c.pages]
+    assert all(p.navs <= 5 for p in pages)
+    assert pool.metrics.recycled == len(pages) - 4
+    assert sum(p.closed for p in pages) == pool.metrics.recycled
+    assert all(c.routed for c in browser.contexts)
+    assert pool.metrics.pages_per_sec > 0
+
+
+def test_failed_recycle_drops_only_that_slot():
+    async def go():
+        scraper = bse.BSEHeadlessScraper(max_workers=4, pages_per_context=2)
+        browser = _Browser()
+        pool = bse.BrowserContextPool(
+            browser, contexts=2, pages_per_context=2, recycle_after=3, page_delay=0.0
+        )
+        await pool.start()
+        browser.contexts[1].broken = True  # its pages can no longer be replaced
+        codes = [str(500000 + i) for i in range(20)]
+        return codes, await pool.run(scraper, codes)
+
+    codes, out = asyncio.run(go())
+    assert [d.scripcd for d in out] == codes
+    assert all(d.error is None for d in out)
+
+
+def test_page_delay_paces_each_worker():
+    async def go(delay):
+        scraper = bse.BSEHeadlessScraper(max_workers=2, pages_per_context=1)
+        pool = bse.BrowserContextPool(_Browser(), contexts=2, pages_per_context=1, page_delay=delay)
+        await pool.run(scraper, [str(500000 + i) for i in range(6)])
+        return pool.metrics.elapsed
+
+    assert bse.BSEHeadlessScraper().page_delay == bse.PAGE_DELAY > 0
+    assert asyncio.run(go(0.05)) >= 3 * 0.05 > asyncio.run(go(0.0))
+
+
+# ---------------- real headless pass over local fixtures ----------------
+class _Handler(BaseHTTPRequestHandler):
+    hits: dict = {}
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        _Handler.hits[path] = _Handler.hits.get(path, 0) + 1
+        if path == "/StockReach.aspx":
+            body = _quote_html(self.path.rsplit("=", 1)[1]).encode()
+            ctype = "text/html"
+        elif path == "/site.css":
+            body, ctype = b"body{}", "text/css"
+        else:
+            body, ctype = b"\x89PNG", "image/png"
+        self.send_response(200)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *a):
+        pass
+
+
+def test_pool_against_local_server():
+    pytest.importorskip("playwright")
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{srv.server_address[1]}/StockReach.aspx?scripcd={{scripcd}}"
+
+    async def go():
+        scraper = bse.BSEHeadlessScraper(max_workers=4, pages_per_context=2, url_template=url)
+        await scraper.setup_browser()
+        try:
+            out = await scraper.scrape_stocks_async([str(500000 + i) for i in range(12)])
+            return out, scraper.metrics
+        finally:
+            await scraper.close_browser()
+
+    try:
+        out, metrics = asyncio.run(go())
+    finally:
+        srv.shutdown()
+    assert all(d.error is None for d in out), [d.error for d in out]
+    assert out[0].company_name == "CO 500000" and out[0].volume == 1234
+    assert "/logo.png" not in _Handler.hits
+    assert metrics.blocked_requests >= 12
+    print(f"⏱️ {metrics.summary()}")
+
+
+if __name__ == "__main__":
+    test_pool_work_stealing_and_recycling()
+    test_failed_recycle_drops_only_that_slot()
+    test_page_delay_paces_each_worker()
+    test_pool_against_local_server()
+    print("✅ smoke_bse_pool: passed")
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_eod_features.py — v1.1
+# EOD feature store → read-only morning forecast with vectorized scoring
+# ============================================================
+from __future__ import annotations
+
+import asyncio
+import random
+from datetime import date, datetime, timedelta
+
+import polars as pl
+
+from queen.daemons import morning_intel as mi
+from queen.services import eod_features as ef
+from queen.services import forecast as fc
+
+SESSION = date(2025, 6, 3)
+
+
+def _bars(rng: random.Random, n: int, step: timedelta, start: datetime) -> pl.DataFrame:
+    close, rows = 100.0, []
+    for i in range(n):
+        close *= 1 + rng.gauss(0.001, 0.01)
+        rows.append({
+            "timestamp": start + i * step, "open": close, "high": close * 1.01,
+            "low": close * 0.99, "close": close, "volume": float(rng.randint(100, 1000)),
+        })
+    return pl.DataFrame(rows)
+
+
+def _ref_score(r: dict) -> tuple[int, list[str]]:
+    """The pre-store per-symbol rules (morning_intel v1.0 _score_and_reasons)."""
+    e20, e50, e200, cmp_, vwap, rsi = r["ema20"], r["ema50"], r["ema200"], r["cmp"], r["vwap"], r["rsi"]
+    ema_bias = "Neutral"
+    if r["daily_bars"] >= 200 and None not in (e20, e50, e200):
+        ema_bias = "Bullish" if e20 > e50 > e200 else "Bearish" if e20 < e50 < e200 else "Neutral"
+    st = r["supertrend"]
+    st_bias = "Neutral" if st is None or cmp_ == st else ("Bullish" if cmp_ > st else "Bearish")
+    score, reasons = 0, []
+    if ema_bias == "Bullish":
+        score, reasons = score + 3, reasons + ["EMA stack ↑"]
+    elif ema_bias == "Bearish":
+        score, reasons = score - 2, reasons + ["EMA stack ↓"]
+    if st_bias == "Bullish":
+        score, reasons = score + 2, reasons + ["Supertrend ↑"]
+    elif st_bias == "Bearish":
+        score, reasons = score - 2, reasons + ["Supertrend ↓"]
+    if rsi is not None:
+        if rsi >= 60:
+            score, reasons = score + 2, reasons + ["RSI strong"]
+        elif rsi <= 45:
+            score, reasons = score - 2, reasons + ["RSI weak"]
+    if vwap is not None:
+        score += 1 if cmp_ > vwap else 0
+        reasons.append("Price > VWAP" if cmp_ > vwap else "Price ≤ VWAP")
+    if e50 is not None:
+        score += 2 if cmp_ > e50 else 0
+        reasons.append("Price > EMA50" if cmp_ > e50 else "Price ≤ EMA50")
+    return max(0, min(10, score)), reasons
+
+
+def test_vectorized_score_matches_rules():
+    rng = random.Random(11)
+    rows = []
+    for i in range(300):
+        pick = lambda lo, hi: None if rng.random() < 0.15 else rng.uniform(lo, hi)  # noqa: E731
+        rows.append({
+            "symbol": f"S{i}", "cmp": 100.0, "ema20": pick(90, 110), "ema50": pick(90, 110),
+            "ema200": pick(90, 110), "daily_bars": rng.choice([50, 250]), "rsi": pick(30, 75),
+            "vwap": pick(95, 105), "supertrend": pick(95, 105),
+        })
+    scored = mi.score_forecast(pl.DataFrame(rows))
+    for r in scored.iter_rows(named=True):
+        score, reasons = _ref_score(r)
+        assert r["score"] == score and r["reasons"] == reasons
+        assert r["decision"] == ("BUY" if score >= 8 else "SELL" if score <= 3 else "HOLD")
+
+
+def test_eod_store_then_pure_read(monkeypatch, tmp_path):
+    rng = random.Random(2)
+    calls: list[str] = []
+
+    async def fake_daily(symbol, from_d, to_d, interval):
+        calls.append(f"{symbol}:daily")
+        return _bars(rng, 260, timedelta(days=1), datetime(2024, 5, 1))
+
+    async def fake_unified(symbol, mode, from_date, to_date, interval):
+        calls.append(f"{symbol}:intra")
+        return _bars(rng, 25, timedelta(minutes=15), datetime(2025, 6, 3, 9, 15))
+
+    monkeypatch.setattr(ef, "fetch_daily_range", fake_daily)
+    monkeypatch.setattr(ef, "fetch_unified", fake_unified)
+    monkeypatch.setattr(ef, "store_dir", lambda: tmp_path)
+
+    feats = asyncio.run(ef.build_eod_features(["AAA", "BBB"], session=SESSION))
+    assert sorted(feats["symbol"].to_list()) == ["AAA", "BBB"]
+    assert feats["ema200"].null_count() == 0 and feats["supertrend"].null_count() == 0
+    assert (tmp_path / "features_20250603.parquet").exists()
+
+    # Incremental: only the new symbol is fetched
+    calls.clear()
+    asyncio.run(ef.build_eod_features(["AAA", "CCC"], session=SESSION))
+    assert sorted(calls) == ["CCC:daily", "CCC:intra"]
+
+    # Morning: pure read + scoring, no broker calls
+    calls.clear()
+    monkeypatch.setitem(mi.SETTINGS.DEFAULTS, "INTRADAY_SYMBOLS", ["AAA", "BBB", "CCC"])
+    monkeypatch.setitem(mi.PATHS, "RUNTIME", tmp_path / "rt")
+    monkeypatch.setitem(mi.PATHS, "SNAPSHOTS", tmp_path / "snap")
+    monkeypatch.setattr(mi, "_prev_session", lambda d: SESSION)
+    rows = asyncio.run(mi.forecast_next_session(date(2025, 6, 4)))
+    assert calls == []
+    assert sorted(r.symbol for r in rows) == ["AAA", "BBB", "CCC"]
+    assert all(r.decision in {"BUY", "SELL", "HOLD"} for r in rows)
+
+
+def test_no_data_symbols_are_not_refetched(monkeypatch, tmp_path):
+    rng = random.Random(5)
+    calls: list[str] = []
+
+    async def fake_daily(symbol, from_d, to_d, interval):
+        calls.append(symbol)
+        if symbol == "DEAD":
+            return pl.DataFrame()
+        return _bars(rng, 260, timedelta(days=1), datetime(2024, 5, 1))
+
+    async def fake_unified(symbol, mode, from_date, to_date, interval):
+        if symbol == "DEAD":
+            return pl.DataFrame()
+        return _bars(rng, 25, timedelta(minutes=15), datetime(2025, 6, 3, 9, 15))
+
+    monkeypatch.setattr(ef, "fetch_daily_range", fake_daily)
+    monkeypatch.setattr(ef, "fetch_unified", fake_unified)
+    monkeypatch.setattr(ef, "store_dir", lambda: tmp_path)
+    monkeypatch.setitem(mi.SETTINGS.DEFAULTS, "INTRADAY_SYMBOLS", ["AAA", "DEAD"])
+    monkeypatch.setitem(mi.PATHS, "RUNTIME", tmp_path / "rt")
+    monkeypatch.setitem(mi.PATHS, "SNAPSHOTS", tmp_path / "snap")
+    monkeypatch.setattr(mi, "_prev_session", lambda d: SESSION)
+
+    rows = asyncio.run(mi.forecast_next_session(date(2025, 6, 4)))
+    assert sorted(calls) == ["AAA", "DEAD"] and [r.symbol for r in rows] == ["AAA"]
+    assert ef.attempted(SESSION) == {"AAA", "DEAD"}
+
+    calls.clear()
+    rows = asyncio.run(mi.forecast_next_session(date(2025, 6, 4)))
+    assert calls == [] and [r.symbol for r in rows] == ["AAA"]
+
+    # refresh retries it
+    asyncio.run(ef.build_eod_features(["DEAD"], session=SESSION, refresh=True))
+    assert calls == ["DEAD"]
+
+
+def test_plan_uses_store_only_for_previous_session(monkeypatch, tmp_path):
+    monkeypatch.setattr(ef, "store_dir", lambda: tmp_path)
+    row = {k: None for k in ef.SCHEMA}
+    row.update(symbol="AAA", session=SESSION, cmp=100.0, daily_bars=250, targets=[], obv="Rising")
+    pl.DataFrame([row], schema=ef.SCHEMA).write_parquet(tmp_path / "features_20250603.parquet")
+
+    live: list[tuple[list[str], int]] = []
+
+    async def fake_pass(cfg):
+        live.append((cfg.symbols, cfg.interval_min))
+        return [{"symbol": s, "cmp": 1.0} for s in cfg.symbols]
+
+    monkeypatch.setattr(fc, "_one_pass", fake_pass)
+    monkeypatch.setattr(fc, "position_for", lambda *a, **k: None)
+    monkeypatch.setattr(fc, "PLAN_FILE", tmp_path / "plan.json")
+    monkeypatch.setattr(fc, "ARCHIVE_DIR", tmp_path)
+
+    def plan(next_sess: date, **opt) -> dict:
+        monkeypatch.setattr(fc, "_infer_next_session_date", lambda now: next_sess)
+        return asyncio.run(fc.build_next_session_plan(["AAA", "BBB"], fc.ForecastOptions(**opt)))
+
+    # 2025-06-03 is the session before 06-04: AAA from the store, BBB live
+    out = plan(date(2025, 6, 4))
+    assert live == [(["BBB"], 15)] and out["rows"][0]["cmp"] == 100.0
+
+    # A store older than the previous session counts as missing
+    live.clear()
+    plan(date(2025, 6, 6))
+    assert live == [(["AAA", "BBB"], 15)]
+
+    # A different bar size never reads the 15m store
+    live.clear()
+    plan(date(2025, 6, 4), interval_min=5)
+    assert live == [(["AAA", "BBB"], 5)]
+
+
+if __name__ == "__main__":
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_fundamentals_snapshot.py — v1.0
+# Parquet snapshot + incremental reparse for the fundamentals loader
+# ============================================================
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import polars as pl
+
+from queen.helpers import fundamentals_polars_engine as fpe
+
+_SAMPLES = Path(__file__).resolve().parents[1] / "data" / "runtime" / "fundamentals" / "processed"
+
+
+def _seed(dst: Path, n: int) -> None:
+    """Write n synthetic symbols cloned from the bundled processed JSONs."""
+    samples = [
+        json.loads(p.read_text(encoding="utf-8"))
+        for p in sorted(_SAMPLES.glob("*.json"))
+        if not p.name.startswith((".", "_"))
+    ]
+    for i in range(n):
+        d = dict(samples[i % len(samples)])
+        d["symbol"] = f"SYM{i:04d}"
+        (dst / f"SYM{i:04d}.json").write_text(json.dumps(d), encoding="utf-8")
+
+
+def _assert_same(a: pl.DataFrame, b: pl.DataFrame) -> None:
+    assert a.columns == b.columns, set(a.columns) ^ set(b.columns)
+    assert a.schema == b.schema
+    for c in a.columns:
+        assert a[c].to_list() == b[c].to_list(), c
+
+
+def _bump(p: Path) -> None:
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _count_parses(counter: dict) -> None:
+    real = fpe._parse_files
+
+    def counting(paths, workers):
+        counter["n"] += len(paths)
+        return real(paths, workers)
+
+    fpe._parse_files = counting
+
+
+def test_snapshot_roundtrip_and_incremental():
+    tmp = Path(tempfile.mkdtemp(prefix="fund_snap_"))
+    real_parse = fpe._parse_files
+    try:
+        _seed(tmp, 40)
+        (tmp / "BROKEN.json").write_text("{not json", encoding="utf-8")
+
+        fresh = fpe.build_df_from_all_processed(tmp, use_cache=False, workers=1)
+        assert fresh.height == 40
+        assert not (tmp / fpe.SNAPSHOT_NAME).exists()
+
+        parsed = {"n": 0}
+        _count_parses(parsed)
+
+        cold = fpe.build_df_from_all_processed(tmp)
+        assert (tmp / fpe.SNAPSHOT_NAME).exists()
+        assert parsed["n"] == 41
+        _assert_same(fresh, cold)
+
+        # Unchanged: served from parquet, nothing reparsed (broken file included)
+        parsed["n"] = 0
+        warm = fpe.build_df_from_all_processed(tmp)
+        assert parsed["n"] == 0
+        _assert_same(fresh, warm)
+
+        # One edit + one new file + one delete: only the touched files reparse
+        p = tmp / "SYM0003.json"
+        d = json.loads(p.read_text(encoding="utf-8"))
+        d["sector"] = "Edited Sector"
+        p.write_text(json.dumps(d), encoding="utf-8")
+        _bump(p)
+        shutil.copy(tmp / "SYM0001.json", tmp / "NEWCO.json")
+        (tmp / "SYM0010.json").unlink()
+
+        parsed["n"] = 0
+        inc = fpe.build_df_from_all_processed(tmp)
+        assert parsed["n"] == 2
+        ref = fpe.build_df_from_all_processed(tmp, use_cache=False, workers=1)
+        _assert_same(ref, inc)
+        assert inc.filter(pl.col("Symbol") == "SYM0003")["Sector"][0] == "Edited Sector"
+        assert "SYM0010" not in inc["Symbol"].to_list()
+    finally:
+        fpe._parse_files = real_parse
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_warm_load_latency():
+    tmp = Path(tempfile.mkdtemp(prefix="fund_snap_"))
+    try:
+        _seed(tmp, 500)
+        t0 = time.perf_counter()
+        fpe.build_df_from_all_processed(tmp, use_cache=False, workers=1)
+        full_ms = (time.perf_counter() - t0) * 1000.0
+
+        fpe.build_df_from_all_processed(tmp)
+        t0 = time.perf_counter()
+        df = fpe.build_df_from_all_processed(tmp)
+        warm_ms = (time.perf_counter() - t0) * 1000.0
+
+        assert df.height == 500
+        print(f"⏱️ 500 symbols: full parse {full_ms:.1f} ms, snapshot {warm_ms:.1f} ms")
+        assert warm_ms < full_ms
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_snapshot_roundtrip_and_incremental()
+    test_warm_load_latency()
+    print("✅ smoke_fundamentals_snapshot: passed")
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_fundamentals_timeseries.py — v1.0
+# Native-expression timeseries engine vs legacy row-wise UDFs
+# ============================================================
+from __future__ import annotations
+
+import math
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+import polars as pl
+
+from queen.helpers import fundamentals_timeseries_engine as ts
+
+# ------------------------------------------------------------
+# Legacy (v2.0) per-row reference implementations
+# ------------------------------------------------------------
+
+
+def _fl_slope(v):
+    return None if len(v) < 2 else (v[-1] - v[0]) / max(1, len(v) - 1)
+
+
+def _reg_slope(v):
+    if len(v) < 3:
+        return _fl_slope(v)
+    n = len(v)
+    xm, ym = (n - 1) / 2.0, sum(v) / n
+    num = sum((i - xm) * (y - ym) for i, y in enumerate(v))
+    den = sum((i - xm) ** 2 for i in range(n))
+    return None if den == 0 else num / den
+
+
+def _accel(v):
+    return None if len(v) < 3 else (v[-1] - v[-2]) - (v[-2] - v[-3])
+
+
+def _cv(v):
+    if len(v) < 2:
+        return None
+    m = sum(v) / len(v)
+    if m == 0:
+        return None
+    return (sum((x - m) ** 2 for x in v) / (len(v) - 1)) ** 0.5 / abs(m)
+
+
+def _growth(v):
+    if len(v) < 2 or v[0] == 0 or v[-1] / v[0] < 0:
+        return None
+    return ((v[-1] / v[0]) ** (1.0 / (len(v) - 1)) - 1) * 100
+
+
+def _label(s, a):
+    if s is None:
+        return None
+    if s > 0.5:
+        return "RISING" if a is None or a >= 0 else "RISING_BUT_SLOWING"
+    if s < -0.5:
+        return "FALLING" if a is None or a <= 0 else "FALLING_BUT_RECOVERING"
+    return "FLAT"
+
+
+def _momentum(s, cv):
+    if s is None:
+        return None
+    sn = max(0, min(1, (s + 10) / 20))
+    st = 1 / (1 + cv) if cv is not None and cv > 0 else 0.5
+    return (sn * 0.7 + st * 0.3) * 100
+
+
+def _composite(r: Dict[str, Any]) -> Optional[float]:
+    parts = []
+    if r.get("Earnings_Momentum_Score") is not None:
+        parts.append((r["Earnings_Momentum_Score"], 0.3))
+    if r.get("Sales_Momentum_Score") is not None:
+        parts.append((r["Sales_Momentum_Score"], 0.2))
+    if r.get("ROCE_Slope") is not None:
+        parts.append((max(0, min(100, 50 + r["ROCE_Slope"] * 5)), 0.25))
+    if r.get("ROE_Slope") is not None:
+        parts.append((max(0, min(100, 50 + r["ROE_Slope"] * 5)), 0.15))
+    if r.get("Profit_Q_CV") is not None:
+        parts.append((max(0, min(100, 100 - r["Profit_Q_CV"] * 100)), 0.1))
+    if not parts:
+        return None
+    return sum(s * w for s, w in parts) / sum(w for _, w in parts)
+
+
+def _avg_scores(r, cols, mult):
+    xs = [max(0, min(100, 50 + r[c] * mult)) for c in cols if r.get(c) is not None]
+    return sum(xs) / len(xs) if xs else None
+
+
+def _reference(df: pl.DataFrame) -> List[Dict[str, Any]]:
+    out = []
+    for row in df.iter_rows(named=True):
+        q = ts._pick_series_from_table(row["_quarters"], ts.Q_PROFIT_CANDIDATES) or []
+        s = ts._pick_series_from_table(row["_quarters"], ts.Q_SALES_CANDIDATES) or []
+        roce = ts._pick_series_from_table(row["_ratios"], ts.ROCE_CANDIDATES) or []
+        roe = ts._pick_series_from_table(row["_ratios"], ts.ROE_CANDIDATES) or []
+        pl_sales = ts._pick_series_from_table(row["_profit_loss"], ts.PL_SALES_CANDIDATES) or []
+        r = {
+            "Profit_Q_Slope": _fl_slope(q),
+            "Profit_Q_Accel": _accel(q),
+            "Profit_Q_CV": _cv(q),
+            "Sales_Q_Slope": _fl_slope(s),
+            "Sales_Q_Accel": _accel(s),
+            "Sales_Q_CV": _cv(s),
+            "Sales_Q_Growth": _growth(s),
+            "ROCE_Slope": _fl_slope(roce),
+            "ROE_Slope": _fl_slope(roe),
+            "Sales_Y_Slope": _reg_slope(pl_sales),
+        }
+        r["Earnings_Momentum"] = _label(r["Profit_Q_Slope"], r["Profit_Q_Accel"])
+        r["Fundamental_Momentum"] = _label(r["ROCE_Slope"], r["Sales_Q_Accel"])
+        r["Earnings_Momentum_Score"] = _momentum(r["Profit_Q_Slope"], r["Profit_Q_CV"])
+        r["Sales_Momentum_Score"] = _momentum(r["Sales_Q_Slope"], r["Sales_Q_CV"])
+        r["Trend_Composite_Score"] = _composite(r)
+        out.append(r)
+    return out
+
+
+# ------------------------------------------------------------
+# Synthetic universe (nested Screener-style tables)
+# ------------------------------------------------------------
+def _table(rng: random.Random, metrics: List[str], n: int) -> Dict[str, Dict[str, Any]]:
+    t = {}
+    for m in metrics:
+        if rng.random() < 0.1:
+            continue  # metric missing
+        vals = {}
+        base = rng.uniform(-50, 500)
+        for i in range(rng.randint(0, n)):
+            v = base + rng.gauss(0, 30) + i * rng.uniform(-5, 10)
+            vals[f"P{i}"] = f"{v:,.2f}" if rng.random() < 0.2 else round(v, 2)
+        t[m] = vals
+    return t
+
+
+def _universe(n: int, seed: int = 11) -> pl.DataFrame:
+    rng = random.Random(seed)
+    rows = {"Symbol": [], "_quarters": [], "_profit_loss": [], "_ratios": [], "_balance_sheet": []}
+    for i in range(n):
+        rows["Symbol"].append(f"S{i}")
+        rows["_quarters"].append(_table(rng, ["Sales", "Net Profit", "EPS in Rs", "OPM %"], 12))
+        rows["_profit_loss"].append(_table(rng, ["Sales", "Net Profit", "EPS in Rs"], 10))
+        rows["_ratios"].append(_table(rng, ["ROCE %", "ROE %", "Debtor Days"], 10))
+        rows["_balance_sheet"].append(_table(rng, ["Borrowings", "Reserves", "Total Assets"], 10))
+    return pl.DataFrame(
+        rows,
+        schema={"Symbol": pl.Utf8, **{k: pl.Object for k in rows if k != "Symbol"}},
+    )
+
+
+def _close(a, b) -> bool:
+    if a is None or b is None:
+        return a is None and b is None
+    if isinstance(a, str) or isinstance(b, str):
+        return a == b
+    return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_equivalence():
+    df = _universe(400)
+    got = ts.add_composite_scores(ts.add_timeseries_features(df))
+    ref = _reference(df)
+    for i, r in enumerate(ref):
+        for k, v in r.items():
+            assert _close(got[k][i], v), (i, k, got[k][i], v)
+
+
+def test_latency_5k():
+    df = _universe(5000)
+    t0 = time.perf_counter()
+    out = ts.add_composite_scores(ts.add_timeseries_features(df))
+    dt_ms = (time.perf_counter() - t0) * 1000.0
+    assert out.height == 5000
+    cap_ms = float(os.getenv("FUND_TS_CAP_MS", "1500.0"))
+    print(f"⏱️ timeseries + composite over 5k symbols: {dt_ms:.1f} ms")
+    assert dt_ms < cap_ms
+
+
+if __name__ == "__main__":
+    test_equivalence()
+    test_latency_5k()
+    print("✅ smoke_fundamentals_timeseries: passed")
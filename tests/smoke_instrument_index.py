@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_instrument_index.py — v1.1
+# Precompiled instrument index: snapshot reuse, hot reload, lookup speed
+# ============================================================
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+
+from queen.helpers import instrument_index as ii
+from queen.helpers import instruments
+
+
+def _write(p: Path, rows: list[dict]) -> None:
+    p.write_text(json.dumps(rows), encoding="utf-8")
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _loader(sources: dict[str, Path], calls: dict):
+    def load(mode: str) -> pl.DataFrame:
+        calls["n"] += 1
+        df = pl.read_json(sources[mode])
+        if "listing_date" in df.columns:
+            df = df.with_columns(pl.col("listing_date").str.strptime(pl.Date, strict=False))
+        return df
+
+    return load
+
+
+def test_index_snapshot_reload_and_speed():
+    tmp = Path(tempfile.mkdtemp(prefix="inst_index_"))
+    monthly, intraday = tmp / "monthly.json", tmp / "intraday.json"
+    _write(monthly, [
+        {"symbol": "TCS", "isin": "NSE_EQ|INE467B01029", "listing_date": "2004-08-25"},
+        {"symbol": "NSDL", "isin": "NSE_EQ|INEA00000101", "listing_date": "2025-08-06"},
+    ])
+    _write(intraday, [
+        {"symbol": "NSDL", "isin": "BSE_EQ|INEA00000101"},
+        {"symbol": "INFY", "isin": "NSE_EQ|INE009A01021"},
+    ])
+    sources = {"INTRADAY": intraday, "MONTHLY": monthly}
+    calls = {"n": 0}
+    real_dir = ii.index_dir
+    try:
+        ii.index_dir = lambda: tmp / "cache"
+        h = ii.IndexHandle(lambda: sources, _loader(sources, calls), check_every=0.0)
+        idx = h.get()
+        assert calls["n"] == 2 and len(list((tmp / "cache").glob("index_*.arrow"))) == 1
+        assert idx.by_mode["MONTHLY"]["TCS"] == "NSE_EQ|INE467B01029"
+        assert idx.rev_by_mode["INTRADAY"]["NSE_EQ|INE009A01021"] == "INFY"
+        assert idx.merged["NSDL"] == "BSE_EQ|INEA00000101"  # first source wins
+        assert idx.listing["TCS"] == date(2004, 8, 25)
+        assert idx.has_listing == {"INTRADAY": False, "MONTHLY": True}
+        assert idx.mode_frame("INTRADAY").columns == ["symbol", "isin"]
+
+        # Fresh handle → memory-maps the snapshot, no JSON parsing
+        h2 = ii.IndexHandle(lambda: sources, _loader(sources, calls))
+        assert h2.get().by_mode == idx.by_mode and calls["n"] == 2
+
+        # Master edited → recompiled on the next check, old snapshot pruned
+        _write(monthly, [{"symbol": "TCS", "isin": "NSE_EQ|NEWKEY", "listing_date": "2004-08-25"}])
+        assert h.get().by_mode["MONTHLY"] == {"TCS": "NSE_EQ|NEWKEY"}
+        assert h.reloads == 2 and calls["n"] == 4
+        assert len(list((tmp / "cache").glob("index_*.arrow"))) == 1
+
+        # Between checks a lookup is a clock compare + dict hit
+        h.check_every = 60.0
+        ns = ii.bench(h, ["TCS", "NSDL", "INFY"], number=50_000)
+        print(f"instrument lookup: {ns:.0f} ns")
+        assert ns < 20_000
+    finally:
+        ii.index_dir = real_dir
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_lookups_normalize_mode(monkeypatch, tmp_path):
+    monthly, intraday = tmp_path / "monthly.json", tmp_path / "intraday.json"
+    _write(monthly, [{"symbol": "NSDL", "isin": "NSE_EQ|INEA00000101", "listing_date": "2025-08-06"}])
+    _write(intraday, [{"symbol": "NSDL", "isin": "BSE_EQ|INEA00000101"}])
+    sources = {"INTRADAY": intraday, "MONTHLY": monthly}
+    monkeypatch.setattr(ii, "index_dir", lambda: tmp_path / "cache")
+    monkeypatch.setattr(
+        instruments, "_INDEX", ii.IndexHandle(lambda: sources, _loader(sources, {"n": 0}))
+    )
+
+    # merged view says BSE (intraday wins); lower-case monthly must stay mode-local
+    assert instruments.resolve_instrument("NSDL", mode="monthly") == "NSE_EQ|INEA00000101"
+    meta = instruments.get_instrument_meta("nsdl", mode=" monthly ")
+    assert meta == {"symbol": "NSDL", "isin": "NSE_EQ|INEA00000101", "listing_date": date(2025, 8, 6)}
+    assert instruments.get_symbol_from_isin("BSE_EQ|INEA00000101", mode="monthly") is None
+
+    m = instruments.get_instrument_map("intraday")
+    m["NSDL"] = "MUTATED"
+    assert instruments.get_instrument_map("INTRADAY")["NSDL"] == "BSE_EQ|INEA00000101"
+
+
+if __name__ == "__main__":
+    test_index_snapshot_reload_and_speed()
+    print("✅ smoke_instrument_index: passed")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_jsonl_log.py — v1.2
+# Reverse-seek tail, rotated segments, sidecar-index range reads
+# ============================================================
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from queen.helpers import io, jsonl_log
+
+_T0 = datetime(2025, 6, 4, 9, 15)
+
+
+def _rec(i: int) -> dict:
+    return {"i": i, "timestamp": (_T0 + timedelta(minutes=i)).isoformat(), "pad": "x" * (i % 37)}
+
+
+def test_tail_matches_full_read():
+    tmp = Path(tempfile.mkdtemp(prefix="jsonl_tail_"))
+    try:
+        p = tmp / "log.jsonl"
+        with open(p, "w", encoding="utf-8") as f:
+            for i in range(1000):
+                f.write(json.dumps(_rec(i)) + "\n")
+                if i == 500:
+                    f.write("{not json\n\n")
+            f.write('{"i": 1000, "timestamp": "partial')  # torn final write
+        full = [r for r in io.read_jsonl(p)]
+        for n in (1, 7, 200, 999, 5000):
+            assert jsonl_log.tail_records(p, n, block_size=97) == full[-n:], n
+        assert io.tail_jsonl(p, 3) == full[-3:]
+        assert jsonl_log.tail_records(tmp / "missing.jsonl", 5) == []
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_segments_and_range_reads():
+    tmp = Path(tempfile.mkdtemp(prefix="jsonl_seg_"))
+    try:
+        p = tmp / "alerts.jsonl"
+        for i in range(3000):
+            io.append_jsonl(p, _rec(i))
+            jsonl_log.rotate(p, max_bytes=40_000)
+        segs = jsonl_log.segments(p)
+        assert len(segs) > 3 and segs[-1] == p
+        allrecs = [r for s in segs for r in io.read_jsonl(s)]
+        assert [r["i"] for r in allrecs] == list(range(3000))
+        assert jsonl_log.tail_segmented(p, 1234) == allrecs[-1234:]
+
+        lo, hi = _T0 + timedelta(minutes=700), _T0 + timedelta(minutes=2100)
+        got = jsonl_log.read_range(p, lo, hi.isoformat())
+        assert [r["i"] for r in got] == list(range(700, 2101))
+        # Closed segments are indexed on rotation; reads write nothing
+        assert all(s.with_name(s.name + ".idx").exists() for s in segs[:-1])
+        assert not p.with_name(p.name + ".idx").exists()
+
+        # Newest-first limit: last N matches of a wide range, oldest first
+        for n in (1, 5, 300, 900):
+            got = jsonl_log.read_range(p, lo, hi, limit=n, newest=True)
+            assert [r["i"] for r in got] == list(range(2101 - n, 2101)), n
+
+        # Appends after indexing are picked up incrementally
+        io.append_jsonl(p, _rec(3000))
+        assert jsonl_log.read_range(p, _T0 + timedelta(minutes=3000))[-1]["i"] == 3000
+        assert jsonl_log.read_range(p, None, _T0 + timedelta(minutes=2), limit=2) == allrecs[:2]
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_naive_times_are_market_local(monkeypatch, tmp_path):
+    ist = timezone(timedelta(hours=5, minutes=30))
+    midnight = datetime(2025, 6, 3, tzinfo=ist).timestamp()
+    assert jsonl_log.ts_value("2025-06-03") == midnight
+    assert jsonl_log.ts_value(date(2025, 6, 3)) == midnight
+    assert jsonl_log.ts_value(datetime(2025, 6, 3)) == midnight
+    assert jsonl_log.ts_value("2025-06-02T18:30:00Z") == midnight
+
+    from queen.services import history
+
+    p = tmp_path / "alerts_log.jsonl"
+    # 23:00 UTC on the 2nd is 04:30 IST on the 3rd
+    for ts in ("2025-06-02T18:00:00Z", "2025-06-02T23:00:00Z", "2025-06-03T10:00:00+05:30"):
+        io.append_jsonl(p, {"timestamp": ts})
+    monkeypatch.setattr(history, "DEFAULT_PATHS", [p])
+    rows = history.load_history(10, since="2025-06-03")
+    assert [r["timestamp"] for r in rows] == ["2025-06-02T23:00:00Z", "2025-06-03T10:00:00+05:30"]
+    assert history.load_history(1, since="2025-06-03")[0]["timestamp"].endswith("+05:30")
+    assert not list(tmp_path.glob("*.idx"))
+
+
+def test_active_segment_index_is_incremental(monkeypatch, tmp_path):
+    # Never rotated (like ARCHIVES/alerts_log.jsonl): no sidecar on disk
+    p = tmp_path / "alerts_log.jsonl"
+    with open(p, "w", encoding="utf-8") as f:
+        for i in range(5000):
+            f.write(json.dumps(_rec(i)) + "\n")
+    since, until = _T0 + timedelta(minutes=4990), _T0 + timedelta(minutes=6000)
+    first = jsonl_log.read_range(p, since, until, limit=5, newest=True)
+    assert [r["i"] for r in first] == [4995, 4996, 4997, 4998, 4999]
+
+    with open(p, "a", encoding="utf-8") as f:
+        for i in range(5000, 5010):
+            f.write(json.dumps(_rec(i)) + "\n")
+    parsed = []
+    real = jsonl_log._loads
+    monkeypatch.setattr(jsonl_log, "_loads", lambda line: parsed.append(1) or real(line))
+    again = jsonl_log.read_range(p, since, until, limit=5, newest=True)
+    assert [r["i"] for r in again] == [5005, 5006, 5007, 5008, 5009]
+    assert len(parsed) < 2 * jsonl_log.INDEX_EVERY  # new lines + one seek window, not 5000
+    assert not list(tmp_path.glob("*.idx"))
+
+    # Replaced file (new inode) → index rebuilt, not reused
+    p.unlink()
+    p.write_text(json.dumps(_rec(1)) + "\n", encoding="utf-8")
+    assert [r["i"] for r in jsonl_log.read_range(p, _T0, until)] == [1]
+
+
+if __name__ == "__main__":
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
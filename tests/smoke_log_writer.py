@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_log_writer.py — v1.0
+# Buffered group-commit writer, segment rotation, parquet roll-ups
+# ============================================================
+from __future__ import annotations
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import polars as pl
+
+from queen.helpers import io, jsonl_log
+from queen.helpers.log_writer import BufferedLogWriter, scan_rollups
+
+
+def test_group_commit_and_rotation():
+    tmp = Path(tempfile.mkdtemp(prefix="logw_"))
+    try:
+        p = tmp / "snap.jsonl"
+        w = BufferedLogWriter(p, flush_records=50, flush_interval=3600,
+                              max_bytes=20_000, keep_segments=3, rollup=True)
+        w.write_many({"i": i, "pad": "x" * 40} for i in range(49))
+        assert not p.exists()  # still buffered
+        w.write_many({"i": i, "pad": "x" * 40} for i in range(49, 2000))
+        w.close()
+        assert w.stats["flushes"] == 40 and w.stats["rotations"] > 3
+
+        segs = jsonl_log.segments(p)
+        assert len(segs) <= 4  # 3 kept closed + active
+        kept = [r["i"] for s in segs for r in io.read_jsonl(s)]
+        assert kept == list(range(kept[0], 2000))
+
+        # Every closed segment (including pruned raw ones) has a parquet roll-up
+        lf = scan_rollups(p)
+        rolled = lf.select("i").collect()["i"].to_list()
+        active = [r["i"] for r in io.read_jsonl(p)]
+        assert rolled + active == list(range(2000))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_csv_and_append_jsonl_visibility():
+    tmp = Path(tempfile.mkdtemp(prefix="logw_csv_"))
+    try:
+        c = tmp / "events.csv"
+        with BufferedLogWriter(c) as w:
+            w.write({"timestamp": "t0", "tf": "5m", "flip": True, "score": None})
+        with BufferedLogWriter(c) as w:  # reuses the existing header
+            w.write({"tf": "15m", "timestamp": "t1", "flip": False, "score": 1.5})
+        df = pl.read_csv(c)
+        assert df.columns == ["timestamp", "tf", "flip", "score"]
+        assert df["flip"].to_list() == [True, False] and df["score"].to_list() == [None, 1.5]
+
+        j = tmp / "alerts.jsonl"
+        io.append_jsonl(j, {"a": 1})
+        assert io.read_jsonl(j) == [{"a": 1}]
+        j.rename(tmp / "alerts.000001.jsonl")  # external rotation → writer reopens
+        io.append_jsonl(j, {"a": 2})
+        assert jsonl_log.tail_segmented(j, 5) == [{"a": 1}, {"a": 2}]
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_group_commit_and_rotation()
+    test_csv_and_append_jsonl_visibility()
+    print("✅ smoke_log_writer: passed")
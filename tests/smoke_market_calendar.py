@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_market_calendar.py — v1.0
+# Precomputed busday calendar vs. day-by-day reference + session columns
+# ============================================================
+from __future__ import annotations
+
+import datetime as dt
+from datetime import date, timedelta
+
+import polars as pl
+
+from queen.helpers import market as M
+
+_HOLS = ["2025-01-26", "2025-03-14", "2025-08-15", "2030-01-01"]
+
+
+def _ref_is(d: date) -> bool:
+    return d.weekday() < 5 and d.isoformat() not in _HOLS
+
+
+def _ref_offset(d: date, n: int) -> date:
+    step, left = (1 if n > 0 else -1), abs(n)
+    while left:
+        d += timedelta(days=step)
+        left -= _ref_is(d)
+    return d
+
+
+def test_calendar_matches_reference():
+    # Span ends 2026 → 2030 dates exercise the np.busday_* fallback
+    cal = M.TradingCalendar(_HOLS, first_year=2024, last_year=2026)
+    d0 = date(2023, 12, 1)
+    for k in range(0, 1000, 7):
+        d = d0 + timedelta(days=k)
+        assert cal.is_trading_day(d) == _ref_is(d), d
+        for n in (-25, -1, 0, 1, 3, 40):
+            assert cal.offset(d, n) == _ref_offset(d, n), (d, n)
+        e = d + timedelta(days=45)
+        want = [d + timedelta(days=i) for i in range(46) if _ref_is(d + timedelta(days=i))]
+        assert cal.between(d, e) == want
+        assert cal.count(d, e) == len(want)
+
+    assert cal.offset(date(2025, 3, 13), 1) == date(2025, 3, 17)  # Fri holiday + weekend
+    assert cal.count(date(2025, 3, 10), date(2025, 3, 9)) == 0
+    assert list(cal.mask_for(["2025-03-14", "2025-03-17"])) == [False, True]
+
+
+def test_module_helpers_and_session_columns():
+    d = date(2025, 6, 4)
+    assert M.previous_trading_days(d, 3) == [M.offset_working_day(d, -k) for k in (1, 2, 3)]
+    assert M.trading_days_between(d, d) == int(M.is_working_day(d))
+    assert M.next_working_day(d) == M.offset_working_day(d, 1)
+
+    base = dt.datetime(2025, 6, 4)
+    ts = [base.replace(hour=h, minute=m) for h, m in ((8, 59), (9, 0), (9, 15), (12, 0), (15, 30), (15, 31))]
+    ts.append(dt.datetime(2025, 6, 7, 10, 0))  # Saturday
+    df = pl.DataFrame({"timestamp": ts})
+    out = M.with_session_columns(df)
+    assert out["session"].to_list() == [M.current_session(t) for t in ts]
+    assert out["is_trading_day"].to_list() == [M.is_working_day(t.date()) for t in ts]
+
+    utc = df.with_columns(pl.col("timestamp").dt.replace_time_zone(M.MARKET_TZ_KEY).dt.convert_time_zone("UTC"))
+    assert M.with_session_columns(utc)["session"].to_list() == out["session"].to_list()
+
+
+if __name__ == "__main__":
+    test_calendar_matches_reference()
+    test_module_helpers_and_session_columns()
+    print("✅ smoke_market_calendar: passed")
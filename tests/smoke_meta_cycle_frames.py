@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_meta_cycle_frames.py — v1.1
+# One base fetch per symbol → resampled 15m / 1h / daily frames
+# ============================================================
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timedelta
+
+import polars as pl
+
+from queen.helpers.intervals import parse_minutes
+from queen.services import bars
+from queen.strategies import meta_strategy_cycle as M
+
+
+def _bars(days: list[date], step: int) -> pl.DataFrame:
+    ts = pl.concat(
+        [
+            pl.datetime_range(
+                datetime(d.year, d.month, d.day, 9, 15),
+                datetime(d.year, d.month, d.day, 15, 30) - timedelta(minutes=step),
+                f"{step}m",
+                eager=True,
+                time_zone="Asia/Kolkata",
+            )
+            for d in days
+        ]
+    )
+    n = len(ts)
+    return pl.DataFrame(
+        {
+            "timestamp": ts,
+            "open": [100.0 + i for i in range(n)],
+            "high": [101.0 + i for i in range(n)],
+            "low": [99.0 + i for i in range(n)],
+            "close": [100.5 + i for i in range(n)],
+            "volume": [1000] * n,
+        }
+    )
+
+
+def test_frames_from_one_base_fetch(monkeypatch):
+    today = date.today()
+    past = [today - timedelta(days=k) for k in (2, 1)]
+    calls: list[str] = []
+
+    async def fake_hist(symbol, mode, interval, from_date, to_date):
+        calls.append("hist")
+        return _bars([d for d in past if d.isoformat() >= from_date], parse_minutes(interval))
+
+    async def fake_live(symbol, interval):
+        calls.append("live")
+        return _bars([today], parse_minutes(interval))
+
+    monkeypatch.setattr(bars, "fetch_unified", fake_hist)
+    monkeypatch.setattr(bars, "fetch_intraday", fake_live)
+    bars.invalidate()
+
+    tfs = ["intraday_15m", "hourly_1h", "daily"]
+    frames = asyncio.run(M._frames_for("AAA", tfs))
+    assert calls == ["hist", "live"]
+    assert frames["intraday_15m"].height == 75
+    hourly = frames["hourly_1h"]
+    assert hourly.height == 21
+    assert hourly["timestamp"].dt.minute().unique().to_list() == [15]
+    assert frames["daily"].height == 3
+
+    rows = asyncio.run(M._collect_rows(["AAA", "BBB", "CCC"], tfs, max_workers=2))
+    assert sorted({r["symbol"] for r in rows}) == ["AAA", "BBB", "CCC"]
+    assert len(rows) == 9
+    assert calls.count("hist") == 3  # AAA served from cache
+
+
+if __name__ == "__main__":
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -4,9 +4,12 @@
 # ============================================================
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 import polars as pl
+import pytest
+from queen.strategies import meta_strategy_cycle as msc
 from queen.strategies.meta_strategy_cycle import run_meta_cycle
 from queen.settings import settings as SETTINGS
 
@@ -47,5 +50,27 @@ def test():
     print("✅ smoke_meta_strategy_cycle: passed")
 
 
+def test_async_entry_inside_running_loop(monkeypatch, tmp_path):
+    row = {"timestamp": "2025-06-03T15:15:00+05:30", "symbol": "DEMO", "timeframe": "daily",
+           "Tactical_Index": 0.5, "strategy_score": 0.5, "bias": "Neutral", "entry_ok": False,
+           "exit_ok": False, "risk_band": "Medium", "Regime_State": "RANGE"}
+
+    async def fake_rows(symbols, tfs):
+        return [dict(row)]
+
+    monkeypatch.setattr(msc, "_collect_rows", fake_rows)
+    monkeypatch.setattr(msc, "_append_fused_rows", lambda df: df)
+    monkeypatch.setattr(msc, "_write_latest_pointer", lambda *a: None)
+    kw = dict(snapshot_parquet=tmp_path / "s.parquet", snapshot_jsonl=tmp_path / "s.jsonl")
+
+    async def handler():
+        with pytest.raises(RuntimeError, match="run_meta_cycle_async"):
+            run_meta_cycle(["DEMO"], **kw)
+        return await msc.run_meta_cycle_async(["DEMO"], **kw)
+
+    parquet_path, _, df = asyncio.run(handler())
+    assert parquet_path.exists() and df["symbol"].to_list() == ["DEMO"]
+
+
 if __name__ == "__main__":
     test()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_options_chain_batch.py — v1.1
+# Async pooled full-chain fetch, explicit ATM trim, TTL cache, batch sentiment
+# ============================================================
+from __future__ import annotations
+
+import asyncio
+import functools
+
+import httpx
+import polars as pl
+
+from queen.fetchers import options_chain as oc
+from queen.technicals import options_sentiment as osent
+
+
+def _payload(spot: float) -> dict:
+    rows = []
+    for k in range(21):
+        strike = 100.0 + 5 * k
+        side = lambda oi: {  # noqa: E731
+            "instrument_key": f"NSE_FO|{strike}",
+            "market_data": {"ltp": 3.0, "close_price": 2.5, "oi": oi, "prev_oi": oi - 10, "volume": 100},
+            "option_greeks": {"iv": 0.2},
+        }
+        rows.append({
+            "expiry": "2025-06-26",
+            "strike_price": strike,
+            "underlying_spot_price": spot,
+            "call_options": side(1000 + k),
+            "put_options": side(2000 - k),
+        })
+    return {"status": "success", "data": rows}
+
+
+def test_fetch_chains_window_cache_and_sentiment(monkeypatch):
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = request.url.params["instrument_key"]
+        calls.append(key)
+        assert request.url.params["expiry_date"] == "2025-06-26"
+        return httpx.Response(200, json=_payload(152.0 if key.endswith("AAA") else 118.0))
+
+    monkeypatch.setenv("UPSTOX_TOKEN", "t")
+    monkeypatch.setattr(oc.httpx, "AsyncClient", functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(oc, "resolve_instrument", lambda s: f"NSE_EQ|{s}")
+    monkeypatch.setattr(oc, "_expiry_iso", lambda s, m: "2025-06-26")
+    monkeypatch.setattr(oc, "_CHAIN_CACHE", {})
+    monkeypatch.setattr(osent, "is_fno", lambda s: True)
+
+    df = asyncio.run(oc.fetch_chains(["AAA", "BBB"]))
+    assert sorted(calls) == ["NSE_EQ|AAA", "NSE_EQ|BBB"]
+    assert df.height == 2 * 21 * 2  # every strike, both sides, both underlyings
+    a = df.filter(df["underlying"] == "AAA")
+    assert set(a["instrument_type"]) == {"CE", "PE"}
+    assert (a["open_interest"] - a["prev_open_interest"]).unique().to_list() == [10.0]
+
+    # Display trim is explicit and per underlying (spot from the chain or a map)
+    shown = oc.trim_strike_window(df, width=2)
+    strikes = lambda f, u: sorted(set(f.filter(f["underlying"] == u)["strike_price"].to_list()))  # noqa: E731
+    assert strikes(shown, "AAA") == [140.0, 145.0, 150.0, 155.0, 160.0]
+    assert strikes(shown, "BBB") == [110.0, 115.0, 120.0, 125.0, 130.0]
+    assert strikes(oc.trim_strike_window(df, {"BBB": 181.0}, width=1), "BBB") == [175.0, 180.0, 185.0]
+
+    # Second pass inside the TTL: no HTTP calls
+    out = asyncio.run(osent.refresh_options_sentiment(["AAA", "BBB"]))
+    assert len(calls) == 2
+    assert set(out) == {"AAA", "BBB"}
+    assert out["AAA"]["atm"] == 150.0 and out["AAA"]["pcr"] > 1
+
+
+def test_batch_sentiment_uses_full_chain(monkeypatch):
+    # OI piles up 30 strikes below ATM: outside any display window
+    rows = []
+    for k in range(41):
+        strike = 100.0 + 5 * k
+        rows += [
+            {"underlying": "AAA", "strike_price": strike, "instrument_type": "CE",
+             "open_interest": 90_000.0 if strike == 105.0 else 500.0,
+             "prev_open_interest": 500.0, "underlying_spot_price": 250.0},
+            {"underlying": "AAA", "strike_price": strike, "instrument_type": "PE",
+             "open_interest": 90_000.0 if strike == 105.0 else 100.0,
+             "prev_open_interest": 100.0, "underlying_spot_price": 250.0},
+        ]
+    chain = pl.DataFrame(rows)
+
+    async def fake_chains(symbols, *, mode="intraday"):
+        return chain
+
+    monkeypatch.setattr(oc, "fetch_chains", fake_chains)
+    out = asyncio.run(osent.refresh_options_sentiment(["AAA"]))["AAA"]
+
+    def pain(s: float) -> float:
+        ce = chain.filter(pl.col("instrument_type") == "CE")
+        pe = chain.filter(pl.col("instrument_type") == "PE")
+        return float(
+            (ce["open_interest"] * (s - ce["strike_price"]).clip(lower_bound=0)).sum()
+            + (pe["open_interest"] * (pe["strike_price"] - s).clip(lower_bound=0)).sum()
+        )
+
+    strikes = sorted(set(chain["strike_price"].to_list()))
+    assert out["max_pain"] == min(strikes, key=lambda s: (pain(s), s)) == 105.0
+    assert abs(out["max_pain"] - out["atm"]) > 5 * 10  # beyond ATM±STRIKE_WINDOW
+    pe_oi, ce_oi = 90_000.0 + 40 * 100.0, 90_000.0 + 40 * 500.0
+    assert out["pcr"] == pe_oi / ce_oi
+
+
+if __name__ == "__main__":
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
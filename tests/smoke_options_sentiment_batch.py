@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_options_sentiment_batch.py — v1.0
+# Vectorized PCR / OI build-up / payout-matrix max pain per underlying
+# ============================================================
+from __future__ import annotations
+
+import random
+
+import polars as pl
+
+from queen.technicals import options_sentiment as osent
+
+
+def _chain(rng: random.Random, name: str, n: int) -> list[dict]:
+    rows = []
+    for k in range(n):
+        strike = 1000.0 + 20 * k
+        for typ in ("CE", "PE"):
+            oi = float(rng.randint(0, 5000))
+            rows.append({
+                "underlying": name, "expiry": "2025-06-26", "strike_price": strike,
+                "instrument_type": typ, "open_interest": oi,
+                "prev_open_interest": oi + rng.randint(-300, 300),
+                "close": rng.uniform(1, 50), "prev_close": rng.uniform(1, 50),
+                "underlying_spot_price": 1000.0 + 20 * n / 2 + 7,
+            })
+    return rows
+
+
+def _ref_max_pain(rows: list[dict]) -> float:
+    strikes = sorted({r["strike_price"] for r in rows})
+
+    def pay(s: float) -> float:
+        return sum(
+            r["open_interest"] * (max(s - r["strike_price"], 0) if r["instrument_type"] == "CE"
+                                  else max(r["strike_price"] - s, 0))
+            for r in rows
+        )
+    return min(strikes, key=lambda s: (pay(s), s))
+
+
+def test_batch_matches_reference():
+    rng = random.Random(7)
+    chains = {f"U{i}": _chain(rng, f"U{i}", rng.randint(3, 25)) for i in range(12)}
+    frame = osent.options_sentiment_frame(pl.DataFrame([r for rows in chains.values() for r in rows]))
+    assert frame.height == 12
+    for row in frame.iter_rows(named=True):
+        rows = chains[row["underlying"]]
+        assert row["max_pain"] == _ref_max_pain(rows)
+        ce = sum(r["open_interest"] for r in rows if r["instrument_type"] == "CE")
+        pe = sum(r["open_interest"] for r in rows if r["instrument_type"] == "PE")
+        assert abs(row["pcr"] - pe / ce) < 1e-12
+
+
+def test_true_max_pain_differs_from_peak_oi(monkeypatch):
+    monkeypatch.setattr(osent, "is_fno", lambda s: True)
+    # Peak combined OI sits at 100, but writer payout is lowest at 110
+    rows = [
+        {"strike_price": 100.0, "instrument_type": "CE", "open_interest": 10.0, "close": 5.0, "expiry": "E"},
+        {"strike_price": 100.0, "instrument_type": "PE", "open_interest": 900.0, "close": 5.0, "expiry": "E"},
+        {"strike_price": 110.0, "instrument_type": "CE", "open_interest": 300.0, "close": 5.0, "expiry": "E"},
+        {"strike_price": 110.0, "instrument_type": "PE", "open_interest": 300.0, "close": 5.0, "expiry": "E"},
+        {"strike_price": 120.0, "instrument_type": "CE", "open_interest": 800.0, "close": 5.0, "expiry": "E"},
+        {"strike_price": 120.0, "instrument_type": "PE", "open_interest": 10.0, "close": 5.0, "expiry": "E"},
+    ]
+    out = osent.compute_options_sentiment("X", "intraday", 112.0, pl.DataFrame(rows))
+    assert out["max_pain"] == 110.0 and out["max_pain_distance"] == 2.0
+    assert out["atm"] == 110.0 and out["atm_pressure"] == 0.0
+    assert out["bias"] == "neutral" and out["expiry"] == "E"
+
+
+if __name__ == "__main__":
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
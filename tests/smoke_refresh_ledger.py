@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_refresh_ledger.py — v1.1
+# Refresh ledger planning + conditional (ETag/304) screener refresh
+# ============================================================
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import httpx
+
+from queen.fetchers import screener_scraper as ss
+from queen.helpers.refresh_ledger import RefreshLedger, parse_period, results_window
+
+_RAW = Path(__file__).resolve().parents[1] / "data" / "runtime" / "fundamentals" / "raw"
+_FIXTURES = {p.stem: p.read_bytes() for p in sorted(_RAW.glob("*.html"))}
+
+
+def test_periods_and_windows():
+    assert parse_period("Sep 2025") == date(2025, 9, 30)
+    assert parse_period("31-Dec-2024") == date(2024, 12, 31)
+    assert results_window("Sep 2025", 45) == (date(2025, 12, 31), date(2026, 2, 14))
+    # March quarter: annual results get the longer deadline
+    assert results_window("Dec 2025", 45) == (date(2026, 3, 31), date(2026, 5, 30))
+    assert results_window("n/a", 45) is None
+
+
+def test_plan_priority_and_stats():
+    tmp = Path(tempfile.mkdtemp(prefix="ledger_"))
+    try:
+        led = RefreshLedger(tmp / "l.json", max_age=7 * 86400, recheck=86400)
+        now = time.time()
+        today = date.fromtimestamp(now)
+        for k in ("FRESH", "STALE", "WINDOW", "CLOSED", "KNOWN"):
+            led.record_response(k, status=200, content=k.encode())
+        e = led._entries
+        e["STALE"]["fetched_at"] = now - 8 * 86400
+        e["WINDOW"]["fetched_at"] = now - 2 * 86400
+        e["WINDOW"]["window"] = [str(today - timedelta(days=10)), str(today + timedelta(days=30))]
+        # window already over: only max_age can make it due again
+        e["CLOSED"]["fetched_at"] = now - 2 * 86400
+        e["CLOSED"]["window"] = ["2000-01-01", "2000-02-15"]
+        e["KNOWN"]["fetched_at"] = now - 3600
+        led.save()
+
+        led = RefreshLedger(tmp / "l.json", max_age=7 * 86400, recheck=86400)
+        due, skipped = led.plan(
+            ["FRESH", "NEW", "STALE", "WINDOW", "CLOSED", "KNOWN"],
+            now=now,
+            result_dates={"KNOWN": now - 60},
+        )
+        assert due == ["KNOWN", "WINDOW", "NEW", "STALE"]
+        assert skipped == ["FRESH", "CLOSED"]
+
+        led.record_skip("FRESH")
+        assert led.conditional_headers("FRESH") == {}
+        led.record_response("FRESH", status=200, headers={"ETag": '"v1"'}, content=b"FRESH")
+        assert led.conditional_headers("FRESH") == {"If-None-Match": '"v1"'}
+        assert led.record_response("FRESH", status=304) == "not_modified"
+        assert led.record_response("FRESH", status=200, content=b"FRESH") == "unchanged"
+        assert led.record_response("FRESH", status=200, content=b"new") == "changed"
+        st = led.stats
+        assert (st.skipped, st.not_modified, st.unchanged, st.changed) == (1, 1, 2, 1)
+        assert st.bytes_saved == 2 * len(b"FRESH")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_screener_conditional_refresh():
+    tmp = Path(tempfile.mkdtemp(prefix="screener_refresh_"))
+    saved = {k: getattr(ss.Config, k) for k in (
+        "OUTPUT_DIR", "RAW_DIR", "PROCESSED_DIR", "RATE_LIMIT_RPM",
+        "RATE_LIMIT_BURST", "DEBUG", "MAX_RETRIES", "RETRY_SLEEP_BASE",
+        "CONDITIONAL_REFRESH",
+    )}
+    seen = {"200": 0, "304": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        parts = [p for p in request.url.path.split("/") if p]
+        if not parts:
+            return httpx.Response(200, content=b"<html></html>")
+        sym = parts[1] if len(parts) == 2 and parts[0] == "company" else None
+        if sym not in _FIXTURES:
+            return httpx.Response(404)
+        etag = f'"{sym}-v1"'
+        if request.headers.get("if-none-match") == etag:
+            seen["304"] += 1
+            return httpx.Response(304, headers={"ETag": etag})
+        seen["200"] += 1
+        return httpx.Response(200, content=_FIXTURES[sym], headers={"ETag": etag})
+
+    def run(**kw):
+        return ss.AsyncFundamentalsScraper(
+            concurrency=4, parse_workers=0, transport=httpx.MockTransport(handler)
+        ).run(list(_FIXTURES), **kw)
+
+    try:
+        ss.Config.OUTPUT_DIR = tmp
+        ss.Config.RAW_DIR = tmp / "raw"
+        ss.Config.PROCESSED_DIR = tmp / "processed"
+        ss.Config.RATE_LIMIT_RPM = 60_000
+        ss.Config.RATE_LIMIT_BURST = 50
+        ss.Config.DEBUG = False
+        ss.Config.MAX_RETRIES = 1
+        ss.Config.RETRY_SLEEP_BASE = 0.0
+        ss.Config.CONDITIONAL_REFRESH = True
+
+        first = run()
+        assert seen == {"200": len(_FIXTURES), "304": 0}
+        ledger = json.loads((tmp / "processed" / "_refresh_ledger.json").read_text())
+        assert all(ledger[s]["etag"] and ledger[s]["window"] for s in _FIXTURES)
+
+        # Fresh batch (no checkpoint): nothing is due, no requests at all
+        ckpt = tmp / "processed" / "_checkpoint.jsonl"
+        ckpt.unlink()
+        seen.update({"200": 0, "304": 0})
+        again = run()
+        assert seen == {"200": 0, "304": 0}
+        for sym in _FIXTURES:
+            assert again[sym]["symbol"] == first[sym]["symbol"]
+
+        # Known result date just passed: conditional GET, served as 304
+        ckpt.unlink(missing_ok=True)
+        now = time.time()
+        run(result_dates={s: now for s in _FIXTURES})
+        assert seen == {"200": 0, "304": len(_FIXTURES)}
+
+        # Full refresh ignores the ledger
+        ckpt.unlink(missing_ok=True)
+        ss.Config.CONDITIONAL_REFRESH = False
+        run()
+        assert seen["200"] == len(_FIXTURES)
+    finally:
+        for k, v in saved.items():
+            setattr(ss.Config, k, v)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_periods_and_windows()
+    test_plan_priority_and_stats()
+    test_screener_conditional_refresh()
+    print("✅ smoke_refresh_ledger: passed")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_registry_manifest.py — v1.0
+# Cached registry manifest: reuse, mtime invalidation, one-import get()
+# ============================================================
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+from queen.technicals import manifest
+from queen.technicals import registry as tech_registry
+from queen.technicals.signals import registry
+
+_PLUGIN_A = '''
+REQUIRED_COLUMNS = ["high", "low", "close"]
+LOOKBACK = 14
+
+def compute_alpha(df, **kw):
+    return df
+'''
+_PLUGIN_B = '''
+import qm_plugins_probe.a  # noqa: F401  (proves b is never imported by get("alpha"))
+
+class Beta:
+    def evaluate(self, df, **kw):
+        return df
+'''
+
+
+def _write(p: Path, src: str) -> None:
+    p.write_text(textwrap.dedent(src), encoding="utf-8")
+
+
+def _bump(p: Path) -> None:
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_manifest_cache_and_invalidation():
+    tmp = Path(tempfile.mkdtemp(prefix="reg_manifest_"))
+    pkg = tmp / "qm_plugins_probe"
+    pkg.mkdir()
+    _write(pkg / "__init__.py", "")
+    _write(pkg / "a.py", _PLUGIN_A)
+
+    real_dir, real_build = manifest.manifest_dir, registry.build_registry
+    builds = {"n": 0}
+
+    def counting_build():
+        builds["n"] += 1
+        return real_build()
+
+    old_env = os.environ.get("QUEEN_REGISTRY_PACKAGES")
+    sys.path.insert(0, str(tmp))
+    try:
+        manifest.manifest_dir = lambda: tmp / "cache"
+        registry.build_registry = counting_build
+        os.environ["QUEEN_REGISTRY_PACKAGES"] = "qm_plugins_probe"
+
+        registry.reset_registry()
+        assert registry.names() == ["computealpha"]
+        assert builds["n"] == 1
+        assert registry.requirements("compute_alpha") == {
+            "required_columns": ["high", "low", "close"],
+            "lookback": 14,
+        }
+
+        # Fresh process state: served from the JSON, nothing discovered
+        registry.reset_registry()
+        for m in [m for m in sys.modules if m.startswith("qm_plugins_probe")]:
+            del sys.modules[m]
+        assert registry.names() == ["computealpha"]
+        assert builds["n"] == 1
+        assert "qm_plugins_probe.a" not in sys.modules
+        fn = registry.get("compute_alpha")
+        assert fn.__name__ == "compute_alpha" and "qm_plugins_probe.a" in sys.modules
+
+        # New plugin file → fingerprint changes → rebuilt once
+        _write(pkg / "b.py", _PLUGIN_B)
+        registry.reset_registry()
+        assert registry.names() == ["beta", "computealpha"]
+        assert builds["n"] == 2
+
+        # Edited plugin → rebuilt; get() imports only the owning module
+        _write(pkg / "a.py", _PLUGIN_A.replace("LOOKBACK = 14", "LOOKBACK = 21"))
+        _bump(pkg / "a.py")
+        registry.reset_registry()
+        for m in [m for m in sys.modules if m.startswith("qm_plugins_probe")]:
+            del sys.modules[m]
+        assert registry.requirements("computealpha")["lookback"] == 21
+        assert builds["n"] == 3
+        for m in [m for m in sys.modules if m.startswith("qm_plugins_probe")]:
+            del sys.modules[m]
+        registry.reset_registry()
+        registry.names()
+        registry.get("computealpha")
+        assert "qm_plugins_probe.b" not in sys.modules
+        assert builds["n"] == 3
+    finally:
+        manifest.manifest_dir = real_dir
+        registry.build_registry = real_build
+        if old_env is None:
+            os.environ.pop("QUEEN_REGISTRY_PACKAGES", None)
+        else:
+            os.environ["QUEEN_REGISTRY_PACKAGES"] = old_env
+        registry.reset_registry()
+        sys.path.remove(str(tmp))
+        for m in [m for m in sys.modules if m.startswith("qm_plugins_probe")]:
+            del sys.modules[m]
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_technicals_registry_matches_full_scan():
+    names = tech_registry.list_indicators()
+    assert "macd" in names
+    assert tech_registry.get_indicator("macd").__module__ == tech_registry.module_of("indicator", "macd")
+
+    full_ind: dict = {}
+    tech_registry._autoscan("queen.technicals.indicators", full_ind)
+    assert sorted(full_ind) == names
+
+
+if __name__ == "__main__":
+    test_manifest_cache_and_invalidation()
+    test_technicals_registry_matches_full_scan()
+    print("✅ smoke_registry_manifest: passed")
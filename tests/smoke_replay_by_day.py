@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_replay_by_day.py — v1.0
+# Day-chunked replay: process pool output == serial output
+# ============================================================
+from __future__ import annotations
+
+import asyncio
+import math
+from datetime import date, datetime, timedelta
+
+import polars as pl
+
+from queen.cli import replay_actionable as ra
+
+
+def _bars(days: list[date]) -> pl.DataFrame:
+    ts = [
+        datetime(d.year, d.month, d.day, 9, 15) + timedelta(minutes=15 * k)
+        for d in days
+        for k in range(25)
+    ]
+    close = [100.0 + 3 * math.sin(i / 4) + i * 0.05 for i in range(len(ts))]
+    return pl.DataFrame(
+        {
+            "timestamp": ts,
+            "open": [c - 0.2 for c in close],
+            "high": [c + 0.6 for c in close],
+            "low": [c - 0.6 for c in close],
+            "close": close,
+            "volume": [1000 + 10 * (i % 7) for i in range(len(ts))],
+        }
+    ).with_columns(pl.col("timestamp").dt.replace_time_zone("Asia/Kolkata"))
+
+
+def _run(monkeypatch, df: pl.DataFrame, **kw) -> list[dict]:
+    async def fake_unified(*a, **k):
+        return df
+
+    monkeypatch.setattr(ra, "fetch_unified", fake_unified)
+    cfg = ra.ReplayConfig(symbol="TEST", date_from="2025-06-02", date_to="2025-06-04", pos_mode="auto", **kw)
+    return asyncio.run(ra.replay_actionable(cfg))["rows"]
+
+
+def test_single_day_chunk_matches_whole_range(monkeypatch):
+    df = _bars([date(2025, 6, 2)])
+    assert _run(monkeypatch, df, by_day=True) == _run(monkeypatch, df)
+
+
+def test_process_pool_stitch_matches_serial(monkeypatch):
+    df = _bars([date(2025, 6, 2), date(2025, 6, 3), date(2025, 6, 4)])
+    chunks = ra._day_chunks(df, 25)
+    assert [c[1] for c in chunks] == [0, 25, 25]
+
+    serial = _run(monkeypatch, df, by_day=True, workers=1)
+    pooled = _run(monkeypatch, df, by_day=True, workers=3)
+    assert len(serial) == 25 + 2 * 25 - 24  # first day waits for warmup
+    assert pooled == serial
+    # every chunk ends flat (EOD force in auto mode)
+    assert [r.get("sim_side") for r in serial if r["minutes_from_open"] == 360] == ["FLAT"] * 3
+
+
+if __name__ == "__main__":
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_resample_session.py — v1.0
+# Session-anchored resampling, partial-bar flags, shared bar cache
+# ============================================================
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timedelta
+
+import polars as pl
+
+from queen.helpers.candles import resample_session
+from queen.services import bars
+
+
+def _five_min(days: list[date], drop_tail: int = 0) -> pl.DataFrame:
+    ts = pl.concat(
+        [
+            pl.datetime_range(
+                datetime(d.year, d.month, d.day, 9, 15),
+                datetime(d.year, d.month, d.day, 15, 25),
+                "5m",
+                eager=True,
+                time_zone="Asia/Kolkata",
+            )
+            for d in days
+        ]
+    )
+    ts = ts.head(len(ts) - drop_tail)
+    n = len(ts)
+    return pl.DataFrame(
+        {
+            "timestamp": ts,
+            "open": [float(i) for i in range(n)],
+            "high": [float(i) + 1 for i in range(n)],
+            "low": [float(i) - 1 for i in range(n)],
+            "close": [float(i) + 0.5 for i in range(n)],
+            "volume": [10] * n,
+        }
+    )
+
+
+def test_anchor_aggregation_and_partials():
+    df = _five_min([date(2025, 6, 3), date(2025, 6, 4)], drop_tail=30)
+
+    h = resample_session(df, "1h")
+    d1 = h.filter(pl.col("timestamp").dt.day() == 3)
+    assert [t.strftime("%H:%M") for t in d1["timestamp"]] == [
+        "09:15", "10:15", "11:15", "12:15", "13:15", "14:15", "15:15"
+    ]
+    first = d1.row(0, named=True)
+    assert (first["open"], first["high"], first["low"], first["close"], first["volume"]) == (0.0, 12.0, -1.0, 11.5, 120)
+    # 15:15–15:30 is short but complete (session close); only the forming bar is partial
+    assert h["is_partial"].to_list() == [False] * 10 + [True]
+
+    day = resample_session(df, "1d")
+    assert day.height == 2 and day["is_partial"].to_list() == [False, True]
+    assert day["volume"].to_list() == [750, 450]
+
+    # UTC input comes back on the IST session grid
+    utc = df.with_columns(pl.col("timestamp").dt.convert_time_zone("UTC"))
+    assert resample_session(utc, "30m")["timestamp"].to_list() == resample_session(df, "30m")["timestamp"].to_list()
+
+
+def test_shared_cache_one_fetch(monkeypatch):
+    today = date.today()
+    calls: list[str] = []
+
+    async def fake_hist(symbol, mode, interval, from_date, to_date):
+        calls.append("hist")
+        return _five_min([today - timedelta(days=1)])
+
+    async def fake_live(symbol, interval):
+        calls.append("live")
+        return _five_min([today])
+
+    monkeypatch.setattr(bars, "fetch_unified", fake_hist)
+    monkeypatch.setattr(bars, "fetch_intraday", fake_live)
+    bars.invalidate()
+
+    frames = asyncio.run(bars.get_frames("TCS", ["5m", "15m", "60m", "1d"], base="5m"))
+    assert calls == ["hist", "live"]
+    assert frames["5m"].height == 150 and frames["15m"].height == 50 and frames["1d"].height == 2
+
+    again = asyncio.run(bars.get_frames("TCS", ["15m", "1h"], base="5m"))
+    assert calls == ["hist", "live"]  # within TTL: no broker call
+    assert again["15m"] is frames["15m"]  # memoized derived frame
+
+    asyncio.run(bars.base_bars("TCS", base="5m", max_age_s=0))
+    assert calls == ["hist", "live", "live"]  # refresh pulls only today's bars
+
+
+if __name__ == "__main__":
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
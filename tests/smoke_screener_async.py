@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_screener_async.py — v1.2
+# lxml parser parity + async scraper against local HTML fixtures
+# ============================================================
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+import httpx
+from bs4 import BeautifulSoup as BS
+
+from queen.fetchers import screener_scraper as ss
+
+_RAW = Path(__file__).resolve().parents[1] / "data" / "runtime" / "fundamentals" / "raw"
+_FIXTURES = {p.stem: p.read_bytes() for p in sorted(_RAW.glob("*.html"))}
+
+
+def _strip(d: dict) -> dict:
+    d = dict(d)
+    d.pop("_extracted_at", None)
+    return d
+
+
+def test_lxml_parser_matches_bs4():
+    assert _FIXTURES
+    for sym, html in _FIXTURES.items():
+        ref = ss.DataExtractor(BS(html, "lxml"), sym).extract_all()
+        got = ss.parse_company_html(html, sym)
+        assert _strip(ref) == _strip(got), sym
+
+
+def test_async_scrape_local_fixtures():
+    tmp = Path(tempfile.mkdtemp(prefix="screener_async_"))
+    saved = {k: getattr(ss.Config, k) for k in (
+        "OUTPUT_DIR", "RAW_DIR", "PROCESSED_DIR", "RATE_LIMIT_RPM",
+        "RATE_LIMIT_BURST", "DEBUG", "MAX_RETRIES", "RETRY_SLEEP_BASE",
+    )}
+    hits = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hits["n"] += 1
+        parts = [p for p in request.url.path.split("/") if p]
+        if len(parts) == 2 and parts[0] == "company" and parts[1] in _FIXTURES:
+            return httpx.Response(200, content=_FIXTURES[parts[1]])
+        if not parts:
+            return httpx.Response(200, content=b"<html></html>")
+        return httpx.Response(404)
+
+    try:
+        ss.Config.OUTPUT_DIR = tmp
+        ss.Config.RAW_DIR = tmp / "raw"
+        ss.Config.PROCESSED_DIR = tmp / "processed"
+        ss.Config.RATE_LIMIT_RPM = 60_000
+        ss.Config.RATE_LIMIT_BURST = 50
+        ss.Config.DEBUG = False
+        ss.Config.MAX_RETRIES = 1
+        ss.Config.RETRY_SLEEP_BASE = 0.0
+
+        symbols = list(_FIXTURES) + ["NOSUCHCO"]
+        scraper = ss.AsyncFundamentalsScraper(
+            concurrency=4, parse_workers=0, transport=httpx.MockTransport(handler)
+        )
+        out = scraper.run(symbols)
+
+        assert out["NOSUCHCO"].get("_error")
+        for sym, html in _FIXTURES.items():
+            ref = ss.DataExtractor(BS(html, "lxml"), sym).extract_all()
+            assert _strip(out[sym]) == _strip(ref), sym
+            saved_json = json.loads((tmp / "processed" / f"{sym}.json").read_text())
+            assert saved_json["symbol"] == sym
+
+        lines = (tmp / "processed" / "_checkpoint.jsonl").read_text().splitlines()
+        assert sorted(json.loads(l)["symbol"] for l in lines) == sorted(_FIXTURES)
+
+        # Resume: everything done is served from the checkpoint
+        hits["n"] = 0
+        again = ss.AsyncFundamentalsScraper(
+            concurrency=4, parse_workers=0, transport=httpx.MockTransport(handler)
+        ).run(list(_FIXTURES))
+        assert hits["n"] == 0
+        assert set(again) >= set(_FIXTURES)
+    finally:
+        for k, v in saved.items():
+            setattr(ss.Config, k, v)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_unchanged_page_is_checkpointed(monkeypatch, tmp_path):
+    for k, v in {
+        "OUTPUT_DIR": tmp_path, "RAW_DIR": tmp_path / "raw", "PROCESSED_DIR": tmp_path,
+        "RATE_LIMIT_RPM": 60_000, "RATE_LIMIT_BURST": 50, "MAX_RETRIES": 1,
+    }.items():
+        monkeypatch.setattr(ss.Config, k, v)
+    stored = {"symbol": "AAA", "company_name": "Aaa Ltd"}
+    monkeypatch.setattr(ss, "_make_ledger", lambda: None)
+    monkeypatch.setattr(ss, "_reuse_if_unchanged", lambda *a, **k: dict(stored))
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(304))
+    out = ss.AsyncFundamentalsScraper(concurrency=2, parse_workers=0, transport=transport).run(["AAA"])
+    assert out["AAA"] == stored
+
+    # A restart must not refetch a symbol served from the unchanged copy
+    lines = (tmp_path / "_checkpoint.jsonl").read_text().splitlines()
+    assert [json.loads(l)["symbol"] for l in lines] == ["AAA"]
+    assert ss.CheckpointManager(tmp_path / "_checkpoint.json").is_completed("AAA")
+
+
+def test_checkpoint_lines_visible_before_save(tmp_path):
+    # Simulates a crash: nothing calls save()/close() on the writer
+    cp = ss.CheckpointManager(tmp_path / "_checkpoint.json")
+    cp.mark_completed("AAA", {"ok": 1})
+    cp.mark_completed("BBB", {"ok": 2})
+    again = ss.CheckpointManager(tmp_path / "_checkpoint.json")
+    assert again.get_completed() == {"AAA", "BBB"}
+    cp.close()
+
+
+if __name__ == "__main__":
+    test_lxml_parser_matches_bs4()
+    test_async_scrape_local_fixtures()
+    print("✅ smoke_screener_async: passed")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_sector_context.py — v1.1
+# Sector strength once per bar close, shared across symbols
+# ============================================================
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+import polars as pl
+
+from queen.services import bars, scoring
+from queen.services import sector_context as sc
+
+
+def _index(n: int, start: datetime = datetime(2025, 6, 3, 9, 15)) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "timestamp": [start + timedelta(minutes=15 * i) for i in range(n)],
+            "open": [100.0 - i for i in range(n)],
+            "high": [101.0 - i for i in range(n)],
+            "low": [99.0 - i for i in range(n)],
+            "close": [100.0 - i for i in range(n)],
+            "volume": [1000] * n,
+        }
+    )
+
+
+def test_one_compute_per_bar(monkeypatch):
+    calls: list[int] = []
+    real = sc.compute_sector_strength
+
+    def counting(df):
+        calls.append(df.height)
+        return real(df)
+
+    monkeypatch.setattr(sc, "compute_sector_strength", counting)
+    sc.invalidate()
+
+    sector_df = _index(40)
+    rows = [
+        scoring.action_for(f"S{i}", {"CMP": 100.0, "sector_name": "nifty bank", "sector_df": sector_df})
+        for i in range(50)
+    ]
+    assert calls == [40]
+    assert {r["sector_score"] for r in rows} == {sc.get("NIFTY BANK")["sector_score"]}
+
+    # A new bar close → exactly one more compute
+    scoring.action_for("S0", {"CMP": 100.0, "sector_name": "NIFTY BANK", "sector_df": _index(41)})
+    assert calls == [40, 41]
+
+
+def test_staleness_and_refresh(monkeypatch):
+    sc.invalidate()
+    last = datetime(2025, 6, 3, 9, 15) + timedelta(minutes=15 * 39)
+
+    async def fake_frames(symbol, intervals, **kw):
+        assert symbol == "NSE_INDEX|Nifty Bank"
+        return {iv: _index(40) for iv in intervals}
+
+    monkeypatch.setattr(bars, "get_frames", fake_frames)
+    out = asyncio.run(sc.refresh_sectors({"NIFTY BANK": "NSE_INDEX|Nifty Bank"}))
+    assert out["NIFTY BANK"]["bar_ts"] == last
+
+    assert sc.get("NIFTY BANK", as_of=last + timedelta(minutes=10))["sector_stale"] is False
+    assert sc.get("NIFTY BANK", as_of=last + timedelta(minutes=15))["sector_stale"] is True
+    assert sc.get("NIFTY IT") is None
+
+
+def test_empty_frame_keeps_cached_context():
+    sc.invalidate()
+    ctx = sc.update("NIFTY BANK", _index(40))
+    assert sc.update("NIFTY BANK", pl.DataFrame()) is ctx
+    assert sc.get("NIFTY BANK") is ctx
+
+
+def test_stale_context_never_vetoes(monkeypatch):
+    monkeypatch.setattr(scoring, "log_sector_veto", lambda **kw: None)
+    weak = {"sector_score": -9.0, "sector_bias": "Bearish", "sector_trend": "Strong Bearish"}
+    kw = dict(symbol="S", interval="15m", mode="intraday", decision="BUY", bias="Long")
+
+    decision, bias, _ = scoring._apply_sector_veto_if_needed(sector_ctx=weak, **kw)
+    assert (decision, bias) == ("HOLD", "Neutral")
+
+    decision, bias, out = scoring._apply_sector_veto_if_needed(
+        sector_ctx={**weak, "sector_stale": True}, **kw
+    )
+    assert (decision, bias) == ("BUY", "Long")
+    assert "sector_veto_applied" not in out
+
+
+if __name__ == "__main__":
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
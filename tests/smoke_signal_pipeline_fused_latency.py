@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_signal_pipeline_fused_latency.py — v1.0
+# Fused last-value analysis: parity + per-symbol latency
+# ============================================================
+from __future__ import annotations
+
+import math
+import os
+import time
+
+import numpy as np
+import polars as pl
+
+from queen.technicals.indicators import core
+from queen.technicals.indicators.volume_confirmation import (
+    compute_accumulation_distribution,
+    compute_rvol,
+)
+from queen.upstox_websocket.services.signal_pipeline import fused_last_values
+
+
+def _build_df(n: int = 500) -> pl.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.005, n))
+    return pl.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 0.001, n)),
+            "high": close * (1 + np.abs(rng.normal(0, 0.004, n))),
+            "low": close * (1 - np.abs(rng.normal(0, 0.004, n))),
+            "close": close,
+            "volume": rng.integers(10_000, 90_000, n).astype(float),
+        }
+    )
+
+
+def _separate(df: pl.DataFrame) -> dict:
+    """Per-indicator path: each call materializes a full series for [-1]."""
+    hist = core.macd(df)["hist"]
+    return {
+        "rsi": core.rsi(df, 14)[-1],
+        "ema_20": core.ema(df, 20)[-1],
+        "ema_50": core.ema(df, 50)[-1],
+        "ema_200": core.ema(df, 200)[-1],
+        "hist": hist[-1],
+        "hist_prev": hist[-2],
+        "atr": core.atr(df, 14)[-1],
+        "rvol": compute_rvol(df)["rvol"][-1],
+        "ad": compute_accumulation_distribution(df),
+    }
+
+
+def _best_of_5(fn) -> float:
+    best = float("inf")
+    for _ in range(5):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - t0) * 1000.0)
+    return best
+
+
+def test_parity():
+    df = _build_df()
+    fused = fused_last_values(df)
+    ref = _separate(df)
+    for k in ("rsi", "ema_20", "ema_50", "ema_200", "hist", "hist_prev", "atr", "rvol"):
+        assert math.isclose(fused[k], ref[k], rel_tol=1e-9, abs_tol=1e-9), k
+
+
+def test_latency():
+    df = _build_df()
+    fused_last_values(df)
+    _separate(df)
+
+    t_sep = _best_of_5(lambda: _separate(df))
+    t_fused = _best_of_5(lambda: fused_last_values(df))
+    print(f"⏱️ per-symbol core analysis: separate={t_sep:.2f} ms fused={t_fused:.2f} ms")
+
+    cap_ms = float(os.getenv("FUSED_CAP_MS", "10.0"))
+    assert t_fused < cap_ms, f"fused analysis too slow: {t_fused:.2f} ms"
+    assert t_fused < t_sep, "fused path should beat per-indicator calls"
+
+
+if __name__ == "__main__":
+    test_parity()
+    test_latency()
+    print("✅ smoke_signal_pipeline_fused_latency: passed")
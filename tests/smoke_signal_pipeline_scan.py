@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_signal_pipeline_scan.py — v1.1
+# Concurrent + incremental SignalPipeline.scan_universe
+# ============================================================
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+import numpy as np
+import polars as pl
+
+from queen.upstox_websocket.services.signal_pipeline import (
+    PipelineSettings,
+    SignalPipeline,
+    candles_digest,
+    last_closed_bar,
+)
+from database.models import QueenDatabase
+
+
+def _candles(n: int = 120, seed: int = 0) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.004, n))
+    return pl.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 0.001, n)),
+            "high": close * 1.004,
+            "low": close * 0.996,
+            "close": close,
+            "volume": rng.integers(1_000, 9_000, n),
+        }
+    )
+
+
+def _pipeline() -> SignalPipeline:
+    db = QueenDatabase(":memory:")
+    db.init()
+    return SignalPipeline(db=db, settings=PipelineSettings(max_concurrent_fetch=2))
+
+
+def test_bar_keys():
+    # 15m bars anchored at 09:15 → 10:07 sits in the 10:00 bar
+    assert last_closed_bar("intraday", datetime(2025, 1, 6, 10, 7)) == datetime(2025, 1, 6, 10, 0)
+    # daily bar before close on a Monday → Friday's session, not Sunday
+    assert last_closed_bar("swing", datetime(2025, 1, 6, 11, 0)) == datetime(2025, 1, 3, 15, 30)
+    # overnight / weekend keys stay pinned to the last session close
+    fri_close = datetime(2025, 1, 3, 15, 30)
+    for now in (datetime(2025, 1, 3, 18, 0), datetime(2025, 1, 4, 12, 0), datetime(2025, 1, 6, 9, 0)):
+        assert last_closed_bar("intraday", now) == fri_close
+        assert last_closed_bar("btst", now) == fri_close
+    assert last_closed_bar("swing", datetime(2025, 1, 3, 16, 0)) == fri_close
+    # day after a holiday (2025-02-26) keys to the session before it
+    assert last_closed_bar("swing", datetime(2025, 2, 27, 10, 0)) == datetime(2025, 2, 25, 15, 30)
+
+
+def test_digest_tracks_tail():
+    df = _candles()
+    assert candles_digest(df, 50) == candles_digest(df.clone(), 50)
+    changed = df.with_columns(pl.col("close").shift(-1).fill_null(1.0))
+    assert candles_digest(df, 50) != candles_digest(changed, 50)
+
+
+def test_incremental_scan():
+    pipe = _pipeline()
+    universe = [{"symbol": f"S{i}", "instrument_key": f"NSE_EQ|S{i}"} for i in range(6)]
+    frames = {u["symbol"]: _candles(seed=i) for i, u in enumerate(universe)}
+    calls: list[tuple[str, str]] = []
+    in_flight = 0
+    peak = 0
+
+    async def provider(symbol: str, tf: str):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        calls.append((symbol, tf))
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return frames[symbol]
+
+    async def run():
+        await pipe.scan_universe(universe, provider, ["intraday"], only_closed=True)
+        first = len(calls)
+        # same bar → nothing due
+        await pipe.scan_universe(universe, provider, ["intraday"], only_closed=True)
+        assert len(calls) == first
+        # full scan with unchanged inputs → fetched, but analysis skipped
+        analyzed = []
+        orig = pipe.analyze_symbol
+
+        async def spy(**kw):
+            analyzed.append(kw["symbol"])
+            return await orig(**kw)
+
+        pipe.analyze_symbol = spy  # type: ignore[method-assign]
+        await pipe.scan_universe(universe, provider, ["intraday"])
+        assert not analyzed
+        return first
+
+    first = asyncio.run(run())
+    assert first == len(universe)
+    assert peak <= 2
+
+
+if __name__ == "__main__":
+    test_bar_keys()
+    test_digest_tracks_tail()
+    test_incremental_scan()
+    print("✅ smoke_signal_pipeline_scan: passed")
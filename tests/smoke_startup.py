@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_startup.py — v1.0
+# Cold-start import budget + lazy facade behaviour
+# ============================================================
+from __future__ import annotations
+
+import sys
+
+from queen.cli import startup_bench as sb
+from queen.helpers.lazy import LazyAttr, LazyModule, lazy_attr, lazy_import
+
+
+def test_importtime_parser():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   queen.helpers.io\n"
+        "import time:      1500 |       2000 | queen.services.x\n"
+    )
+    self_ms, cum_ms = sb.parse_importtime(stderr)
+    assert self_ms == {"queen.helpers.io": 0.12, "queen.services.x": 1.5}
+    assert cum_ms["queen.services.x"] == 2.0
+
+
+def test_lazy_facade():
+    name = "queen.helpers.lazy_probe_missing"
+    proxy = lazy_import(name)
+    assert isinstance(proxy, LazyModule) and name not in sys.modules
+    assert lazy_import("sys") is sys
+
+    dumps = lazy_attr("json", "dumps")
+    assert isinstance(dumps, LazyAttr)
+    assert dumps({"a": 1}) == '{"a": 1}'
+
+
+def test_startup_budgets():
+    budgets = sb.startup_config()["BUDGET_MS"]
+    problems = []
+    for mod in budgets:
+        prof = sb.profile_import(mod)
+        print(f"⏱️ {mod}: total {prof.total_ms:.1f} ms, queen {prof.queen_ms:.1f} ms")
+        problems += sb.check_budget(prof)
+    assert not problems, "\n".join(problems)
+
+
+def test_services_stay_lazy_until_use():
+    prof = sb.profile_import("queen.services.live", deferred=["queen.fetchers.upstox_fetcher"])
+    assert prof.heavy == []
+    from queen.services import live
+
+    assert live.fetch_intraday.resolve().__module__ == "queen.fetchers.upstox_fetcher"
+
+
+if __name__ == "__main__":
+    test_importtime_parser()
+    test_lazy_facade()
+    test_startup_budgets()
+    test_services_stay_lazy_until_use()
+    print("✅ smoke_startup: passed")
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_time_columns.py — v1.0
+# Vectorized time_bucket / session_phase / minutes_from_open
+# ============================================================
+from __future__ import annotations
+
+import datetime as dt
+
+import polars as pl
+
+from queen.helpers.market import current_session, time_bucket, with_time_columns
+from queen.strategies.playbook import assign_playbook
+
+
+def _minutes():
+    base = dt.datetime(2025, 6, 4, 8, 50)
+    return [base + dt.timedelta(minutes=m) for m in range(0, 8 * 60, 5)]
+
+
+def test_columns_match_scalar_paths():
+    ts = _minutes()
+    out = with_time_columns(pl.DataFrame({"timestamp": ts}))
+    assert out["time_bucket"].to_list() == [time_bucket(t) for t in ts]
+    assert out["session_phase"].to_list() == [current_session(t) for t in ts]
+    mfo = dict(zip(ts, out["minutes_from_open"].to_list()))
+    assert mfo[dt.datetime(2025, 6, 4, 9, 15)] == 0
+    assert mfo[dt.datetime(2025, 6, 4, 9, 5)] == -10
+
+    # Row frames (replay / scan output) carry ISO strings with offsets
+    iso = pl.DataFrame({"timestamp": [t.isoformat() + "+05:30" for t in ts]})
+    assert with_time_columns(iso)["time_bucket"].to_list() == out["time_bucket"].to_list()
+
+    aware = pl.DataFrame({"timestamp": ts}).with_columns(
+        pl.col("timestamp").dt.replace_time_zone("Asia/Kolkata").dt.convert_time_zone("UTC")
+    )
+    assert with_time_columns(aware)["time_bucket"].to_list() == out["time_bucket"].to_list()
+
+
+def test_playbook_reads_precomputed_bucket():
+    row = {"decision": "BUY", "time_bucket": "LATE_SESSION", "timestamp": "2025-06-04T09:40:00"}
+    assert assign_playbook(row, interval="15m")["time_bucket"] == "LATE_SESSION"
+    row = {"decision": "BUY", "time_bucket": "UNKNOWN", "timestamp": "2025-06-04T09:40:00"}
+    assert assign_playbook(row, interval="15m")["time_bucket"] == "OPENING_DRIVE"
+
+
+if __name__ == "__main__":
+    test_columns_match_scalar_paths()
+    test_playbook_reads_precomputed_bucket()
+    print("✅ smoke_time_columns: passed")
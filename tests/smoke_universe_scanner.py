@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# ============================================================
+# queen/tests/smoke_universe_scanner.py — v1.0
+# Long-frame scanner metrics, bounded fetch pool, per-day cache
+# ============================================================
+from __future__ import annotations
+
+import asyncio
+import random
+from datetime import date, datetime, timedelta
+
+import polars as pl
+
+from queen.cli import universe_scanner as us
+
+
+def _daily(rng: random.Random, n: int, start: datetime = datetime(2025, 1, 1)) -> pl.DataFrame:
+    close, rows = 100.0, []
+    for i in range(n):
+        close *= 1 + rng.gauss(0, 0.02)
+        rows.append({
+            "timestamp": start + timedelta(days=i),
+            "open": close * 0.99, "high": close * (1 + rng.random() * 0.03),
+            "low": close * (1 - rng.random() * 0.03), "close": close,
+            "volume": float(rng.randint(1_000, 50_000)),
+        })
+    return pl.DataFrame(rows)
+
+
+def _ref_beta(df: pl.DataFrame, bench: pl.DataFrame, window: int) -> float:
+    m = df.join(bench, on="timestamp", suffix="_b").with_columns(
+        r=pl.col("close") / pl.col("close").shift(1) - 1,
+        rb=pl.col("close_b") / pl.col("close_b").shift(1) - 1,
+    ).drop_nulls().tail(window)
+    return m.select(pl.cov("r", "rb"))["r"][0] / m["rb"].var()
+
+
+def test_metrics_match_per_symbol_reference():
+    rng = random.Random(3)
+    bench = _daily(rng, 80)
+    frames = {f"S{i}": _daily(rng, n) for i, n in enumerate((80, 60, 30, 10))}
+    hist = pl.concat([d.with_columns(pl.lit(s).alias("symbol")) for s, d in frames.items()])
+
+    out = {r["symbol"]: r for r in us.compute_metrics(hist, bench, beta_window=20).iter_rows(named=True)}
+    for sym, d in frames.items():
+        row = out[sym]
+        assert abs(row["avg_daily_value"] - (d["close"] * d["volume"]).mean()) < 1e-6
+        if d.height < 20:
+            assert row["beta"] is None and row["volatility"] is None
+            continue
+        assert abs(row["beta"] - _ref_beta(d, bench, 20)) < 1e-9
+        ema = d["close"].ewm_mean(span=50)[-1]
+        assert (row["momentum"] is None) == (d.height < 50)
+        if d.height >= 50:
+            assert abs(row["momentum"] - d["close"][-1] / ema * 100) < 1e-9
+
+
+def test_bounded_pool_and_day_cache(monkeypatch, tmp_path):
+    rng = random.Random(5)
+    calls: list[str] = []
+    inflight = {"now": 0, "max": 0}
+
+    async def fake_unified(symbol, mode, from_date, to_date, interval):
+        calls.append(f"{symbol}:{mode}")
+        inflight["now"] += 1
+        inflight["max"] = max(inflight["max"], inflight["now"])
+        await asyncio.sleep(0.001)
+        inflight["now"] -= 1
+        if symbol == "BAD":
+            raise RuntimeError("boom")
+        return _daily(rng, 40)
+
+    monkeypatch.setattr(us, "fetch_unified", fake_unified)
+    monkeypatch.setattr(us, "CACHE_DIR", tmp_path)
+    day = date(2025, 6, 3)
+
+    syms = [f"S{i}" for i in range(12)] + ["BAD"]
+    first = asyncio.run(us.scan_metrics(syms, day=day, concurrency=3))
+    assert inflight["max"] <= 3
+    assert first.height == 12 and "BAD" not in first["symbol"].to_list()
+    assert first["beta"].null_count() == 0
+    assert (tmp_path / "metrics_20250603.parquet").exists()
+
+    # Same trading day: only symbols not yet cached are fetched
+    calls.clear()
+    again = asyncio.run(us.scan_metrics(["S0", "S1", "NEW"], day=day, concurrency=3))
+    assert sorted(calls) == ["NEW:daily", "NEW:intraday", "NIFTY50:daily"]
+    assert sorted(again["symbol"].to_list()) == ["NEW", "S0", "S1"]
+
+
+if __name__ == "__main__":
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
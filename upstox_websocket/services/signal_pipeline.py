@@ -12,12 +12,13 @@ Version: 1.0
 """
 
 import asyncio
+import hashlib
 import logging
 import sys
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -29,6 +30,24 @@ except ImportError:
     HAS_POLARS = False
     pl = None
 
+try:
+    from queen.helpers.market import MARKET_TZ, is_trading_day, last_trading_day
+except ImportError:
+    # Standalone service: NSE timezone, weekday-only calendar (no holidays)
+    from datetime import date
+    from zoneinfo import ZoneInfo
+
+    MARKET_TZ = ZoneInfo("Asia/Kolkata")
+
+    def is_trading_day(d: date) -> bool:
+        return d.weekday() < 5
+
+    def last_trading_day(ref: Optional[date] = None) -> date:
+        d = ref or datetime.now(MARKET_TZ).date()
+        while not is_trading_day(d):
+            d -= timedelta(days=1)
+        return d
+
 from database.models import (
     Direction,
     QueenDatabase,
@@ -105,8 +124,11 @@ try:
 except ImportError:
     pass
 
+VOLUME_SETTINGS: Dict[str, Any] = {"rvol_period": 20, "spike_threshold": 2.0}
+
 try:
     from queen.technicals.indicators.volume_confirmation import (
+        VOLUME_SETTINGS,
         compute_rvol,
         detect_accumulation_distribution,
         detect_volume_spike,
@@ -175,6 +197,140 @@ class PipelineSettings:
     # Update intervals (seconds)
     scan_interval: int = 60  # How often to scan for new signals
 
+    # Universe scan concurrency / incremental settings
+    max_concurrent_fetch: int = 8  # Parallel candle_provider calls
+    max_concurrent_analysis: int = 4  # Parallel analysis workers (threads)
+    hash_bars: int = 50  # Last N bars hashed to detect unchanged inputs
+
+    # Fused "last-value" analysis (one polars query for core + volume)
+    fused_analysis: bool = True
+
+
+# Bar size (minutes) backing each signal timeframe; >= 1440 means daily bars
+TIMEFRAME_BAR_MINUTES: Dict[str, int] = {
+    Timeframe.SCALP.value: 5,
+    Timeframe.INTRADAY.value: 15,
+    Timeframe.BTST.value: 60,
+    Timeframe.SWING.value: 1440,
+    Timeframe.POSITIONAL.value: 1440,
+    Timeframe.INVESTMENT.value: 1440,
+}
+
+SESSION_OPEN = time(9, 15)
+SESSION_CLOSE = time(15, 30)
+
+
+def last_closed_bar(timeframe: str, now: Optional[datetime] = None) -> datetime:
+    """Return the close time of the most recent completed bar for a timeframe.
+
+    Keys follow the trading calendar: intraday bars are anchored at the NSE
+    open (09:15) of the last trading session and capped at its close
+    (15:30); daily bars close at 15:30 of the last completed trading day.
+    Outside market hours, on weekends and on holidays the key stays put,
+    so it doubles as a "bar key" for incremental scanning.
+    """
+    now = now or datetime.now(MARKET_TZ).replace(tzinfo=None)
+    minutes = TIMEFRAME_BAR_MINUTES.get(timeframe, 15)
+
+    day = now.date()
+    if not is_trading_day(day) or now.time() < SESSION_OPEN:
+        day = last_trading_day(day - timedelta(days=1))
+    close = datetime.combine(day, SESSION_CLOSE)
+
+    if minutes >= 1440:
+        if now < close:
+            close = datetime.combine(last_trading_day(day - timedelta(days=1)), SESSION_CLOSE)
+        return close
+
+    if now >= close:
+        return close
+    anchor = datetime.combine(day, SESSION_OPEN)
+    elapsed = int((now - anchor).total_seconds() // 60)
+    return anchor + timedelta(minutes=(elapsed // minutes) * minutes)
+
+
+def candles_digest(df: "pl.DataFrame", bars: int = 50) -> str:
+    """Content hash of the last N bars (used to skip unchanged inputs)"""
+    tail = df.tail(bars)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(tail.columns).encode())
+    h.update(tail.hash_rows(seed=0).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+# ============================================
+# Fused Last-Value Analysis
+# ============================================
+
+def _ewm(expr: "pl.Expr", span: int) -> "pl.Expr":
+    return expr.ewm_mean(span=span, adjust=False)
+
+
+def fused_last_values(
+    df: "pl.DataFrame",
+    rvol_period: Optional[int] = None,
+    ad_period: int = 10,
+) -> Dict[str, Optional[float]]:
+    """Compute last values of RSI/EMA/MACD/ATR/RVOL/A-D in one polars select.
+
+    Formulas match ``queen.technicals.indicators.core`` (EWM RSI/ATR, EMA,
+    12/26/9 MACD) and ``volume_confirmation`` (RVOL, accumulation), but only
+    the final scalars are materialized.
+
+    Returns:
+        Dict of scalars (None where the input is too short)
+
+    """
+    rvol_period = rvol_period or VOLUME_SETTINGS["rvol_period"]
+    close = pl.col("close").cast(pl.Float64, strict=False)
+    high = pl.col("high").cast(pl.Float64, strict=False)
+    low = pl.col("low").cast(pl.Float64, strict=False)
+    prev_close = close.shift(1)
+
+    delta = close.diff().fill_null(0.0)
+    avg_gain = _ewm(delta.clip(lower_bound=0.0), 14)
+    avg_loss = _ewm((-delta).clip(lower_bound=0.0), 14)
+    rsi = 100.0 - 100.0 / (1.0 + avg_gain / (avg_loss + 1e-12))
+
+    macd_line = _ewm(close, 12) - _ewm(close, 26)
+    hist = macd_line - _ewm(macd_line, 9)
+
+    tr = pl.max_horizontal(
+        (high - low).abs(), (high - prev_close).abs(), (low - prev_close).abs()
+    )
+
+    exprs = [
+        rsi.last().alias("rsi"),
+        _ewm(close, 20).last().alias("ema_20"),
+        _ewm(close, 50).last().alias("ema_50"),
+        _ewm(close, 200).last().alias("ema_200"),
+        hist.tail(2).implode().alias("hist"),
+        _ewm(tr, 14).last().alias("atr"),
+        close.tail(ad_period).first().alias("ad_close_first"),
+        close.last().alias("ad_close_last"),
+    ]
+
+    has_volume = "volume" in df.columns
+    if has_volume:
+        vol = pl.col("volume").cast(pl.Float64, strict=False)
+        half = ad_period // 2
+        exprs += [
+            (vol / vol.rolling_mean(window_size=rvol_period)).last().alias("rvol"),
+            vol.tail(ad_period).head(half).sum().alias("ad_vol_first"),
+            vol.tail(ad_period).tail(ad_period - half).sum().alias("ad_vol_second"),
+        ]
+
+    row = df.select(exprs).row(0, named=True)
+
+    tail = row.pop("hist")
+    row["hist"] = tail[-1] if tail else None
+    row["hist_prev"] = tail[-2] if len(tail) > 1 else None
+    if len(df) < 200:
+        row["ema_200"] = None
+    if not has_volume or len(df) < ad_period:
+        row["ad_vol_first"] = row["ad_vol_second"] = None
+    return row
+
 
 # ============================================
 # Analysis Result Classes
@@ -285,6 +441,10 @@ class SignalPipeline:
         self._running = False
         self._scan_task: Optional[asyncio.Task] = None
 
+        # Incremental scan state, keyed by (symbol, timeframe)
+        self._last_bar: Dict[Tuple[str, str], datetime] = {}
+        self._input_hashes: Dict[Tuple[str, str], str] = {}
+
         # Log available modules
         self._log_module_status()
 
@@ -333,6 +493,11 @@ class SignalPipeline:
         if not HAS_POLARS or df is None or len(df) < 20:
             return analysis
 
+        if self.settings.fused_analysis:
+            self._apply_fused_core(analysis, df, current_price)
+            self._run_structure_analysis(analysis, df, current_price)
+            return analysis
+
         close = df["close"].to_numpy()
         high = df["high"].to_numpy()
         low = df["low"].to_numpy()
@@ -422,6 +587,80 @@ class SignalPipeline:
             except Exception as e:
                 logger.debug(f"Volume error: {e}")
 
+        self._run_structure_analysis(analysis, df, current_price)
+        return analysis
+
+    def _apply_fused_core(
+        self,
+        analysis: TechnicalAnalysis,
+        df: "pl.DataFrame",
+        current_price: float
+    ) -> None:
+        """Fill core + volume fields from a single fused polars query"""
+        try:
+            v = fused_last_values(df)
+        except Exception as e:
+            logger.debug(f"Fused analysis error: {e}")
+            return
+
+        analysis.rsi = v["rsi"]
+        if analysis.rsi:
+            if analysis.rsi >= 70:
+                analysis.rsi_status = "overbought"
+            elif analysis.rsi >= 60:
+                analysis.rsi_status = "bullish"
+            elif analysis.rsi <= 30:
+                analysis.rsi_status = "oversold"
+            elif analysis.rsi <= 40:
+                analysis.rsi_status = "bearish"
+
+        analysis.ema_20 = v["ema_20"]
+        analysis.ema_50 = v["ema_50"]
+        analysis.ema_200 = v["ema_200"]
+        if analysis.ema_20:
+            analysis.above_ema_20 = current_price > analysis.ema_20
+        if analysis.ema_50:
+            analysis.above_ema_50 = current_price > analysis.ema_50
+
+        hist, hist_prev = v["hist"], v["hist_prev"]
+        if hist is not None:
+            analysis.macd_histogram = hist
+            if hist_prev is not None:
+                if hist > 0 and hist > hist_prev:
+                    analysis.macd_signal = "bullish"
+                elif hist < 0 and hist < hist_prev:
+                    analysis.macd_signal = "bearish"
+
+        if v["atr"] is not None:
+            analysis.atr = v["atr"]
+            analysis.atr_pct = (analysis.atr / current_price) * 100 if current_price else None
+
+        rvol = v.get("rvol")
+        if rvol is not None:
+            analysis.rvol = rvol
+            analysis.volume_spike = rvol >= VOLUME_SETTINGS["spike_threshold"]
+
+        # Accumulation/distribution (same rule as volume_confirmation)
+        first, second = v.get("ad_vol_first"), v.get("ad_vol_second")
+        c0, c1 = v["ad_close_first"], v["ad_close_last"]
+        if first is not None and second is not None and c0:
+            price_change = (c1 - c0) / c0 * 100
+            vol_up = second > first * 1.1
+            vol_down = second < first * 0.9
+            if price_change > 1:
+                analysis.accumulation = vol_up
+                analysis.distribution = vol_down
+            elif price_change < -1:
+                analysis.accumulation = vol_down
+                analysis.distribution = vol_up
+
+    def _run_structure_analysis(
+        self,
+        analysis: TechnicalAnalysis,
+        df: "pl.DataFrame",
+        current_price: float
+    ) -> None:
+        """SMC / Wyckoff / breakout modules (structure, not last-value series)"""
         # SMC - FVG
         if HAS_FVG and detect_fvg_zones:
             try:
@@ -500,8 +739,6 @@ class SignalPipeline:
             except Exception as e:
                 logger.debug(f"Breakout error: {e}")
 
-        return analysis
-
     def _calculate_signal_score(
         self,
         analysis: TechnicalAnalysis,
@@ -842,8 +1079,10 @@ class SignalPipeline:
 
         signals = []
 
-        # Run technical analysis
-        analysis = self._run_technical_analysis(candles, current_price)
+        # Run technical analysis (off the event loop; polars/numpy release the GIL)
+        analysis = await asyncio.to_thread(
+            self._run_technical_analysis, candles, current_price
+        )
 
         # Check for long signal
         long_score = self._calculate_signal_score(analysis, timeframe, Direction.LONG.value)
@@ -978,18 +1217,84 @@ class SignalPipeline:
 
     # ==================== Batch Scanning ====================
 
+    def due_pairs(
+        self,
+        universe: List[Dict[str, Any]],
+        timeframes: List[str],
+        now: Optional[datetime] = None,
+    ) -> List[Tuple[Dict[str, Any], str]]:
+        """Return (item, timeframe) pairs whose bar closed since the last scan"""
+        now = now or datetime.now(MARKET_TZ).replace(tzinfo=None)
+        due = []
+        for tf in timeframes:
+            bar = last_closed_bar(tf, now)
+            for item in universe:
+                if self._last_bar.get((item["symbol"], tf)) != bar:
+                    due.append((item, tf))
+        return due
+
+    async def _scan_pair(
+        self,
+        item: Dict[str, Any],
+        tf: str,
+        candle_provider: Callable[[str, str], "pl.DataFrame"],
+        fetch_sem: asyncio.Semaphore,
+        analysis_sem: asyncio.Semaphore,
+        skip_unchanged: bool,
+        bar: datetime,
+    ) -> List[Signal]:
+        """Fetch + analyze a single (symbol, timeframe) pair"""
+        symbol = item["symbol"]
+        key = (symbol, tf)
+
+        try:
+            async with fetch_sem:
+                candles = await candle_provider(symbol, tf)
+
+            if candles is None or len(candles) < 20:
+                return []
+
+            digest = candles_digest(candles, self.settings.hash_bars)
+            if skip_unchanged and self._input_hashes.get(key) == digest:
+                logger.debug(f"{symbol} ({tf}): inputs unchanged, skipping")
+                self._last_bar[key] = bar
+                return []
+
+            async with analysis_sem:
+                signals = await self.analyze_symbol(
+                    symbol=symbol,
+                    instrument_key=item["instrument_key"],
+                    candles=candles,
+                    timeframe=tf
+                )
+
+            self._input_hashes[key] = digest
+            self._last_bar[key] = bar
+            return signals
+
+        except Exception as e:
+            logger.error(f"Error scanning {symbol} ({tf}): {e}")
+            return []
+
     async def scan_universe(
         self,
         universe: List[Dict[str, Any]],
         candle_provider: Callable[[str, str], "pl.DataFrame"],
         timeframes: Optional[List[str]] = None,
+        only_closed: bool = False,
+        skip_unchanged: bool = True,
     ) -> List[Signal]:
         """Scan multiple symbols for signals.
 
+        Fetch and analysis run concurrently, capped by
+        ``settings.max_concurrent_fetch`` / ``settings.max_concurrent_analysis``.
+
         Args:
             universe: List of dicts with 'symbol' and 'instrument_key'
             candle_provider: Async function that returns candles for (symbol, timeframe)
             timeframes: List of timeframes to scan (default: all)
+            only_closed: Only scan pairs whose bar closed since the last scan
+            skip_unchanged: Skip analysis when the last N bars hash is unchanged
 
         Returns:
             List of generated signals
@@ -998,37 +1303,38 @@ class SignalPipeline:
         if timeframes is None:
             timeframes = [t.value for t in Timeframe]
 
-        all_signals = []
+        now = datetime.now(MARKET_TZ).replace(tzinfo=None)
+        if only_closed:
+            pairs = self.due_pairs(universe, timeframes, now)
+        else:
+            pairs = [(item, tf) for item in universe for tf in timeframes]
 
-        for item in universe:
-            symbol = item["symbol"]
-            instrument_key = item["instrument_key"]
+        if not pairs:
+            logger.debug("Scan skipped: no bars closed since last scan")
+            return []
 
-            for tf in timeframes:
-                try:
-                    # Get candles
-                    candles = await candle_provider(symbol, tf)
-
-                    if candles is None or len(candles) < 20:
-                        continue
-
-                    # Analyze
-                    signals = await self.analyze_symbol(
-                        symbol=symbol,
-                        instrument_key=instrument_key,
-                        candles=candles,
-                        timeframe=tf
-                    )
+        fetch_sem = asyncio.Semaphore(max(1, self.settings.max_concurrent_fetch))
+        analysis_sem = asyncio.Semaphore(max(1, self.settings.max_concurrent_analysis))
 
-                    # Save signals
-                    for signal in signals:
-                        self.save_signal(signal)
-                        all_signals.append(signal)
+        results = await asyncio.gather(*(
+            self._scan_pair(
+                item, tf, candle_provider, fetch_sem, analysis_sem,
+                skip_unchanged, last_closed_bar(tf, now),
+            )
+            for item, tf in pairs
+        ))
 
-                except Exception as e:
-                    logger.error(f"Error scanning {symbol} ({tf}): {e}")
+        # Save in universe order so DB ids stay deterministic
+        all_signals = []
+        for signals in results:
+            for signal in signals:
+                self.save_signal(signal)
+                all_signals.append(signal)
 
-        logger.info(f"Scan complete: {len(all_signals)} signals generated")
+        logger.info(
+            f"Scan complete: {len(all_signals)} signals generated "
+            f"({len(pairs)} symbol/timeframe pairs)"
+        )
         return all_signals
 
     # ==================== Background Scanner ====================
@@ -1041,6 +1347,8 @@ class SignalPipeline:
     ) -> None:
         """Start background scanner loop.
 
+        Each tick only analyzes (symbol, timeframe) pairs whose bar just closed.
+
         Args:
             universe: List of symbols to scan
             candle_provider: Function to get candles
@@ -1052,7 +1360,9 @@ class SignalPipeline:
         async def scan_loop():
             while self._running:
                 try:
-                    await self.scan_universe(universe, candle_provider, timeframes)
+                    await self.scan_universe(
+                        universe, candle_provider, timeframes, only_closed=True
+                    )
                 except Exception as e:
                     logger.error(f"Scan error: {e}")
 
@@ -1110,6 +1420,9 @@ EXPORTS = {
     "PipelineSettings": PipelineSettings,
     "TechnicalAnalysis": TechnicalAnalysis,
     "SignalCandidate": SignalCandidate,
+    "last_closed_bar": last_closed_bar,
+    "candles_digest": candles_digest,
+    "fused_last_values": fused_last_values,
     "get_pipeline": get_pipeline,
     "init_pipeline": init_pipeline,
 }